@@ -43,6 +43,7 @@ from agent_comm_core.config.models import (
     SecurityConfig,
     ServerConfig,
     SSLConfig,
+    WebSocketConfig,
 )
 
 __all__ = [
@@ -61,6 +62,7 @@ __all__ = [
     "LoggingConfig",
     "AgentConfig",
     "CommunicationServerConfig",
+    "WebSocketConfig",
     # Loader
     "ConfigLoader",
     # Convenience functions
@@ -208,6 +208,9 @@ class ConfigLoader:
             # Communication server settings
             "COMMUNICATION_SERVER_URL": ("communication_server", "url"),
             "AGENT_COMM_SERVER_URL": ("communication_server", "url"),
+            # WebSocket settings
+            "AGENT_COMM_WS_BACKPLANE": ("websocket", "backplane"),
+            "AGENT_COMM_WS_REDIS_URL": ("websocket", "redis_url"),
             # Logging settings
             "MCP_BROKER_LOG_LEVEL": ("logging", "level"),
             "MCP_BROKER_LOG_FORMAT": ("logging", "format"),
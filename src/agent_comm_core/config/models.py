@@ -136,6 +136,15 @@ class CommunicationServerConfig(BaseModel):
     timeout: int = 30
 
 
+class WebSocketConfig(BaseModel):
+    """WebSocket fan-out configuration for the Communication Server."""
+
+    # "redis" shares broadcasts between server workers; "memory" is one worker only
+    backplane: Literal["memory", "redis"] = "memory"
+    redis_url: str | None = None
+    channel_prefix: str = "agent_comm:ws"
+
+
 class Config(BaseModel):
     """Root configuration model for the entire system."""
 
@@ -149,6 +158,7 @@ class Config(BaseModel):
     communication_server: CommunicationServerConfig = Field(
         default_factory=CommunicationServerConfig
     )
+    websocket: WebSocketConfig = Field(default_factory=WebSocketConfig)
 
     @field_validator("version")
     @classmethod
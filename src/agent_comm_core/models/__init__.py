@@ -33,7 +33,12 @@ from agent_comm_core.models.common import (
     ProjectStatus,
     SenderType,
 )
-from agent_comm_core.models.communication import Communication, CommunicationCreate
+from agent_comm_core.models.communication import (
+    Communication,
+    CommunicationBatchCreate,
+    CommunicationBatchResult,
+    CommunicationCreate,
+)
 from agent_comm_core.models.decision import Decision, DecisionCreate
 from agent_comm_core.models.meeting import (
     Meeting,
@@ -94,6 +99,8 @@ __all__ = [
     "ValidationMixin",
     # Communication models
     "Communication",
+    "CommunicationBatchCreate",
+    "CommunicationBatchResult",
     "CommunicationCreate",
     # Meeting models
     "Meeting",
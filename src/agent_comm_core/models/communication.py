@@ -38,7 +38,27 @@ class CommunicationBase(BaseModel):
 class CommunicationCreate(CommunicationBase):
     """Model for creating a new communication."""
 
-    pass
+    id: Optional[UUID] = Field(
+        default=None, description="Client-assigned ID (makes retried bulk inserts idempotent)"
+    )
+    created_at: Optional[datetime] = Field(
+        default=None, description="Client-side creation timestamp for deferred logging"
+    )
+
+
+class CommunicationBatchCreate(BaseModel):
+    """Model for logging several communications in one request."""
+
+    communications: list[CommunicationCreate] = Field(
+        ..., min_length=1, max_length=1000, description="Communications to log"
+    )
+
+
+class CommunicationBatchResult(BaseModel):
+    """Result of a bulk communication insert."""
+
+    created: int = Field(..., description="Number of communications stored")
+    duplicates: int = Field(default=0, description="Communications skipped as already stored")
 
 
 class Communication(CommunicationBase):
@@ -136,6 +136,26 @@ class CommunicationRepository(BaseRepository[Communication, CommunicationCreate]
         """
         pass
 
+    async def create_many(self, items: list[CommunicationCreate]) -> list[Communication]:
+        """
+        Create several communications, skipping client IDs already stored.
+
+        The default implementation creates items one by one; backends
+        should override it with a single round trip.
+
+        Args:
+            items: Communication creation data
+
+        Returns:
+            The newly created communications
+        """
+        created = []
+        for item in items:
+            if item.id is not None and await self.get_by_id(item.id) is not None:
+                continue
+            created.append(await self.create(item))
+        return created
+
 
 class MeetingRepository(BaseRepository[Meeting, MeetingCreate]):
     """
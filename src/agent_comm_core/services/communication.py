@@ -69,6 +69,21 @@ class CommunicationService:
         )
         return await self._repository.create(create_data)
 
+    async def log_communications(self, items: list[CommunicationCreate]) -> list[Communication]:
+        """
+        Log several communications in one operation.
+
+        Items carrying an already stored client ID are skipped, so a
+        retried batch does not create duplicates.
+
+        Args:
+            items: Communications to log
+
+        Returns:
+            The newly created communication records
+        """
+        return await self._repository.create_many(items)
+
     async def get_communication(self, id: UUID) -> Optional[Communication]:
         """
         Retrieve a communication by its ID.
@@ -8,7 +8,12 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from agent_comm_core.models.communication import Communication, CommunicationCreate
+from agent_comm_core.models.communication import (
+    Communication,
+    CommunicationBatchCreate,
+    CommunicationBatchResult,
+    CommunicationCreate,
+)
 from agent_comm_core.models.auth import User, Agent
 from agent_comm_core.services.communication import CommunicationService
 
@@ -59,6 +64,34 @@ async def log_communication(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.post("/bulk", response_model=CommunicationBatchResult, status_code=status.HTTP_201_CREATED)
+async def log_communications_bulk(
+    data: CommunicationBatchCreate,
+    agent: Agent = Depends(require_communicate_capability),
+    service: CommunicationService = Depends(get_communication_service),
+) -> CommunicationBatchResult:
+    """
+    Log a batch of communications in one request.
+
+    Used by write-behind clients. Items with a client-assigned ID that is
+    already stored are skipped, so retrying a batch is safe.
+
+    Requires agent authentication with 'communicate' capability.
+
+    Args:
+        data: Communications to log
+        agent: Authenticated agent (injected)
+        service: Communication service (injected)
+
+    Returns:
+        Number of communications created and skipped as duplicates
+    """
+    created = await service.log_communications(data.communications)
+    return CommunicationBatchResult(
+        created=len(created), duplicates=len(data.communications) - len(created)
+    )
+
+
 @router.get("", response_model=list[Communication])
 async def query_communications(
     from_agent: Optional[str] = Query(None, description="Filter by source agent"),
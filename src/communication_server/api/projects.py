@@ -747,7 +747,7 @@ async def get_project_messages(
 
 async def _broadcast_project_event(_project_id: str, event: dict):
     """
-    Broadcast a project-related event to all connected WebSocket clients.
+    Broadcast a project-related event to subscribed WebSocket clients.
 
     Args:
         _project_id: Project ID (reserved for future filtering)
@@ -758,7 +758,7 @@ async def _broadcast_project_event(_project_id: str, event: dict):
 
     try:
         status_handler = get_status_handler(None)
-        await status_handler.broadcast_to_all(event)
+        await status_handler.broadcast_event(event)
     except Exception as e:
         # Log error but don't fail the request
         import logging
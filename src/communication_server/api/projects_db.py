@@ -127,7 +127,7 @@ async def verify_project_ownership(
 
 async def _broadcast_project_event(project_id: str, event: dict):
     """
-    Broadcast a project-related event to all connected WebSocket clients.
+    Broadcast a project-related event to subscribed WebSocket clients.
 
     Args:
         project_id: Project ID
@@ -137,7 +137,7 @@ async def _broadcast_project_event(project_id: str, event: dict):
 
     try:
         status_handler = get_status_handler(None)
-        await status_handler.broadcast_to_all(event)
+        await status_handler.broadcast_event(event)
     except Exception as e:
         import logging
 
@@ -77,7 +77,14 @@ class CommunicationDB(Base):
         """Create from Pydantic model."""
         import json
 
+        # Client-assigned ID and timestamp are kept when present (bulk logging)
+        optional = {
+            field: getattr(data, field)
+            for field in ("id", "created_at")
+            if getattr(data, field, None) is not None
+        }
         return cls(
+            **optional,
             from_agent=data.from_agent,
             to_agent=data.to_agent,
             message_type=data.message_type,
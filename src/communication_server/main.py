@@ -50,8 +50,11 @@ from communication_server.security.middleware import (
     RateLimitMiddleware,
     SecurityHeadersMiddleware,
 )
+from communication_server.websocket.backplane import create_backplane
+from communication_server.websocket.chat_manager import get_chat_manager
 from communication_server.websocket.handler import WebSocketHandler
 from communication_server.websocket.manager import ConnectionManager
+from communication_server.websocket.status_handler import get_status_handler
 
 # Load configuration
 config_path = os.getenv("CONFIG_PATH")
@@ -59,8 +62,15 @@ config_loader = ConfigLoader(config_path=Path(config_path)) if config_path else
 config: Config = config_loader.load()
 
 
+# Backplane carrying WebSocket broadcasts between server workers
+backplane = create_backplane(
+    config.websocket.backplane,
+    redis_url=config.websocket.redis_url,
+    channel_prefix=config.websocket.channel_prefix,
+)
+
 # Global connection manager
-connection_manager = ConnectionManager()
+connection_manager = ConnectionManager(backplane=backplane)
 
 
 @asynccontextmanager
@@ -94,9 +104,15 @@ async def lifespan(app: FastAPI):  # noqa: ARG001
         print(f"Warning: Failed to load projects from database: {e}")
         # Continue anyway - registry will operate in memory-only mode
 
+    # Attach the chat and status singletons to the backplane before it starts
+    get_chat_manager(backplane)
+    get_status_handler(connection_manager, backplane)
+    await backplane.start()
+
     yield
 
     # Shutdown
+    await backplane.close()
     await close_db()
 
 
@@ -306,9 +322,7 @@ async def websocket_status_endpoint(websocket: WebSocket, token: str | None = No
         websocket: WebSocket connection
         token: Authentication token (JWT access token or API token)
     """
-    from communication_server.websocket.status_handler import get_status_handler
-
-    handler = get_status_handler(connection_manager)
+    handler = get_status_handler(connection_manager, backplane)
     await handler.handle_connection(websocket, token)
 
 
@@ -328,7 +342,6 @@ async def websocket_chat_endpoint(websocket: WebSocket, room_id: str, token: str
     from uuid import UUID
 
     from communication_server.websocket.chat_handler import ChatWebSocketHandler
-    from communication_server.websocket.chat_manager import get_chat_manager
 
     try:
         room_uuid = UUID(room_id)
@@ -336,7 +349,7 @@ async def websocket_chat_endpoint(websocket: WebSocket, room_id: str, token: str
         await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
         return
 
-    chat_manager = get_chat_manager()
+    chat_manager = get_chat_manager(backplane)
     handler = ChatWebSocketHandler(chat_manager)
     await handler.handle_connection(websocket, room_uuid, token)
 
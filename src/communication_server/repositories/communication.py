@@ -63,6 +63,39 @@ class SQLAlchemyCommunicationRepository(CommunicationRepository):
         await self._session.flush()
         return db_comm.to_pydantic()
 
+    async def create_many(self, items: list[CommunicationCreate]) -> list[Communication]:
+        """
+        Create several communications with one flush.
+
+        Items whose client-assigned ID is already stored (or repeated
+        within the batch) are skipped, so retried batches are idempotent.
+
+        Args:
+            items: Communication creation data
+
+        Returns:
+            The newly created communications
+        """
+        ids = [item.id for item in items if item.id is not None]
+        seen: set[UUID] = set()
+        if ids:
+            result = await self._session.execute(
+                select(CommunicationDB.id).where(CommunicationDB.id.in_(ids))
+            )
+            seen.update(result.scalars().all())
+
+        db_comms = []
+        for item in items:
+            if item.id is not None:
+                if item.id in seen:
+                    continue
+                seen.add(item.id)
+            db_comms.append(CommunicationDB.from_pydantic(item))
+
+        self._session.add_all(db_comms)
+        await self._session.flush()
+        return [comm.to_pydantic() for comm in db_comms]
+
     async def update(self, id: UUID, data: dict) -> Optional[Communication]:
         """
         Update an existing communication.
@@ -7,5 +7,6 @@ agent meetings and discussions.
 
 from communication_server.websocket.handler import WebSocketHandler
 from communication_server.websocket.manager import ConnectionManager
+from communication_server.websocket.outbound import SlowConsumerPolicy
 
-__all__ = ["ConnectionManager", "WebSocketHandler"]
+__all__ = ["ConnectionManager", "SlowConsumerPolicy", "WebSocketHandler"]
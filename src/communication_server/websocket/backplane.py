@@ -0,0 +1,272 @@
+"""
+Pub/sub backplane for cross-worker WebSocket fan-out.
+
+WebSocket connections live in the worker process that accepted them.
+When the server runs several workers, a broadcast raised in one worker
+(e.g. a chat message posted over REST) must reach sockets held by the
+others. Connection managers therefore publish room broadcasts to a
+backplane once, and every worker, the publisher included, delivers the
+message to its own local sockets from its subscription.
+
+Implementations:
+- InMemoryBackplane: delivers within the current process (one worker)
+- RedisBackplane: Redis pub/sub, shared by every worker using the same
+  Redis server and channel prefix
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - exercised only without the redis extra
+    aioredis = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+BackplaneHandler = Callable[[dict], Awaitable[None]]
+
+
+class Backplane(ABC):
+    """
+    Abstract pub/sub transport for WebSocket broadcasts.
+
+    Handlers are registered per channel with subscribe() before start();
+    publish() delivers a JSON-serializable message to the handlers of
+    that channel in every process attached to the backplane.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the backplane with no subscriptions."""
+        self._handlers: dict[str, list[BackplaneHandler]] = defaultdict(list)
+
+    def subscribe(self, channel: str, handler: BackplaneHandler) -> None:
+        """
+        Register a handler for messages published on a channel.
+
+        Args:
+            channel: Channel name
+            handler: Coroutine called with each message
+        """
+        self._handlers[channel].append(handler)
+
+    @abstractmethod
+    async def publish(self, channel: str, message: dict) -> None:
+        """
+        Publish a message to every subscriber of a channel.
+
+        Args:
+            channel: Channel name
+            message: JSON-serializable message
+        """
+
+    async def start(self) -> None:  # noqa: B027 - optional hook
+        """Start receiving messages (no-op for in-process backplanes)."""
+
+    async def close(self) -> None:  # noqa: B027 - optional hook
+        """Stop receiving messages and release resources."""
+
+    async def _dispatch(self, channel: str, message: dict) -> None:
+        """
+        Deliver a message to this process's handlers for a channel.
+
+        A failing handler is logged and does not affect the others.
+
+        Args:
+            channel: Channel name
+            message: Received message
+        """
+        for handler in self._handlers.get(channel, ()):
+            try:
+                await handler(message)
+            except Exception as e:
+                logger.error(f"Backplane handler for '{channel}' failed: {e}")
+
+
+class InMemoryBackplane(Backplane):
+    """Backplane that delivers published messages within this process."""
+
+    async def publish(self, channel: str, message: dict) -> None:
+        """
+        Deliver a message to this process's subscribers.
+
+        Args:
+            channel: Channel name
+            message: JSON-serializable message
+        """
+        await self._dispatch(channel, message)
+
+
+class RedisBackplane(Backplane):
+    """
+    Backplane over Redis pub/sub for multi-worker deployments.
+
+    Every worker subscribes to "{channel_prefix}:{channel}" and receives
+    its own publications too, so each message is delivered exactly once
+    per worker. If publishing fails, the message is delivered locally
+    so the publishing worker's sockets still get it.
+
+    Attributes:
+        channel_prefix: Prefix applied to every Redis channel
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        channel_prefix: str = "agent_comm:ws",
+        client: Any = None,
+        reconnect_delay: float = 1.0,
+        start_timeout: float = 5.0,
+    ) -> None:
+        """
+        Initialize the Redis backplane.
+
+        Args:
+            redis_url: Redis connection URL (ignored if client is given)
+            channel_prefix: Prefix applied to every Redis channel
+            client: Optional pre-built redis.asyncio client (e.g. fakeredis)
+            reconnect_delay: Seconds to wait before resubscribing after an error
+            start_timeout: Seconds start() waits for the first subscription
+
+        Raises:
+            RuntimeError: If the redis package is not installed
+            ValueError: If neither redis_url nor client is provided
+        """
+        super().__init__()
+        if client is None:
+            if aioredis is None:
+                raise RuntimeError(
+                    "redis package not installed. Install with: pip install -e '.[redis]'"
+                )
+            if not redis_url:
+                raise ValueError("redis_url is required for the Redis backplane")
+            client = aioredis.from_url(redis_url, decode_responses=True)
+
+        self.channel_prefix = channel_prefix
+        self._redis = client
+        self._reconnect_delay = reconnect_delay
+        self._start_timeout = start_timeout
+        self._listener: asyncio.Task[None] | None = None
+        self._subscribed = asyncio.Event()
+
+    def subscribe(self, channel: str, handler: BackplaneHandler) -> None:
+        """
+        Register a handler for messages published on a channel.
+
+        Args:
+            channel: Channel name
+            handler: Coroutine called with each message
+
+        Raises:
+            RuntimeError: If the backplane has already been started
+        """
+        if self._listener is not None:
+            raise RuntimeError("Subscribe to the Redis backplane before starting it")
+        super().subscribe(channel, handler)
+
+    async def publish(self, channel: str, message: dict) -> None:
+        """
+        Publish a message to every worker's subscribers.
+
+        Args:
+            channel: Channel name
+            message: JSON-serializable message
+        """
+        try:
+            await self._redis.publish(self._channel_name(channel), json.dumps(message))
+        except Exception as e:
+            logger.warning(f"Backplane publish failed, delivering locally only: {e}")
+            await self._dispatch(channel, message)
+
+    async def start(self) -> None:
+        """Subscribe to every registered channel and start the listener."""
+        if self._listener is not None or not self._handlers:
+            return
+        self._listener = asyncio.create_task(self._listen())
+        # Publications made before the subscription is active would be lost
+        try:
+            await asyncio.wait_for(self._subscribed.wait(), self._start_timeout)
+        except TimeoutError:
+            logger.warning("Backplane not subscribed yet; retrying in the background")
+
+    async def close(self) -> None:
+        """Stop the listener and close the Redis client."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        await self._redis.aclose()
+
+    def _channel_name(self, channel: str) -> str:
+        """
+        Create the Redis channel name for a backplane channel.
+
+        Args:
+            channel: Backplane channel name
+
+        Returns:
+            Prefixed Redis channel name
+        """
+        return f"{self.channel_prefix}:{channel}"
+
+    async def _listen(self) -> None:
+        """Receive messages and dispatch them, resubscribing after errors."""
+        channels = {self._channel_name(channel): channel for channel in self._handlers}
+        while True:
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(*channels)
+                self._subscribed.set()
+                async for item in pubsub.listen():
+                    if item.get("type") != "message":
+                        continue
+                    channel = channels.get(item["channel"])
+                    if channel is None:
+                        continue
+                    try:
+                        message = json.loads(item["data"])
+                    except (TypeError, ValueError):
+                        logger.warning(f"Ignoring malformed backplane message on {item['channel']}")
+                        continue
+                    await self._dispatch(channel, message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Backplane subscription failed, resubscribing: {e}")
+                await asyncio.sleep(self._reconnect_delay)
+            finally:
+                with contextlib.suppress(Exception):
+                    await pubsub.aclose()
+
+
+def create_backplane(
+    backend: str = "memory",
+    redis_url: str | None = None,
+    channel_prefix: str = "agent_comm:ws",
+) -> Backplane:
+    """
+    Create a backplane from configuration.
+
+    Args:
+        backend: Backplane name ("memory" or "redis")
+        redis_url: Redis connection URL (required for "redis")
+        channel_prefix: Prefix applied to every Redis channel
+
+    Returns:
+        Configured backplane
+
+    Raises:
+        ValueError: If the backend name is unknown or redis_url is missing
+    """
+    if backend == "memory":
+        return InMemoryBackplane()
+    if backend == "redis":
+        return RedisBackplane(redis_url=redis_url, channel_prefix=channel_prefix)
+    raise ValueError(f"Unknown WebSocket backplane '{backend}'. Must be one of: memory, redis")
@@ -2,15 +2,42 @@
 WebSocket connection manager for chat rooms.
 
 Manages active WebSocket connections for chat rooms and provides
-broadcast functionality for real-time messaging.
+broadcast functionality for real-time messaging. Outgoing frames go
+through a per-connection ConnectionWriter, so a broadcast never waits
+on a slow participant. With a backplane, broadcasts are published once
+and every worker delivers them to its own connections.
+
+Typing indicators are aggregated per room: clients report typing on
+every keystroke, but only state changes are forwarded, and each room
+gets at most one "who is typing" frame per window.
 """
 
+import asyncio
 from collections import defaultdict
+from collections.abc import Hashable
 from uuid import UUID
 
 from fastapi import WebSocket
 
 from agent_comm_core.models.auth import Agent, User
+from communication_server.websocket.backplane import Backplane
+from communication_server.websocket.outbound import (
+    CoalesceKey,
+    ConnectionWriter,
+    OutboundStats,
+    SlowConsumerPolicy,
+    encode_frame,
+)
+
+# Backplane channel carrying chat room broadcasts
+CHAT_CHANNEL = "chat"
+
+
+def _coalesce_chat_frame(message: dict) -> Hashable | None:
+    """Coalesce typing frames; each carries the room's full typing state."""
+    if message.get("event") == "chat.typing":
+        return "chat.typing"
+    return None
 
 
 class ChatConnectionManager:
@@ -21,8 +48,36 @@ class ChatConnectionManager:
     for broadcasting messages to all participants.
     """
 
-    def __init__(self) -> None:
-        """Initialize the chat connection manager."""
+    def __init__(
+        self,
+        max_queue: int = 256,
+        policy: SlowConsumerPolicy = SlowConsumerPolicy.COALESCE,
+        coalesce_key: CoalesceKey | None = _coalesce_chat_frame,
+        backplane: Backplane | None = None,
+        typing_window: float = 0.25,
+        typing_ttl: float = 5.0,
+    ) -> None:
+        """
+        Initialize the chat connection manager.
+
+        Args:
+            max_queue: Outbound frames held per connection
+            policy: What to do when a connection's outbound queue is full
+            coalesce_key: Key function for the COALESCE policy
+            backplane: Pub/sub backplane for cross-worker broadcasts
+                (None delivers to this process's connections only)
+            typing_window: Seconds typing changes are collected before a
+                room's typing frame is sent
+            typing_ttl: Seconds a typing flag lasts without a refresh
+        """
+        self._max_queue = max_queue
+        self._policy = policy
+        self._coalesce_key = coalesce_key
+        self._backplane = backplane
+        self._typing_window = typing_window
+        self._typing_ttl = typing_ttl
+        if backplane is not None:
+            backplane.subscribe(CHAT_CHANNEL, self._deliver)
         # Map room_id -> set of active connections
         self._room_connections: dict[UUID, set[WebSocket]] = defaultdict(set)
         # Map connection -> room_id
@@ -31,8 +86,20 @@ class ChatConnectionManager:
         self._connection_auth: dict[WebSocket, User | Agent] = {}
         # Map room_id -> set of authenticated users/agents
         self._room_participants: dict[UUID, set[User | Agent]] = defaultdict(set)
-        # Map room_id -> typing indicators {sender_id: is_typing}
-        self._typing_indicators: dict[UUID, dict[UUID, bool]] = defaultdict(dict)
+        # Map room_id -> senders currently typing {sender_id: sender_type}
+        self._typing_indicators: dict[UUID, dict[UUID, str]] = defaultdict(dict)
+        # Map room_id -> sender_id -> timer expiring its typing flag
+        self._typing_expiry: dict[UUID, dict[UUID, asyncio.TimerHandle]] = defaultdict(dict)
+        # Map room_id -> pending typing frame
+        self._typing_flushes: dict[UUID, asyncio.TimerHandle] = {}
+        # Map room_id -> sender IDs in the last typing frame sent
+        self._typing_sent: dict[UUID, tuple[UUID, ...]] = {}
+        # Map room_id -> sender_id -> loop time its typing was last forwarded
+        self._typing_forwarded: dict[UUID, dict[UUID, float]] = defaultdict(dict)
+        # Map connection -> outbound writer
+        self._writers: dict[WebSocket, ConnectionWriter] = {}
+        # Map room_id -> outbound delivery counters
+        self._room_stats: dict[UUID, OutboundStats] = defaultdict(OutboundStats)
 
     async def connect(
         self,
@@ -51,6 +118,14 @@ class ChatConnectionManager:
         await websocket.accept()
         self._room_connections[room_id].add(websocket)
         self._connection_rooms[websocket] = room_id
+        self._writers[websocket] = ConnectionWriter(
+            websocket,
+            self._room_stats[room_id],
+            self.disconnect,
+            max_queue=self._max_queue,
+            policy=self._policy,
+            coalesce_key=self._coalesce_key,
+        )
         if auth:
             self._connection_auth[websocket] = auth
             self._room_participants[room_id].add(auth)
@@ -63,6 +138,9 @@ class ChatConnectionManager:
             websocket: WebSocket connection
         """
         room_id = self._connection_rooms.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer:
+            writer.close()
         if room_id:
             self._room_connections[room_id].discard(websocket)
             # Remove auth info
@@ -73,7 +151,8 @@ class ChatConnectionManager:
             if not self._room_connections[room_id]:
                 del self._room_connections[room_id]
                 self._room_participants.pop(room_id, None)
-                self._typing_indicators.pop(room_id, None)
+                self._room_stats.pop(room_id, None)
+                self._clear_typing(room_id)
 
     def get_auth(self, websocket: WebSocket) -> User | Agent | None:
         """
@@ -191,7 +270,13 @@ class ChatConnectionManager:
         is_typing: bool,
     ) -> None:
         """
-        Broadcast typing indicator to room.
+        Report a sender's typing state to the room.
+
+        Repeated reports of the same state are dropped, except that an
+        ongoing typing flag is refreshed every half typing_ttl so it does
+        not expire. The room then receives one "chat.typing" frame per
+        typing_window listing everyone typing:
+        {"typing": [{"sender_id": ..., "sender_type": ...}, ...]}.
 
         Args:
             room_id: Room ID
@@ -199,56 +284,197 @@ class ChatConnectionManager:
             sender_type: Sender type (user or agent)
             is_typing: Whether currently typing
         """
-        # Update typing state
-        self._typing_indicators[room_id][sender_id] = is_typing
+        now = asyncio.get_running_loop().time()
+        forwarded = self._typing_forwarded[room_id]
+        if is_typing:
+            last = forwarded.get(sender_id)
+            if last is not None and now - last < self._typing_ttl / 2:
+                return
+            forwarded[sender_id] = now
+        elif forwarded.pop(sender_id, None) is None:
+            return
+
+        update = {
+            "sender_id": str(sender_id),
+            "sender_type": sender_type,
+            "is_typing": is_typing,
+        }
+        if self._backplane is not None:
+            await self._backplane.publish(CHAT_CHANNEL, {"room_id": str(room_id), "typing": update})
+            return
+        self._apply_typing(room_id, update)
+
+    def get_typing_indicators(self, room_id: UUID) -> dict[UUID, bool]:
+        """
+        Get active typing indicators for a room.
+
+        Args:
+            room_id: Room ID
+
+        Returns:
+            Dictionary mapping sender_id to is_typing
+        """
+        return dict.fromkeys(self._typing_indicators.get(room_id, {}), True)
+
+    def _apply_typing(self, room_id: UUID, update: dict) -> None:
+        """
+        Record a typing state change and schedule the room's typing frame.
+
+        Args:
+            room_id: Room ID
+            update: sender_id, sender_type and is_typing
+        """
+        if room_id not in self._room_connections:
+            return
+        sender_id = UUID(update["sender_id"])
+        typing = self._typing_indicators[room_id]
+        timers = self._typing_expiry[room_id]
+        timer = timers.pop(sender_id, None)
+        if timer:
+            timer.cancel()
+
+        if update["is_typing"]:
+            typing[sender_id] = update["sender_type"]
+            timers[sender_id] = asyncio.get_running_loop().call_later(
+                self._typing_ttl, self._expire_typing, room_id, sender_id
+            )
+        else:
+            typing.pop(sender_id, None)
+        self._schedule_typing_flush(room_id)
+
+    def _expire_typing(self, room_id: UUID, sender_id: UUID) -> None:
+        """
+        Clear a typing flag that was not refreshed within typing_ttl.
+
+        Args:
+            room_id: Room ID
+            sender_id: Sender UUID
+        """
+        self._typing_expiry.get(room_id, {}).pop(sender_id, None)
+        if self._typing_indicators.get(room_id, {}).pop(sender_id, None) is not None:
+            self._schedule_typing_flush(room_id)
+
+    def _schedule_typing_flush(self, room_id: UUID) -> None:
+        """
+        Send the room's typing frame at the end of the current window.
+
+        Args:
+            room_id: Room ID
+        """
+        if room_id not in self._typing_flushes:
+            self._typing_flushes[room_id] = asyncio.get_running_loop().call_later(
+                self._typing_window, self._flush_typing, room_id
+            )
+
+    def _flush_typing(self, room_id: UUID) -> None:
+        """
+        Send the room's typing state to this worker's connections.
+
+        Nothing is sent if the state is what the room last received.
+
+        Args:
+            room_id: Room ID
+        """
+        self._typing_flushes.pop(room_id, None)
+        typing = self._typing_indicators.get(room_id, {})
+        senders = tuple(typing)
+        if senders == self._typing_sent.get(room_id, ()):
+            return
+        self._typing_sent[room_id] = senders
 
         message_data = {
             "event": "chat.typing",
             "room_id": str(room_id),
             "data": {
-                "sender_id": str(sender_id),
-                "sender_type": sender_type,
-                "is_typing": is_typing,
+                "typing": [
+                    {"sender_id": str(sender_id), "sender_type": sender_type}
+                    for sender_id, sender_type in typing.items()
+                ],
             },
         }
-        await self._broadcast_to_room(room_id, message_data)
+        self._fan_out(room_id, message_data)
 
-    def get_typing_indicators(self, room_id: UUID) -> dict[UUID, bool]:
+    def _clear_typing(self, room_id: UUID) -> None:
         """
-        Get active typing indicators for a room.
+        Drop a room's typing state and cancel its timers.
 
         Args:
             room_id: Room ID
-
-        Returns:
-            Dictionary mapping sender_id to is_typing
         """
-        return self._typing_indicators.get(room_id, {}).copy()
+        flush = self._typing_flushes.pop(room_id, None)
+        if flush:
+            flush.cancel()
+        for timer in self._typing_expiry.pop(room_id, {}).values():
+            timer.cancel()
+        self._typing_indicators.pop(room_id, None)
+        self._typing_sent.pop(room_id, None)
+        self._typing_forwarded.pop(room_id, None)
 
     async def _broadcast_to_room(self, room_id: UUID, message: dict) -> None:
         """
         Internal method to broadcast to all connections in a room.
 
+        With a backplane the message is published once and each worker
+        delivers it to its own connections. Delivery encodes the message
+        once and queues the frame per connection; this does not wait for
+        it to be sent.
+
         Args:
             room_id: Room ID
             message: Message dictionary to broadcast
         """
+        if self._backplane is not None:
+            await self._backplane.publish(
+                CHAT_CHANNEL, {"room_id": str(room_id), "message": message}
+            )
+            return
+        self._fan_out(room_id, message)
+
+    async def _deliver(self, envelope: dict) -> None:
+        """
+        Deliver a backplane broadcast to this worker's connections.
+
+        Args:
+            envelope: Published room_id and either a message or a
+                typing update
+        """
+        room_id = UUID(envelope["room_id"])
+        if "typing" in envelope:
+            self._apply_typing(room_id, envelope["typing"])
+            return
+        self._fan_out(room_id, envelope["message"])
+
+    def _fan_out(self, room_id: UUID, message: dict) -> None:
+        """
+        Encode a message once and queue the frame for each room connection.
+
+        Args:
+            room_id: Room ID
+            message: Message dictionary to send
+        """
         connections = self._room_connections.get(room_id, set()).copy()
+        if not connections:
+            return
+        frame = encode_frame(message)
+        key = self._coalesce_key(message) if self._coalesce_key else None
         for connection in connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                # Remove failed connection
-                self.disconnect(connection)
+            self._writers[connection].send_frame(frame, key)
 
     async def send_personal_message(self, message: dict, websocket: WebSocket) -> None:
         """
         Send a message to a specific connection.
 
+        Connected sockets get the message through their outbound queue,
+        behind anything already broadcast to them.
+
         Args:
             message: Message dictionary to send
             websocket: Target WebSocket connection
         """
+        writer = self._writers.get(websocket)
+        if writer:
+            writer.send(message)
+            return
         try:
             await websocket.send_json(message)
         except Exception:
@@ -267,6 +493,32 @@ class ChatConnectionManager:
         """
         return len(self._room_connections.get(room_id, set()))
 
+    def get_queue_stats(self, room_id: UUID) -> dict[str, int]:
+        """
+        Get outbound queue metrics for a room.
+
+        Args:
+            room_id: Room ID
+
+        Returns:
+            Dictionary with connections, queued, max_queue_depth, sent,
+            dropped, coalesced and disconnected
+        """
+        depths = [
+            self._writers[connection].depth
+            for connection in self._room_connections.get(room_id, set())
+        ]
+        stats = self._room_stats.get(room_id, OutboundStats())
+        return {
+            "connections": len(depths),
+            "queued": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "sent": stats.sent,
+            "dropped": stats.dropped,
+            "coalesced": stats.coalesced,
+            "disconnected": stats.disconnected,
+        }
+
     def get_room_for_connection(self, websocket: WebSocket) -> UUID | None:
         """
         Get the room ID for a connection.
@@ -296,14 +548,17 @@ class ChatConnectionManager:
 _chat_manager: ChatConnectionManager | None = None
 
 
-def get_chat_manager() -> ChatConnectionManager:
+def get_chat_manager(backplane: Backplane | None = None) -> ChatConnectionManager:
     """
     Get the global chat connection manager instance.
 
+    Args:
+        backplane: Backplane for the instance if it is created by this call
+
     Returns:
         ChatConnectionManager instance
     """
     global _chat_manager
     if _chat_manager is None:
-        _chat_manager = ChatConnectionManager()
+        _chat_manager = ChatConnectionManager(backplane=backplane)
     return _chat_manager
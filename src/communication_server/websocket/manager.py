@@ -2,16 +2,39 @@
 WebSocket connection manager for meeting participants.
 
 Manages active WebSocket connections per meeting and provides
-broadcast functionality for real-time communication.
+broadcast functionality for real-time communication. Outgoing frames
+go through a per-connection ConnectionWriter, so a broadcast never
+waits on a slow participant. With a backplane, broadcasts are published
+once and every worker delivers them to its own connections.
 """
 
 from collections import defaultdict
+from collections.abc import Hashable
 from typing import Dict, Set, Union, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import WebSocket
 
 from agent_comm_core.models.auth import Agent, User
+from communication_server.websocket.backplane import Backplane
+from communication_server.websocket.outbound import (
+    CoalesceKey,
+    ConnectionWriter,
+    OutboundStats,
+    SlowConsumerPolicy,
+    encode_frame,
+)
+
+
+# Backplane channel carrying meeting broadcasts
+MEETING_CHANNEL = "meetings"
+
+
+def _coalesce_meeting_frame(message: dict) -> Hashable | None:
+    """Coalesce state syncs; a newer snapshot supersedes a queued one."""
+    if message.get("type") == "state_sync":
+        return "state_sync"
+    return None
 
 
 class ConnectionManager:
@@ -22,8 +45,29 @@ class ConnectionManager:
     for broadcasting messages to all participants.
     """
 
-    def __init__(self) -> None:
-        """Initialize the connection manager."""
+    def __init__(
+        self,
+        max_queue: int = 256,
+        policy: SlowConsumerPolicy = SlowConsumerPolicy.DROP_OLDEST,
+        coalesce_key: CoalesceKey | None = _coalesce_meeting_frame,
+        backplane: Backplane | None = None,
+    ) -> None:
+        """
+        Initialize the connection manager.
+
+        Args:
+            max_queue: Outbound frames held per connection
+            policy: What to do when a connection's outbound queue is full
+            coalesce_key: Key function for the COALESCE policy
+            backplane: Pub/sub backplane for cross-worker broadcasts
+                (None delivers to this process's connections only)
+        """
+        self._max_queue = max_queue
+        self._policy = policy
+        self._coalesce_key = coalesce_key
+        self._backplane = backplane
+        if backplane is not None:
+            backplane.subscribe(MEETING_CHANNEL, self._deliver)
         # Map meeting_id -> set of active connections
         self._meeting_connections: Dict[UUID, Set[WebSocket]] = defaultdict(set)
         # Map connection -> meeting_id
@@ -32,6 +76,12 @@ class ConnectionManager:
         self._connection_auth: Dict[WebSocket, Union[User, Agent]] = {}
         # Map meeting_id -> set of authenticated users/agents
         self._meeting_participants: Dict[UUID, Set[Union[User, Agent]]] = defaultdict(set)
+        # Map connection -> outbound writer
+        self._writers: Dict[WebSocket, ConnectionWriter] = {}
+        # Map meeting_id -> outbound delivery counters
+        self._meeting_stats: Dict[UUID, OutboundStats] = defaultdict(OutboundStats)
+        # Map connection -> ID naming it in backplane broadcasts
+        self._connection_ids: Dict[WebSocket, str] = {}
 
     async def connect(
         self,
@@ -50,6 +100,15 @@ class ConnectionManager:
         await websocket.accept()
         self._meeting_connections[meeting_id].add(websocket)
         self._connection_meetings[websocket] = meeting_id
+        self._connection_ids[websocket] = uuid4().hex
+        self._writers[websocket] = ConnectionWriter(
+            websocket,
+            self._meeting_stats[meeting_id],
+            self.disconnect,
+            max_queue=self._max_queue,
+            policy=self._policy,
+            coalesce_key=self._coalesce_key,
+        )
         if auth:
             self._connection_auth[websocket] = auth
             self._meeting_participants[meeting_id].add(auth)
@@ -62,6 +121,10 @@ class ConnectionManager:
             websocket: WebSocket connection
         """
         meeting_id = self._connection_meetings.pop(websocket, None)
+        self._connection_ids.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer:
+            writer.close()
         if meeting_id:
             self._meeting_connections[meeting_id].discard(websocket)
             # Remove auth info
@@ -72,6 +135,7 @@ class ConnectionManager:
             if not self._meeting_connections[meeting_id]:
                 del self._meeting_connections[meeting_id]
                 self._meeting_participants.pop(meeting_id, None)
+                self._meeting_stats.pop(meeting_id, None)
 
     def get_auth(self, websocket: WebSocket) -> Optional[Union[User, Agent]]:
         """
@@ -101,10 +165,17 @@ class ConnectionManager:
         """
         Send a message to a specific connection.
 
+        Connected sockets get the message through their outbound queue,
+        behind anything already broadcast to them.
+
         Args:
             message: Message dictionary to send
             websocket: Target WebSocket connection
         """
+        writer = self._writers.get(websocket)
+        if writer:
+            writer.send(message)
+            return
         try:
             await websocket.send_json(message)
         except Exception:
@@ -115,17 +186,16 @@ class ConnectionManager:
         """
         Broadcast a message to all connections in a meeting.
 
+        With a backplane the message is published once and each worker
+        delivers it to its own connections. Delivery encodes the message
+        once and queues the frame per connection; this does not wait for
+        it to be sent.
+
         Args:
             meeting_id: Meeting ID
             message: Message dictionary to broadcast
         """
-        connections = self._meeting_connections.get(meeting_id, set()).copy()
-        for connection in connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                # Remove failed connection
-                self.disconnect(connection)
+        await self._publish(meeting_id, message)
 
     async def broadcast_to_meeting_excluding(
         self, meeting_id: UUID, message: dict, exclude: WebSocket
@@ -138,14 +208,59 @@ class ConnectionManager:
             message: Message dictionary to broadcast
             exclude: WebSocket to exclude from broadcast
         """
-        connections = self._meeting_connections.get(meeting_id, set()).copy()
+        await self._publish(meeting_id, message, exclude)
+
+    async def _publish(
+        self, meeting_id: UUID, message: dict, exclude: WebSocket | None = None
+    ) -> None:
+        """
+        Send a broadcast to the meeting's connections on every worker.
+
+        Args:
+            meeting_id: Meeting ID
+            message: Message dictionary to broadcast
+            exclude: WebSocket to exclude from broadcast (optional)
+        """
+        if self._backplane is None:
+            connections = self._meeting_connections.get(meeting_id, set()) - {exclude}
+            self._fan_out(connections, message)
+            return
+        await self._backplane.publish(
+            MEETING_CHANNEL,
+            {
+                "meeting_id": str(meeting_id),
+                "message": message,
+                "exclude": self._connection_ids.get(exclude) if exclude else None,
+            },
+        )
+
+    async def _deliver(self, envelope: dict) -> None:
+        """
+        Deliver a backplane broadcast to this worker's connections.
+
+        Args:
+            envelope: Published meeting_id, message and excluded connection ID
+        """
+        connections = set(self._meeting_connections.get(UUID(envelope["meeting_id"]), ()))
+        exclude = envelope.get("exclude")
+        if exclude:
+            connections = {c for c in connections if self._connection_ids.get(c) != exclude}
+        self._fan_out(connections, envelope["message"])
+
+    def _fan_out(self, connections: Set[WebSocket], message: dict) -> None:
+        """
+        Encode a message once and queue the frame for each connection.
+
+        Args:
+            connections: Target WebSocket connections
+            message: Message dictionary to send
+        """
+        if not connections:
+            return
+        frame = encode_frame(message)
+        key = self._coalesce_key(message) if self._coalesce_key else None
         for connection in connections:
-            if connection != exclude:
-                try:
-                    await connection.send_json(message)
-                except Exception:
-                    # Remove failed connection
-                    self.disconnect(connection)
+            self._writers[connection].send_frame(frame, key)
 
     def get_connection_count(self, meeting_id: UUID) -> int:
         """
@@ -159,6 +274,32 @@ class ConnectionManager:
         """
         return len(self._meeting_connections.get(meeting_id, set()))
 
+    def get_queue_stats(self, meeting_id: UUID) -> dict[str, int]:
+        """
+        Get outbound queue metrics for a meeting.
+
+        Args:
+            meeting_id: Meeting ID
+
+        Returns:
+            Dictionary with connections, queued, max_queue_depth, sent,
+            dropped, coalesced and disconnected
+        """
+        depths = [
+            self._writers[connection].depth
+            for connection in self._meeting_connections.get(meeting_id, set())
+        ]
+        stats = self._meeting_stats.get(meeting_id, OutboundStats())
+        return {
+            "connections": len(depths),
+            "queued": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "sent": stats.sent,
+            "dropped": stats.dropped,
+            "coalesced": stats.coalesced,
+            "disconnected": stats.disconnected,
+        }
+
     def get_meeting_for_connection(self, websocket: WebSocket) -> UUID | None:
         """
         Get the meeting ID for a connection.
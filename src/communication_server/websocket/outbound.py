@@ -0,0 +1,232 @@
+"""
+Per-connection outbound queues for WebSocket connection managers.
+
+Each connection gets a bounded queue drained by its own writer task,
+so broadcasting only enqueues frames and never awaits network I/O. A
+slow or half-dead client fills its own queue instead of stalling
+delivery to everyone else in the room; what happens then is decided
+by a SlowConsumerPolicy.
+
+Frames are queued pre-encoded: a broadcast serializes its message once
+with encode_frame() and hands the same text to every connection. orjson
+is used for encoding when installed (the "fast" extra).
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections import deque
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from enum import Enum
+
+from fastapi import WebSocket, status
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the fast extra
+    orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Returns a key for frames that supersede earlier frames with the same key
+# (e.g. typing indicators), or None for frames that must all be delivered
+CoalesceKey = Callable[[dict], Hashable | None]
+
+
+def encode_frame(message: dict) -> str:
+    """Serialize a message into a text frame, as WebSocket.send_json would.
+
+    Args:
+        message: JSON-serializable message
+
+    Returns:
+        Compact JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(message).decode()
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+class SlowConsumerPolicy(str, Enum):
+    """What to do when a connection's outbound queue is full."""
+
+    # Drop the oldest queued frame to make room
+    DROP_OLDEST = "drop_oldest"
+    # Replace a queued frame with the same coalesce key; otherwise drop oldest
+    COALESCE = "coalesce"
+    # Close the connection so the client reconnects and resyncs
+    DISCONNECT = "disconnect"
+
+
+@dataclass
+class OutboundStats:
+    """Delivery counters shared by all connections in one room."""
+
+    sent: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    disconnected: int = 0
+
+
+class ConnectionWriter:
+    """
+    Bounded outbound queue and writer task for one WebSocket.
+
+    Attributes:
+        max_queue: Frames held before the slow-consumer policy applies
+        policy: Slow-consumer policy
+        stats: Counters shared with the connection's room
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        stats: OutboundStats,
+        on_failure: Callable[[WebSocket], None],
+        max_queue: int = 256,
+        policy: SlowConsumerPolicy = SlowConsumerPolicy.DROP_OLDEST,
+        coalesce_key: CoalesceKey | None = None,
+        close_timeout: float = 5.0,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            websocket: Connection to write to
+            stats: Counters shared with the connection's room
+            on_failure: Called with the websocket when a send fails or the
+                connection is evicted as a slow consumer
+            max_queue: Frames held before the slow-consumer policy applies
+            policy: Slow-consumer policy
+            coalesce_key: Key function used by the COALESCE policy
+            close_timeout: Seconds close() lets the writer drain queued frames
+        """
+        self.max_queue = max_queue
+        self.policy = policy
+        self.stats = stats
+        self._websocket = websocket
+        self._on_failure = on_failure
+        self._coalesce_key = coalesce_key
+        self._close_timeout = close_timeout
+
+        # Frames are [key, text] so coalescing can replace a frame in place
+        self._frames: deque[list] = deque()
+        self._keyed: dict[Hashable, list] = {}
+        self._ready = asyncio.Event()
+        self._closed = False
+        self._task = asyncio.create_task(self._run())
+
+    @property
+    def depth(self) -> int:
+        """Number of frames waiting to be sent."""
+        return len(self._frames)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the writer has stopped accepting frames."""
+        return self._closed
+
+    def send(self, message: dict) -> bool:
+        """Encode and queue a message for this connection only.
+
+        Args:
+            message: JSON-serializable message
+
+        Returns:
+            False if the writer is closed or the connection was evicted
+        """
+        key = self._coalesce_key(message) if self._coalesce_key else None
+        return self.send_frame(encode_frame(message), key)
+
+    def send_frame(self, text: str, key: Hashable | None = None) -> bool:
+        """Queue a pre-encoded frame without awaiting network I/O.
+
+        Args:
+            text: Frame from encode_frame()
+            key: Coalesce key of the encoded message, if any
+
+        Returns:
+            False if the writer is closed or the connection was evicted
+        """
+        if self._closed:
+            return False
+
+        if self.policy is not SlowConsumerPolicy.COALESCE:
+            key = None
+        if key is not None:
+            frame = self._keyed.get(key)
+            if frame is not None:
+                frame[1] = text
+                self.stats.coalesced += 1
+                return True
+
+        if len(self._frames) >= self.max_queue:
+            if self.policy is SlowConsumerPolicy.DISCONNECT:
+                self._evict()
+                return False
+            self._forget(self._frames.popleft())
+            self.stats.dropped += 1
+
+        frame = [key, text]
+        self._frames.append(frame)
+        if key is not None:
+            self._keyed[key] = frame
+        self._ready.set()
+        return True
+
+    def close(self) -> None:
+        """Stop accepting frames and let the writer drain what is queued.
+
+        The writer is cancelled if draining takes longer than close_timeout.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._ready.set()
+        if not self._task.done():
+            asyncio.get_running_loop().call_later(self._close_timeout, self._task.cancel)
+
+    def _forget(self, frame: list) -> None:
+        """Drop a frame's coalesce entry once it leaves the queue."""
+        key = frame[0]
+        if key is not None and self._keyed.get(key) is frame:
+            del self._keyed[key]
+
+    def _evict(self) -> None:
+        """Drop a slow consumer and ask its client to reconnect."""
+        self._closed = True
+        self._frames.clear()
+        self._keyed.clear()
+        self._task.cancel()
+        self.stats.disconnected += 1
+        logger.warning(f"Disconnecting slow WebSocket consumer ({self.max_queue} frames queued)")
+        self._on_failure(self._websocket)
+        self._task = asyncio.create_task(self._close_socket())
+
+    async def _close_socket(self) -> None:
+        """Close the evicted connection, ignoring already-closed sockets."""
+        with contextlib.suppress(Exception):
+            await self._websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+
+    async def _run(self) -> None:
+        """Send queued frames in order until closed and drained."""
+        while True:
+            while not self._frames:
+                if self._closed:
+                    return
+                self._ready.clear()
+                await self._ready.wait()
+
+            frame = self._frames.popleft()
+            self._forget(frame)
+            try:
+                await self._websocket.send_text(frame[1])
+            except Exception:
+                # Connection is gone; queued frames cannot be delivered
+                self._closed = True
+                self._frames.clear()
+                self._keyed.clear()
+                self._on_failure(self._websocket)
+                return
+            self.stats.sent += 1
@@ -2,7 +2,11 @@
 WebSocket handler for real-time status board updates.
 
 Provides WebSocket endpoint for live updates on agent status,
-new communications, and meeting events.
+new communications, and meeting events. Subscribers can narrow what
+they receive by event type, project and agent; events are routed
+through a SubscriptionIndex so only matching subscribers are sent to.
+With a backplane, events are published once and every worker sends
+them to its own subscribers.
 """
 
 import json
@@ -12,10 +16,16 @@ from fastapi import WebSocket, WebSocketDisconnect
 
 from agent_comm_core.models.auth import Agent, User
 from communication_server.websocket.auth import WebSocketAuth, get_token_from_query
+from communication_server.websocket.backplane import Backplane
 from communication_server.websocket.manager import ConnectionManager
+from communication_server.websocket.outbound import encode_frame
+from communication_server.websocket.subscriptions import SubscriptionIndex
 
 logger = logging.getLogger(__name__)
 
+# Backplane channel carrying status board events
+STATUS_CHANNEL = "status"
+
 
 class StatusWebSocketHandler:
     """
@@ -26,15 +36,23 @@ class StatusWebSocketHandler:
     and meeting events.
     """
 
-    def __init__(self, connection_manager: ConnectionManager) -> None:
+    def __init__(
+        self, connection_manager: ConnectionManager, backplane: Backplane | None = None
+    ) -> None:
         """
         Initialize the status WebSocket handler.
 
         Args:
             connection_manager: Connection manager for WebSocket connections
+            backplane: Pub/sub backplane for cross-worker broadcasts
+                (None delivers to this process's subscribers only)
         """
         self._connection_manager = connection_manager
-        self._status_subscribers: set[WebSocket] = set()
+        self._backplane = backplane
+        if backplane is not None:
+            backplane.subscribe(STATUS_CHANNEL, self._deliver)
+        # Subscribers indexed by the event types, projects and agents they follow
+        self._subscriptions = SubscriptionIndex()
         # Track authentication for subscribers
         self._subscriber_auth: dict[WebSocket, User | Agent] = {}
 
@@ -63,7 +81,8 @@ class StatusWebSocketHandler:
                 return
 
         await websocket.accept()
-        self._status_subscribers.add(websocket)
+        # New subscribers get every event until they send filters
+        self._subscriptions.subscribe(websocket)
         if auth:
             self._subscriber_auth[websocket] = auth
 
@@ -91,7 +110,7 @@ class StatusWebSocketHandler:
         except Exception as e:
             logger.error(f"Error in status WebSocket: {e}")
         finally:
-            self._status_subscribers.discard(websocket)
+            self._subscriptions.unsubscribe(websocket)
             self._subscriber_auth.pop(websocket, None)
 
     def _get_participant_name(self, auth: User | Agent | None) -> str:
@@ -129,12 +148,19 @@ class StatusWebSocketHandler:
             if msg_type == "ping":
                 await websocket.send_json({"type": "pong", "timestamp": _get_timestamp()})
             elif msg_type == "subscribe":
-                # Client wants specific events (can be extended)
+                # Replace the client's filters; empty filters mean every event
+                try:
+                    self._subscriptions.subscribe(websocket, data.get("filters"))
+                except ValueError as e:
+                    await websocket.send_json(
+                        {"type": "error", "message": str(e), "timestamp": _get_timestamp()}
+                    )
+                    return
                 participant_name = self._get_participant_name(auth)
                 await websocket.send_json(
                     {
                         "type": "subscribed",
-                        "filters": data.get("filters", {}),
+                        "filters": self._subscriptions.get_filters(websocket),
                         "participant": participant_name,
                         "timestamp": _get_timestamp(),
                     }
@@ -149,7 +175,7 @@ class StatusWebSocketHandler:
         self, agent_id: str, old_status: str, new_status: str
     ) -> None:
         """
-        Broadcast agent status change to all subscribers.
+        Broadcast agent status change to matching subscribers.
 
         Args:
             agent_id: Display agent ID
@@ -165,7 +191,7 @@ class StatusWebSocketHandler:
             },
             "timestamp": _get_timestamp(),
         }
-        await self._broadcast_to_all(message)
+        await self.broadcast_event(message)
 
     async def broadcast_new_communication(
         self, from_agent: str, to_agent: str, message_type: str
@@ -187,7 +213,7 @@ class StatusWebSocketHandler:
             },
             "timestamp": _get_timestamp(),
         }
-        await self._broadcast_to_all(message)
+        await self.broadcast_event(message)
 
     async def broadcast_meeting_event(self, meeting_id: str, event_type: str, data: dict) -> None:
         """
@@ -203,7 +229,7 @@ class StatusWebSocketHandler:
             "data": {"meeting_id": meeting_id, "event_type": event_type, **data},
             "timestamp": _get_timestamp(),
         }
-        await self._broadcast_to_all(message)
+        await self.broadcast_event(message)
 
     async def broadcast_agent_registered(self, agent_id: str, nickname: str) -> None:
         """
@@ -218,7 +244,7 @@ class StatusWebSocketHandler:
             "data": {"agent_id": agent_id, "nickname": nickname},
             "timestamp": _get_timestamp(),
         }
-        await self._broadcast_to_all(message)
+        await self.broadcast_event(message)
 
     async def broadcast_agent_unregistered(self, agent_id: str) -> None:
         """
@@ -232,26 +258,53 @@ class StatusWebSocketHandler:
             "data": {"agent_id": agent_id},
             "timestamp": _get_timestamp(),
         }
-        await self._broadcast_to_all(message)
+        await self.broadcast_event(message)
 
-    async def _broadcast_to_all(self, message: dict) -> None:
+    async def broadcast_event(self, message: dict) -> None:
         """
-        Broadcast a message to all connected subscribers.
+        Broadcast an event to the subscribers whose filters match it.
+
+        The event type is the message "type"; the project is its
+        "project_id"; agents are the "agent_id", "from_agent" and
+        "to_agent" fields of its "data".
 
         Args:
-            message: Message to broadcast
+            message: Event to broadcast
         """
+        if self._backplane is not None:
+            await self._backplane.publish(STATUS_CHANNEL, message)
+            return
+        await self._deliver(message)
+
+    async def _deliver(self, message: dict) -> None:
+        """
+        Send an event to this worker's matching subscribers.
+
+        Args:
+            message: Event to send
+        """
+        data = message.get("data") or {}
+        recipients = self._subscriptions.match(
+            message.get("type"),
+            message.get("project_id"),
+            (data.get(key) for key in _AGENT_FIELDS),
+        )
+        if not recipients:
+            return
+
         disconnected = set()
+        # Encode once for every subscriber instead of once per send_json
+        frame = encode_frame(message)
 
-        for websocket in self._status_subscribers:
+        for websocket in recipients:
             try:
-                await websocket.send_json(message)
+                await websocket.send_text(frame)
             except Exception:
                 disconnected.add(websocket)
 
         # Clean up disconnected clients
         for websocket in disconnected:
-            self._status_subscribers.discard(websocket)
+            self._subscriptions.unsubscribe(websocket)
 
     def get_subscriber_count(self) -> int:
         """
@@ -260,7 +313,11 @@ class StatusWebSocketHandler:
         Returns:
             Number of connected WebSocket clients
         """
-        return len(self._status_subscribers)
+        return len(self._subscriptions)
+
+
+# Event data fields naming the agents an event concerns
+_AGENT_FIELDS = ("agent_id", "from_agent", "to_agent")
 
 
 def _get_timestamp() -> str:
@@ -279,17 +336,20 @@ def _get_timestamp() -> str:
 _status_handler: StatusWebSocketHandler | None = None
 
 
-def get_status_handler(connection_manager: ConnectionManager) -> StatusWebSocketHandler:
+def get_status_handler(
+    connection_manager: ConnectionManager, backplane: Backplane | None = None
+) -> StatusWebSocketHandler:
     """
     Get or create the status WebSocket handler.
 
     Args:
         connection_manager: Connection manager for WebSocket connections
+        backplane: Backplane for the handler if it is created by this call
 
     Returns:
         The StatusWebSocketHandler instance
     """
     global _status_handler
     if _status_handler is None:
-        _status_handler = StatusWebSocketHandler(connection_manager)
+        _status_handler = StatusWebSocketHandler(connection_manager, backplane)
     return _status_handler
@@ -0,0 +1,177 @@
+"""
+Subscription index for status board WebSocket subscribers.
+
+Subscribers narrow the events they receive with filters on event type,
+project ID and agent ID. The index keeps, per filter dimension, the
+subscribers listening for each value plus those with no filter on that
+dimension, so a broadcast looks up its recipients instead of testing
+every subscriber.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+
+from fastapi import WebSocket
+
+# Filter keys accepted from clients, one per indexed event attribute
+FILTER_DIMENSIONS = ("event_types", "project_ids", "agent_ids")
+
+
+def normalize_filters(filters: dict | None) -> dict[str, frozenset[str]]:
+    """
+    Validate subscription filters from a client.
+
+    Each filter is a string or a list of strings; missing or empty
+    filters match everything.
+
+    Args:
+        filters: Filters as sent by the client
+
+    Returns:
+        Non-empty filters by dimension
+
+    Raises:
+        ValueError: If filters are not in the expected shape
+    """
+    if filters is None:
+        return {}
+    if not isinstance(filters, dict):
+        raise ValueError("filters must be an object")
+
+    unknown = sorted(set(filters) - set(FILTER_DIMENSIONS))
+    if unknown:
+        raise ValueError(f"Unknown filters: {', '.join(unknown)}")
+
+    normalized = {}
+    for dimension, values in filters.items():
+        if isinstance(values, str):
+            values = [values]
+        if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+            raise ValueError(f"{dimension} must be a string or a list of strings")
+        if values:
+            normalized[dimension] = frozenset(values)
+    return normalized
+
+
+class SubscriptionIndex:
+    """
+    Index of subscribers by the event attributes they filter on.
+
+    A subscriber matches an event when every filter it set lists one
+    of the event's values for that dimension. An event that does not
+    carry a dimension (e.g. project_ids for an agent status change)
+    only reaches subscribers without a filter on it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        # Map subscriber -> its normalized filters
+        self._filters: dict[WebSocket, dict[str, frozenset[str]]] = {}
+        # Map dimension -> value -> subscribers filtering on that value
+        self._by_value: dict[str, dict[str, set[WebSocket]]] = {
+            dimension: defaultdict(set) for dimension in FILTER_DIMENSIONS
+        }
+        # Map dimension -> subscribers with no filter on that dimension
+        self._unfiltered: dict[str, set[WebSocket]] = {
+            dimension: set() for dimension in FILTER_DIMENSIONS
+        }
+
+    def __len__(self) -> int:
+        """Number of subscribers."""
+        return len(self._filters)
+
+    def __contains__(self, websocket: object) -> bool:
+        """Whether a connection is subscribed."""
+        return websocket in self._filters
+
+    def get_filters(self, websocket: WebSocket) -> dict[str, list[str]]:
+        """
+        Get a subscriber's filters.
+
+        Args:
+            websocket: Subscriber connection
+
+        Returns:
+            Filters by dimension, with values sorted
+        """
+        filters = self._filters.get(websocket, {})
+        return {dimension: sorted(values) for dimension, values in filters.items()}
+
+    def subscribe(self, websocket: WebSocket, filters: dict | None = None) -> None:
+        """
+        Add a subscriber or replace its filters.
+
+        Args:
+            websocket: Subscriber connection
+            filters: Client filters; None or empty subscribes to everything
+
+        Raises:
+            ValueError: If filters are not in the expected shape
+        """
+        normalized = normalize_filters(filters)
+        self.unsubscribe(websocket)
+        self._filters[websocket] = normalized
+        for dimension in FILTER_DIMENSIONS:
+            values = normalized.get(dimension)
+            if values is None:
+                self._unfiltered[dimension].add(websocket)
+                continue
+            for value in values:
+                self._by_value[dimension][value].add(websocket)
+
+    def unsubscribe(self, websocket: WebSocket) -> None:
+        """
+        Remove a subscriber.
+
+        Args:
+            websocket: Subscriber connection
+        """
+        filters = self._filters.pop(websocket, None)
+        if filters is None:
+            return
+        for dimension in FILTER_DIMENSIONS:
+            values = filters.get(dimension)
+            if values is None:
+                self._unfiltered[dimension].discard(websocket)
+                continue
+            index = self._by_value[dimension]
+            for value in values:
+                index[value].discard(websocket)
+                if not index[value]:
+                    del index[value]
+
+    def match(
+        self,
+        event_type: str | None,
+        project_id: str | None = None,
+        agent_ids: Iterable[str] = (),
+    ) -> set[WebSocket]:
+        """
+        Find the subscribers an event should be sent to.
+
+        Args:
+            event_type: Event type, or None if the event has none
+            project_id: Project the event belongs to, if any
+            agent_ids: Agents the event concerns, if any
+
+        Returns:
+            Matching subscribers
+        """
+        event_values = {
+            "event_types": [event_type] if event_type else [],
+            "project_ids": [project_id] if project_id else [],
+            "agent_ids": [agent_id for agent_id in agent_ids if agent_id],
+        }
+
+        candidates: list[set[WebSocket]] = []
+        for dimension, values in event_values.items():
+            index = self._by_value[dimension]
+            filtered = [index[value] for value in values if value in index]
+            if filtered:
+                candidates.append(self._unfiltered[dimension].union(*filtered))
+            else:
+                candidates.append(self._unfiltered[dimension])
+
+        # Intersecting from the smallest set keeps the work near the result size
+        candidates.sort(key=len)
+        return candidates[0].intersection(*candidates[1:])
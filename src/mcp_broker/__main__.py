@@ -10,7 +10,7 @@ import os
 import sys
 from typing import Any
 
-from mcp_broker.core.config import get_config
+from mcp_broker.core.config import BrokerConfig, get_config
 from mcp_broker.core.logging import get_logger, setup_logging
 
 
@@ -169,7 +169,13 @@ async def _main_async() -> int:
     config = get_config(**overrides)
 
     # Setup logging
-    setup_logging(level=config.get_log_level(), format_type=config.get_log_format())
+    broker_config = BrokerConfig(config)
+    setup_logging(
+        level=config.get_log_level(),
+        format_type=config.get_log_format(),
+        use_queue=broker_config.log_queue,
+        sample_rates=broker_config.log_sample_rates,
+    )
     logger = get_logger(__name__)
 
     # Run security validation at startup
@@ -7,5 +7,6 @@ managing meetings, and retrieving decisions.
 """
 
 from mcp_broker.client.http_client import HTTPClient
+from mcp_broker.client.write_behind import CommunicationLogBuffer
 
-__all__ = ["HTTPClient"]
+__all__ = ["CommunicationLogBuffer", "HTTPClient"]
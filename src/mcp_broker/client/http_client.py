@@ -11,7 +11,12 @@ from uuid import UUID
 import httpx
 from pydantic import BaseModel
 
-from agent_comm_core.models.communication import Communication, CommunicationCreate
+from agent_comm_core.models.communication import (
+    Communication,
+    CommunicationBatchCreate,
+    CommunicationBatchResult,
+    CommunicationCreate,
+)
 from agent_comm_core.models.decision import Decision
 from agent_comm_core.models.meeting import Meeting, MeetingCreate
 from mcp_broker.core.config import get_config
@@ -55,6 +60,8 @@ class HTTPClient:
         agent_nickname: Agent's display nickname
         client: httpx async client instance
         timeout: Request timeout in seconds
+        max_connections: Connection pool size
+        max_keepalive_connections: Idle connections kept open for reuse
     """
 
     def __init__(
@@ -63,6 +70,8 @@ class HTTPClient:
         agent_token: str = "",
         agent_nickname: str = "AnonymousAgent",
         timeout: float = 30.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
     ) -> None:
         """Initialize the HTTP client.
 
@@ -72,6 +81,8 @@ class HTTPClient:
             agent_token: API token for authentication (defaults to AGENT_TOKEN env var)
             agent_nickname: Agent's display nickname (defaults to AGENT_NICKNAME env var)
             timeout: Request timeout in seconds
+            max_connections: Connection pool size
+            max_keepalive_connections: Idle connections kept open for reuse
         """
         import os
 
@@ -95,6 +106,8 @@ class HTTPClient:
         self.agent_token = agent_token
         self.agent_nickname = agent_nickname
         self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
         self._client: httpx.AsyncClient | None = None
 
         logger.info(
@@ -114,11 +127,7 @@ class HTTPClient:
         Returns:
             The HTTPClient instance
         """
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=self.timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-        )
+        self._client = self._create_client()
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
@@ -156,13 +165,24 @@ class HTTPClient:
             The httpx AsyncClient instance
         """
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                timeout=self.timeout,
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            )
+            self._client = self._create_client()
         return self._client
 
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the pooled httpx client.
+
+        Returns:
+            A new httpx AsyncClient instance
+        """
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_keepalive_connections=self.max_keepalive_connections,
+                max_connections=self.max_connections,
+            ),
+        )
+
     def _handle_error(self, response: httpx.Response) -> None:
         """Handle HTTP error response.
 
@@ -277,6 +297,26 @@ class HTTPClient:
         result = await self._post("/api/v1/communications", communication)
         return Communication(**result)
 
+    async def log_communications(
+        self, communications: list[CommunicationCreate]
+    ) -> CommunicationBatchResult:
+        """Log a batch of communications in one request.
+
+        Args:
+            communications: Communications to log (at most 1000)
+
+        Returns:
+            Number of communications created and skipped as duplicates
+
+        Raises:
+            CommunicationServerAPIError: If request fails
+        """
+        result = await self._post(
+            "/api/v1/communications/bulk",
+            CommunicationBatchCreate(communications=communications),
+        )
+        return CommunicationBatchResult(**result)
+
     async def get_communications(
         self,
         from_agent: str | None = None,
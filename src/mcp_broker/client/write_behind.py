@@ -0,0 +1,229 @@
+"""
+Write-behind communication logging for MCP Broker Server.
+
+This module provides CommunicationLogBuffer, which takes communication
+log writes off the tool-call path. Communications are assigned their ID
+and timestamp locally, queued, and shipped to the Communication Server's
+bulk endpoint in batches, flushed when a batch fills or a time window
+elapses. Because IDs are client-assigned, a retried batch is idempotent.
+"""
+
+import asyncio
+import contextlib
+import random
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from agent_comm_core.models.communication import Communication, CommunicationCreate
+from mcp_broker.client.http_client import CommunicationServerAPIError, HTTPClient
+from mcp_broker.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Status codes worth retrying; other 4xx responses will fail again
+_RETRYABLE_STATUS = {408, 425, 429}
+
+
+class CommunicationLogBuffer:
+    """
+    Bounded write-behind buffer for communication logging.
+
+    Memory is bounded by max_pending queued items plus one batch in
+    flight. When the queue is full, submit() waits for the flusher to
+    make room, which pushes back on callers instead of growing without
+    limit.
+
+    Attributes:
+        max_batch_size: Most communications sent in one request
+        flush_interval: Seconds to wait for a batch to fill before sending
+        max_pending: Queued communications before submit() blocks
+        max_retries: Retries per batch before it is dropped
+        submitted: Communications accepted by submit()
+        sent: Communications acknowledged by the server
+        batches: Batches acknowledged by the server
+        retries: Batch send attempts that were retried
+        dropped: Communications given up on after errors
+    """
+
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        max_batch_size: int = 100,
+        flush_interval: float = 0.25,
+        max_pending: int = 10_000,
+        max_retries: int = 5,
+        retry_base_delay: float = 0.1,
+        retry_max_delay: float = 5.0,
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            http_client: Client used to reach the Communication Server
+            max_batch_size: Most communications sent in one request
+            flush_interval: Seconds to wait for a batch to fill before sending
+            max_pending: Queued communications before submit() blocks
+            max_retries: Retries per batch before it is dropped
+            retry_base_delay: Backoff ceiling for the first retry, in seconds
+            retry_max_delay: Largest backoff ceiling, in seconds
+        """
+        self._http_client = http_client
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+
+        self.submitted = 0
+        self.sent = 0
+        self.batches = 0
+        self.retries = 0
+        self.dropped = 0
+
+        self._queue: asyncio.Queue[CommunicationCreate] = asyncio.Queue(maxsize=max_pending)
+        self._task: asyncio.Task[None] | None = None
+        self._closing = False
+
+    async def submit(self, communication: CommunicationCreate) -> Communication:
+        """Queue a communication for logging.
+
+        Returns as soon as the communication is queued. It waits only when
+        max_pending communications are already queued.
+
+        Args:
+            communication: Communication to log
+
+        Returns:
+            The communication record as it will be stored
+
+        Raises:
+            RuntimeError: If the buffer has been closed
+        """
+        if self._closing:
+            raise RuntimeError("Communication log buffer is closed")
+
+        item = communication.model_copy(
+            update={
+                "id": communication.id or uuid4(),
+                "created_at": communication.created_at or datetime.now(UTC),
+            }
+        )
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        await self._queue.put(item)
+        self.submitted += 1
+        return Communication(**item.model_dump())
+
+    @property
+    def pending(self) -> int:
+        """Number of communications waiting to be sent."""
+        return self._queue.qsize()
+
+    async def flush(self) -> None:
+        """Wait until every queued communication has been sent or dropped."""
+        if self._task is not None and not self._task.done():
+            await self._queue.join()
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """Flush queued communications and stop the flusher.
+
+        Args:
+            timeout: Seconds to wait for the final flush
+        """
+        self._closing = True
+        if self._task is None:
+            return
+
+        try:
+            await asyncio.wait_for(self.flush(), timeout)
+        except TimeoutError:
+            lost = self._queue.qsize()
+            self.dropped += lost
+            logger.warning(
+                f"Communication log flush timed out, dropping {lost} queued communications",
+                extra={"context": {"dropped": lost, "timeout": timeout}},
+            )
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def get_stats(self) -> dict[str, int]:
+        """Get buffer counters.
+
+        Returns:
+            Dictionary with pending, submitted, sent, batches, retries and dropped
+        """
+        return {
+            "pending": self.pending,
+            "submitted": self.submitted,
+            "sent": self.sent,
+            "batches": self.batches,
+            "retries": self.retries,
+            "dropped": self.dropped,
+        }
+
+    async def _run(self) -> None:
+        """Collect queued communications into batches and send them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                remaining = deadline - loop.time()
+                if self._closing or remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except TimeoutError:
+                    break
+
+            try:
+                await self._send(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _send(self, batch: list[CommunicationCreate]) -> None:
+        """Send one batch, retrying transient failures with jittered backoff.
+
+        Args:
+            batch: Communications to send
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self._http_client.log_communications(batch)
+            except Exception as e:
+                status_code = e.status_code if isinstance(e, CommunicationServerAPIError) else None
+                retryable = isinstance(e, CommunicationServerAPIError) and (
+                    status_code is None or status_code >= 500 or status_code in _RETRYABLE_STATUS
+                )
+                if retryable and attempt < self.max_retries:
+                    self.retries += 1
+                    # Full jitter keeps many brokers from retrying in lockstep
+                    ceiling = min(self.retry_max_delay, self.retry_base_delay * 2**attempt)
+                    await asyncio.sleep(random.uniform(0, ceiling))
+                    continue
+                self.dropped += len(batch)
+                logger.error(
+                    f"Dropping {len(batch)} communications after {attempt + 1} attempts: {e}",
+                    extra={
+                        "context": {
+                            "batch_size": len(batch),
+                            "attempts": attempt + 1,
+                            "status_code": status_code,
+                        }
+                    },
+                )
+                return
+            else:
+                self.sent += len(batch)
+                self.batches += 1
+                return
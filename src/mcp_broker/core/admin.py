@@ -6,9 +6,9 @@ administrative authorization including cross-project access control,
 role detection, and permission caching.
 """
 
-from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
+from mcp_broker.core.cache import TTLCache
 from mcp_broker.core.logging import get_logger
 from mcp_broker.models.project import CrossProjectPermission, ProjectDefinition
 
@@ -28,31 +28,43 @@ class AdminPermissionManager:
 
     Attributes:
         _project_registry: Project registry for permission lookups
-        _permission_cache: Cached permission decisions
-        _cache_ttl: Time-to-live for cache entries
+        _permission_cache: Bounded LRU of permission decisions with expiry
     """
 
     def __init__(
         self,
         project_registry: "ProjectRegistry",
         cache_ttl_seconds: int = 300,
+        cache_max_size: int = 10_000,
     ) -> None:
         """Initialize the admin permission manager.
 
         Args:
             project_registry: Project registry for permission lookups
             cache_ttl_seconds: Time-to-live for permission cache (default 5 minutes)
+            cache_max_size: Most cached decisions kept before evicting
         """
         self._project_registry = project_registry
-        self._cache_ttl = timedelta(seconds=cache_ttl_seconds)
 
-        # Cache structure: {(project_id, action, target): (allowed, timestamp)}
-        self._permission_cache: dict[tuple[str, str, str | None], tuple[bool, datetime]] = {}
+        # Keyed by (project_id, action, target); expired entries are swept
+        # once per TTL so decisions that are never re-read do not pile up
+        self._permission_cache: TTLCache[tuple[str, str, str | None], bool] = TTLCache(
+            max_size=cache_max_size,
+            ttl=cache_ttl_seconds,
+            sweep_interval=cache_ttl_seconds,
+        )
+        # Decisions come from project config, so drop them when it changes
+        project_registry.add_change_listener(self.invalidate_project)
 
         logger = get_logger(__name__)
         logger.info(
             "AdminPermissionManager initialized",
-            extra={"context": {"cache_ttl_seconds": cache_ttl_seconds}},
+            extra={
+                "context": {
+                    "cache_ttl_seconds": cache_ttl_seconds,
+                    "cache_max_size": cache_max_size,
+                }
+            },
         )
 
     def is_admin_key(self, api_key: str, project_id: str) -> bool:
@@ -365,6 +377,36 @@ class AdminPermissionManager:
         logger = get_logger(__name__)
         logger.debug("Permission cache cleared")
 
+    def invalidate_project(self, project_id: str) -> int:
+        """Drop cached decisions involving a project.
+
+        Called by the project registry whenever a project is created,
+        updated or deleted; decisions for unrelated projects are kept.
+
+        Args:
+            project_id: Project whose decisions to drop, as requester or target
+
+        Returns:
+            Number of cached decisions removed
+        """
+        removed = self._permission_cache.discard_where(
+            lambda key, _: key[0] == project_id or key[2] == project_id
+        )
+        logger = get_logger(__name__)
+        logger.debug(
+            f"Permission cache invalidated for project {project_id}",
+            extra={"context": {"project_id": project_id, "removed": removed}},
+        )
+        return removed
+
+    def get_permission_cache_stats(self) -> dict[str, int]:
+        """Get permission cache counters.
+
+        Returns:
+            Dictionary with size, hits, misses, evictions and expirations
+        """
+        return self._permission_cache.get_stats()
+
     def _get_cached_permission(self, cache_key: tuple[str, str, str | None]) -> bool | None:
         """Get cached permission decision.
 
@@ -374,15 +416,7 @@ class AdminPermissionManager:
         Returns:
             Cached decision or None if not found/expired
         """
-        if cache_key in self._permission_cache:
-            allowed, timestamp = self._permission_cache[cache_key]
-            if datetime.now(UTC) - timestamp < self._cache_ttl:
-                return allowed
-            else:
-                # Expired, remove from cache
-                del self._permission_cache[cache_key]
-
-        return None
+        return self._permission_cache.get(cache_key)
 
     def _cache_permission(
         self,
@@ -395,7 +429,7 @@ class AdminPermissionManager:
             cache_key: Cache key tuple
             allowed: Permission decision
         """
-        self._permission_cache[cache_key] = (allowed, datetime.now(UTC))
+        self._permission_cache.set(cache_key, allowed)
 
     async def _check_cross_project_permission(
         self,
@@ -0,0 +1,170 @@
+"""
+Bounded caches for MCP Broker Server.
+
+This module provides TTLCache, an LRU cache whose entries also expire
+after a time-to-live. It backs hot-path lookups such as API key
+validation, where unbounded dicts would grow with every distinct key
+presented to the server.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+
+class TTLCache[K, V]:
+    """
+    LRU cache with per-entry expiry.
+
+    Lookups move entries to the most recently used end; inserts past
+    max_size evict from the least recently used end. Expired entries are
+    dropped when they are looked up, and swept out every sweep_interval
+    seconds on insert so entries that are never read again do not linger
+    until evicted. Values must not be None.
+
+    Attributes:
+        max_size: Most entries kept before evicting
+        ttl: Default entry lifetime in seconds
+        hits: Lookups answered from the cache
+        misses: Lookups that found no live entry
+        evictions: Entries dropped to stay within max_size
+        expirations: Entries dropped because their TTL elapsed
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+        sweep_interval: float | None = None,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Most entries kept before evicting
+            ttl: Default entry lifetime in seconds
+            clock: Monotonic time source (overridable for tests)
+            sweep_interval: Seconds between sweeps for expired entries
+                (None sweeps only on lookup)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.sweep_interval = sweep_interval
+        self._clock = clock
+        self._next_sweep = clock() + sweep_interval if sweep_interval else float("inf")
+        # key -> (deadline, value), least recently used first
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        """Look up a live entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        deadline, value = entry
+        if deadline <= self._clock():
+            del self._entries[key]
+            self.misses += 1
+            self.expirations += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Insert or replace an entry.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Entry lifetime in seconds (defaults to the cache ttl)
+        """
+        lifetime = self.ttl if ttl is None else ttl
+        if lifetime <= 0:
+            self._entries.pop(key, None)
+            return
+
+        now = self._clock()
+        if now >= self._next_sweep:
+            self.purge_expired()
+
+        self._entries[key] = (now + lifetime, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: K) -> V | None:
+        """Remove an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The removed value, or None if there was no entry
+        """
+        entry = self._entries.pop(key, None)
+        return entry[1] if entry is not None else None
+
+    def discard_where(self, predicate: Callable[[K, V], bool]) -> int:
+        """Remove every entry matching a predicate.
+
+        Args:
+            predicate: Called with (key, value); True removes the entry
+
+        Returns:
+            Number of entries removed
+        """
+        doomed = [key for key, (_, value) in self._entries.items() if predicate(key, value)]
+        for key in doomed:
+            del self._entries[key]
+        return len(doomed)
+
+    def purge_expired(self) -> int:
+        """Remove every expired entry.
+
+        Returns:
+            Number of entries removed
+        """
+        now = self._clock()
+        expired = [key for key, (deadline, _) in self._entries.items() if deadline <= now]
+        for key in expired:
+            del self._entries[key]
+        self.expirations += len(expired)
+        if self.sweep_interval:
+            self._next_sweep = now + self.sweep_interval
+        return len(expired)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """Get cache counters.
+
+        Returns:
+            Dictionary with size, hits, misses, evictions and expirations
+        """
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
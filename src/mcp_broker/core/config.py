@@ -111,6 +111,44 @@ class BrokerConfig:
 
         return os.getenv("MCP_BROKER_REDIS_URL")
 
+    @property
+    def wal_dir(self) -> str | None:
+        """Get write-ahead log directory for in-memory message queues."""
+        import os
+
+        return os.getenv("MCP_BROKER_WAL_DIR")
+
+    @property
+    def protocol_index_refresh_interval(self) -> float:
+        """Get seconds between protocol index reloads for shared storage backends."""
+        import os
+
+        return float(os.getenv("MCP_BROKER_PROTOCOL_INDEX_REFRESH", "5"))
+
+    @property
+    def payload_validation_projects(self) -> list[str]:
+        """Get projects whose message payloads are validated ("*" for all)."""
+        import os
+
+        value = os.getenv("MCP_BROKER_PAYLOAD_VALIDATION", "")
+        return [project.strip() for project in value.split(",") if project.strip()]
+
+    @property
+    def log_queue(self) -> bool:
+        """Get whether log records are formatted and written on a background thread."""
+        import os
+
+        return os.getenv("MCP_BROKER_LOG_QUEUE", "false").lower() == "true"
+
+    @property
+    def log_sample_rates(self) -> dict[str, float]:
+        """Get per-logger DEBUG sampling rates ("logger=rate,logger=rate")."""
+        import os
+
+        from mcp_broker.core.logging import parse_sample_rates
+
+        return parse_sample_rates(os.getenv("MCP_BROKER_LOG_SAMPLE", ""))
+
     @property
     def queue_capacity(self) -> int:
         """Get queue capacity."""
@@ -125,6 +163,48 @@ class BrokerConfig:
 
         return float(os.getenv("MCP_BROKER_QUEUE_WARNING", "0.9"))
 
+    @property
+    def dead_letter_capacity(self) -> int:
+        """Get in-memory dead-letter capacity per project."""
+        import os
+
+        return int(os.getenv("MCP_BROKER_DEAD_LETTER_CAPACITY", "1000"))
+
+    @property
+    def dead_letter_dir(self) -> str | None:
+        """Get directory for dead letters spilled to disk."""
+        import os
+
+        return os.getenv("MCP_BROKER_DEAD_LETTER_DIR")
+
+    @property
+    def dead_letter_segment_capacity(self) -> int:
+        """Get maximum dead letters spilled to disk per project."""
+        import os
+
+        return int(os.getenv("MCP_BROKER_DEAD_LETTER_SEGMENT_CAPACITY", "100000"))
+
+    @property
+    def communication_log_batch_size(self) -> int:
+        """Get communications per bulk log request (0 logs each one synchronously)."""
+        import os
+
+        return int(os.getenv("MCP_BROKER_COMM_LOG_BATCH_SIZE", "100"))
+
+    @property
+    def communication_log_flush_interval(self) -> float:
+        """Get seconds to wait for a communication log batch to fill."""
+        import os
+
+        return float(os.getenv("MCP_BROKER_COMM_LOG_FLUSH_INTERVAL", "0.25"))
+
+    @property
+    def communication_log_max_pending(self) -> int:
+        """Get queued communication log writes before callers are held back."""
+        import os
+
+        return int(os.getenv("MCP_BROKER_COMM_LOG_MAX_PENDING", "10000"))
+
     @property
     def heartbeat_interval(self) -> int:
         """Get heartbeat interval."""
@@ -3,10 +3,22 @@ Structured logging configuration for MCP Broker Server.
 
 This module provides centralized logging setup with support for both
 JSON and text formatted logs, appropriate for development and production.
+
+For high-volume paths it also provides:
+- queue mode: records are handed to a background QueueListener thread,
+  so JSON encoding and stream/file I/O happen off the event loop
+- log_lazy(): builds the message and context only if the level is enabled
+- SamplingFilter: keeps 1 in N low-level records per logger
 """
 
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import queue
 import sys
+from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -14,6 +26,14 @@ from typing import Any
 # Type alias for log context
 LogContext = dict[str, Any]
 
+# Shared encoder; json.dumps(default=...) builds a new encoder per call
+_encode_json = json.JSONEncoder(default=str).encode
+
+# Background listener and sampler installed by setup_logging()
+_queue_listener: logging.handlers.QueueListener | None = None
+_sampler: "SamplingFilter | None" = None
+_atexit_registered = False
+
 
 class StructuredFormatter(logging.Formatter):
     """JSON-structured log formatter for production environments.
@@ -31,11 +51,9 @@ class StructuredFormatter(logging.Formatter):
         Returns:
             JSON-formatted log string
         """
-        import json
-
-        # Create base log entry
+        # Create base log entry; the record time, not the (possibly deferred) format time
         log_entry: LogContext = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -44,15 +62,17 @@ class StructuredFormatter(logging.Formatter):
             "line": record.lineno,
         }
 
-        # Add exception info if present
+        # Add exception info if present (pre-rendered in queue mode)
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_entry["exception"] = record.exc_text
 
         # Add extra context from record
         if hasattr(record, "context"):
             log_entry["context"] = record.context  # type: ignore
 
-        return json.dumps(log_entry, default=str)
+        return _encode_json(log_entry)
 
 
 class TextFormatter(logging.Formatter):
@@ -82,20 +102,171 @@ class TextFormatter(logging.Formatter):
         """
         color = self.COLORS.get(record.levelname, "")
         level = f"{color}{record.levelname}{self.RESET}"
-        timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = datetime.fromtimestamp(record.created, UTC).strftime("%Y-%m-%d %H:%M:%S")
         logger_name = record.name
 
         message = record.getMessage()
         if record.exc_info:
             message += "\n" + self.formatException(record.exc_info)
+        elif record.exc_text:
+            message += "\n" + record.exc_text
 
         return f"{timestamp} | {level:8} | {logger_name}: {message}"
 
 
+class SamplingFilter(logging.Filter):
+    """Keep 1 in N low-level records per logger.
+
+    Rates are configured per logger name and inherited by child loggers
+    (a rate for "mcp_broker.storage" also applies to
+    "mcp_broker.storage.memory"). Sampling is deterministic: a rate of
+    0.01 keeps the 1st, 101st, 201st... record. Records above max_level
+    always pass.
+
+    Attributes:
+        max_level: Highest level that is sampled
+        dropped: Number of records dropped by sampling
+    """
+
+    def __init__(self, rates: dict[str, float], max_level: int = logging.DEBUG) -> None:
+        """Initialize the filter.
+
+        Args:
+            rates: Logger name -> fraction of records to keep (0.0 to 1.0)
+            max_level: Highest level that is sampled
+        """
+        super().__init__()
+        self.max_level = max_level
+        self.dropped = 0
+        # Keep every Nth record; 0 drops all
+        self._intervals = {
+            name: max(1, round(1 / min(rate, 1.0))) if rate > 0 else 0
+            for name, rate in rates.items()
+        }
+        self._resolved: dict[str, int | None] = {}
+        self._counters: dict[str, int] = {}
+
+    def _interval(self, name: str) -> int | None:
+        """Find the sampling interval for a logger, walking up its parents."""
+        try:
+            return self._resolved[name]
+        except KeyError:
+            pass
+
+        interval = None
+        candidate = name
+        while candidate:
+            if candidate in self._intervals:
+                interval = self._intervals[candidate]
+                break
+            candidate = candidate.rpartition(".")[0]
+        self._resolved[name] = interval
+        return interval
+
+    def sample(self, name: str, level: int) -> bool:
+        """Decide whether to keep a record.
+
+        Args:
+            name: Logger name
+            level: Record level
+
+        Returns:
+            True if the record should be emitted
+        """
+        if level > self.max_level:
+            return True
+        interval = self._interval(name)
+        if interval is None or interval == 1:
+            return True
+
+        count = self._counters.get(name, 0)
+        self._counters[name] = count + 1
+        if interval and count % interval == 0:
+            return True
+        self.dropped += 1
+        return False
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Apply sampling once per record.
+
+        The decision is stored on the record, so every handler sharing
+        this filter agrees and records from log_lazy() are not counted twice.
+        """
+        keep = getattr(record, "sampled", None)
+        if keep is None:
+            keep = record.sampled = self.sample(record.name, record.levelno)  # type: ignore[attr-defined]
+        return keep
+
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps records structured for the listener thread.
+
+    The message and exception text are rendered in the calling thread
+    (arguments may be mutated later), while context and JSON encoding are
+    left to the listener's formatter. When the queue is full, records are
+    dropped and counted instead of blocking the event loop.
+
+    Attributes:
+        dropped: Number of records dropped because the queue was full
+    """
+
+    def __init__(self, log_queue: queue.Queue[logging.LogRecord]) -> None:
+        """Initialize the handler.
+
+        Args:
+            log_queue: Bounded queue drained by the listener
+        """
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Render the message and exception text into a copy of the record."""
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue a record, dropping it if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def parse_sample_rates(value: str) -> dict[str, float]:
+    """Parse logger sampling rates from "name=rate,name=rate".
+
+    Args:
+        value: Comma-separated logger=rate pairs
+
+    Returns:
+        Dictionary of logger name -> rate
+
+    Raises:
+        ValueError: If a pair is malformed
+    """
+    rates: dict[str, float] = {}
+    for pair in value.split(","):
+        if not pair.strip():
+            continue
+        name, separator, rate = pair.partition("=")
+        if not separator or not name.strip():
+            raise ValueError(f"Invalid log sampling rate '{pair}', expected logger=rate")
+        rates[name.strip()] = float(rate)
+    return rates
+
+
 def setup_logging(
     level: str = "INFO",
     format_type: str = "json",
     log_file: Path | None = None,
+    use_queue: bool = False,
+    sample_rates: dict[str, float] | None = None,
+    max_queue_size: int = 10_000,
 ) -> None:
     """Configure logging for the MCP Broker Server.
 
@@ -103,10 +274,19 @@ def setup_logging(
         level: Logging level (DEBUG, INFO, WARNING, ERROR)
         format_type: Log format ('json' or 'text')
         log_file: Optional path to log file
+        use_queue: Format and write records on a background thread
+        sample_rates: Logger name -> fraction of DEBUG records to keep
+        max_queue_size: Records buffered for the background thread before dropping
 
     Example:
         >>> setup_logging(level="DEBUG", format_type="text")
+        >>> setup_logging(use_queue=True, sample_rates={"mcp_broker.storage": 0.01})
     """
+    global _sampler, _queue_listener, _atexit_registered
+
+    # Stop a listener from a previous call so its queue is drained
+    shutdown_logging()
+
     # Get root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, level.upper()))
@@ -123,14 +303,70 @@ def setup_logging(
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     # File handler if specified
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if use_queue:
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=max_queue_size)
+        _queue_listener = logging.handlers.QueueListener(log_queue, *handlers)
+        _queue_listener.start()
+        handlers = [StructuredQueueHandler(log_queue)]
+        if not _atexit_registered:
+            atexit.register(shutdown_logging)
+            _atexit_registered = True
+
+    _sampler = SamplingFilter(sample_rates) if sample_rates else None
+    for handler in handlers:
+        if _sampler is not None:
+            handler.addFilter(_sampler)
+        root_logger.addHandler(handler)
+
+
+def shutdown_logging() -> None:
+    """Stop the background listener, writing out every queued record."""
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+def log_lazy(
+    logger: logging.Logger,
+    level: int,
+    message: str | Callable[[], str],
+    context: Callable[[], dict[str, Any]] | None = None,
+) -> None:
+    """Log a record whose message and context are built only if needed.
+
+    Nothing is built when the level is disabled or the record is sampled
+    out, which keeps per-message debug logging cheap on hot paths.
+
+    Args:
+        logger: Logger to emit on
+        level: Logging level
+        message: Message, or a callable returning it
+        context: Callable returning the structured context
+
+    Example:
+        >>> log_lazy(logger, logging.DEBUG, lambda: f"Enqueued {mid}",
+        ...          lambda: {"message_id": str(mid)})
+    """
+    if not logger.isEnabledFor(level):
+        return
+    if _sampler is not None and not _sampler.sample(logger.name, level):
+        return
+
+    extra: dict[str, Any] = {"sampled": True}
+    if context is not None:
+        extra["context"] = context()
+    logger.log(level, message() if callable(message) else message, extra=extra, stacklevel=2)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -0,0 +1,142 @@
+"""
+In-process call metrics for MCP Broker Server.
+
+This module provides fixed-bucket latency histograms and per-name call
+counters. Buckets grow geometrically (about 19% apart), so recording is
+a bisect over a small constant list and percentiles are accurate to
+within one bucket regardless of how many calls were recorded.
+"""
+
+from bisect import bisect_left
+
+# Bucket upper bounds in milliseconds: 0.05ms .. ~100s
+_BUCKET_BOUNDS_MS: tuple[float, ...] = tuple(0.05 * 1.1892**i for i in range(85))
+
+
+class LatencyHistogram:
+    """
+    Latency histogram with geometric buckets.
+
+    Attributes:
+        count: Number of recorded samples
+        total_ms: Sum of recorded latencies in milliseconds
+        min_ms: Smallest recorded latency, or None before the first sample
+        max_ms: Largest recorded latency, or None before the first sample
+    """
+
+    __slots__ = ("count", "total_ms", "min_ms", "max_ms", "_buckets")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms: float | None = None
+        self.max_ms: float | None = None
+        # One extra overflow bucket past the last bound
+        self._buckets = [0] * (len(_BUCKET_BOUNDS_MS) + 1)
+
+    def record(self, duration_ms: float) -> None:
+        """Record one latency sample.
+
+        Args:
+            duration_ms: Latency in milliseconds
+        """
+        self._buckets[bisect_left(_BUCKET_BOUNDS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        if self.min_ms is None or duration_ms < self.min_ms:
+            self.min_ms = duration_ms
+        if self.max_ms is None or duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+
+    def percentile(self, fraction: float) -> float | None:
+        """Estimate a latency percentile.
+
+        The estimate is the upper bound of the bucket holding the requested
+        rank, clamped to the observed min and max.
+
+        Args:
+            fraction: Percentile as a fraction (0.5 for p50)
+
+        Returns:
+            Latency in milliseconds, or None if nothing was recorded
+        """
+        if not self.count or self.min_ms is None or self.max_ms is None:
+            return None
+
+        rank = max(1, round(fraction * self.count))
+        seen = 0
+        for index, bucket in enumerate(self._buckets):
+            seen += bucket
+            if seen >= rank:
+                bound = _BUCKET_BOUNDS_MS[index] if index < len(_BUCKET_BOUNDS_MS) else self.max_ms
+                return min(max(bound, self.min_ms), self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> dict[str, float | int | None]:
+        """Summarize the histogram.
+
+        Returns:
+            Dictionary with count, mean, min, max and p50/p95/p99 in milliseconds
+        """
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else None,
+            "min_ms": self.min_ms,
+            "max_ms": self.max_ms,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+        }
+
+
+class CallMetrics:
+    """
+    Call counts, error counts and latency histograms keyed by name.
+
+    Used for MCP tool calls; names are created on first record.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self._calls: dict[str, int] = {}
+        self._errors: dict[str, int] = {}
+        self._latency: dict[str, LatencyHistogram] = {}
+
+    def record(self, name: str, duration_ms: float, error: bool = False) -> None:
+        """Record one call.
+
+        Args:
+            name: Operation name
+            duration_ms: Call latency in milliseconds
+            error: Whether the call failed
+        """
+        self._calls[name] = self._calls.get(name, 0) + 1
+        if error:
+            self._errors[name] = self._errors.get(name, 0) + 1
+
+        histogram = self._latency.get(name)
+        if histogram is None:
+            histogram = self._latency[name] = LatencyHistogram()
+        histogram.record(duration_ms)
+
+    def snapshot(self) -> dict[str, dict[str, float | int | None]]:
+        """Summarize every recorded operation.
+
+        Returns:
+            Dictionary of name -> calls, errors and latency summary
+        """
+        return {
+            name: {
+                "calls": calls,
+                "errors": self._errors.get(name, 0),
+                **self._latency[name].to_dict(),
+            }
+            for name, calls in sorted(self._calls.items())
+        }
+
+    def reset(self) -> None:
+        """Discard all recorded calls."""
+        self._calls.clear()
+        self._errors.clear()
+        self._latency.clear()
@@ -4,16 +4,20 @@ FastAPI application entry point for MCP Broker Server.
 Provides HTTP endpoints for health checks and testing.
 """
 
+import json
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Any
+from uuid import UUID
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from agent_comm_core.config import get_config as get_core_config
 from mcp_broker.core.config import BrokerConfig, get_config_legacy
-from mcp_broker.core.logging import get_logger, setup_logging
+from mcp_broker.core.logging import get_logger, setup_logging, shutdown_logging
 from mcp_broker.core.security import SecurityMiddleware
 from mcp_broker.mcp.server import MCPServer
 
@@ -36,7 +40,12 @@ async def lifespan(app: FastAPI) -> Any:
 
     # Setup
     _global_config = get_config_legacy()
-    setup_logging(level=_global_config.log_level, format_type=_global_config.log_format)
+    setup_logging(
+        level=_global_config.log_level,
+        format_type=_global_config.log_format,
+        use_queue=_global_config.log_queue,
+        sample_rates=_global_config.log_sample_rates,
+    )
 
     logger = get_logger(__name__)
     logger.info("Starting MCP Broker Server (FastAPI mode)")
@@ -67,6 +76,7 @@ async def lifespan(app: FastAPI) -> Any:
     if _broker_server:
         await _broker_server.stop()
     logger.info("MCP Broker Server stopped")
+    shutdown_logging()
 
 
 # Create FastAPI app
@@ -191,6 +201,55 @@ async def list_sessions_api(
     }
 
 
+@app.get("/sessions/{session_id}/stream", tags=["Sessions"])
+async def stream_session_messages(
+    session_id: UUID,
+    project_id: str = "default",
+    batch_size: int = Query(default=10, ge=1, le=100),
+    keepalive: float = Query(default=15.0, gt=0, le=300),
+) -> StreamingResponse:
+    """Stream queued messages for a session as Server-Sent Events.
+
+    Each batch of messages is sent as a "messages" event whose data is a
+    JSON array. A comment line is sent after keepalive seconds without
+    traffic. The stream ends when the session disconnects.
+
+    Args:
+        session_id: Session UUID to stream messages for
+        project_id: Project identifier
+        batch_size: Maximum messages per event
+        keepalive: Seconds between keep-alive comments when idle
+
+    Returns:
+        StreamingResponse with text/event-stream content
+    """
+    global _broker_server
+
+    if not _broker_server:
+        raise HTTPException(status_code=503, detail="Server not initialized")
+
+    session_manager = _broker_server.session_manager
+    session = await session_manager.get_session(session_id, project_id)
+    if not session:
+        raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
+
+    async def event_stream() -> AsyncIterator[str]:
+        async for batch in session_manager.stream_messages(
+            session_id, batch_size=batch_size, idle_timeout=keepalive, project_id=project_id
+        ):
+            if not batch:
+                yield ": keep-alive\n\n"
+                continue
+            data = json.dumps([m.model_dump(mode="json") for m in batch], separators=(",", ":"))
+            yield f"event: messages\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/protocols", tags=["Protocols"])
 async def list_protocols_api(
     name: str | None = None,
@@ -200,7 +259,7 @@ async def list_protocols_api(
 
     Args:
         name: Optional name filter
-        version: Optional version filter
+        version: Optional version or version range filter (e.g. "^1.2")
 
     Returns:
         Dict with protocols list
@@ -210,7 +269,10 @@ async def list_protocols_api(
     if not _broker_server:
         raise HTTPException(status_code=503, detail="Server not initialized")
 
-    protocols = await _broker_server.protocol_registry.discover(name=name, version=version)
+    try:
+        protocols = await _broker_server.protocol_registry.discover(name=name, version=version)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
     return {
         "protocols": [
@@ -261,6 +323,21 @@ async def security_status() -> SecurityStatusResponse:
     )
 
 
+@app.get("/admin/tools/metrics", tags=["Admin"])
+async def tool_metrics() -> dict[str, Any]:
+    """Get per-tool MCP call metrics.
+
+    Returns:
+        Dict with call counts, error counts and latency percentiles per tool
+    """
+    global _broker_server
+
+    if not _broker_server:
+        raise HTTPException(status_code=503, detail="Server not initialized")
+
+    return {"tools": _broker_server.tool_metrics.snapshot()}
+
+
 @app.get("/", tags=["Root"])
 async def root() -> dict[str, str]:
     """Root endpoint with server info.
@@ -13,7 +13,9 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from agent_comm_core.models.communication import Communication, CommunicationCreate
 from mcp_broker.client.http_client import HTTPClient
+from mcp_broker.client.write_behind import CommunicationLogBuffer
 
 
 # Tool input schemas
@@ -97,6 +99,7 @@ class MeetingMCPTools:
         agent_id: str | None = None,
         agent_token: str = "",
         agent_nickname: str = "",
+        communication_log: CommunicationLogBuffer | None = None,
     ) -> None:
         """Initialize meeting MCP tools.
 
@@ -105,8 +108,11 @@ class MeetingMCPTools:
             agent_id: This agent's ID (deprecated, use agent_nickname)
             agent_token: API token for authentication
             agent_nickname: Agent's display nickname
+            communication_log: Write-behind buffer for communication logging;
+                               communications are posted one by one if None
         """
         self._http_client = http_client
+        self._communication_log = communication_log
         self._agent_id = agent_id or agent_nickname or http_client.agent_nickname
         self._agent_token = agent_token or http_client.agent_token
         self._agent_nickname = agent_nickname or http_client.agent_nickname
@@ -138,7 +144,7 @@ class MeetingMCPTools:
         )
 
         try:
-            result = await self._http_client.log_communication(communication)
+            result = await self._log_communication(communication)
 
             return {
                 "success": True,
@@ -155,6 +161,19 @@ class MeetingMCPTools:
                 "error": str(e),
             }
 
+    async def _log_communication(self, communication: CommunicationCreate) -> Communication:
+        """Log a communication through the write-behind buffer if configured.
+
+        Args:
+            communication: Communication to log
+
+        Returns:
+            The Communication record
+        """
+        if self._communication_log is not None:
+            return await self._communication_log.submit(communication)
+        return await self._http_client.log_communication(communication)
+
     async def create_meeting(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """Create a new meeting.
 
@@ -335,7 +354,7 @@ class MeetingMCPTools:
         )
 
         try:
-            result = await self._http_client.log_communication(communication)
+            result = await self._log_communication(communication)
 
             return {
                 "success": True,
@@ -5,6 +5,9 @@ This module provides the MCPServer class that integrates the
 broker components with the official MCP Python SDK.
 """
 
+import json
+import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 from uuid import UUID
 
@@ -12,7 +15,9 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server as stdio_server
 
 from mcp_broker.client.http_client import HTTPClient
+from mcp_broker.client.write_behind import CommunicationLogBuffer
 from mcp_broker.core.logging import get_logger
+from mcp_broker.core.metrics import CallMetrics
 from mcp_broker.mcp.meeting_tools import MeetingMCPTools
 from mcp_broker.mcp.tools import MCPTools
 from mcp_broker.negotiation.negotiator import CapabilityNegotiator
@@ -20,10 +25,12 @@ from mcp_broker.project.registry import ProjectRegistry
 from mcp_broker.protocol.registry import ProtocolRegistry
 from mcp_broker.routing.router import MessageRouter
 from mcp_broker.session.manager import SessionManager
-from mcp_broker.storage.memory import InMemoryStorage
+from mcp_broker.storage.factory import create_storage
 
 logger = get_logger(__name__)
 
+ToolHandler = Callable[[dict[str, Any]], Awaitable[Any]]
+
 
 class MCPServer:
     """
@@ -41,6 +48,7 @@ class MCPServer:
         router: Message router
         tools: MCP tools collection (broker tools)
         meeting_tools: Meeting MCP tools (Claude Code integration)
+        tool_metrics: Per-tool call counts, error counts and latency histograms
         http_client: HTTP client for Communication Server
         current_session_id: Current session for tool calls
         agent_nickname: Agent's display nickname
@@ -63,7 +71,7 @@ class MCPServer:
         """
         import os
 
-        from mcp_broker.core.config import get_config
+        from mcp_broker.core.config import BrokerConfig, get_config
 
         self.config = config or get_config()
 
@@ -81,10 +89,25 @@ class MCPServer:
         )
 
         # Initialize components
-        self._storage = InMemoryStorage(
-            queue_capacity=int(os.getenv("MCP_BROKER_QUEUE_CAPACITY", "100"))
+        broker_config = (
+            self.config if isinstance(self.config, BrokerConfig) else BrokerConfig(self.config)
+        )
+        self._broker_config = broker_config
+        self._storage = create_storage(
+            backend=broker_config.storage_backend,
+            queue_capacity=broker_config.queue_capacity,
+            redis_url=broker_config.redis_url,
+            wal_dir=broker_config.wal_dir,
+        )
+        # Other broker processes can register protocols in shared storage
+        self.protocol_registry = ProtocolRegistry(
+            self._storage,
+            index_refresh_interval=(
+                None
+                if broker_config.storage_backend == "memory"
+                else broker_config.protocol_index_refresh_interval
+            ),
         )
-        self.protocol_registry = ProtocolRegistry(self._storage)
         self.session_manager = SessionManager(
             storage=self._storage,
             queue_capacity=int(os.getenv("MCP_BROKER_QUEUE_CAPACITY", "100")),
@@ -92,7 +115,15 @@ class MCPServer:
             disconnect_threshold=int(os.getenv("MCP_BROKER_DISCONNECT_THRESHOLD", "60")),
         )
         self.negotiator = CapabilityNegotiator()
-        self.router = MessageRouter(self.session_manager, self._storage)
+        self.router = MessageRouter(
+            self.session_manager,
+            self._storage,
+            dead_letter_capacity=broker_config.dead_letter_capacity,
+            dead_letter_dir=broker_config.dead_letter_dir,
+            dead_letter_segment_capacity=broker_config.dead_letter_segment_capacity,
+            protocol_registry=self.protocol_registry,
+            payload_validation=broker_config.payload_validation_projects,
+        )
         self.project_registry = ProjectRegistry()
 
         # Tools collection
@@ -100,10 +131,16 @@ class MCPServer:
 
         # HTTP Client for Communication Server integration
         self._http_client: HTTPClient | None = None
+        self._communication_log: CommunicationLogBuffer | None = None
+        self._liveness_task: Any = None
 
         # Meeting tools (initialized lazily)
         self._meeting_tools: MeetingMCPTools | None = None
 
+        # Tool name -> handler, and per-tool instrumentation
+        self._tool_handlers = self._build_tool_handlers()
+        self.tool_metrics = CallMetrics()
+
         # Current session context (set per connection)
         self.current_session_id: UUID | None = None
 
@@ -187,11 +224,21 @@ class MCPServer:
             The MeetingMCPTools instance
         """
         if self._meeting_tools is None:
+            # Communication logging is batched off the tool-call path
+            settings = self._broker_config
+            if settings.communication_log_batch_size > 0:
+                self._communication_log = CommunicationLogBuffer(
+                    self.http_client,
+                    max_batch_size=settings.communication_log_batch_size,
+                    flush_interval=settings.communication_log_flush_interval,
+                    max_pending=settings.communication_log_max_pending,
+                )
             self._meeting_tools = MeetingMCPTools(
                 http_client=self.http_client,
                 agent_id=self._agent_id,
                 agent_token=self._agent_token,
                 agent_nickname=self._agent_nickname,
+                communication_log=self._communication_log,
             )
         return self._meeting_tools
 
@@ -269,6 +316,36 @@ class MCPServer:
                         "required": ["recipient_id", "protocol_name", "payload"],
                     },
                 },
+                {
+                    "name": "broker_send_batch",
+                    "description": "Send many point-to-point messages in one call (via broker)",
+                    "inputSchema": {
+                        "type": "object",
+                        "properties": {
+                            "messages": {
+                                "type": "array",
+                                "minItems": 1,
+                                "maxItems": 1000,
+                                "items": {
+                                    "type": "object",
+                                    "properties": {
+                                        "recipient_id": {"type": "string"},
+                                        "protocol_name": {"type": "string"},
+                                        "protocol_version": {"type": "string"},
+                                        "payload": {"type": "object"},
+                                        "priority": {
+                                            "type": "string",
+                                            "enum": ["low", "normal", "high", "urgent"],
+                                        },
+                                        "ttl": {"type": "integer"},
+                                    },
+                                    "required": ["recipient_id", "protocol_name", "payload"],
+                                },
+                            },
+                        },
+                        "required": ["messages"],
+                    },
+                },
                 {
                     "name": "broadcast_message",
                     "description": "Broadcast message to all compatible sessions",
@@ -367,72 +444,81 @@ class MCPServer:
         @self._server.call_tool()
         async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[dict[str, Any]]:
             """Handle call_tool request."""
-            logger.info(
-                f"Tool called: {name}",
-                extra={"context": {"tool_name": name, "arguments": arguments}},
+            return [{"type": "text", "text": await self.call_tool(name, arguments)}]
+
+    def _build_tool_handlers(self) -> dict[str, ToolHandler]:
+        """Map tool names to their handlers.
+
+        Meeting tools are resolved on each call because they are created
+        lazily with the HTTP client.
+
+        Returns:
+            Dictionary of tool name -> async handler
+        """
+
+        def meeting_tool(method: str) -> ToolHandler:
+            async def handler(arguments: dict[str, Any]) -> Any:
+                return await getattr(self.meeting_tools, method)(arguments)
+
+            return handler
+
+        return {
+            # Broker tools
+            "register_protocol": self._tools.register_protocol,
+            "discover_protocols": self._tools.discover_protocols,
+            "negotiate_capabilities": self._tools.negotiate_capabilities,
+            "broker_send_message": self._tools.send_message,
+            "broker_send_batch": self._tools.send_batch,
+            "broadcast_message": self._tools.broadcast_message,
+            "list_sessions": self._tools.list_sessions,
+            "create_project": self._tools.create_project,
+            "list_projects": self._tools.list_projects,
+            "get_project_info": self._tools.get_project_info,
+            "rotate_project_keys": self._tools.rotate_project_keys,
+            # Meeting tools (Claude Code integration)
+            "send_message": meeting_tool("send_message"),
+            "create_meeting": meeting_tool("create_meeting"),
+            "join_meeting": meeting_tool("join_meeting"),
+            "get_decisions": meeting_tool("get_decisions"),
+            "propose_topic": meeting_tool("propose_topic"),
+        }
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> str:
+        """Dispatch a tool call and encode its result.
+
+        Every known tool call is timed into tool_metrics. Calls that raise
+        or return {"success": False} count as errors.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            Compact JSON encoding of the tool result, or an error message
+        """
+        handler = self._tool_handlers.get(name)
+        if handler is None:
+            return f"Unknown tool: {name}"
+
+        logger.debug(
+            f"Tool called: {name}",
+            extra={"context": {"tool_name": name, "argument_keys": sorted(arguments)}},
+        )
+
+        started = time.perf_counter()
+        try:
+            result = await handler(arguments)
+        except Exception as e:
+            self.tool_metrics.record(name, (time.perf_counter() - started) * 1000, error=True)
+            logger.error(
+                f"Tool error: {name}: {e}",
+                extra={"context": {"tool_name": name, "error": str(e)}},
             )
+            return f"Error: {e}"
 
-            try:
-                # Broker tools
-                if name == "register_protocol":
-                    result = await self._tools.register_protocol(arguments)
-                elif name == "discover_protocols":
-                    result = await self._tools.discover_protocols(arguments)
-                elif name == "negotiate_capabilities":
-                    result = await self._tools.negotiate_capabilities(arguments)
-                elif name == "broker_send_message":
-                    result = await self._tools.send_message(arguments)
-                elif name == "broadcast_message":
-                    result = await self._tools.broadcast_message(arguments)
-                elif name == "list_sessions":
-                    result = await self._tools.list_sessions(arguments)
-                elif name == "create_project":
-                    result = await self._tools.create_project(arguments)
-                elif name == "list_projects":
-                    result = await self._tools.list_projects(arguments)
-                elif name == "get_project_info":
-                    result = await self._tools.get_project_info(arguments)
-                elif name == "rotate_project_keys":
-                    result = await self._tools.rotate_project_keys(arguments)
-
-                # Meeting tools (Claude Code integration)
-                elif name == "send_message":
-                    result = await self.meeting_tools.send_message(arguments)
-                elif name == "create_meeting":
-                    result = await self.meeting_tools.create_meeting(arguments)
-                elif name == "join_meeting":
-                    result = await self.meeting_tools.join_meeting(arguments)
-                elif name == "get_decisions":
-                    result = await self.meeting_tools.get_decisions(arguments)
-                elif name == "propose_topic":
-                    result = await self.meeting_tools.propose_topic(arguments)
-
-                else:
-                    return [
-                        {
-                            "type": "text",
-                            "text": f"Unknown tool: {name}",
-                        }
-                    ]
-
-                return [
-                    {
-                        "type": "text",
-                        "text": str(result),
-                    }
-                ]
-
-            except Exception as e:
-                logger.error(
-                    f"Tool error: {name}: {e}",
-                    extra={"context": {"tool_name": name, "error": str(e)}},
-                )
-                return [
-                    {
-                        "type": "text",
-                        "text": f"Error: {e}",
-                    }
-                ]
+        failed = isinstance(result, dict) and result.get("success") is False
+        self.tool_metrics.record(name, (time.perf_counter() - started) * 1000, error=failed)
+        return json.dumps(result, separators=(",", ":"), default=str)
 
     async def run(self) -> None:
         """Run the MCP server."""
@@ -452,28 +538,42 @@ class MCPServer:
         """Start background maintenance tasks."""
         import asyncio
 
-        async def cleanup_task() -> None:
-            """Background task for session cleanup."""
-            while True:
-                try:
-                    await asyncio.sleep(10)
-                    await self.session_manager.check_stale_sessions()
-                    await self.session_manager.cleanup_expired_sessions()
-                except Exception as e:
-                    logger.error(f"Cleanup task error: {e}")
-
-        # Start cleanup task
-        asyncio.create_task(cleanup_task())
+        # Liveness monitor sleeps until the next heartbeat deadline instead of
+        # rescanning every session on a fixed interval; stored sessions from
+        # before a restart or from other broker processes are loaded on a
+        # slow resync
+        self._liveness_task = asyncio.create_task(
+            self.session_manager.run_liveness_monitor(
+                project_ids=self.project_registry.list_project_ids
+            )
+        )
         logger.info("Background tasks started")
 
     async def stop(self) -> None:
         """Stop the MCP server and cleanup resources."""
         logger.info("Stopping MCP Broker Server...")
 
+        # Stop liveness monitor
+        if self._liveness_task is not None:
+            self._liveness_task.cancel()
+            self._liveness_task = None
+
+        # Persist in-memory dead letters when a spill directory is configured
+        await self.router.dead_letters.flush()
+
+        # Send buffered communication logs before the HTTP client goes away
+        if self._communication_log is not None:
+            await self._communication_log.close()
+
         # Close HTTP client
         if self._http_client:
             await self._http_client.close()
 
+        # Release storage connections (e.g. Redis pool)
+        close_storage = getattr(self._storage, "close", None)
+        if close_storage is not None:
+            await close_storage()
+
         # Cleanup resources
         self._storage = None
         logger.info("MCP Broker Server stopped")
@@ -12,7 +12,7 @@ from mcp.types import Tool
 from pydantic import BaseModel, Field
 
 from mcp_broker.core.logging import get_logger
-from mcp_broker.models.message import Message, MessageHeaders
+from mcp_broker.models.message import DeliveryResult, Message, MessageHeaders
 from mcp_broker.models.protocol import ProtocolDefinition
 from mcp_broker.negotiation.negotiator import ProtocolRequirement
 
@@ -71,6 +71,16 @@ class SendMessageInput(BaseModel):
     ttl: int | None = Field(default=None, description="Time-to-live in seconds")
 
 
+class SendBatchInput(BaseModel):
+    """Input schema for send_batch tool."""
+
+    messages: list[SendMessageInput] = Field(
+        min_length=1,
+        max_length=1000,
+        description="Point-to-point messages to send, each as for send_message",
+    )
+
+
 class BroadcastMessageInput(BaseModel):
     """Input schema for broadcast_message tool."""
 
@@ -108,6 +118,7 @@ class MCPTools:
     2. discover_protocols - Query available protocols
     3. negotiate_capabilities - Perform capability handshake
     4. send_message - Send point-to-point message
+       (broker_send_batch sends many in one call)
     5. broadcast_message - Broadcast to all compatible sessions
     6. list_sessions - List active sessions
     """
@@ -147,6 +158,11 @@ class MCPTools:
                 description="Send a point-to-point message to a specific session",
                 inputSchema=SendMessageInput.model_json_schema(),
             ),
+            Tool(
+                name="broker_send_batch",
+                description="Send many point-to-point messages in one call",
+                inputSchema=SendBatchInput.model_json_schema(),
+            ),
             Tool(
                 name="broadcast_message",
                 description="Broadcast a message to all sessions with compatible capabilities",
@@ -291,11 +307,18 @@ class MCPTools:
         """
         parsed = DiscoverProtocolsInput(**input_data)
 
-        protocols = await self._broker.protocol_registry.discover(
-            name=parsed.name,
-            version=parsed.version_range,
-            tags=parsed.tags,
-        )
+        try:
+            protocols = await self._broker.protocol_registry.discover(
+                name=parsed.name,
+                version=parsed.version_range,
+                tags=parsed.tags,
+            )
+        except ValueError as e:
+            return {
+                "protocols": [],
+                "count": 0,
+                "error": str(e),
+            }
 
         return {
             "protocols": [
@@ -374,8 +397,71 @@ class MCPTools:
             return {"success": False, "error": "No current session"}
 
         # Create message
-        message = Message(
-            sender_id=current_session_id,
+        message = self._build_message(current_session_id, parsed)
+
+        # Send message
+        result = await self._broker.router.send_message(
+            current_session_id, UUID(parsed.recipient_id), message
+        )
+
+        return self._delivery_response(result)
+
+    async def send_batch(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """Send several point-to-point messages in one call.
+
+        Args:
+            input_data: Tool input with a list of messages
+
+        Returns:
+            Batch summary with one delivery result per message, in order
+        """
+        parsed = SendBatchInput(**input_data)
+
+        # Get current session
+        current_session_id = self._broker.current_session_id
+        if not current_session_id:
+            return {"success": False, "error": "No current session"}
+
+        # Malformed recipients fail on their own; the rest of the batch is still sent
+        slots: list[DeliveryResult | None] = []
+        messages: list[tuple[UUID, Message]] = []
+        for item in parsed.messages:
+            try:
+                recipient_id = UUID(item.recipient_id)
+            except ValueError:
+                slots.append(
+                    DeliveryResult(
+                        success=False,
+                        error_reason=f"Invalid recipient_id: {item.recipient_id}",
+                    )
+                )
+                continue
+            slots.append(None)
+            messages.append((recipient_id, self._build_message(current_session_id, item)))
+
+        delivered = iter(await self._broker.router.send_batch(current_session_id, messages))
+        results = [next(delivered) if slot is None else slot for slot in slots]
+
+        sent = sum(result.success for result in results)
+        return {
+            "success": True,
+            "sent": sent,
+            "failed": len(results) - sent,
+            "results": [self._delivery_response(result) for result in results],
+        }
+
+    def _build_message(self, sender_id: UUID, parsed: SendMessageInput) -> Message:
+        """Create a point-to-point message from tool input.
+
+        Args:
+            sender_id: Sending session UUID
+            parsed: Parsed send_message input
+
+        Returns:
+            Message addressed to the input's recipient
+        """
+        return Message(
+            sender_id=sender_id,
             recipient_id=UUID(parsed.recipient_id),
             protocol_name=parsed.protocol_name,
             protocol_version=parsed.protocol_version or "1.0.0",
@@ -383,11 +469,15 @@ class MCPTools:
             headers=MessageHeaders(priority=parsed.priority or "normal", ttl=parsed.ttl),
         )
 
-        # Send message
-        result = await self._broker.router.send_message(
-            current_session_id, UUID(parsed.recipient_id), message
-        )
+    def _delivery_response(self, result: DeliveryResult) -> dict[str, Any]:
+        """Convert a delivery result into a tool response.
+
+        Args:
+            result: Delivery result from the router
 
+        Returns:
+            Response dict with success, message_id and any delivery details
+        """
         response = {
             "success": result.success,
             "message_id": str(result.message_id) if result.message_id else None,
@@ -445,6 +535,7 @@ class MCPTools:
                 "skipped": [str(sid) for sid in result.recipients.get("skipped", [])],
             },
             "reason": result.reason,
+            "duration_ms": result.duration_ms,
         }
 
     async def list_sessions(self, input_data: dict[str, Any]) -> dict[str, Any]:
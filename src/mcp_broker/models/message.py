@@ -121,6 +121,7 @@ class BroadcastResult(BaseModel):
         delivery_count: Number of successful deliveries
         recipients: Dict with delivered, failed, and skipped session IDs
         reason: Reason if no recipients were found
+        duration_ms: Time spent on the broadcast fan-out in milliseconds
     """
 
     success: bool
@@ -129,6 +130,7 @@ class BroadcastResult(BaseModel):
         default_factory=lambda: {"delivered": [], "failed": [], "skipped": []}
     )
     reason: str | None = None
+    duration_ms: float | None = None
 
 
 class EnqueueResult(BaseModel):
@@ -35,6 +35,7 @@ class ProtocolDefinition(BaseModel):
         message_schema: JSON Schema for message validation
         capabilities: Supported communication patterns
         metadata: Optional protocol metadata
+        registered_at: Registration timestamp, set by the protocol registry
     """
 
     name: str = Field(
@@ -53,6 +54,7 @@ class ProtocolDefinition(BaseModel):
         Literal["point_to_point", "broadcast", "request_response", "streaming"]
     ] = Field(default_factory=list)
     metadata: ProtocolMetadata | None = None
+    registered_at: datetime | None = None
 
     @field_validator("message_schema")
     @classmethod
@@ -5,16 +5,144 @@ This module defines the data models for client sessions,
 including session state, capabilities, and status tracking.
 """
 
+from collections.abc import Mapping
 from datetime import UTC, datetime
-from typing import Literal
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Literal
 from uuid import UUID, uuid4
+from weakref import WeakValueDictionary
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+
+"""Maximum number of capability pairs kept in the compatibility cache."""
+COMPATIBILITY_CACHE_SIZE = 4096
+
+
+class CompiledCapabilities:
+    """Frozen, interned form of SessionCapabilities.
+
+    Equal capability declarations compile to the same instance, so the
+    pairwise compatibility cache is keyed by identity-cheap fingerprints.
+
+    Attributes:
+        fingerprint: Canonical, hashable description of the capabilities
+        protocols: Read-only mapping of protocol name -> frozenset of versions
+        features: Frozenset of supported features
+    """
+
+    __slots__ = ("fingerprint", "protocols", "features", "_hash", "__weakref__")
+
+    def __init__(
+        self,
+        fingerprint: tuple[Any, ...],
+        protocols: Mapping[str, frozenset[str]],
+        features: frozenset[str],
+    ) -> None:
+        """Initialize compiled capabilities (use compile_capabilities instead).
+
+        Args:
+            fingerprint: Canonical, hashable description of the capabilities
+            protocols: Protocol name -> frozenset of versions
+            features: Supported features
+        """
+        self.fingerprint = fingerprint
+        self.protocols = protocols
+        self.features = features
+        self._hash = hash(fingerprint)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompiledCapabilities):
+            return NotImplemented
+        return self is other or self.fingerprint == other.fingerprint
+
+
+_interned_capabilities: "WeakValueDictionary[tuple[Any, ...], CompiledCapabilities]" = (
+    WeakValueDictionary()
+)
+
+
+def compile_capabilities(
+    supported_protocols: Mapping[str, list[str]],
+    supported_features: list[str],
+) -> CompiledCapabilities:
+    """Compile a capability declaration into its interned frozen form.
+
+    Args:
+        supported_protocols: Protocol name -> list of supported versions
+        supported_features: Supported communication features
+
+    Returns:
+        Shared CompiledCapabilities instance for this declaration
+    """
+    protocols = {name: frozenset(versions) for name, versions in supported_protocols.items()}
+    features = frozenset(supported_features)
+    fingerprint = (
+        tuple((name, tuple(sorted(versions))) for name, versions in protocols.items()),
+        tuple(sorted(features)),
+    )
+
+    compiled = _interned_capabilities.get(fingerprint)
+    if compiled is None:
+        compiled = CompiledCapabilities(fingerprint, MappingProxyType(protocols), features)
+        _interned_capabilities[fingerprint] = compiled
+    return compiled
+
+
+@lru_cache(maxsize=COMPATIBILITY_CACHE_SIZE)
+def _common_protocols(
+    mine: CompiledCapabilities, theirs: CompiledCapabilities
+) -> Mapping[str, str]:
+    """Compute (and memoize) common protocols of two capability sets.
+
+    Args:
+        mine: Capabilities whose protocol order drives the result
+        theirs: Capabilities to intersect with
+
+    Returns:
+        Read-only mapping of protocol name -> chosen common version
+    """
+    common: dict[str, str] = {}
+
+    for proto_name, my_versions in mine.protocols.items():
+        their_versions = theirs.protocols.get(proto_name)
+        if not their_versions:
+            continue
+
+        # Find common versions
+        common_versions = my_versions & their_versions
+        if common_versions:
+            # For simplicity, return the first common version
+            # In production, would use semver to find highest compatible
+            common[proto_name] = min(common_versions)
+
+    return MappingProxyType(common)
+
+
+def clear_compatibility_cache() -> None:
+    """Drop all memoized pairwise compatibility results."""
+    _common_protocols.cache_clear()
+
+
+def compatibility_cache_info() -> Any:
+    """Get hit/miss statistics of the pairwise compatibility cache.
+
+    Returns:
+        functools cache info with hits, misses, maxsize and currsize
+    """
+    return _common_protocols.cache_info()
 
 
 class SessionCapabilities(BaseModel):
     """Capabilities declared by a session during connection.
 
+    The compiled form is cached on the instance and rebuilt whenever a field
+    is reassigned (including via model_copy). Mutating the protocol dict or
+    feature list in place is not detected; assign a new value instead.
+
     Attributes:
         supported_protocols: Dict mapping protocol names to supported versions
         supported_features: List of supported communication features
@@ -44,6 +172,46 @@ class SessionCapabilities(BaseModel):
         known_features = {"point_to_point", "broadcast", "encryption", "compression"}
         return list(set(v))
 
+    _compiled: CompiledCapabilities | None = PrivateAttr(default=None)
+    _compiled_from: tuple[object, object] | None = PrivateAttr(default=None)
+
+    @property
+    def compiled(self) -> CompiledCapabilities:
+        """Get the interned, frozen form of these capabilities.
+
+        Returns:
+            CompiledCapabilities shared by all equal declarations
+        """
+        # Compare by identity with the objects the cache was built from
+        source = self._compiled_from
+        if (
+            self._compiled is None
+            or source is None
+            or source[0] is not self.supported_protocols
+            or source[1] is not self.supported_features
+        ):
+            self._compiled = compile_capabilities(
+                self.supported_protocols, self.supported_features
+            )
+            self._compiled_from = (self.supported_protocols, self.supported_features)
+        return self._compiled
+
+    def __eq__(self, other: object) -> bool:
+        """Compare declared capabilities, ignoring the compiled cache.
+
+        Args:
+            other: Object to compare with
+
+        Returns:
+            True if both declare the same protocols and features
+        """
+        if not isinstance(other, SessionCapabilities):
+            return NotImplemented
+        return (
+            self.supported_protocols == other.supported_protocols
+            and self.supported_features == other.supported_features
+        )
+
 
 """Type alias for session status values."""
 SessionStatus = Literal["active", "stale", "disconnected"]
@@ -124,8 +292,8 @@ class Session(BaseModel):
         Returns:
             True if session supports the protocol version
         """
-        supported_versions = self.capabilities.supported_protocols.get(protocol_name, [])
-        return protocol_version in supported_versions
+        supported_versions = self.capabilities.compiled.protocols.get(protocol_name)
+        return supported_versions is not None and protocol_version in supported_versions
 
     def find_common_protocols(
         self, other: "Session"
@@ -138,16 +306,19 @@ class Session(BaseModel):
         Returns:
             Dict of protocol name -> highest common version
         """
-        common: dict[str, str] = {}
+        return dict(_common_protocols(self.capabilities.compiled, other.capabilities.compiled))
+
+    def common_protocol_version(self, other: "Session", protocol_name: str) -> str | None:
+        """Get the common version of a single protocol with another session.
 
-        for proto_name, my_versions in self.capabilities.supported_protocols.items():
-            their_versions = other.capabilities.supported_protocols.get(proto_name, [])
+        Served from the pairwise compatibility cache without copying.
 
-            # Find common versions
-            common_versions = set(my_versions) & set(their_versions)
-            if common_versions:
-                # For simplicity, return the first common version
-                # In production, would use semver to find highest compatible
-                common[proto_name] = sorted(common_versions)[0]
+        Args:
+            other: Another session to compare with
+            protocol_name: Protocol to look up
 
-        return common
+        Returns:
+            Common version, or None if the sessions share no version
+        """
+        common = _common_protocols(self.capabilities.compiled, other.capabilities.compiled)
+        return common.get(protocol_name)
@@ -0,0 +1,354 @@
+"""
+Compact compatibility matrix for MCP Broker Server.
+
+Sessions are grouped into capability classes (sessions whose compiled
+capabilities are identical share one class), and (protocol, version)
+pairs are encoded as bit columns. Pairwise compatibility is computed once
+per class pair - with a NumPy matrix product when NumPy is installed, or
+with integer bitsets otherwise - and per-pair details are materialized
+only when a caller asks for them.
+"""
+
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+from mcp_broker.models.session import CompiledCapabilities, Session
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without the fast extra
+    np = None  # type: ignore[assignment]
+
+
+@dataclass
+class PairCompatibility:
+    """Compatibility info for a session pair.
+
+    Attributes:
+        session_a_id: First session ID
+        session_b_id: Second session ID
+        compatible: Whether sessions are compatible
+        common_protocols: Dict of protocol -> version
+        common_features: List of common features
+        reason: Reason if not compatible
+        cross_project: Whether sessions are from different projects
+    """
+
+    session_a_id: UUID
+    session_b_id: UUID
+    compatible: bool
+    common_protocols: dict[str, str] = field(default_factory=dict)
+    common_features: list[str] = field(default_factory=list)
+    reason: str | None = None
+    cross_project: bool = False
+
+
+class CapabilityVocabulary:
+    """Bit column assignment for (protocol, version) pairs.
+
+    Attributes:
+        columns: Dict of (protocol name, version) -> bit position
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty vocabulary."""
+        self.columns: dict[tuple[str, str], int] = {}
+
+    def encode(self, compiled: CompiledCapabilities) -> int:
+        """Encode supported protocol versions as a bitmask.
+
+        Unknown (protocol, version) pairs are assigned new columns.
+
+        Args:
+            compiled: Compiled capabilities to encode
+
+        Returns:
+            Integer whose set bits are the supported protocol versions
+        """
+        mask = 0
+        for name, versions in compiled.protocols.items():
+            for version in versions:
+                column = self.columns.setdefault((name, version), len(self.columns))
+                mask |= 1 << column
+        return mask
+
+
+class _PairView(Mapping[str, PairCompatibility]):
+    """Read-only "i-j" -> PairCompatibility mapping built on demand."""
+
+    def __init__(self, matrix: "CompatibilityMatrix") -> None:
+        self._matrix = matrix
+
+    def __getitem__(self, key: str) -> PairCompatibility:
+        try:
+            first, second = (int(part) for part in key.split("-"))
+        except (AttributeError, ValueError):
+            raise KeyError(key) from None
+        if not 0 <= first < second < len(self._matrix.session_ids):
+            raise KeyError(key)
+        return self._matrix.pair(first, second)
+
+    def __iter__(self) -> Iterator[str]:
+        size = len(self._matrix.session_ids)
+        for i in range(size):
+            for j in range(i + 1, size):
+                yield f"{i}-{j}"
+
+    def __len__(self) -> int:
+        size = len(self._matrix.session_ids)
+        return size * (size - 1) // 2
+
+
+class CompatibilityMatrix:
+    """Compatibility matrix for multiple sessions.
+
+    Storage grows with the number of distinct capability classes rather
+    than the number of session pairs. PairCompatibility objects are only
+    created when read through pair() or the pairs mapping.
+
+    Attributes:
+        session_ids: List of session IDs in matrix
+        project_groups: Dict of project_id -> list of session indices
+        allow_cross_project: Whether sessions in different projects may be compatible
+    """
+
+    def __init__(
+        self,
+        sessions: list[Session] | None = None,
+        allow_cross_project: bool = False,
+    ) -> None:
+        """Build the matrix for an initial set of sessions.
+
+        Args:
+            sessions: Sessions to analyze
+            allow_cross_project: Whether to allow cross-project compatibility
+        """
+        self.session_ids: list[UUID] = []
+        self.project_groups: dict[str, list[int]] = {}
+        self.allow_cross_project = allow_cross_project
+
+        self._sessions: list[Session] = []
+        self._session_class: list[int] = []
+        self._vocabulary = CapabilityVocabulary()
+        self._class_index: dict[CompiledCapabilities, int] = {}
+        self._class_masks: list[int] = []
+        # Class x class compatibility; NumPy bool array or per-class bit rows
+        self._class_compat: Any = None
+        self._class_rows: list[int] = []
+
+        for session in sessions or []:
+            self._append(session)
+        self._compute_class_matrix()
+
+    @property
+    def pairs(self) -> Mapping[str, PairCompatibility]:
+        """Lazy mapping of "i-j" (i < j) -> PairCompatibility."""
+        return _PairView(self)
+
+    @property
+    def class_count(self) -> int:
+        """Number of distinct capability classes in the matrix."""
+        return len(self._class_masks)
+
+    def add_session(self, session: Session) -> int:
+        """Add a session, computing at most one new class row.
+
+        Args:
+            session: Session joining the matrix
+
+        Returns:
+            Index of the new session
+        """
+        known_classes = len(self._class_masks)
+        index = self._append(session)
+
+        if len(self._class_masks) > known_classes:
+            self._add_class_row()
+
+        return index
+
+    def is_compatible(self, i: int, j: int) -> bool:
+        """Check whether two sessions share a protocol version.
+
+        Args:
+            i: Index of the first session
+            j: Index of the second session
+
+        Returns:
+            True if the sessions are compatible
+        """
+        if not self.allow_cross_project and (
+            self._sessions[i].project_id != self._sessions[j].project_id
+        ):
+            return False
+        return self._classes_compatible(self._session_class[i], self._session_class[j])
+
+    def compatible_peers(self, i: int) -> list[int]:
+        """List indices of sessions compatible with session i.
+
+        Args:
+            i: Index of the session
+
+        Returns:
+            Indices of compatible sessions, in ascending order
+        """
+        if self.allow_cross_project:
+            candidates: Iterator[int] | list[int] = iter(range(len(self._sessions)))
+        else:
+            candidates = self.project_groups[self._sessions[i].project_id]
+
+        own_class = self._session_class[i]
+        return [
+            j
+            for j in candidates
+            if j != i and self._classes_compatible(own_class, self._session_class[j])
+        ]
+
+    def compatible_pair_count(self) -> int:
+        """Count compatible unordered session pairs.
+
+        Computed from per-class session counts, so the cost depends on the
+        number of capability classes rather than the number of sessions.
+
+        Returns:
+            Number of compatible pairs
+        """
+        if self.allow_cross_project:
+            groups: list[list[int]] = [list(range(len(self._sessions)))]
+        else:
+            groups = list(self.project_groups.values())
+
+        total = 0
+        for members in groups:
+            counts: dict[int, int] = {}
+            for idx in members:
+                cls = self._session_class[idx]
+                counts[cls] = counts.get(cls, 0) + 1
+
+            classes = sorted(counts)
+            if np is not None and self._class_compat is not None:
+                weights = np.array([counts[c] for c in classes], dtype=np.int64)
+                block = self._class_compat[np.ix_(classes, classes)].astype(np.int64)
+                pair_sum = int(weights @ block @ weights) - int(np.diag(block) @ weights)
+                total += pair_sum // 2
+                continue
+
+            for pos, a in enumerate(classes):
+                if self._classes_compatible(a, a):
+                    total += counts[a] * (counts[a] - 1) // 2
+                for b in classes[pos + 1 :]:
+                    if self._classes_compatible(a, b):
+                        total += counts[a] * counts[b]
+        return total
+
+    def pair(self, i: int, j: int) -> PairCompatibility:
+        """Materialize compatibility details for one session pair.
+
+        Args:
+            i: Index of the first session
+            j: Index of the second session
+
+        Returns:
+            PairCompatibility for the pair
+        """
+        session_a = self._sessions[i]
+        session_b = self._sessions[j]
+        cross_project = session_a.project_id != session_b.project_id
+
+        if cross_project and not self.allow_cross_project:
+            return PairCompatibility(
+                session_a_id=session_a.session_id,
+                session_b_id=session_b.session_id,
+                compatible=False,
+                common_protocols={},
+                common_features=[],
+                reason=f"Cross-project compatibility not allowed: {session_a.project_id} != {session_b.project_id}",
+                cross_project=True,
+            )
+
+        compatible = self._classes_compatible(self._session_class[i], self._session_class[j])
+        features_a = session_a.capabilities.compiled.features
+        features_b = session_b.capabilities.compiled.features
+
+        return PairCompatibility(
+            session_a_id=session_a.session_id,
+            session_b_id=session_b.session_id,
+            compatible=compatible,
+            common_protocols=session_a.find_common_protocols(session_b) if compatible else {},
+            common_features=list(features_a & features_b),
+            reason=None if compatible else "No common protocols",
+            cross_project=cross_project,
+        )
+
+    def _append(self, session: Session) -> int:
+        """Record a session and its capability class without computing rows."""
+        index = len(self._sessions)
+        self._sessions.append(session)
+        self.session_ids.append(session.session_id)
+        self.project_groups.setdefault(session.project_id, []).append(index)
+
+        compiled = session.capabilities.compiled
+        cls = self._class_index.get(compiled)
+        if cls is None:
+            cls = len(self._class_masks)
+            self._class_index[compiled] = cls
+            self._class_masks.append(self._vocabulary.encode(compiled))
+        self._session_class.append(cls)
+
+        return index
+
+    def _compute_class_matrix(self) -> None:
+        """Compute compatibility between all capability classes."""
+        class_count = len(self._class_masks)
+
+        if np is not None:
+            columns = len(self._vocabulary.columns)
+            encoded = np.zeros((class_count, columns), dtype=np.float32)
+            for cls, mask in enumerate(self._class_masks):
+                bits = [pos for pos in range(mask.bit_length()) if mask >> pos & 1]
+                encoded[cls, bits] = 1.0
+            # Shared protocol-version count for every class pair in one product
+            self._class_compat = (encoded @ encoded.T) > 0
+            return
+
+        self._class_rows = []
+        for cls in range(class_count):
+            self._class_rows.append(self._bit_row(self._class_masks[cls], class_count))
+
+    def _add_class_row(self) -> None:
+        """Extend the class matrix with the most recently added class."""
+        cls = len(self._class_masks) - 1
+        new_mask = self._class_masks[cls]
+        row = [bool(new_mask & mask) for mask in self._class_masks]
+
+        if np is not None:
+            capacity = self._class_compat.shape[0]
+            if cls >= capacity:
+                # Grow geometrically so repeated joins copy amortized O(1) rows
+                grown = np.zeros((max(2 * capacity, 16),) * 2, dtype=bool)
+                grown[:capacity, :capacity] = self._class_compat
+                self._class_compat = grown
+            self._class_compat[cls, : cls + 1] = row
+            self._class_compat[: cls + 1, cls] = row
+            return
+
+        for other, compatible in enumerate(row[:cls]):
+            if compatible:
+                self._class_rows[other] |= 1 << cls
+        self._class_rows.append(self._bit_row(new_mask, cls + 1))
+
+    def _bit_row(self, mask: int, class_count: int) -> int:
+        """Build a bit row of classes sharing any protocol version with mask."""
+        row = 0
+        for other in range(class_count):
+            if mask & self._class_masks[other]:
+                row |= 1 << other
+        return row
+
+    def _classes_compatible(self, a: int, b: int) -> bool:
+        """Look up compatibility between two capability classes."""
+        if np is not None:
+            return bool(self._class_compat[a, b])
+        return bool(self._class_rows[a] >> b & 1)
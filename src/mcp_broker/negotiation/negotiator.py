@@ -8,10 +8,13 @@ compatibility checking.
 
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
-from uuid import UUID
 
 from mcp_broker.core.logging import get_logger
 from mcp_broker.models.session import Session
+from mcp_broker.negotiation.matrix import (  # noqa: F401 - PairCompatibility re-exported
+    CompatibilityMatrix,
+    PairCompatibility,
+)
 
 if TYPE_CHECKING:
     pass
@@ -55,44 +58,6 @@ class ProtocolRequirement:
     version: str
 
 
-@dataclass
-class CompatibilityMatrix:
-    """Compatibility matrix for multiple sessions.
-
-    Attributes:
-        pairs: Dict of pair_key -> compatibility info
-        session_ids: List of session IDs in matrix
-        project_groups: Dict of project_id -> list of session indices
-    """
-
-    pairs: dict[str, "PairCompatibility"] = field(default_factory=dict)
-    session_ids: list[UUID] = field(default_factory=list)
-    project_groups: dict[str, list[int]] = field(default_factory=dict)
-
-
-@dataclass
-class PairCompatibility:
-    """Compatibility info for a session pair.
-
-    Attributes:
-        session_a_id: First session ID
-        session_b_id: Second session ID
-        compatible: Whether sessions are compatible
-        common_protocols: Dict of protocol -> version
-        common_features: List of common features
-        reason: Reason if not compatible
-        cross_project: Whether sessions are from different projects
-    """
-
-    session_a_id: UUID
-    session_b_id: UUID
-    compatible: bool
-    common_protocols: dict[str, str] = field(default_factory=dict)
-    common_features: list[str] = field(default_factory=list)
-    reason: str | None = None
-    cross_project: bool = False
-
-
 class CapabilityNegotiator:
     """
     Negotiator for session capability handshake.
@@ -189,8 +154,8 @@ class CapabilityNegotiator:
                         )
 
         # Check feature intersection
-        features_a = set(session_a.capabilities.supported_features)
-        features_b = set(session_b.capabilities.supported_features)
+        features_a = session_a.capabilities.compiled.features
+        features_b = session_b.capabilities.compiled.features
         common_features = list(features_a & features_b)
         unsupported_a = list(features_b - features_a)
         unsupported_b = list(features_a - features_b)
@@ -252,6 +217,9 @@ class CapabilityNegotiator:
     ) -> CompatibilityMatrix:
         """Compute compatibility matrix for multiple sessions.
 
+        Sessions with identical capabilities are compared once, and pair
+        details are materialized lazily through the returned matrix.
+
         Args:
             sessions: List of sessions to analyze
             allow_cross_project: Whether to allow cross-project compatibility
@@ -260,58 +228,7 @@ class CapabilityNegotiator:
             CompatibilityMatrix with pairwise compatibility
         """
         logger = get_logger(__name__)
-        matrix = CompatibilityMatrix()
-        matrix.session_ids = [s.session_id for s in sessions]
-
-        # Group sessions by project
-        for idx, session in enumerate(sessions):
-            if session.project_id not in matrix.project_groups:
-                matrix.project_groups[session.project_id] = []
-            matrix.project_groups[session.project_id].append(idx)
-
-        # Compare each pair
-        for i, session_a in enumerate(sessions):
-            for j, session_b in enumerate(sessions):
-                if i >= j:
-                    continue  # Skip duplicates and self-comparison
-
-                # Check if cross-project
-                cross_project = session_a.project_id != session_b.project_id
-
-                # Skip cross-project if not allowed
-                if cross_project and not allow_cross_project:
-                    pair_key = f"{i}-{j}"
-                    matrix.pairs[pair_key] = PairCompatibility(
-                        session_a_id=session_a.session_id,
-                        session_b_id=session_b.session_id,
-                        compatible=False,
-                        common_protocols={},
-                        common_features=[],
-                        reason=f"Cross-project compatibility not allowed: {session_a.project_id} != {session_b.project_id}",
-                        cross_project=True,
-                    )
-                    continue
-
-                # Find common protocols and features
-                common_protocols = session_a.find_common_protocols(session_b)
-
-                features_a = set(session_a.capabilities.supported_features)
-                features_b = set(session_b.capabilities.supported_features)
-                common_features = list(features_a & features_b)
-
-                # Determine compatibility
-                compatible = len(common_protocols) > 0
-
-                pair_key = f"{i}-{j}"
-                matrix.pairs[pair_key] = PairCompatibility(
-                    session_a_id=session_a.session_id,
-                    session_b_id=session_b.session_id,
-                    compatible=compatible,
-                    common_protocols=common_protocols,
-                    common_features=common_features,
-                    reason=None if compatible else "No common protocols",
-                    cross_project=cross_project,
-                )
+        matrix = CompatibilityMatrix(sessions, allow_cross_project=allow_cross_project)
 
         logger.debug(
             f"Computed compatibility matrix for {len(sessions)} sessions",
@@ -320,6 +237,7 @@ class CapabilityNegotiator:
                     "session_count": len(sessions),
                     "pair_count": len(matrix.pairs),
                     "project_groups": len(matrix.project_groups),
+                    "capability_classes": matrix.class_count,
                 }
             },
         )
@@ -208,6 +208,24 @@ class CrossProjectConfig(BaseModel):
         """
         return self.permissions_b_to_a.message_rate_limit
 
+    def get_rate_limit_from(self, sender_project: str) -> int:
+        """Get rate limit for messages sent by one side of the relationship.
+
+        Args:
+            sender_project: Project sending the messages
+
+        Returns:
+            Messages per minute (0 = unlimited)
+
+        Raises:
+            ValueError: If sender_project is not part of the relationship
+        """
+        if sender_project == self.project_a:
+            return self.get_rate_limit_a_to_b()
+        if sender_project == self.project_b:
+            return self.get_rate_limit_b_to_a()
+        raise ValueError(f"Project '{sender_project}' is not part of this relationship")
+
     @classmethod
     def create_pair(cls, project_a: str, project_b: str) -> tuple["CrossProjectConfig", "CrossProjectConfig"]:
         """Create a pair of cross-project configs.
@@ -8,11 +8,13 @@ write-through caching to the database.
 
 import hashlib
 import secrets
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable, Iterator
 from datetime import UTC, datetime, timedelta
+from typing import NamedTuple
 from uuid import UUID
 
 from agent_comm_core.db.database import db_session
+from mcp_broker.core.cache import TTLCache
 from mcp_broker.core.logging import get_logger
 from mcp_broker.models.project import (
     ProjectAPIKey,
@@ -29,6 +31,17 @@ logger = get_logger(__name__)
 # Type alias for session factory
 SessionFactory = AsyncGenerator[object]
 
+# Longer keys are rejected before any parsing or hashing work
+_MAX_API_KEY_LENGTH = 512
+
+
+class CachedApiKey(NamedTuple):
+    """A validated API key as held in the API key cache."""
+
+    project_id: str
+    key_id: str
+    expires_at: datetime | None
+
 
 class ProjectRegistry:
     """
@@ -48,25 +61,66 @@ class ProjectRegistry:
         _db_session_factory: Async session factory for database operations
         _api_key_secrets: Dict mapping (project_id, key_id) to api_key_secret
                           (Secrets are never stored in DB, only in memory)
+        _api_key_cache: LRU+TTL cache of SHA-256 key hash -> validated key
+        _rejected_api_keys: Short-lived cache of key hashes that failed validation
     """
 
-    def __init__(self, db_session_factory: SessionFactory | None = None) -> None:
+    def __init__(
+        self,
+        db_session_factory: SessionFactory | None = None,
+        api_key_cache_size: int = 10_000,
+        api_key_cache_ttl: float = 300.0,
+        rejected_api_key_ttl: float = 5.0,
+    ) -> None:
         """
         Initialize the project registry.
 
         Args:
             db_session_factory: Optional async session factory for DB operations.
                               If None, registry operates in memory-only mode.
+            api_key_cache_size: Most validated keys kept in the API key cache
+            api_key_cache_ttl: Seconds a validated key is trusted without rechecking
+            rejected_api_key_ttl: Seconds a rejected key is refused without rechecking
         """
         self._projects: dict[str, ProjectDefinition] = {}
         self._db_session_factory = db_session_factory
         self._api_key_secrets: dict[tuple[str, str], str] = {}
+        self._api_key_cache: TTLCache[str, CachedApiKey] = TTLCache(
+            api_key_cache_size, api_key_cache_ttl
+        )
+        self._rejected_api_keys: TTLCache[str, bool] = TTLCache(
+            api_key_cache_size, rejected_api_key_ttl
+        )
+        self._change_listeners: list[Callable[[str], object]] = []
 
         logger.info(
             "ProjectRegistry initialized",
             extra={"context": {"database_enabled": db_session_factory is not None}},
         )
 
+    def add_change_listener(self, listener: Callable[[str], object]) -> None:
+        """
+        Register a callback for project changes.
+
+        The listener is called with the project ID whenever a project is
+        created, updated or deleted, e.g.
+        AdminPermissionManager.invalidate_project.
+
+        Args:
+            listener: Callable taking the changed project ID
+        """
+        self._change_listeners.append(listener)
+
+    def _notify_change(self, project_id: str) -> None:
+        """
+        Call change listeners for a project.
+
+        Args:
+            project_id: Changed project ID
+        """
+        for listener in self._change_listeners:
+            listener(project_id)
+
     def _generate_api_key(
         self,
         project_id: str,
@@ -145,6 +199,9 @@ class ProjectRegistry:
                         extra={"context": {"project_id": project.project_id}},
                     )
 
+                # Keys loaded from the database may have been rejected before
+                self._rejected_api_keys.clear()
+
                 logger.info(
                     f"Loaded {loaded_count} projects from database",
                     extra={"context": {"count": loaded_count}},
@@ -348,6 +405,8 @@ class ProjectRegistry:
 
         # Store API key secret in memory
         self._api_key_secrets[(project_id, key_id)] = api_key
+        self._rejected_api_keys.clear()
+        self._notify_change(project_id)
 
         # Save to database if session factory available
         if owner_uuid and self._db_session_factory:
@@ -415,6 +474,15 @@ class ProjectRegistry:
 
         return result
 
+    def list_project_ids(self) -> list[str]:
+        """
+        List the IDs of all registered projects, including inactive ones.
+
+        Returns:
+            Project IDs
+        """
+        return list(self._projects)
+
     async def update_project(
         self,
         project_id: str,
@@ -461,6 +529,7 @@ class ProjectRegistry:
         old_status = project.status
         project.status = deepcopy(old_status)
         project.status.last_modified = datetime.now(UTC)
+        self._notify_change(project_id)
 
         # Sync to database if available
         if self._db_session_factory:
@@ -518,6 +587,8 @@ class ProjectRegistry:
         keys_to_remove = [(pid, kid) for (pid, kid) in self._api_key_secrets if pid == project_id]
         for key in keys_to_remove:
             del self._api_key_secrets[key]
+        self.invalidate_api_key_cache(project_id)
+        self._notify_change(project_id)
 
         logger.info(
             f"Deleted project: {project_id}",
@@ -533,74 +604,166 @@ class ProjectRegistry:
         """
         Validate an API key and extract project and key IDs.
 
+        Validated keys are cached by SHA-256 hash until the cache TTL or the
+        key's own expiry, whichever comes first. Rejected keys are cached
+        briefly so repeated bad keys do not reach the database.
+
         Args:
             api_key: API key string to validate
 
         Returns:
             Tuple of (project_id, key_id) if valid, None otherwise
         """
+        if len(api_key) > _MAX_API_KEY_LENGTH:
+            return None
+
+        key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+        now = datetime.now(UTC)
+
+        cached = self._api_key_cache.get(key_hash)
+        if cached is not None:
+            if cached.expires_at is None or cached.expires_at > now:
+                return (cached.project_id, cached.key_id)
+            self._api_key_cache.pop(key_hash)
+
+        if self._rejected_api_keys.get(key_hash):
+            return None
+
         try:
-            # Split from right to handle project_ids with underscores
-            parts = api_key.rsplit("_", 2)
-            if len(parts) != 3:
-                return None
+            validated = await self._verify_api_key(api_key, key_hash, now)
+        except Exception as e:
+            # Not cached as rejected: the key may be fine once the database is back
+            logger.warning(
+                f"Database API key validation failed: {e}",
+                extra={"context": {"error": str(e)}},
+            )
+            return None
 
-            project_id, key_id, _secret = parts
+        if validated is None:
+            self._rejected_api_keys.set(key_hash, True)
+            return None
 
-            # Check if project exists
-            project = await self.get_project(project_id)
-            if not project:
-                return None
+        ttl = self._api_key_cache.ttl
+        if validated.expires_at is not None:
+            ttl = min(ttl, (validated.expires_at - now).total_seconds())
+        self._api_key_cache.set(key_hash, validated, ttl)
 
-            # Check against stored secrets first (for keys generated by this registry)
-            stored_secret = self._api_key_secrets.get((project_id, key_id))
-            if stored_secret and stored_secret == api_key:
-                # Verify key is still active and not expired
-                for project_key in project.api_keys:
-                    if project_key.key_id == key_id:
-                        if not project_key.is_active:
-                            return None
-                        if project_key.expires_at:
-                            now = datetime.now(UTC)
-                            if project_key.expires_at < now:
-                                return None
-                        break
+        logger.debug(
+            f"API key validated for project: {validated.project_id}",
+            extra={"context": {"project_id": validated.project_id, "key_id": validated.key_id}},
+        )
+        return (validated.project_id, validated.key_id)
 
-                logger.debug(
-                    f"API key validated for project: {project_id}",
-                    extra={"context": {"project_id": project_id, "key_id": key_id}},
-                )
-                return (project_id, key_id)
-
-            # If not in memory secrets, validate against database hash
-            if self._db_session_factory:
-                try:
-                    async with db_session() as session:
-                        from agent_comm_core.repositories import ProjectApiKeyRepository
-
-                        key_repo = ProjectApiKeyRepository(session)
-
-                        # Compute hash of provided key
-                        api_key_hash = hashlib.sha256(api_key.encode()).hexdigest()
-
-                        # Look up by hash
-                        db_key = await key_repo.get_by_hash(api_key_hash)
-                        if db_key and db_key.is_valid:
-                            logger.debug(
-                                f"API key validated for project: {project_id}",
-                                extra={"context": {"project_id": project_id, "key_id": key_id}},
-                            )
-                            return (project_id, key_id)
-                except Exception as e:
-                    logger.warning(
-                        f"Database API key validation failed: {e}",
-                        extra={"context": {"error": str(e)}},
-                    )
+    def invalidate_api_key_cache(self, project_id: str | None = None) -> int:
+        """
+        Drop cached API key validations.
+
+        Called by rotate_api_keys and delete_project; call it after
+        changing a project's keys by any other route.
+
+        Args:
+            project_id: Only drop keys of this project (None = all projects)
+
+        Returns:
+            Number of cached keys dropped
+        """
+        self._rejected_api_keys.clear()
+        if project_id is None:
+            dropped = len(self._api_key_cache)
+            self._api_key_cache.clear()
+            return dropped
+        return self._api_key_cache.discard_where(lambda _, key: key.project_id == project_id)
+
+    def get_api_key_cache_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Get API key cache counters.
+
+        Returns:
+            Dictionary with "validated" and "rejected" cache statistics
+        """
+        return {
+            "validated": self._api_key_cache.get_stats(),
+            "rejected": self._rejected_api_keys.get_stats(),
+        }
+
+    def _split_api_key(self, api_key: str) -> Iterator[tuple[str, str]]:
+        """
+        List the (project_id, key_id) readings of an API key.
+
+        Project IDs, key IDs and secrets may all contain underscores, so a
+        key can be split several ways. Only splits naming a known project
+        are produced.
+
+        Args:
+            api_key: API key string
 
+        Yields:
+            Candidate (project_id, key_id) pairs
+        """
+        separators = [i for i, char in enumerate(api_key) if char == "_"]
+        for index, start in enumerate(separators):
+            project_id = api_key[:start]
+            if project_id not in self._projects:
+                continue
+            for end in separators[index + 1 :]:
+                if end > start + 1 and end < len(api_key) - 1:
+                    yield project_id, api_key[start + 1 : end]
+
+    async def _verify_api_key(
+        self,
+        api_key: str,
+        key_hash: str,
+        now: datetime,
+    ) -> CachedApiKey | None:
+        """
+        Check an API key against in-memory secrets, then the database.
+
+        Args:
+            api_key: API key string
+            key_hash: SHA-256 hex digest of the key
+            now: Current time for expiry checks
+
+        Returns:
+            The validated key, or None if the key is invalid
+
+        Raises:
+            Exception: If the database lookup fails
+        """
+        candidates = list(self._split_api_key(api_key))
+
+        # Check against stored secrets first (for keys generated by this registry)
+        for project_id, key_id in candidates:
+            stored_secret = self._api_key_secrets.get((project_id, key_id))
+            if stored_secret is None or not secrets.compare_digest(stored_secret, api_key):
+                continue
+
+            # Verify key is still active and not expired
+            project = self._projects[project_id]
+            project_key = next((k for k in project.api_keys if k.key_id == key_id), None)
+            if project_key is None:
+                return CachedApiKey(project_id, key_id, None)
+            if not project_key.is_active:
+                return None
+            if project_key.expires_at and project_key.expires_at < now:
+                return None
+            return CachedApiKey(project_id, key_id, project_key.expires_at)
+
+        # If not in memory secrets, validate against database hash
+        if not candidates or not self._db_session_factory:
             return None
 
-        except Exception:
+        async with db_session() as session:
+            from agent_comm_core.repositories import ProjectApiKeyRepository
+
+            key_repo = ProjectApiKeyRepository(session)
+            db_key = await key_repo.get_by_hash(key_hash)
+
+        if db_key is None or not db_key.is_valid:
             return None
+        for project_id, key_id in candidates:
+            if key_id == db_key.key_id:
+                return CachedApiKey(project_id, key_id, db_key.expires_at)
+        return None
 
     async def rotate_api_keys(
         self,
@@ -658,8 +821,8 @@ class ProjectRegistry:
                     )
                     break
         else:
-            # Rotate all keys
-            for project_key in project.api_keys:
+            # Rotate all keys (iterate a snapshot: new keys are appended)
+            for project_key in list(project.api_keys):
                 # Set expiration on old key
                 project_key.expires_at = expiration
 
@@ -683,6 +846,9 @@ class ProjectRegistry:
                 extra={"context": {"project_id": project_id}},
             )
 
+        # Old keys now expire; cached validations must not outlive that
+        self.invalidate_api_key_cache(project_id)
+
         # Sync to database if available
         if self._db_session_factory:
             try:
@@ -749,6 +915,7 @@ class ProjectRegistry:
             self._api_key_secrets[("default", "default")] = (
                 "default_default_abcdefghijklmnopqrstuvwxyz123456"
             )
+            self._rejected_api_keys.clear()
 
             logger.info("Created default project for backward compatibility")
 
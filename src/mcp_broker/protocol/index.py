@@ -0,0 +1,348 @@
+"""
+Protocol discovery index for MCP Broker Server.
+
+This module provides the per-project ProtocolIndex used by
+ProtocolRegistry to answer discovery queries without scanning storage,
+and the VersionRange parser for semantic version range filters.
+
+Index layout:
+- name -> sorted list of semver Versions (range queries use bisect)
+- tag -> set of entry keys (inverted index)
+- (name, Version) -> {source project -> ProtocolInfo}; source is None for
+  protocols owned by the indexed project and the owning project ID for
+  protocols shared into it
+
+Supported range syntax (clauses separated by commas or whitespace are
+intersected):
+- "1.2.3", "=1.2.3", "==1.2.3" -> exactly that version
+- "1.2", "1.x", "1.2.*" -> any version with that prefix
+- ">=1.2", ">1.2.3", "<2", "<=2.1" -> comparisons (partial versions allowed)
+- "^1.2.3" -> compatible with 1.2.3 (same major, or minor below 1.0.0)
+- "~1.2.3" -> same major and minor
+- "!=1.2.3" -> exclude one version
+- "*" or "" -> any version
+"""
+
+import re
+from bisect import bisect_left
+from collections.abc import Iterable
+
+from semver import Version
+
+from mcp_broker.models.protocol import ProtocolInfo
+
+EntryKey = tuple[str, Version, str | None]
+
+_CLAUSE = re.compile(
+    r"\s*(\^|~|>=|<=|>|<|==|=|!=)?\s*v?((?:\d+|[xX*])(?:\.(?:\d+|[xX*])){0,2})\s*,?"
+)
+
+
+def parse_version(version: str) -> Version:
+    """Parse a protocol version string.
+
+    Args:
+        version: Version in major.minor.patch form
+
+    Returns:
+        Parsed semver Version
+
+    Raises:
+        ValueError: If the version is not major.minor.patch
+    """
+    parts = version.split(".")
+    if len(parts) != 3 or not all(part.isdigit() for part in parts):
+        raise ValueError(f"Invalid version '{version}', expected major.minor.patch")
+    return Version(*(int(part) for part in parts))
+
+
+class VersionRange:
+    """
+    A semver range reduced to one interval plus excluded versions.
+
+    Attributes:
+        lower: Inclusive lower bound, or None for no lower bound
+        upper: Exclusive upper bound, or None for no upper bound
+        excluded: Versions removed from the interval
+    """
+
+    __slots__ = ("lower", "upper", "excluded")
+
+    def __init__(
+        self,
+        lower: Version | None = None,
+        upper: Version | None = None,
+        excluded: frozenset[Version] = frozenset(),
+    ) -> None:
+        """Create a range from bounds.
+
+        Args:
+            lower: Inclusive lower bound
+            upper: Exclusive upper bound
+            excluded: Versions removed from the interval
+        """
+        self.lower = lower
+        self.upper = upper
+        self.excluded = excluded
+
+    @classmethod
+    def parse(cls, spec: str) -> "VersionRange":
+        """Parse a range expression.
+
+        Args:
+            spec: Range expression (see module docstring)
+
+        Returns:
+            Parsed VersionRange
+
+        Raises:
+            ValueError: If the expression is malformed
+        """
+        lower: Version | None = None
+        upper: Version | None = None
+        excluded: set[Version] = set()
+
+        position = 0
+        spec = spec.strip()
+        while position < len(spec):
+            match = _CLAUSE.match(spec, position)
+            if match is None or match.end() == position:
+                raise ValueError(f"Invalid version range '{spec}'")
+            position = match.end()
+
+            operator = match.group(1) or "="
+            numbers: list[int] = []
+            for part in match.group(2).split("."):
+                if not part.isdigit():
+                    break
+                numbers.append(int(part))
+
+            if operator == "!=":
+                if len(numbers) != 3:
+                    raise ValueError(f"'!=' needs a full version in range '{spec}'")
+                excluded.add(Version(*numbers))
+                continue
+
+            clause_lower, clause_upper = cls._clause_bounds(operator, numbers)
+            if clause_lower is not None and (lower is None or clause_lower > lower):
+                lower = clause_lower
+            if clause_upper is not None and (upper is None or clause_upper < upper):
+                upper = clause_upper
+
+        return cls(lower, upper, frozenset(excluded))
+
+    @staticmethod
+    def _clause_bounds(operator: str, numbers: list[int]) -> tuple[Version | None, Version | None]:
+        """Translate one clause into [lower, upper) bounds."""
+        if not numbers:
+            # "*" matches everything; "<*" and ">*" match nothing
+            if operator in ("=", "==", ">=", "<=", "^", "~"):
+                return None, None
+            return Version(0), Version(0)
+
+        floor = Version(*numbers, *([0] * (3 - len(numbers))))
+        precision = len(numbers)
+
+        def bump(index: int) -> Version:
+            """Smallest version above every version sharing numbers[:index + 1]."""
+            head = numbers[:index] + [numbers[index] + 1]
+            return Version(*head, *([0] * (3 - len(head))))
+
+        # Upper bound of the versions matched by a partial or full version
+        prefix_end = bump(precision - 1)
+
+        if operator in ("=", "=="):
+            return floor, prefix_end
+        if operator == ">=":
+            return floor, None
+        if operator == ">":
+            return prefix_end, None
+        if operator == "<":
+            return None, floor
+        if operator == "<=":
+            return None, prefix_end
+        if operator == "~":
+            return floor, bump(min(precision - 1, 1))
+        # "^": bump the first non-zero component among those given
+        for index, number in enumerate(numbers):
+            if number != 0:
+                return floor, bump(index)
+        return floor, prefix_end
+
+    def contains(self, version: Version) -> bool:
+        """Check whether a version is in the range.
+
+        Args:
+            version: Version to test
+
+        Returns:
+            True if the version satisfies the range
+        """
+        if self.lower is not None and version < self.lower:
+            return False
+        if self.upper is not None and version >= self.upper:
+            return False
+        return version not in self.excluded
+
+    def select(self, versions: list[Version]) -> list[Version]:
+        """Pick the matching versions from a sorted list.
+
+        Args:
+            versions: Versions in ascending order
+
+        Returns:
+            Matching versions in ascending order
+        """
+        start = bisect_left(versions, self.lower) if self.lower is not None else 0
+        end = bisect_left(versions, self.upper) if self.upper is not None else len(versions)
+        if not self.excluded:
+            return versions[start:end]
+        return [v for v in versions[start:end] if v not in self.excluded]
+
+
+class ProtocolIndex:
+    """
+    In-memory discovery index for the protocols visible to one project.
+
+    Attributes:
+        loaded_at: Monotonic time at which the index was loaded from storage
+        shared_generation: Sharing generation the shared entries reflect
+    """
+
+    def __init__(self, loaded_at: float = 0.0) -> None:
+        """Initialize an empty index.
+
+        Args:
+            loaded_at: Monotonic time at which the index was loaded
+        """
+        self.loaded_at = loaded_at
+        self.shared_generation = -1
+
+        self._entries: dict[tuple[str, Version], dict[str | None, ProtocolInfo]] = {}
+        self._versions: dict[str, list[Version]] = {}
+        self._tags: dict[str, set[EntryKey]] = {}
+        self._shared: set[EntryKey] = set()
+
+    def __len__(self) -> int:
+        return sum(len(sources) for sources in self._entries.values())
+
+    def add(self, info: ProtocolInfo, source_project: str | None = None) -> None:
+        """Index a protocol, replacing any entry with the same key.
+
+        Args:
+            info: Protocol info to index
+            source_project: Owning project for shared protocols, None for own
+        """
+        version = parse_version(info.version)
+        key = (info.name, version, source_project)
+        if source_project in self._entries.get((info.name, version), {}):
+            self.remove(info.name, info.version, source_project)
+
+        sources = self._entries.get((info.name, version))
+        if sources is None:
+            sources = self._entries[(info.name, version)] = {}
+            versions = self._versions.setdefault(info.name, [])
+            versions.insert(bisect_left(versions, version), version)
+        sources[source_project] = info
+
+        for tag in info.metadata.tags if info.metadata else []:
+            self._tags.setdefault(tag, set()).add(key)
+        if source_project is not None:
+            self._shared.add(key)
+
+    def remove(self, name: str, version: str, source_project: str | None = None) -> bool:
+        """Remove a protocol from the index.
+
+        Args:
+            name: Protocol name
+            version: Protocol version
+            source_project: Owning project for shared protocols, None for own
+
+        Returns:
+            True if an entry was removed
+        """
+        parsed = parse_version(version)
+        sources = self._entries.get((name, parsed))
+        if not sources or source_project not in sources:
+            return False
+
+        info = sources.pop(source_project)
+        key = (name, parsed, source_project)
+        for tag in info.metadata.tags if info.metadata else []:
+            tagged = self._tags.get(tag)
+            if tagged is not None:
+                tagged.discard(key)
+                if not tagged:
+                    del self._tags[tag]
+        self._shared.discard(key)
+
+        if not sources:
+            del self._entries[(name, parsed)]
+            versions = self._versions[name]
+            del versions[bisect_left(versions, parsed)]
+            if not versions:
+                del self._versions[name]
+        return True
+
+    def clear_shared(self) -> None:
+        """Remove every shared entry."""
+        for name, version, source in list(self._shared):
+            self.remove(name, str(version), source)
+
+    def query(
+        self,
+        name: str | None = None,
+        version_range: VersionRange | None = None,
+        tags: list[str] | None = None,
+        include_shared: bool = False,
+    ) -> list[ProtocolInfo]:
+        """Find protocols matching all given filters.
+
+        Results are ordered by name, then version, with a project's own
+        protocol ahead of shared ones of the same name and version.
+
+        Args:
+            name: Exact protocol name
+            version_range: Version range to match
+            tags: Match protocols carrying any of these tags
+            include_shared: Include protocols shared into the project
+
+        Returns:
+            Matching protocol infos
+        """
+        if tags:
+            tagged: set[EntryKey] = set()
+            for tag in tags:
+                tagged |= self._tags.get(tag, set())
+            keys: Iterable[EntryKey] = sorted(
+                (
+                    key
+                    for key in tagged
+                    if (name is None or key[0] == name)
+                    and (version_range is None or version_range.contains(key[1]))
+                ),
+                key=lambda key: (key[0], key[1], key[2] or ""),
+            )
+        else:
+            keys = self._range_keys(name, version_range)
+
+        return [
+            self._entries[(key_name, version)][source]
+            for key_name, version, source in keys
+            if include_shared or source is None
+        ]
+
+    def _range_keys(self, name: str | None, version_range: VersionRange | None) -> list[EntryKey]:
+        """List entry keys for one or all names, narrowed by bisect."""
+        names = [name] if name is not None else sorted(self._versions)
+        keys: list[EntryKey] = []
+        for protocol_name in names:
+            versions = self._versions.get(protocol_name, [])
+            if version_range is not None:
+                versions = version_range.select(versions)
+            for version in versions:
+                sources = self._entries[(protocol_name, version)]
+                # Own protocol (None) first, then shared ones by project
+                for source in sorted(sources, key=lambda s: (s is not None, s or "")):
+                    keys.append((protocol_name, version, source))
+        return keys
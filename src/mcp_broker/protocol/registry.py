@@ -6,18 +6,27 @@ registering, validating, and discovering communication protocols.
 
 Supports project-scoped protocol isolation with optional cross-project
 protocol sharing (read-only references).
+
+Discovery is answered from a per-project ProtocolIndex that is loaded
+from storage on first use and kept current by register() and sharing
+changes.
 """
 
+import asyncio
+import time
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 from mcp_broker.core.logging import get_logger
+from mcp_broker.models.message import Message
 from mcp_broker.models.protocol import (
     ProtocolDefinition,
     ProtocolInfo,
     ProtocolValidationError,
     ValidationResult,
 )
+from mcp_broker.protocol.index import ProtocolIndex, VersionRange
+from mcp_broker.protocol.validation import ValidatorCache, describe_error
 from mcp_broker.storage.interface import StorageBackend
 
 if TYPE_CHECKING:
@@ -30,6 +39,9 @@ logger = get_logger(__name__)
 # Maps (source_project_id, protocol_name, protocol_version) -> set(target_project_ids)
 _shared_protocols: dict[tuple[str, str, str], set[str]] = {}
 
+# Bumped on every share/unshare so indexes know to re-merge shared protocols
+_shared_generation = 0
+
 
 class ProtocolRegistry:
     """
@@ -37,21 +49,31 @@ class ProtocolRegistry:
 
     The ProtocolRegistry handles:
     - Protocol registration with JSON Schema validation
-    - Protocol discovery with filtering by name, version, tags
+    - Protocol discovery with filtering by name, version range, tags
     - Duplicate prevention
     - Protocol metadata tracking
+    - Message payload validation with cached compiled schemas
 
     Attributes:
         storage: Storage backend for protocol persistence
     """
 
-    def __init__(self, storage: StorageBackend) -> None:
+    def __init__(
+        self, storage: StorageBackend, index_refresh_interval: float | None = None
+    ) -> None:
         """Initialize the protocol registry.
 
         Args:
             storage: Storage backend for persistence
+            index_refresh_interval: Seconds after which a project's discovery
+                index is reloaded from storage, so protocols registered by
+                other broker processes become visible (None never reloads)
         """
         self._storage = storage
+        self._index_refresh_interval = index_refresh_interval
+        self._indexes: dict[str, ProtocolIndex] = {}
+        self._index_lock = asyncio.Lock()
+        self._validators = ValidatorCache()
         logger.info("ProtocolRegistry initialized")
 
     async def register(
@@ -69,6 +91,11 @@ class ProtocolRegistry:
         Raises:
             ValueError: If protocol already exists or validation fails
         """
+        async with self._index_lock:
+            return await self._register(protocol, project_id)
+
+    async def _register(self, protocol: ProtocolDefinition, project_id: str) -> ProtocolInfo:
+        """Register a protocol while holding the index lock."""
         # Check for duplicate within project
         existing = await self._storage.get_protocol(protocol.name, protocol.version, project_id)
         if existing:
@@ -88,16 +115,14 @@ class ProtocolRegistry:
             )
 
         # Save to storage with project scope
+        protocol = protocol.model_copy(update={"registered_at": datetime.now(UTC)})
         await self._storage.save_protocol(protocol, project_id)
 
-        # Create protocol info
-        info = ProtocolInfo(
-            name=protocol.name,
-            version=protocol.version,
-            registered_at=datetime.now(UTC),
-            capabilities=protocol.capabilities,
-            metadata=protocol.metadata,
-        )
+        # Create protocol info, indexed if the project's index is loaded
+        info = self._to_info(protocol)
+        index = self._indexes.get(project_id)
+        if index is not None:
+            index.add(info)
 
         logger.info(
             f"Registered protocol: {protocol.name} v{protocol.version} in project {project_id}",
@@ -126,50 +151,24 @@ class ProtocolRegistry:
 
         Args:
             name: Filter by protocol name (optional)
-            version: Filter by exact version or version range (optional)
-            tags: Filter by capability tags (optional)
+            version: Filter by exact version or version range such as
+                "^1.2" or ">=2,<3" (optional)
+            tags: Filter by capability tags, matching any (optional)
             project_id: Project identifier (defaults to "default")
             include_shared: Include protocols shared from other projects (optional)
 
         Returns:
-            List of matching protocol info objects
+            List of matching protocol info objects, ordered by name and version
+
+        Raises:
+            ValueError: If the version range is malformed
         """
-        protocols = await self._storage.list_protocols(
-            name=name, version=version, project_id=project_id
+        version_range = VersionRange.parse(version) if version else None
+        index = await self._get_index(project_id, include_shared)
+        results = index.query(
+            name=name, version_range=version_range, tags=tags, include_shared=include_shared
         )
 
-        # Convert to ProtocolInfo
-        results = [
-            ProtocolInfo(
-                name=p.name,
-                version=p.version,
-                registered_at=datetime.now(UTC),  # In production, track actual registration time
-                capabilities=p.capabilities,
-                metadata=p.metadata,
-            )
-            for p in protocols
-        ]
-
-        # Add shared protocols if requested
-        if include_shared:
-            shared_protocols = await self._get_shared_protocols(project_id, name, version)
-            for sp in shared_protocols:
-                results.append(
-                    ProtocolInfo(
-                        name=sp.name,
-                        version=sp.version,
-                        registered_at=datetime.now(UTC),
-                        capabilities=sp.capabilities,
-                        metadata=sp.metadata,
-                    )
-                )
-
-        # Filter by tags if specified
-        if tags:
-            results = [
-                r for r in results if r.metadata and any(tag in r.metadata.tags for tag in tags)
-            ]
-
         logger.debug(
             f"Protocol discovery: name={name}, version={version}, tags={tags}, project={project_id}, found={len(results)}",
             extra={
@@ -221,6 +220,7 @@ class ProtocolRegistry:
             _shared_protocols[key] = set()
 
         _shared_protocols[key].add(target_project_id)
+        _bump_shared_generation()
 
         logger.info(
             f"Shared protocol {name} v{version} from {source_project_id} to {target_project_id}",
@@ -262,6 +262,8 @@ class ProtocolRegistry:
             return False
 
         _shared_protocols[key].discard(target_project_id)
+        _bump_shared_generation()
+        self._validators.invalidate(target_project_id, name, version)
 
         # Clean up empty entries
         if not _shared_protocols[key]:
@@ -303,40 +305,197 @@ class ProtocolRegistry:
 
         return shared
 
+    async def delete_protocol(
+        self, name: str, version: str, project_id: str = "default"
+    ) -> bool:
+        """Delete a protocol that has no active references.
+
+        The protocol is removed from storage, the discovery index, the
+        payload validator cache and every project it was shared with.
+
+        Args:
+            name: Protocol name
+            version: Protocol version
+            project_id: Project identifier (defaults to "default")
+
+        Returns:
+            True if deleted, False if not found
+
+        Raises:
+            ValueError: If sessions still reference the protocol
+        """
+        async with self._index_lock:
+            can_delete, error = await self.can_delete_protocol(name, version, project_id)
+            if not can_delete:
+                if await self._storage.get_protocol(name, version, project_id) is None:
+                    return False
+                raise ValueError(error)
+
+            if not await self._storage.delete_protocol(name, version, project_id):
+                return False
+
+            index = self._indexes.get(project_id)
+            if index is not None:
+                index.remove(name, version)
+            self._validators.invalidate(project_id, name, version)
+
+            targets = _shared_protocols.pop((project_id, name, version), set())
+            for target_project_id in targets:
+                self._validators.invalidate(target_project_id, name, version)
+            if targets:
+                _bump_shared_generation()
+
+        logger.info(
+            f"Deleted protocol: {name} v{version} from project {project_id}",
+            extra={
+                "context": {
+                    "protocol_name": name,
+                    "version": version,
+                    "project_id": project_id,
+                    "unshared_from": sorted(targets),
+                }
+            },
+        )
+        return True
+
+    async def validate_payload(self, message: Message, project_id: str = "default") -> str | None:
+        """Check a message payload against its protocol's schema.
+
+        Protocols shared into the project are used when the project does
+        not define the protocol version itself. Compiled validators are
+        cached per (project, name, version).
+
+        Args:
+            message: Message whose payload to check
+            project_id: Project the message is sent in (defaults to "default")
+
+        Returns:
+            Reason the payload is rejected, or None if it is valid
+        """
+        name, version = message.protocol_name, message.protocol_version
+        validator = self._validators.get(project_id, name, version)
+
+        if validator is None:
+            protocol = await self._resolve_protocol(name, version, project_id)
+            if protocol is None:
+                return f"Protocol '{name}' version '{version}' is not registered in project '{project_id}'"
+            validator = self._validators.put(project_id, name, version, protocol.message_schema)
+
+        error = describe_error(validator, message.payload)
+        if error is None:
+            return None
+        return f"Payload does not match protocol '{name}' v{version}: {error}"
+
+    def get_validator_stats(self) -> dict[str, int]:
+        """Get payload validator cache counters.
+
+        Returns:
+            Dictionary with size, hits and misses
+        """
+        return self._validators.get_stats()
+
+    async def _resolve_protocol(
+        self, name: str, version: str, project_id: str
+    ) -> ProtocolDefinition | None:
+        """Find a protocol defined in or shared into a project."""
+        protocol = await self._storage.get_protocol(name, version, project_id)
+        if protocol is not None:
+            return protocol
+
+        for (source_project, proto_name, proto_version), targets in list(
+            _shared_protocols.items()
+        ):
+            if proto_name == name and proto_version == version and project_id in targets:
+                protocol = await self._storage.get_protocol(name, version, source_project)
+                if protocol is not None:
+                    return protocol
+        return None
+
+    def invalidate(self, project_id: str | None = None) -> None:
+        """Drop cached discovery indexes so they are reloaded from storage.
+
+        Call after changing protocols in storage without going through
+        the registry.
+
+        Args:
+            project_id: Project whose index to drop, or None for all projects
+        """
+        if project_id is None:
+            self._indexes.clear()
+        else:
+            self._indexes.pop(project_id, None)
+
+    async def _get_index(self, project_id: str, include_shared: bool) -> ProtocolIndex:
+        """Get a project's discovery index, loading or refreshing it as needed.
+
+        Args:
+            project_id: Project identifier
+            include_shared: Whether shared protocols must be merged in
+
+        Returns:
+            The project's ProtocolIndex
+        """
+        async with self._index_lock:
+            now = time.monotonic()
+            index = self._indexes.get(project_id)
+            if index is None or (
+                self._index_refresh_interval is not None
+                and now - index.loaded_at >= self._index_refresh_interval
+            ):
+                index = ProtocolIndex(loaded_at=now)
+                for protocol in await self._storage.list_protocols(project_id=project_id):
+                    index.add(self._to_info(protocol))
+                self._indexes[project_id] = index
+
+            if include_shared and index.shared_generation != _shared_generation:
+                generation = _shared_generation
+                index.clear_shared()
+                for source_project, protocol in await self._get_shared_protocols(project_id):
+                    index.add(self._to_info(protocol), source_project)
+                index.shared_generation = generation
+
+            return index
+
     async def _get_shared_protocols(
-        self,
-        project_id: str,
-        name: str | None = None,
-        version: str | None = None,
-    ) -> list[ProtocolDefinition]:
+        self, project_id: str
+    ) -> list[tuple[str, ProtocolDefinition]]:
         """Get protocols shared with the specified project.
 
         Args:
             project_id: Target project
-            name: Optional filter by protocol name
-            version: Optional filter by protocol version
 
         Returns:
-            List of shared protocol definitions
+            List of (source project, shared protocol definition) tuples
         """
         shared = []
-        for (source_project, proto_name, proto_version), targets in _shared_protocols.items():
+        for (source_project, proto_name, proto_version), targets in list(
+            _shared_protocols.items()
+        ):
             if project_id in targets:
-                # Apply filters
-                if name and proto_name != name:
-                    continue
-                if version and proto_version != version:
-                    continue
-
                 # Get protocol from source project
                 protocol = await self._storage.get_protocol(
                     proto_name, proto_version, source_project
                 )
                 if protocol:
-                    shared.append(protocol)
+                    shared.append((source_project, protocol))
 
         return shared
 
+    @staticmethod
+    def _to_info(protocol: ProtocolDefinition) -> ProtocolInfo:
+        """Build the public info for a stored protocol.
+
+        Protocols stored before registration times were recorded are
+        stamped with the time they are first indexed.
+        """
+        return ProtocolInfo(
+            name=protocol.name,
+            version=protocol.version,
+            registered_at=protocol.registered_at or datetime.now(UTC),
+            capabilities=protocol.capabilities,
+            metadata=protocol.metadata,
+        )
+
     async def get(
         self, name: str, version: str, project_id: str = "default"
     ) -> ProtocolDefinition | None:
@@ -460,3 +619,9 @@ class ProtocolRegistry:
             )
 
         return True, None
+
+
+def _bump_shared_generation() -> None:
+    """Signal that the set of shared protocols changed."""
+    global _shared_generation
+    _shared_generation += 1
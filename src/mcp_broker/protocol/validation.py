@@ -0,0 +1,129 @@
+"""
+Payload validation for MCP Broker Server.
+
+This module provides the compiled-validator cache used by ProtocolRegistry
+to check message payloads against registered protocol schemas. Building
+a jsonschema validator walks the whole schema, so each schema is compiled
+once per (project, protocol name, version) and reused for every message.
+"""
+
+from typing import Any
+
+import jsonschema
+from jsonschema.exceptions import best_match
+
+ValidatorKey = tuple[str, str, str]
+
+
+def compile_schema(schema: dict[str, Any]) -> Any:
+    """Build a validator for a protocol schema.
+
+    The schema's "$schema" dialect is honored, defaulting to Draft 7.
+    Schemas are checked at registration, so they are not re-checked here.
+
+    Args:
+        schema: JSON Schema dictionary
+
+    Returns:
+        jsonschema validator instance
+    """
+    validator_cls = jsonschema.validators.validator_for(schema, default=jsonschema.Draft7Validator)
+    return validator_cls(schema)
+
+
+def describe_error(validator: Any, payload: Any) -> str | None:
+    """Validate a payload and describe the most relevant error.
+
+    Args:
+        validator: Validator built by compile_schema
+        payload: Payload to check
+
+    Returns:
+        Error description, or None if the payload is valid
+    """
+    error = best_match(validator.iter_errors(payload))
+    if error is None:
+        return None
+    location = "/".join(str(part) for part in error.absolute_path)
+    return f"{error.message} (at /{location})" if location else error.message
+
+
+class ValidatorCache:
+    """
+    Cache of compiled payload validators keyed by (project, name, version).
+
+    Protocol versions are immutable once registered, so entries stay
+    valid until the protocol is deleted or unshared.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that had to compile a validator
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self.hits = 0
+        self.misses = 0
+        self._validators: dict[ValidatorKey, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._validators)
+
+    def get(self, project_id: str, name: str, version: str) -> Any | None:
+        """Look up a compiled validator.
+
+        Args:
+            project_id: Project the message is sent in
+            name: Protocol name
+            version: Protocol version
+
+        Returns:
+            Cached validator, or None on a miss
+        """
+        validator = self._validators.get((project_id, name, version))
+        if validator is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return validator
+
+    def put(self, project_id: str, name: str, version: str, schema: dict[str, Any]) -> Any:
+        """Compile a schema and cache the validator.
+
+        Args:
+            project_id: Project the message is sent in
+            name: Protocol name
+            version: Protocol version
+            schema: Protocol message schema
+
+        Returns:
+            The compiled validator
+        """
+        validator = compile_schema(schema)
+        self._validators[(project_id, name, version)] = validator
+        return validator
+
+    def invalidate(self, project_id: str, name: str, version: str) -> bool:
+        """Drop one cached validator.
+
+        Args:
+            project_id: Project identifier
+            name: Protocol name
+            version: Protocol version
+
+        Returns:
+            True if an entry was removed
+        """
+        return self._validators.pop((project_id, name, version), None) is not None
+
+    def clear(self) -> None:
+        """Drop every cached validator."""
+        self._validators.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """Get cache counters.
+
+        Returns:
+            Dictionary with size, hits and misses
+        """
+        return {"size": len(self._validators), "hits": self.hits, "misses": self.misses}
@@ -1,5 +1,7 @@
 """Message Routing module for MCP Broker Server."""
 
+from mcp_broker.routing.dead_letter import DeadLetterQueue
+from mcp_broker.routing.rate_limit import RateLimiter, RedisRateLimiter
 from mcp_broker.routing.router import MessageRouter
 
-__all__ = ["MessageRouter"]
+__all__ = ["DeadLetterQueue", "MessageRouter", "RateLimiter", "RedisRateLimiter"]
@@ -14,8 +14,10 @@ from mcp_broker.core.logging import get_logger
 from mcp_broker.models.message import DeliveryResult, Message
 from mcp_broker.models.project import CrossProjectPermission, ProjectDefinition
 from mcp_broker.models.session import Session
+from mcp_broker.routing.rate_limit import RateLimiter
 
 if TYPE_CHECKING:
+    from mcp_broker.project.cross_project_config import CrossProjectRelationshipManager
     from mcp_broker.project.registry import ProjectRegistry
     from mcp_broker.session.manager import SessionManager
 
@@ -34,24 +36,30 @@ class CrossProjectRouter:
     Attributes:
         project_registry: Project registry for permission checks
         session_manager: Session manager for session access
+        rate_limiter: GCRA limiter for per-project-pair message rates
     """
 
     def __init__(
         self,
         project_registry: "ProjectRegistry",
         session_manager: "SessionManager",
+        rate_limiter: RateLimiter | None = None,
+        relationship_manager: "CrossProjectRelationshipManager | None" = None,
     ) -> None:
         """Initialize the cross-project router.
 
         Args:
             project_registry: Project registry for permission checks
             session_manager: Session manager for session access
+            rate_limiter: Rate limiter to use; pass a RedisRateLimiter to
+                share limits across broker workers (defaults to in-process)
+            relationship_manager: Optional relationship manager whose
+                directional rate limits take precedence over permissions
         """
         self._project_registry = project_registry
         self._session_manager = session_manager
-
-        # Track message counts for rate limiting
-        self._message_counts: dict[tuple[str, str], list[datetime]] = {}
+        self._relationship_manager = relationship_manager
+        self.rate_limiter = rate_limiter or RateLimiter()
 
         logger = get_logger(__name__)
         logger.info("CrossProjectRouter initialized")
@@ -114,9 +122,11 @@ class CrossProjectRouter:
             )
 
         # Check rate limits
-        rate_limit = permission.message_rate_limit
+        rate_limit = self._resolve_rate_limit(sender_project_id, recipient_project_id, permission)
         if rate_limit > 0:
-            if not self._check_rate_limit(sender_project_id, recipient_project_id, rate_limit):
+            if not await self._check_rate_limit(
+                sender_project_id, recipient_project_id, rate_limit
+            ):
                 return DeliveryResult(
                     success=False,
                     error_reason=f"Rate limit exceeded for {sender_project_id} -> {recipient_project_id}",
@@ -281,7 +291,34 @@ class CrossProjectRouter:
 
         return None
 
-    def _check_rate_limit(
+    def _resolve_rate_limit(
+        self,
+        sender_project: str,
+        recipient_project: str,
+        permission: CrossProjectPermission,
+    ) -> int:
+        """Get the rate limit for one direction of a project pair.
+
+        The directional limit of an established relationship wins over the
+        limit carried by the matched permission.
+
+        Args:
+            sender_project: Sender project ID
+            recipient_project: Recipient project ID
+            permission: Permission that authorized the message
+
+        Returns:
+            Messages per minute (0 = unlimited)
+        """
+        if self._relationship_manager is not None:
+            relationship = self._relationship_manager.get_relationship(
+                sender_project, recipient_project
+            )
+            if relationship is not None:
+                return relationship.get_rate_limit_from(sender_project)
+        return permission.message_rate_limit
+
+    async def _check_rate_limit(
         self,
         sender_project: str,
         recipient_project: str,
@@ -297,30 +334,7 @@ class CrossProjectRouter:
         Returns:
             True if within rate limit, False otherwise
         """
-        if rate_limit == 0:
-            return True
-
-        key = (sender_project, recipient_project)
-        now = datetime.now(UTC)
-        one_minute_ago = now.replace(second=now.second - 60)
-
-        # Clean old entries
-        if key in self._message_counts:
-            self._message_counts[key] = [
-                ts for ts in self._message_counts[key] if ts > one_minute_ago
-            ]
-
-        # Check current count
-        current_count = len(self._message_counts.get(key, []))
-        if current_count >= rate_limit:
-            return False
-
-        # Record this message
-        if key not in self._message_counts:
-            self._message_counts[key] = []
-        self._message_counts[key].append(now)
-
-        return True
+        return await self.rate_limiter.acquire(sender_project, recipient_project, rate_limit)
 
     def _check_protocol_compatibility(
         self, sender: Session, recipient: Session, protocol_name: str
@@ -349,13 +363,16 @@ class CrossProjectRouter:
     def get_cross_project_stats(self) -> dict[str, int]:
         """Get statistics for cross-project communication.
 
+        Counts cover rate-limit decisions for rate-limited pairs.
+
         Returns:
             Dictionary with statistics
         """
-        total_pairs = len(self._message_counts)
-        total_messages = sum(len(timestamps) for timestamps in self._message_counts.values())
+        stats = self.rate_limiter.get_stats()
 
         return {
-            "active_project_pairs": total_pairs,
-            "total_messages_sent": total_messages,
+            "active_project_pairs": stats["active_project_pairs"],
+            "total_messages_sent": stats["allowed"],
+            "allowed": stats["allowed"],
+            "throttled": stats["throttled"],
         }
@@ -0,0 +1,373 @@
+"""
+Dead-letter queue for MCP Broker Server.
+
+This module provides the DeadLetterQueue class that holds messages the
+router could not deliver. Each project has a bounded in-memory ring
+buffer; when a ring is full its oldest entry is spilled to an append-only
+JSON Lines segment file (when a spill directory is configured) or
+dropped. Entries on disk are older than entries in memory, so reads and
+replays walk the segment first and the ring second.
+
+Segment I/O runs in worker threads so it never blocks the event loop.
+Overflow is handed to a background spill task, and each segment holds
+at most segment_capacity entries; spilled entries beyond that are dropped.
+
+Segment layout:
+- "{spill_dir}/{quoted project_id}.jsonl" -> One dead-letter entry per line
+"""
+
+import asyncio
+import json
+import os
+from collections import deque
+from collections.abc import Callable, Iterable
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any
+from urllib.parse import quote, unquote
+
+from mcp_broker.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+SEGMENT_SUFFIX = ".jsonl"
+
+
+class DeadLetterQueue:
+    """
+    Bounded, per-project dead-letter queue with optional disk spill.
+
+    Attributes:
+        capacity: Maximum in-memory entries per project
+        spill_dir: Directory for overflow segment files, or None to drop overflow
+        segment_capacity: Maximum entries kept on disk per project
+        dropped: Number of entries discarded because they could not be spilled
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1000,
+        spill_dir: str | Path | None = None,
+        segment_capacity: int = 100_000,
+    ) -> None:
+        """Initialize the dead-letter queue.
+
+        Segment files left by a previous process are picked up, so spilled
+        and flushed entries survive restarts.
+
+        Args:
+            capacity: Maximum in-memory entries per project
+            spill_dir: Directory for overflow segment files
+            segment_capacity: Maximum entries kept on disk per project
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if segment_capacity < 0:
+            raise ValueError("segment_capacity must be non-negative")
+
+        self.capacity = capacity
+        self.spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self.segment_capacity = segment_capacity
+        self.dropped = 0
+
+        self._rings: dict[str, deque[dict[str, Any]]] = {}
+        self._pending: dict[str, list[dict[str, Any]]] = {}  # overflow not yet on disk
+        self._spilled: dict[str, int] = {}
+        self._spill_files: dict[str, IO[str]] = {}
+        self._io_lock = asyncio.Lock()
+        self._spill_task: asyncio.Task[None] | None = None
+
+        if self.spill_dir is not None:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            for segment in self.spill_dir.glob(f"*{SEGMENT_SUFFIX}"):
+                project_id = unquote(segment.name[: -len(SEGMENT_SUFFIX)])
+                with segment.open(encoding="utf-8") as handle:
+                    self._spilled[project_id] = sum(1 for _ in handle)
+
+    def __len__(self) -> int:
+        return self.size()
+
+    def size(self, project_id: str | None = None) -> int:
+        """Count dead letters in memory and on disk.
+
+        Args:
+            project_id: Project to count, or None for all projects
+
+        Returns:
+            Number of dead letters
+        """
+        project_ids = [project_id] if project_id is not None else self._project_order()
+        return sum(
+            self._spilled.get(pid, 0)
+            + len(self._pending.get(pid, ()))
+            + len(self._rings.get(pid, ()))
+            for pid in project_ids
+        )
+
+    def projects(self) -> list[str]:
+        """List projects that currently hold dead letters.
+
+        Returns:
+            Project identifiers
+        """
+        return [project_id for project_id in self._project_order() if self.size(project_id)]
+
+    def append(self, entry: dict[str, Any], project_id: str = "default") -> None:
+        """Add a dead letter, spilling the oldest in-memory entry on overflow.
+
+        The spill itself happens in a background task, so this never
+        blocks on disk.
+
+        Args:
+            entry: JSON-serializable dead-letter record
+            project_id: Project identifier
+        """
+        ring = self._rings.setdefault(project_id, deque())
+        if len(ring) >= self.capacity:
+            oldest = ring.popleft()
+            if self.spill_dir is None:
+                self._drop(project_id, 1, "Dead-letter queue full")
+            else:
+                self._pending.setdefault(project_id, []).append(oldest)
+                self._schedule_spill()
+        ring.append(entry)
+
+    async def page(
+        self, project_id: str | None = None, offset: int = 0, limit: int = 100
+    ) -> list[dict[str, Any]]:
+        """Read dead letters oldest first without removing them.
+
+        Args:
+            project_id: Project to read, or None for all projects
+            offset: Number of entries to skip
+            limit: Maximum number of entries to return
+
+        Returns:
+            Up to limit dead-letter records
+        """
+        if offset < 0 or limit < 0:
+            raise ValueError("offset and limit must be non-negative")
+
+        async with self._io_lock:
+            await self._spill_pending()
+
+            project_ids = [project_id] if project_id is not None else self._project_order()
+            entries: list[dict[str, Any]] = []
+
+            for pid in project_ids:
+                if len(entries) >= limit:
+                    break
+                size = self.size(pid)
+                if offset >= size:
+                    offset -= size
+                    continue
+                stop = offset + limit - len(entries)
+                spilled = self._spilled.get(pid, 0)
+                if offset < spilled:
+                    entries.extend(
+                        await asyncio.to_thread(self._read_segment, pid, offset, min(stop, spilled))
+                    )
+                ring = self._rings.get(pid, ())
+                entries.extend(islice(ring, max(offset - spilled, 0), max(stop - spilled, 0)))
+                offset = 0
+
+        return entries
+
+    async def discard(self, project_id: str, entry_ids: Iterable[str]) -> int:
+        """Remove specific dead letters by their dead_letter_id.
+
+        Args:
+            project_id: Project holding the entries
+            entry_ids: Identifiers of entries to remove
+
+        Returns:
+            Number of entries removed
+        """
+        wanted = set(entry_ids)
+        if not wanted:
+            return 0
+
+        async with self._io_lock:
+            await self._spill_pending()
+
+            removed = 0
+            ring = self._rings.get(project_id)
+            if ring:
+                kept = [entry for entry in ring if entry.get("dead_letter_id") not in wanted]
+                removed += len(ring) - len(kept)
+                self._rings[project_id] = deque(kept)
+
+            spilled = self._spilled.get(project_id)
+            if spilled:
+                kept_on_disk = await asyncio.to_thread(
+                    self._rewrite_segment,
+                    project_id,
+                    lambda entry: entry.get("dead_letter_id") not in wanted,
+                )
+                removed += spilled - kept_on_disk
+                if kept_on_disk:
+                    self._spilled[project_id] = kept_on_disk
+                else:
+                    del self._spilled[project_id]
+
+        return removed
+
+    async def clear(self, project_id: str | None = None) -> int:
+        """Remove dead letters from memory and disk.
+
+        Args:
+            project_id: Project to clear, or None for all projects
+
+        Returns:
+            Number of entries removed
+        """
+        async with self._io_lock:
+            project_ids = [project_id] if project_id is not None else self._project_order()
+            count = 0
+
+            for pid in project_ids:
+                count += self.size(pid)
+                self._rings.pop(pid, None)
+                self._pending.pop(pid, None)
+                if self._spilled.pop(pid, None) is not None:
+                    await asyncio.to_thread(self._remove_segment, pid)
+
+        return count
+
+    async def flush(self) -> int:
+        """Spill every in-memory entry to disk so it survives a restart.
+
+        Does nothing when no spill directory is configured.
+
+        Returns:
+            Number of entries written
+        """
+        if self.spill_dir is None:
+            return 0
+
+        async with self._io_lock:
+            for project_id, ring in self._rings.items():
+                if ring:
+                    self._pending.setdefault(project_id, []).extend(ring)
+                    ring.clear()
+
+            before = sum(self._spilled.values())
+            await self._spill_pending()
+            await asyncio.to_thread(self.close)
+
+        return sum(self._spilled.values()) - before
+
+    def close(self) -> None:
+        """Close open segment files."""
+        for project_id in list(self._spill_files):
+            self._close_segment(project_id)
+
+    def _project_order(self) -> list[str]:
+        """List known projects, spilled ones first, without duplicates."""
+        return list(dict.fromkeys([*self._spilled, *self._pending, *self._rings]))
+
+    def _segment_path(self, project_id: str) -> Path:
+        """Get the segment file path for a project."""
+        assert self.spill_dir is not None
+        return self.spill_dir / f"{quote(project_id, safe='')}{SEGMENT_SUFFIX}"
+
+    def _drop(self, project_id: str, count: int, reason: str) -> None:
+        """Count entries discarded instead of being kept."""
+        self.dropped += count
+        logger.debug(
+            f"{reason}, dropped {count} entries",
+            extra={"context": {"project_id": project_id, "dropped_total": self.dropped}},
+        )
+
+    def _schedule_spill(self) -> None:
+        """Start a background spill unless one is already running."""
+        if self._spill_task is None or self._spill_task.done():
+            self._spill_task = asyncio.get_running_loop().create_task(self._run_spill())
+
+    async def _run_spill(self) -> None:
+        """Background task that writes pending overflow to disk."""
+        async with self._io_lock:
+            await self._spill_pending()
+
+    async def _spill_pending(self) -> None:
+        """Write pending overflow to the segments (caller holds the I/O lock).
+
+        Entries stay counted as pending until their write completes, and
+        entries that would grow a segment past segment_capacity are dropped.
+        """
+        while self._pending:
+            project_id, pending = next(iter(self._pending.items()))
+            batch = list(pending)
+            spilled = self._spilled.get(project_id, 0)
+            overflow = max(spilled + len(batch) - self.segment_capacity, 0)
+
+            if overflow < len(batch):
+                try:
+                    await asyncio.to_thread(self._write_segment, project_id, batch[overflow:])
+                except OSError as e:
+                    logger.error(
+                        f"Dead-letter spill failed: {e}",
+                        extra={"context": {"project_id": project_id}},
+                    )
+                    overflow = len(batch)
+                else:
+                    self._spilled[project_id] = spilled + len(batch) - overflow
+            if overflow:
+                self._drop(project_id, overflow, "Dead-letter segment full")
+
+            del pending[: len(batch)]
+            if not pending:
+                del self._pending[project_id]
+
+    def _write_segment(self, project_id: str, entries: list[dict[str, Any]]) -> None:
+        """Append entries to a project's segment (runs in a worker thread)."""
+        handle = self._spill_files.get(project_id)
+        if handle is None:
+            handle = self._segment_path(project_id).open("a", encoding="utf-8")
+            self._spill_files[project_id] = handle
+
+        handle.writelines(json.dumps(entry, default=str) + "\n" for entry in entries)
+        handle.flush()
+
+    def _read_segment(self, project_id: str, start: int, stop: int) -> list[dict[str, Any]]:
+        """Read entries start..stop of a project's segment (runs in a worker thread)."""
+        with self._segment_path(project_id).open(encoding="utf-8") as segment:
+            return [json.loads(line) for line in islice(segment, start, stop)]
+
+    def _close_segment(self, project_id: str) -> None:
+        """Close a project's open segment file, if any."""
+        handle = self._spill_files.pop(project_id, None)
+        if handle is not None:
+            handle.close()
+
+    def _remove_segment(self, project_id: str) -> None:
+        """Close and delete a project's segment (runs in a worker thread)."""
+        self._close_segment(project_id)
+        self._segment_path(project_id).unlink(missing_ok=True)
+
+    def _rewrite_segment(self, project_id: str, keep: Callable[[dict[str, Any]], bool]) -> int:
+        """Rewrite a segment keeping only entries for which keep() is true.
+
+        Runs in a worker thread.
+
+        Returns:
+            Number of entries kept
+        """
+        self._close_segment(project_id)
+        path = self._segment_path(project_id)
+        temp_path = path.with_suffix(SEGMENT_SUFFIX + ".tmp")
+        kept = 0
+
+        with path.open(encoding="utf-8") as source, temp_path.open("w", encoding="utf-8") as target:
+            for line in source:
+                if keep(json.loads(line)):
+                    target.write(line)
+                    kept += 1
+
+        if kept:
+            os.replace(temp_path, path)
+        else:
+            temp_path.unlink()
+            path.unlink()
+
+        return kept
@@ -0,0 +1,228 @@
+"""
+Cross-project rate limiting for MCP Broker Server.
+
+This module provides GCRA (generic cell rate algorithm) limiters for
+per-(sender project, recipient project) message rates. GCRA keeps a
+single "theoretical arrival time" (TAT) per pair instead of a log of
+recent sends, so each decision is O(1) in time and space. A limit of N
+messages per minute admits a burst of up to N messages, then one message
+every 60/N seconds.
+
+Two backends are provided:
+- RateLimiter: TATs held in process memory (single broker worker)
+- RedisRateLimiter: TATs held in Redis so limits hold across workers
+
+Redis key layout:
+- "{prefix}:ratelimit:{sender}:{recipient}" -> TAT as a POSIX timestamp string
+"""
+
+import math
+import time
+from typing import Any
+
+from mcp_broker.core.logging import get_logger
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import WatchError
+except ImportError:  # pragma: no cover - exercised only without the redis extra
+    aioredis = None  # type: ignore[assignment]
+    WatchError = Exception  # type: ignore[assignment,misc]
+
+logger = get_logger(__name__)
+
+RATE_WINDOW_SECONDS = 60.0
+
+PairKey = tuple[str, str]
+
+
+def gcra(tat: float | None, now: float, rate_limit: int) -> tuple[bool, float]:
+    """Apply one GCRA decision.
+
+    Args:
+        tat: Stored theoretical arrival time, or None if the pair is idle
+        now: Current POSIX timestamp
+        rate_limit: Messages per minute (must be positive)
+
+    Returns:
+        Tuple of (allowed, TAT to store); the TAT is unchanged when throttled
+    """
+    interval = RATE_WINDOW_SECONDS / rate_limit
+    tat = now if tat is None or tat < now else tat
+    # A full burst of rate_limit messages fits in one window
+    if tat - now > RATE_WINDOW_SECONDS - interval:
+        return False, tat
+    return True, tat + interval
+
+
+class RateLimiter:
+    """
+    In-process GCRA rate limiter for cross-project message pairs.
+
+    Attributes:
+        allowed: Number of messages admitted
+        throttled: Number of messages rejected
+    """
+
+    def __init__(self) -> None:
+        """Initialize the rate limiter."""
+        self.allowed = 0
+        self.throttled = 0
+        self._pair_allowed: dict[PairKey, int] = {}
+        self._pair_throttled: dict[PairKey, int] = {}
+        self._tats: dict[PairKey, float] = {}
+
+    async def acquire(
+        self,
+        sender_project: str,
+        recipient_project: str,
+        rate_limit: int,
+        now: float | None = None,
+    ) -> bool:
+        """Admit or reject one message from sender_project to recipient_project.
+
+        Args:
+            sender_project: Sender project ID
+            recipient_project: Recipient project ID
+            rate_limit: Messages per minute (0 = unlimited)
+            now: Current POSIX timestamp (defaults to the wall clock)
+
+        Returns:
+            True if the message is within the rate limit
+        """
+        key = (sender_project, recipient_project)
+        if rate_limit <= 0:
+            allowed = True
+        else:
+            allowed = await self._decide(key, rate_limit, time.time() if now is None else now)
+        self._record(key, allowed)
+        return allowed
+
+    def get_stats(self) -> dict[str, int]:
+        """Get decision counters.
+
+        Returns:
+            Dictionary with allowed, throttled and active_project_pairs counts
+        """
+        return {
+            "active_project_pairs": len(self._pair_allowed),
+            "allowed": self.allowed,
+            "throttled": self.throttled,
+        }
+
+    def get_pair_stats(self, sender_project: str, recipient_project: str) -> dict[str, int]:
+        """Get decision counters for one direction of a project pair.
+
+        Args:
+            sender_project: Sender project ID
+            recipient_project: Recipient project ID
+
+        Returns:
+            Dictionary with allowed and throttled counts
+        """
+        key = (sender_project, recipient_project)
+        return {
+            "allowed": self._pair_allowed.get(key, 0),
+            "throttled": self._pair_throttled.get(key, 0),
+        }
+
+    async def _decide(self, key: PairKey, rate_limit: int, now: float) -> bool:
+        """Run GCRA against the locally stored TAT."""
+        allowed, self._tats[key] = gcra(self._tats.get(key), now, rate_limit)
+        return allowed
+
+    def _record(self, key: PairKey, allowed: bool) -> None:
+        """Update decision counters."""
+        if allowed:
+            self.allowed += 1
+            self._pair_allowed[key] = self._pair_allowed.get(key, 0) + 1
+            return
+
+        self.throttled += 1
+        self._pair_throttled[key] = self._pair_throttled.get(key, 0) + 1
+        logger.debug(
+            f"Cross-project rate limit hit: {key[0]} -> {key[1]}",
+            extra={
+                "context": {
+                    "sender_project": key[0],
+                    "recipient_project": key[1],
+                    "throttled_total": self.throttled,
+                }
+            },
+        )
+
+
+class RedisRateLimiter(RateLimiter):
+    """
+    GCRA rate limiter whose state is shared through Redis.
+
+    Each decision reads and replaces the pair's TAT under WATCH/MULTI, so
+    concurrent broker workers never admit more than the configured rate
+    between them. Keys expire once their TAT has passed, leaving no state
+    behind for idle pairs. Workers should have synchronized clocks.
+
+    Decision counters are kept per worker.
+
+    Attributes:
+        key_prefix: Prefix applied to every Redis key
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        key_prefix: str = "mcp_broker",
+        client: Any = None,
+    ) -> None:
+        """Initialize the Redis rate limiter.
+
+        Args:
+            redis_url: Redis connection URL (ignored if client is given)
+            key_prefix: Prefix applied to every Redis key
+            client: Optional pre-built redis.asyncio client (e.g. fakeredis)
+
+        Raises:
+            RuntimeError: If the redis package is not installed
+            ValueError: If neither redis_url nor client is provided
+        """
+        super().__init__()
+        if client is None:
+            if aioredis is None:
+                raise RuntimeError(
+                    "redis package not installed. Install with: pip install -e '.[redis]'"
+                )
+            if not redis_url:
+                raise ValueError("redis_url is required for the Redis rate limiter")
+            client = aioredis.from_url(redis_url, decode_responses=True)
+
+        self.key_prefix = key_prefix
+        self._redis = client
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        await self._redis.aclose()
+
+    def _key(self, key: PairKey) -> str:
+        """Get the Redis key holding a pair's TAT."""
+        return f"{self.key_prefix}:ratelimit:{key[0]}:{key[1]}"
+
+    async def _decide(self, key: PairKey, rate_limit: int, now: float) -> bool:
+        """Run GCRA against the TAT stored in Redis."""
+        redis_key = self._key(key)
+
+        async with self._redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(redis_key)
+                    raw = await pipe.get(redis_key)
+                    allowed, tat = gcra(float(raw) if raw else None, now, rate_limit)
+
+                    if not allowed:
+                        await pipe.unwatch()
+                        return False
+
+                    pipe.multi()
+                    pipe.set(redis_key, repr(tat), px=max(1, math.ceil((tat - now) * 1000)))
+                    await pipe.execute()
+                    return True
+                except WatchError:
+                    continue
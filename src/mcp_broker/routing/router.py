@@ -9,18 +9,25 @@ Supports project-scoped message routing with per-project
 statistics tracking.
 """
 
+import logging
+import time
+from collections.abc import Iterable
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
-from uuid import UUID
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from uuid import UUID, uuid4
 
-from mcp_broker.core.logging import get_logger
+from mcp_broker.core.logging import get_logger, log_lazy
 from mcp_broker.models.message import (
     BroadcastResult,
     DeliveryResult,
     Message,
 )
+from mcp_broker.routing.dead_letter import DeadLetterQueue
 
 if TYPE_CHECKING:
+    from mcp_broker.models.session import Session
+    from mcp_broker.protocol.registry import ProtocolRegistry
     from mcp_broker.session.manager import SessionManager
     from mcp_broker.storage.interface import StorageBackend
 
@@ -34,6 +41,8 @@ class MessageStatistics:
         total_queued: Total messages queued for offline sessions
         total_failed: Total messages that failed to deliver
         total_broadcast: Total broadcast messages sent
+        total_broadcast_ms: Cumulative broadcast fan-out time in milliseconds
+        last_broadcast_ms: Fan-out time of the most recent broadcast
         last_activity: Timestamp of last message activity
     """
 
@@ -44,36 +53,58 @@ class MessageStatistics:
         self.total_queued: int = 0
         self.total_failed: int = 0
         self.total_broadcast: int = 0
+        self.total_broadcast_ms: float = 0.0
+        self.last_broadcast_ms: float | None = None
         self.last_activity: datetime | None = None
 
-    def record_sent(self) -> None:
-        """Record a message send attempt."""
-        self.total_sent += 1
+    def record_sent(self, count: int = 1) -> None:
+        """Record message send attempts.
+
+        Args:
+            count: Number of send attempts
+        """
+        self.total_sent += count
         self.last_activity = datetime.now(UTC)
 
-    def record_delivered(self) -> None:
-        """Record a successful message delivery."""
-        self.total_delivered += 1
+    def record_delivered(self, count: int = 1) -> None:
+        """Record successful message deliveries.
+
+        Args:
+            count: Number of deliveries
+        """
+        self.total_delivered += count
         self.last_activity = datetime.now(UTC)
 
-    def record_queued(self) -> None:
-        """Record a message queued for offline session."""
-        self.total_queued += 1
+    def record_queued(self, count: int = 1) -> None:
+        """Record messages queued for offline sessions.
+
+        Args:
+            count: Number of queued messages
+        """
+        self.total_queued += count
         self.last_activity = datetime.now(UTC)
 
-    def record_failed(self) -> None:
-        """Record a failed message delivery."""
-        self.total_failed += 1
+    def record_failed(self, count: int = 1) -> None:
+        """Record failed message deliveries.
+
+        Args:
+            count: Number of failures
+        """
+        self.total_failed += count
         self.last_activity = datetime.now(UTC)
 
-    def record_broadcast(self, recipient_count: int) -> None:
+    def record_broadcast(self, recipient_count: int, duration_ms: float | None = None) -> None:
         """Record a broadcast message.
 
         Args:
             recipient_count: Number of recipients in broadcast
+            duration_ms: Fan-out time in milliseconds (optional)
         """
         self.total_broadcast += 1
         self.total_sent += recipient_count
+        if duration_ms is not None:
+            self.total_broadcast_ms += duration_ms
+            self.last_broadcast_ms = duration_ms
         self.last_activity = datetime.now(UTC)
 
     def to_dict(self) -> dict:
@@ -88,6 +119,10 @@ class MessageStatistics:
             "total_queued": self.total_queued,
             "total_failed": self.total_failed,
             "total_broadcast": self.total_broadcast,
+            "avg_broadcast_ms": (
+                self.total_broadcast_ms / self.total_broadcast if self.total_broadcast else None
+            ),
+            "last_broadcast_ms": self.last_broadcast_ms,
             "last_activity": self.last_activity.isoformat() if self.last_activity else None,
         }
 
@@ -102,6 +137,7 @@ class MessageRouter:
     - Message queuing for offline recipients
     - Delivery confirmation and error handling
     - Per-project message statistics tracking
+    - Opt-in per-project payload validation against protocol schemas
 
     Attributes:
         session_manager: Session manager for session access
@@ -113,17 +149,31 @@ class MessageRouter:
         self,
         session_manager: "SessionManager",
         storage: "StorageBackend",
+        dead_letter_capacity: int = 1000,
+        dead_letter_dir: str | Path | None = None,
+        dead_letter_segment_capacity: int = 100_000,
+        protocol_registry: "ProtocolRegistry | None" = None,
+        payload_validation: Iterable[str] = (),
     ) -> None:
         """Initialize the message router.
 
         Args:
             session_manager: Session manager for session access
             storage: Storage backend for persistence
+            dead_letter_capacity: In-memory dead letters kept per project
+            dead_letter_dir: Directory for dead letters that overflow memory
+            dead_letter_segment_capacity: Dead letters kept on disk per project
+            protocol_registry: Registry used to validate message payloads
+            payload_validation: Projects whose payloads are validated ("*" for all)
         """
         self._session_manager = session_manager
         self._storage = storage
-        self._dead_letter_queue: list[dict] = []
+        self._dead_letters = DeadLetterQueue(
+            dead_letter_capacity, dead_letter_dir, dead_letter_segment_capacity
+        )
         self._statistics: dict[str, MessageStatistics] = {}
+        self._protocol_registry = protocol_registry
+        self._payload_validation: set[str] = set(payload_validation)
 
         logger = get_logger(__name__)
         logger.info("MessageRouter initialized")
@@ -161,6 +211,50 @@ class MessageRouter:
         """
         return {project_id: stats.to_dict() for project_id, stats in self._statistics.items()}
 
+    def enable_payload_validation(self, project_id: str) -> None:
+        """Start validating payloads sent in a project.
+
+        Args:
+            project_id: Project identifier, or "*" for all projects
+        """
+        self._payload_validation.add(project_id)
+
+    def disable_payload_validation(self, project_id: str) -> None:
+        """Stop validating payloads sent in a project.
+
+        Args:
+            project_id: Project identifier, or "*" for all projects
+        """
+        self._payload_validation.discard(project_id)
+
+    def payload_validation_enabled(self, project_id: str) -> bool:
+        """Check whether payloads sent in a project are validated.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            True if validation is enabled and a protocol registry is set
+        """
+        return self._protocol_registry is not None and (
+            project_id in self._payload_validation or "*" in self._payload_validation
+        )
+
+    async def _check_payload(self, message: Message, project_id: str) -> str | None:
+        """Validate a payload if the project enforces protocol schemas.
+
+        Args:
+            message: Message to check
+            project_id: Project identifier
+
+        Returns:
+            Reason the payload is rejected, or None if it may be sent
+        """
+        if not self.payload_validation_enabled(project_id):
+            return None
+        assert self._protocol_registry is not None
+        return await self._protocol_registry.validate_payload(message, project_id)
+
     async def send_message(
         self,
         sender_id: UUID,
@@ -176,6 +270,29 @@ class MessageRouter:
             message: Message to send
             project_id: Project identifier for isolation (defaults to "default")
 
+        Returns:
+            DeliveryResult with delivery status
+        """
+        return await self._send(sender_id, recipient_id, message, project_id)
+
+    async def _send(
+        self,
+        sender_id: UUID,
+        recipient_id: UUID,
+        message: Message,
+        project_id: str,
+        dead_letter: bool = True,
+    ) -> DeliveryResult:
+        """Send a point-to-point message (see send_message).
+
+        Args:
+            sender_id: Sender session UUID
+            recipient_id: Recipient session UUID
+            message: Message to send
+            project_id: Project identifier for isolation
+            dead_letter: Record a dead letter if an offline recipient's
+                queue is full (replay keeps the original entry instead)
+
         Returns:
             DeliveryResult with delivery status
         """
@@ -199,6 +316,16 @@ class MessageRouter:
                 error_reason=f"Sender session {sender_id} not in project '{project_id}'",
             )
 
+        # Enforce the protocol schema if the project opted in
+        payload_error = await self._check_payload(message, project_id)
+        if payload_error:
+            stats.record_failed()
+            return DeliveryResult(
+                success=False,
+                error_reason=payload_error,
+                message_id=message.message_id,
+            )
+
         # Get recipient session (must be in same project)
         recipient = await self._session_manager.get_session(recipient_id, project_id)
         if not recipient:
@@ -216,9 +343,8 @@ class MessageRouter:
                 error_reason=f"Cross-project messaging not allowed: {sender.project_id} -> {recipient.project_id}",
             )
 
-        # Check compatibility
-        common_protocols = sender.find_common_protocols(recipient)
-        if message.protocol_name not in common_protocols:
+        # Check compatibility (memoized per capability pair)
+        if sender.common_protocol_version(recipient, message.protocol_name) is None:
             stats.record_failed()
             return DeliveryResult(
                 success=False,
@@ -252,41 +378,36 @@ class MessageRouter:
             else:
                 # Queue full - move to dead letter queue
                 stats.record_failed()
-                self._dead_letter_queue.append(
-                    {
-                        "message": message.model_dump(),
-                        "failed_at": datetime.now(UTC).isoformat(),
-                        "reason": "queue_full",
-                        "sender_id": str(sender_id),
-                        "recipient_id": str(recipient_id),
-                        "project_id": project_id,
-                    }
-                )
+                if dead_letter:
+                    self._record_dead_letter(
+                        sender_id, recipient_id, message, project_id, datetime.now(UTC)
+                    )
                 return DeliveryResult(
                     success=False,
                     error_reason="Queue full",
                     message_id=message.message_id,
                 )
 
-        # Recipient is active - deliver immediately
-        # In production, would use SSE or WebSocket to push message
-        # For now, we'll queue it for the session to retrieve
+        # Recipient is active - enqueue and wake its stream consumer
+        # (SessionManager.stream_messages / GET /sessions/{id}/stream)
         enqueue_result = await self._session_manager.enqueue_message(
             recipient_id, message, project_id
         )
 
         if enqueue_result.success:
             stats.record_delivered()
-            logger.info(
-                f"Message delivered: {message.message_id} from {sender_id} to {recipient_id}",
-                extra={
-                    "context": {
-                        "message_id": str(message.message_id),
-                        "sender_id": str(sender_id),
-                        "recipient_id": str(recipient_id),
-                        "protocol": message.protocol_name,
-                        "project_id": project_id,
-                    }
+            log_lazy(
+                logger,
+                logging.INFO,
+                lambda: (
+                    f"Message delivered: {message.message_id} from {sender_id} to {recipient_id}"
+                ),
+                lambda: {
+                    "message_id": str(message.message_id),
+                    "sender_id": str(sender_id),
+                    "recipient_id": str(recipient_id),
+                    "protocol": message.protocol_name,
+                    "project_id": project_id,
                 },
             )
             return DeliveryResult(
@@ -311,6 +432,11 @@ class MessageRouter:
     ) -> BroadcastResult:
         """Broadcast a message to all compatible sessions.
 
+        The sender is validated, the payload checked and protocol
+        compatibility resolved once per broadcast. Per-recipient messages
+        are shallow copies that share the original payload and headers,
+        and all of them are enqueued in a single storage operation.
+
         Args:
             sender_id: Sender session UUID
             message: Message to broadcast (should have recipient_id=None)
@@ -318,10 +444,11 @@ class MessageRouter:
             project_id: Project identifier for isolation (defaults to "default")
 
         Returns:
-            BroadcastResult with delivery summary
+            BroadcastResult with delivery summary and fan-out duration
         """
         logger = get_logger(__name__)
         stats = self._get_statistics(project_id)
+        started = time.perf_counter()
 
         # Get sender (must be in the project)
         sender = await self._session_manager.get_session(sender_id, project_id)
@@ -339,6 +466,12 @@ class MessageRouter:
                 reason=f"Sender session {sender_id} not in project '{project_id}'",
             )
 
+        # Validate the shared payload once for every recipient
+        payload_error = await self._check_payload(message, project_id)
+        if payload_error:
+            stats.record_failed()
+            return BroadcastResult(success=False, reason=payload_error)
+
         # Get all active sessions in the project
         all_sessions = await self._session_manager.list_sessions(
             status_filter="active", project_id=project_id
@@ -353,27 +486,24 @@ class MessageRouter:
                 delivery_count=0,
                 reason="No other active sessions in project",
                 recipients={"delivered": [], "failed": [], "skipped": [sender_id]},
+                duration_ms=(time.perf_counter() - started) * 1000,
             )
 
         # Apply capability filter if specified
         if capability_filter:
-            filtered_recipients = []
-            for session in recipients:
-                # Check if session has required capabilities
-                has_all = all(
-                    feature in session.capabilities.supported_features
-                    for feature in capability_filter.values()
-                )
-                if has_all:
-                    filtered_recipients.append(session)
-            recipients = filtered_recipients
-
-        # Check protocol compatibility
-        compatible_recipients = []
-        for recipient in recipients:
-            common_protocols = sender.find_common_protocols(recipient)
-            if message.protocol_name in common_protocols:
-                compatible_recipients.append(recipient)
+            required_features = list(capability_filter.values())
+            recipients = [
+                s
+                for s in recipients
+                if all(f in s.capabilities.supported_features for f in required_features)
+            ]
+
+        # Check protocol compatibility (memoized per capability pair)
+        compatible_recipients = [
+            s
+            for s in recipients
+            if sender.common_protocol_version(s, message.protocol_name) is not None
+        ]
 
         if not compatible_recipients:
             return BroadcastResult(
@@ -385,44 +515,34 @@ class MessageRouter:
                     "failed": [],
                     "skipped": [s.session_id for s in recipients] + [sender_id],
                 },
+                duration_ms=(time.perf_counter() - started) * 1000,
             )
 
-        # Broadcast to compatible recipients
-        delivered: list[UUID] = []
-        failed: list[UUID] = []
-        skipped: list[UUID] = []
-
-        for recipient in compatible_recipients:
-            # Create individual message for this recipient
-            recipient_message = Message(
-                message_id=message.message_id,  # Same ID for broadcast
-                sender_id=message.sender_id,
-                recipient_id=recipient.session_id,
-                timestamp=message.timestamp,
-                protocol_name=message.protocol_name,
-                protocol_version=message.protocol_version,
-                payload=message.payload,
-                headers=message.headers,
-            )
+        # Fan out: one shallow copy per recipient, one batched enqueue
+        items = [
+            (s.session_id, message.model_copy(update={"recipient_id": s.session_id}))
+            for s in compatible_recipients
+        ]
+        accepted = await self._session_manager.enqueue_messages(items, project_id)
 
-            result = await self.send_message(
-                sender_id, recipient.session_id, recipient_message, project_id
-            )
+        delivered = [sid for (sid, _), ok in zip(items, accepted, strict=True) if ok]
+        failed = [sid for (sid, _), ok in zip(items, accepted, strict=True) if not ok]
 
-            if result.success or result.queued:
-                delivered.append(recipient.session_id)
-            else:
-                failed.append(recipient.session_id)
+        stats.record_sent(len(items))
+        stats.record_delivered(len(delivered))
+        if failed:
+            stats.record_failed(len(failed))
 
         # Include incompatible sessions in skipped
-        incompatible = [
-            s.session_id for s in recipients if s.session_id not in compatible_recipients
-        ]
-        skipped.extend(incompatible)
+        compatible_ids = {sid for sid, _ in items}
+        skipped = [s.session_id for s in recipients if s.session_id not in compatible_ids]
         skipped.append(sender_id)
 
+        duration_ms = (time.perf_counter() - started) * 1000
+
         logger.info(
-            f"Broadcast completed: {len(delivered)} delivered, {len(failed)} failed",
+            f"Broadcast completed: {len(delivered)} delivered, {len(failed)} failed "
+            f"in {duration_ms:.2f}ms",
             extra={
                 "context": {
                     "sender_id": str(sender_id),
@@ -431,33 +551,311 @@ class MessageRouter:
                     "delivered": len(delivered),
                     "failed": len(failed),
                     "skipped": len(skipped),
+                    "duration_ms": round(duration_ms, 3),
                 }
             },
         )
 
         # Record broadcast statistics
-        stats.record_broadcast(len(delivered))
+        stats.record_broadcast(len(delivered), duration_ms)
 
         return BroadcastResult(
             success=True,
             delivery_count=len(delivered),
             recipients={"delivered": delivered, "failed": failed, "skipped": skipped},
+            duration_ms=duration_ms,
+        )
+
+    async def send_batch(
+        self,
+        sender_id: UUID,
+        messages: list[tuple[UUID, Message]],
+        project_id: str = "default",
+    ) -> list[DeliveryResult]:
+        """Send several point-to-point messages from one sender.
+
+        Each item gets the same checks as send_message, but the sender is
+        resolved once, each distinct recipient once, and all accepted
+        messages are enqueued, grouped by recipient, in a single storage
+        operation. Messages to the same recipient keep their order.
+
+        Args:
+            sender_id: Sender session UUID
+            messages: (recipient_id, message) pairs to send
+            project_id: Project identifier for isolation (defaults to "default")
+
+        Returns:
+            One DeliveryResult per item, in input order
+        """
+        logger = get_logger(__name__)
+        stats = self._get_statistics(project_id)
+        stats.record_sent(len(messages))
+
+        sender = await self._session_manager.get_session(sender_id, project_id)
+        if not sender or sender.project_id != project_id:
+            reason = (
+                f"Sender session {sender_id} not found"
+                if not sender
+                else f"Sender session {sender_id} not in project '{project_id}'"
+            )
+            stats.record_failed(len(messages))
+            return [
+                DeliveryResult(success=False, error_reason=reason, message_id=m.message_id)
+                for _, m in messages
+            ]
+
+        results: list[DeliveryResult | None] = [None] * len(messages)
+        recipients: dict[UUID, Session | None] = {}
+        groups: dict[UUID, list[int]] = {}
+        for index, (recipient_id, message) in enumerate(messages):
+            if recipient_id not in recipients:
+                recipients[recipient_id] = await self._session_manager.get_session(
+                    recipient_id, project_id
+                )
+            error = await self._batch_item_error(
+                sender, recipient_id, recipients[recipient_id], message, project_id
+            )
+            if error:
+                results[index] = DeliveryResult(
+                    success=False, error_reason=error, message_id=message.message_id
+                )
+            else:
+                groups.setdefault(recipient_id, []).append(index)
+
+        order = [index for indices in groups.values() for index in indices]
+        accepted = await self._session_manager.enqueue_messages(
+            [messages[index] for index in order], project_id
         )
 
-    def get_dead_letter_queue(self) -> list[dict]:
-        """Get messages in the dead-letter queue.
+        delivered_at = datetime.now(UTC)
+        queued = delivered = 0
+        for index, ok in zip(order, accepted, strict=True):
+            recipient_id, message = messages[index]
+            recipient = recipients[recipient_id]
+            offline = recipient is not None and recipient.status == "disconnected"
+            if ok and offline:
+                queued += 1
+                results[index] = DeliveryResult(
+                    success=True, queued=True, message_id=message.message_id
+                )
+            elif ok:
+                delivered += 1
+                results[index] = DeliveryResult(
+                    success=True, delivered_at=delivered_at, message_id=message.message_id
+                )
+            else:
+                if offline:
+                    self._record_dead_letter(
+                        sender_id, recipient_id, message, project_id, delivered_at
+                    )
+                results[index] = DeliveryResult(
+                    success=False, error_reason="Queue full", message_id=message.message_id
+                )
+
+        failed = len(messages) - queued - delivered
+        stats.record_delivered(delivered)
+        if queued:
+            stats.record_queued(queued)
+        if failed:
+            stats.record_failed(failed)
+
+        logger.info(
+            f"Batch sent: {delivered} delivered, {queued} queued, {failed} failed",
+            extra={
+                "context": {
+                    "sender_id": str(sender_id),
+                    "project_id": project_id,
+                    "messages": len(messages),
+                    "recipients": len(recipients),
+                    "delivered": delivered,
+                    "queued": queued,
+                    "failed": failed,
+                }
+            },
+        )
+
+        return [result for result in results if result is not None]
+
+    async def _batch_item_error(
+        self,
+        sender: "Session",
+        recipient_id: UUID,
+        recipient: "Session | None",
+        message: Message,
+        project_id: str,
+    ) -> str | None:
+        """Check one send_batch item the way send_message would.
+
+        Args:
+            sender: Resolved sender session
+            recipient_id: Recipient session UUID
+            recipient: Resolved recipient session, or None if not found
+            message: Message to send
+            project_id: Project identifier
+
+        Returns:
+            Reason the item cannot be sent, or None if it may be enqueued
+        """
+        payload_error = await self._check_payload(message, project_id)
+        if payload_error:
+            return payload_error
+        if not recipient:
+            return f"Recipient session {recipient_id} not found in project '{project_id}'"
+        if recipient.project_id != project_id:
+            return (
+                f"Cross-project messaging not allowed: "
+                f"{sender.project_id} -> {recipient.project_id}"
+            )
+        if sender.common_protocol_version(recipient, message.protocol_name) is None:
+            return f"Protocol mismatch: no common version for '{message.protocol_name}'"
+        return None
+
+    def _record_dead_letter(
+        self,
+        sender_id: UUID,
+        recipient_id: UUID,
+        message: Message,
+        project_id: str,
+        failed_at: datetime,
+    ) -> None:
+        """Record a message whose offline recipient's queue was full.
+
+        Args:
+            sender_id: Sender session UUID
+            recipient_id: Recipient session UUID
+            message: Message that could not be queued
+            project_id: Project identifier
+            failed_at: When the enqueue was rejected
+        """
+        self._dead_letters.append(
+            {
+                "dead_letter_id": uuid4().hex,
+                "message": message.model_dump(mode="json"),
+                "failed_at": failed_at.isoformat(),
+                "reason": "queue_full",
+                "sender_id": str(sender_id),
+                "recipient_id": str(recipient_id),
+                "project_id": project_id,
+            },
+            project_id,
+        )
+
+    @property
+    def dead_letters(self) -> DeadLetterQueue:
+        """Dead-letter queue holding undeliverable messages."""
+        return self._dead_letters
+
+    async def get_dead_letter_queue(
+        self,
+        project_id: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Get messages in the dead-letter queue, oldest first.
+
+        Args:
+            project_id: Project to read, or None for all projects
+            offset: Number of entries to skip
+            limit: Maximum number of entries (None for all)
 
         Returns:
             List of failed message metadata
         """
-        return self._dead_letter_queue.copy()
+        if limit is None:
+            limit = self._dead_letters.size(project_id)
+        return await self._dead_letters.page(project_id, offset, limit)
 
-    def clear_dead_letter_queue(self) -> int:
+    async def clear_dead_letter_queue(self, project_id: str | None = None) -> int:
         """Clear the dead-letter queue.
 
+        Args:
+            project_id: Project to clear, or None for all projects
+
         Returns:
             Number of messages cleared
         """
-        count = len(self._dead_letter_queue)
-        self._dead_letter_queue.clear()
-        return count
+        return await self._dead_letters.clear(project_id)
+
+    async def replay_dead_letters(
+        self, project_id: str = "default", limit: int = 100
+    ) -> dict[str, Any]:
+        """Re-send dead letters whose recipients have queue room again.
+
+        Entries are replayed oldest first through send_message. Entries for
+        a recipient whose queue is still full, including one that filled up
+        during the replay, stay in place, and later entries for that
+        recipient are held back to preserve order.
+
+        Args:
+            project_id: Project whose dead letters to replay
+            limit: Maximum number of entries to examine
+
+        Returns:
+            Dict with replayed, retained, discarded and remaining counts
+        """
+        logger = get_logger(__name__)
+        entries = await self._dead_letters.page(project_id, 0, limit)
+
+        finished: list[str] = []
+        blocked: set[UUID] = set()
+        replayed = retained = discarded = 0
+
+        for entry in entries:
+            recipient_id = UUID(entry["recipient_id"])
+            if recipient_id in blocked or not await self._session_manager.has_queue_capacity(
+                recipient_id, project_id
+            ):
+                blocked.add(recipient_id)
+                retained += 1
+                continue
+
+            result = await self._send(
+                UUID(entry["sender_id"]),
+                recipient_id,
+                Message.model_validate(entry["message"]),
+                project_id,
+                dead_letter=False,
+            )
+
+            if result.error_reason == "Queue full":
+                # The queue filled up after the capacity check; keep the entry
+                blocked.add(recipient_id)
+                retained += 1
+                continue
+
+            finished.append(entry["dead_letter_id"])
+            if result.success:
+                replayed += 1
+            else:
+                discarded += 1
+                logger.warning(
+                    f"Discarding dead letter {entry['dead_letter_id']}: {result.error_reason}",
+                    extra={
+                        "context": {
+                            "project_id": project_id,
+                            "recipient_id": str(recipient_id),
+                            "reason": result.error_reason,
+                        }
+                    },
+                )
+
+        await self._dead_letters.discard(project_id, finished)
+
+        logger.info(
+            f"Replayed {replayed} dead letters for project {project_id}",
+            extra={
+                "context": {
+                    "project_id": project_id,
+                    "replayed": replayed,
+                    "retained": retained,
+                    "discarded": discarded,
+                }
+            },
+        )
+
+        return {
+            "replayed": replayed,
+            "retained": retained,
+            "discarded": discarded,
+            "remaining": self._dead_letters.size(project_id),
+        }
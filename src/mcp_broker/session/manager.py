@@ -5,11 +5,18 @@ This module provides the SessionManager class responsible for
 managing client sessions, heartbeats, and message queues.
 """
 
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import suppress
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from mcp_broker.core.logging import get_logger
+from mcp_broker.core.logging import get_logger, log_lazy
 from mcp_broker.models.message import EnqueueResult, Message
 from mcp_broker.models.session import (
     Session,
@@ -22,6 +29,9 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Liveness heap entry: (deadline, sequence, kind, (project_id, session_id), heartbeat)
+LivenessEntry = tuple[float, int, str, tuple[str, UUID], float]
+
 
 class SessionManager:
     """
@@ -30,7 +40,9 @@ class SessionManager:
     The SessionManager handles:
     - Session creation with unique ID assignment
     - Heartbeat monitoring and stale session detection
+    - Deadline-ordered liveness tracking across all projects
     - Message queuing for offline sessions
+    - Push notification of queued messages to waiting consumers
     - Session disconnection and cleanup
     - Duplicate session handling
 
@@ -61,6 +73,18 @@ class SessionManager:
         self._stale_threshold = stale_threshold
         self._disconnect_threshold = disconnect_threshold
 
+        # Per-queue wake-up signals for consumers waiting on new messages,
+        # with the number of waiters holding each; dropped when the last leaves
+        self._message_signals: dict[tuple[str, UUID], asyncio.Event] = {}
+        self._message_waiters: dict[tuple[str, UUID], int] = {}
+
+        # Liveness deadlines ordered by expiry time. Entries are invalidated
+        # lazily: only the entry matching the latest heartbeat mark is acted on.
+        self._liveness_heap: list[LivenessEntry] = []
+        self._heartbeat_marks: dict[tuple[str, UUID], float] = {}
+        self._liveness_sequence = itertools.count()
+        self._liveness_wakeup = asyncio.Event()
+
         logger.info(
             "SessionManager initialized",
             extra={
@@ -116,7 +140,11 @@ class SessionManager:
             queue_size=0,
         )
 
+        # Precompile capabilities so send-path compatibility checks are cache hits
+        _ = session.capabilities.compiled
+
         await self._storage.save_session(session, session.project_id)
+        self._schedule_liveness(session)
 
         logger.info(
             f"Session created: {sid}",
@@ -170,10 +198,13 @@ class SessionManager:
             )
 
         await self._storage.save_session(session, session.project_id)
+        self._schedule_liveness(session)
 
-        logger.debug(
-            f"Heartbeat updated for session {session_id}",
-            extra={"context": {"session_id": str(session_id), "project_id": project_id}},
+        log_lazy(
+            logger,
+            logging.DEBUG,
+            lambda: f"Heartbeat updated for session {session_id}",
+            lambda: {"session_id": str(session_id), "project_id": project_id},
         )
 
         return session
@@ -225,6 +256,14 @@ class SessionManager:
         session.status = "disconnected"
         await self._storage.save_session(session, session.project_id)
 
+        # Stop liveness tracking; pending heap entries are skipped lazily
+        self._heartbeat_marks.pop((session.project_id, session_id), None)
+
+        # Wake any stream consumers so they observe the disconnect
+        signal = self._message_signals.pop((project_id, session_id), None)
+        if signal is not None:
+            signal.set()
+
         # Note: Keep session in storage to allow message queuing for offline sessions
         # Session will be fully cleaned up by cleanup_expired_sessions after threshold
 
@@ -300,6 +339,7 @@ class SessionManager:
         try:
             await self._storage.enqueue_message(recipient_id, message, project_id)
             new_size = current_size + 1
+            self._notify_message(recipient_id, project_id)
 
             return EnqueueResult(success=True, queue_size=new_size)
         except ValueError as e:
@@ -309,6 +349,44 @@ class SessionManager:
                 error_reason=str(e),
             )
 
+    async def has_queue_capacity(self, session_id: UUID, project_id: str = "default") -> bool:
+        """Check whether a session's queue can accept another message.
+
+        Args:
+            session_id: Session UUID
+            project_id: Project identifier (defaults to "default")
+
+        Returns:
+            True if the queue is below capacity
+        """
+        queue_size = await self._storage.get_queue_size(session_id, project_id)
+        return queue_size < self._queue_capacity
+
+    async def enqueue_messages(
+        self,
+        items: list[tuple[UUID, Message]],
+        project_id: str = "default",
+    ) -> list[bool]:
+        """Enqueue messages for several sessions in one storage operation.
+
+        Callers are expected to pass existing sessions (e.g. from
+        list_sessions); unlike enqueue_message no per-item lookup is done.
+
+        Args:
+            items: (recipient_id, message) pairs to enqueue
+            project_id: Project identifier (defaults to "default")
+
+        Returns:
+            One flag per item: True if enqueued, False if the queue was full
+        """
+        accepted = await self._storage.enqueue_messages(items, project_id)
+
+        for (recipient_id, _), ok in zip(items, accepted, strict=True):
+            if ok:
+                self._notify_message(recipient_id, project_id)
+
+        return accepted
+
     async def dequeue_messages(
         self,
         session_id: UUID,
@@ -341,6 +419,314 @@ class SessionManager:
 
         return messages
 
+    def _acquire_message_signal(self, session_id: UUID, project_id: str) -> asyncio.Event:
+        """Get or create the wake-up signal for a session queue and join its waiters.
+
+        Every call must be paired with _release_message_signal().
+
+        Args:
+            session_id: Session UUID
+            project_id: Project identifier
+
+        Returns:
+            Event set whenever a message is enqueued for the session
+        """
+        key = (project_id, session_id)
+        signal = self._message_signals.get(key)
+        if signal is None:
+            signal = asyncio.Event()
+            self._message_signals[key] = signal
+        self._message_waiters[key] = self._message_waiters.get(key, 0) + 1
+        return signal
+
+    def _release_message_signal(
+        self, session_id: UUID, project_id: str, signal: asyncio.Event
+    ) -> None:
+        """Leave a session queue's waiters, dropping its signal after the last one.
+
+        Args:
+            session_id: Session UUID
+            project_id: Project identifier
+            signal: Signal returned by _acquire_message_signal()
+        """
+        key = (project_id, session_id)
+        waiters = self._message_waiters.pop(key, 1) - 1
+        if waiters > 0:
+            self._message_waiters[key] = waiters
+        elif self._message_signals.get(key) is signal:
+            del self._message_signals[key]
+
+    def _notify_message(self, session_id: UUID, project_id: str) -> None:
+        """Wake consumers waiting on a session queue.
+
+        Args:
+            session_id: Session UUID
+            project_id: Project identifier
+        """
+        signal = self._message_signals.get((project_id, session_id))
+        if signal is not None:
+            signal.set()
+
+    async def wait_for_messages(
+        self,
+        session_id: UUID,
+        timeout: float | None = None,
+        project_id: str = "default",
+    ) -> bool:
+        """Wait until a session queue has messages.
+
+        Returns immediately if messages are already queued. Messages enqueued
+        by other broker processes are not signalled, so callers sharing a
+        storage backend across workers should pass a timeout.
+
+        Args:
+            session_id: Session UUID
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            project_id: Project identifier (defaults to "default")
+
+        Returns:
+            True if messages are available, False on timeout
+        """
+        signal = self._acquire_message_signal(session_id, project_id)
+        try:
+            signal.clear()
+
+            if await self._storage.get_queue_size(session_id, project_id) > 0:
+                return True
+
+            with suppress(TimeoutError):
+                await asyncio.wait_for(signal.wait(), timeout)
+
+            return await self._storage.get_queue_size(session_id, project_id) > 0
+        finally:
+            self._release_message_signal(session_id, project_id, signal)
+
+    async def stream_messages(
+        self,
+        session_id: UUID,
+        batch_size: int = 10,
+        idle_timeout: float = 15.0,
+        project_id: str = "default",
+    ) -> AsyncIterator[list[Message]]:
+        """Stream queued messages for a session as they arrive.
+
+        Drains the queue in batches of up to batch_size and then sleeps until
+        the next enqueue. An empty batch is yielded after idle_timeout seconds
+        without traffic so transports can send keep-alives. The stream ends
+        when the session is disconnected or removed.
+
+        Args:
+            session_id: Session UUID
+            batch_size: Maximum messages per yielded batch
+            idle_timeout: Seconds without messages before yielding an empty batch
+            project_id: Project identifier (defaults to "default")
+
+        Yields:
+            Batches of dequeued messages (oldest first)
+        """
+        while True:
+            session = await self._storage.get_session(session_id, project_id)
+            if session is None or session.status == "disconnected":
+                return
+
+            if await self.wait_for_messages(session_id, idle_timeout, project_id):
+                messages = await self.dequeue_messages(session_id, batch_size, project_id)
+                if messages:
+                    yield messages
+            else:
+                yield []
+
+    def _schedule_liveness(self, session: Session) -> None:
+        """Push stale and disconnect deadlines for a session's latest heartbeat.
+
+        Args:
+            session: Session whose heartbeat was created or refreshed
+        """
+        key = (session.project_id, session.session_id)
+        heartbeat = session.last_heartbeat.timestamp()
+        self._heartbeat_marks[key] = heartbeat
+
+        previous_head = self._liveness_heap[0][0] if self._liveness_heap else None
+        heapq.heappush(
+            self._liveness_heap,
+            (
+                heartbeat + self._stale_threshold,
+                next(self._liveness_sequence),
+                "stale",
+                key,
+                heartbeat,
+            ),
+        )
+        heapq.heappush(
+            self._liveness_heap,
+            (
+                heartbeat + self._disconnect_threshold,
+                next(self._liveness_sequence),
+                "disconnect",
+                key,
+                heartbeat,
+            ),
+        )
+
+        # Superseded entries stay in the heap until they expire; rebuild when
+        # they dominate so memory tracks live sessions, not heartbeat volume
+        if len(self._liveness_heap) > 4 * len(self._heartbeat_marks) + 64:
+            self._liveness_heap = [
+                entry
+                for entry in self._liveness_heap
+                if self._heartbeat_marks.get(entry[3]) == entry[4]
+            ]
+            heapq.heapify(self._liveness_heap)
+
+        # Wake the monitor if its next deadline moved earlier
+        if previous_head is None or self._liveness_heap[0][0] < previous_head:
+            self._liveness_wakeup.set()
+
+    def next_liveness_deadline(self) -> float | None:
+        """Get the earliest pending liveness deadline.
+
+        Returns:
+            Deadline as a POSIX timestamp, or None if nothing is tracked
+        """
+        return self._liveness_heap[0][0] if self._liveness_heap else None
+
+    async def expire_sessions(
+        self, now: float | None = None
+    ) -> tuple[list[Session], list[Session]]:
+        """Apply stale and disconnect transitions whose deadline has passed.
+
+        Only heap entries that are due are examined, so the cost of a tick is
+        proportional to the number of expiring sessions, across all projects.
+
+        Args:
+            now: Current POSIX timestamp (defaults to time.time())
+
+        Returns:
+            Tuple of (sessions marked stale, sessions disconnected)
+        """
+        now = time.time() if now is None else now
+        stale_sessions: list[Session] = []
+        disconnected: list[Session] = []
+
+        while self._liveness_heap and self._liveness_heap[0][0] <= now:
+            _, _, kind, key, heartbeat = heapq.heappop(self._liveness_heap)
+
+            if self._heartbeat_marks.get(key) != heartbeat:
+                continue  # Superseded by a later heartbeat or untracked
+
+            project_id, session_id = key
+            session = await self._storage.get_session(session_id, project_id)
+            if session is None or session.status == "disconnected":
+                self._heartbeat_marks.pop(key, None)
+                continue
+
+            if session.last_heartbeat.timestamp() != heartbeat:
+                # Heartbeat was written without going through the manager
+                self._schedule_liveness(session)
+                continue
+
+            if kind == "stale":
+                if session.status == "active":
+                    session.status = "stale"
+                    await self._storage.save_session(session, session.project_id)
+                    stale_sessions.append(session)
+
+                    logger.info(
+                        f"Session marked as stale: {session.session_id}",
+                        extra={
+                            "context": {
+                                "session_id": str(session.session_id),
+                                "project_id": session.project_id,
+                                "last_heartbeat": session.last_heartbeat.isoformat(),
+                                "lag_ms": round(
+                                    (now - heartbeat - self._stale_threshold) * 1000, 1
+                                ),
+                            }
+                        },
+                    )
+            else:
+                await self.disconnect_session(session.session_id, session.project_id)
+                disconnected.append(session)
+
+                logger.info(
+                    f"Session disconnected due to timeout: {session.session_id}",
+                    extra={
+                        "context": {
+                            "session_id": str(session.session_id),
+                            "project_id": session.project_id,
+                            "lag_ms": round(
+                                (now - heartbeat - self._disconnect_threshold) * 1000, 1
+                            ),
+                        }
+                    },
+                )
+
+        return stale_sessions, disconnected
+
+    async def track_sessions(self, project_ids: Iterable[str]) -> int:
+        """Start liveness tracking for stored sessions this manager has not seen.
+
+        Deadlines are normally scheduled by create_session and
+        update_heartbeat. Sessions that existed before a restart, or that
+        were created by another broker process sharing the storage
+        backend, are picked up here.
+
+        Args:
+            project_ids: Projects whose sessions to load
+
+        Returns:
+            Number of sessions newly scheduled
+        """
+        scheduled = 0
+        for project_id in project_ids:
+            for session in await self._storage.list_sessions(project_id=project_id):
+                if session.status == "disconnected":
+                    continue
+                key = (session.project_id, session.session_id)
+                if self._heartbeat_marks.get(key) == session.last_heartbeat.timestamp():
+                    continue
+                self._schedule_liveness(session)
+                scheduled += 1
+        return scheduled
+
+    async def run_liveness_monitor(
+        self,
+        max_interval: float = 10.0,
+        project_ids: Callable[[], Iterable[str]] | None = None,
+        resync_interval: float = 60.0,
+    ) -> None:
+        """Apply liveness transitions as their deadlines pass.
+
+        Sleeps until the earliest pending deadline (at most max_interval) and
+        is woken early when a new session introduces an earlier deadline.
+        Stored sessions are loaded with track_sessions on start and every
+        resync_interval seconds. Runs until cancelled.
+
+        Args:
+            max_interval: Upper bound on the sleep between checks, in seconds
+            project_ids: Returns the projects to load sessions from
+                (defaults to the "default" project only)
+            resync_interval: Seconds between loads of stored sessions
+        """
+        next_resync = 0.0
+        while True:
+            try:
+                if time.monotonic() >= next_resync:
+                    next_resync = time.monotonic() + resync_interval
+                    await self.track_sessions(project_ids() if project_ids else ("default",))
+                await self.expire_sessions()
+            except Exception as e:
+                logger.error(f"Liveness monitor error: {e}")
+
+            delay = max_interval
+            deadline = self.next_liveness_deadline()
+            if deadline is not None:
+                delay = min(max(deadline - time.time(), 0.0), max_interval)
+
+            self._liveness_wakeup.clear()
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._liveness_wakeup.wait(), delay)
+
     async def check_stale_sessions(self, project_id: str | None = None) -> list[Session]:
         """Check for stale sessions and update their status.
 
@@ -4,7 +4,8 @@ This module provides storage abstraction with support for both
 in-memory and Redis backends for protocol, session, and message data.
 """
 
+from mcp_broker.storage.factory import create_storage
 from mcp_broker.storage.interface import StorageBackend
 from mcp_broker.storage.memory import InMemoryStorage
 
-__all__ = ["StorageBackend", "InMemoryStorage"]
+__all__ = ["StorageBackend", "InMemoryStorage", "create_storage"]
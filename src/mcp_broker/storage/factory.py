@@ -0,0 +1,41 @@
+"""
+Storage backend factory for MCP Broker Server.
+
+This module selects and builds the configured storage backend so that
+the server does not need to know about individual implementations.
+"""
+
+from mcp_broker.storage.interface import StorageBackend
+from mcp_broker.storage.memory import InMemoryStorage
+
+
+def create_storage(
+    backend: str = "memory",
+    queue_capacity: int = 100,
+    redis_url: str | None = None,
+    wal_dir: str | None = None,
+) -> StorageBackend:
+    """Create a storage backend from configuration.
+
+    Args:
+        backend: Backend name ("memory" or "redis")
+        queue_capacity: Maximum messages per session queue
+        redis_url: Redis connection URL (required for "redis")
+        wal_dir: Write-ahead log directory for durable "memory" queues
+
+    Returns:
+        Configured storage backend
+
+    Raises:
+        ValueError: If the backend name is unknown or redis_url is missing
+    """
+    if backend == "memory":
+        return InMemoryStorage(queue_capacity=queue_capacity, wal_dir=wal_dir)
+
+    if backend == "redis":
+        # Import lazily so the redis extra stays optional
+        from mcp_broker.storage.redis_storage import RedisStorage
+
+        return RedisStorage(redis_url=redis_url, queue_capacity=queue_capacity)
+
+    raise ValueError(f"Unknown storage backend '{backend}'. Must be one of: memory, redis")
@@ -158,6 +158,23 @@ class StorageBackend(Protocol):
         """
         ...
 
+    async def enqueue_messages(
+        self, items: list[tuple[UUID, Message]], project_id: str = "default"
+    ) -> list[bool]:
+        """Add several messages to session queues in one operation.
+
+        Used for broadcast fan-out. Items whose queue is at capacity are
+        rejected individually rather than failing the whole batch.
+
+        Args:
+            items: (session_id, message) pairs to enqueue, in order
+            project_id: Project identifier (defaults to "default")
+
+        Returns:
+            One flag per item: True if enqueued, False if the queue was full
+        """
+        ...
+
     async def dequeue_messages(
         self, session_id: UUID, limit: int = 10, project_id: str = "default"
     ) -> list[Message]:
@@ -7,18 +7,27 @@ does not persist across server restarts.
 
 The storage now supports project namespace isolation using the
 pattern: "{project_id}:{resource_type}:{resource_id}"
+
+Message queues can optionally be made durable with a write-ahead log
+(see mcp_broker.storage.wal); reads are still served from memory.
 """
 
-from collections import deque
+import heapq
+import itertools
+import logging
+import time
+from contextlib import suppress
 from datetime import UTC, datetime
-from typing import cast
+from pathlib import Path
 from uuid import UUID
 
-from mcp_broker.core.logging import get_logger
+from mcp_broker.core.logging import get_logger, log_lazy
 from mcp_broker.models.message import Message
 from mcp_broker.models.protocol import ProtocolDefinition
 from mcp_broker.models.session import Session
 from mcp_broker.storage.interface import StorageBackend
+from mcp_broker.storage.session_queue import QueuedMessage, SessionQueue
+from mcp_broker.storage.wal import MessageQueueWAL
 
 logger = get_logger(__name__)
 
@@ -30,18 +39,44 @@ class InMemoryStorage(StorageBackend):
     Storage structure with project namespace isolation:
     - protocols: Dict[(project_id, name, version), ProtocolDefinition]
     - sessions: Dict[(project_id, session_id), Session]
-    - message_queues: Dict[(project_id, session_id), deque[Message]]
+    - message_queues: Dict[(project_id, session_id), SessionQueue]
     - protocol_registry: Dict[(project_id, name), Set[version]] for fast lookup
 
+    Secondary indexes keep listing cost proportional to the number of matches:
+    - project_sessions: Dict[project_id, ordered set of session_id]
+    - status_sessions: Dict[(project_id, status), ordered set of session_id]
+    - project_protocols: Dict[project_id, ordered set of protocol key]
+
+    Session queues dequeue by priority (urgent, high, normal, low) and FIFO
+    within a priority. Messages with a TTL are also indexed in an expiry
+    heap, so expired messages are evicted before capacity checks without
+    scanning queues.
+
+    Ordered sets are dicts with None values so listings keep insertion order.
+    Indexes are maintained by save/delete methods, so callers that change a
+    session's status must save it for the change to be visible to listings.
+
+    When wal_dir is set, queue mutations are logged before they are
+    acknowledged and queues are rebuilt from the log on construction.
+    Enqueued messages only become visible once their log record is
+    durable, so a failed commit never leaves a message deliverable.
+
     Attributes:
         queue_capacity: Maximum messages per session queue
     """
 
-    def __init__(self, queue_capacity: int = 100) -> None:
+    def __init__(
+        self,
+        queue_capacity: int = 100,
+        wal_dir: str | Path | None = None,
+        wal_fsync: bool = True,
+    ) -> None:
         """Initialize in-memory storage.
 
         Args:
             queue_capacity: Maximum messages per session queue
+            wal_dir: Directory for the message queue write-ahead log (None disables it)
+            wal_fsync: Whether write-ahead log commits are fsynced
         """
         self.queue_capacity = queue_capacity
 
@@ -52,14 +87,140 @@ class InMemoryStorage(StorageBackend):
         # Session storage with project namespace
         self._sessions: dict[tuple[str, UUID], Session] = {}
 
+        # Secondary indexes for project- and status-scoped listing
+        self._project_sessions: dict[str, dict[UUID, None]] = {}
+        self._status_sessions: dict[tuple[str, str], dict[UUID, None]] = {}
+        self._indexed_status: dict[tuple[str, UUID], str] = {}
+        self._project_protocols: dict[str, dict[tuple[str, str, str], None]] = {}
+
         # Message queues with project namespace
-        self._message_queues: dict[tuple[str, UUID], deque[Message]] = {}
+        self._message_queues: dict[tuple[str, UUID], SessionQueue] = {}
+
+        # Expiry index: (deadline, sequence, queue key, entry)
+        self._expiry_heap: list[tuple[float, int, tuple[str, UUID], QueuedMessage]] = []
+        self._expiry_sequence = itertools.count()
+
+        # Messages per queue waiting for their WAL commit; they count
+        # towards capacity but are not visible yet
+        self._reserved: dict[tuple[str, UUID], int] = {}
+
+        # Optional write-ahead log; recovery rebuilds the queues
+        self._wal: MessageQueueWAL | None = None
+        if wal_dir is not None:
+            self._wal = MessageQueueWAL(wal_dir, fsync=wal_fsync)
+            for queue_key, records in self._wal.recover().items():
+                queue = self._message_queues[queue_key] = SessionQueue()
+                for lsn, message in records:
+                    self._push_entry(queue_key, queue, QueuedMessage(message, lsn))
 
         logger.info(
             "InMemoryStorage initialized",
-            extra={"context": {"queue_capacity": queue_capacity}},
+            extra={
+                "context": {
+                    "queue_capacity": queue_capacity,
+                    "wal_dir": str(wal_dir) if wal_dir is not None else None,
+                }
+            },
         )
 
+    async def close(self) -> None:
+        """Commit and close the write-ahead log, if enabled."""
+        if self._wal is not None:
+            await self._wal.close()
+
+    def _push_entry(
+        self, queue_key: tuple[str, UUID], queue: SessionQueue, entry: QueuedMessage
+    ) -> None:
+        """Append an entry to a queue and index its expiry.
+
+        Args:
+            queue_key: Project-scoped queue key
+            queue: Queue to append to
+            entry: Entry to enqueue
+        """
+        queue.append(entry)
+        if entry.deadline is not None:
+            heapq.heappush(
+                self._expiry_heap,
+                (entry.deadline, next(self._expiry_sequence), queue_key, entry),
+            )
+
+    async def _log_enqueues(
+        self, project_id: str, entries: list[tuple[UUID, QueuedMessage]]
+    ) -> None:
+        """Log enqueued entries and wait until the records are durable.
+
+        Args:
+            project_id: Project identifier
+            entries: (session_id, entry) pairs, in enqueue order
+
+        Raises:
+            OSError: If the commit fails; the records are retracted
+        """
+        assert self._wal is not None
+        committed = None
+        for session_id, entry in entries:
+            entry.lsn, committed = self._wal.log_enqueue(project_id, session_id, entry.message)
+        if committed is None:
+            return
+
+        try:
+            await committed
+        except OSError:
+            # A partially written batch must not resurrect these on recovery
+            retracted = None
+            for session_id, entry in entries:
+                retracted = self._wal.log_dequeue(project_id, session_id, [entry.lsn])
+            if retracted is not None:
+                with suppress(OSError):
+                    await retracted
+            raise
+
+    def _reserve(self, queue_key: tuple[str, UUID], count: int) -> None:
+        """Adjust the number of a queue's messages waiting for their commit.
+
+        Args:
+            queue_key: Project-scoped queue key
+            count: Change in reserved messages
+        """
+        reserved = self._reserved.get(queue_key, 0) + count
+        if reserved:
+            self._reserved[queue_key] = reserved
+        else:
+            self._reserved.pop(queue_key, None)
+
+    async def evict_expired_messages(self) -> int:
+        """Evict queued messages whose TTL has elapsed.
+
+        Only due entries of the expiry index are visited.
+
+        Returns:
+            Number of messages evicted
+        """
+        now = time.time()
+        evicted: dict[tuple[str, UUID], list[int]] = {}
+
+        while self._expiry_heap and self._expiry_heap[0][0] < now:
+            _, _, queue_key, entry = heapq.heappop(self._expiry_heap)
+            queue = self._message_queues.get(queue_key)
+            if queue is not None and queue.evict(entry):
+                evicted.setdefault(queue_key, []).append(entry.lsn)
+
+        for queue_key, lsns in evicted.items():
+            session = self._sessions.get(queue_key)
+            if session:
+                session.queue_size = len(self._message_queues[queue_key])
+            if self._wal is not None:
+                await self._wal.log_dequeue(queue_key[0], queue_key[1], lsns)
+
+        count = sum(len(lsns) for lsns in evicted.values())
+        if count:
+            logger.debug(
+                f"Evicted {count} expired messages",
+                extra={"context": {"evicted": count, "queues": len(evicted)}},
+            )
+        return count
+
     def _protocol_key(self, project_id: str, name: str, version: str) -> tuple[str, str, str]:
         """Create a project-scoped key for protocol storage.
 
@@ -97,6 +258,63 @@ class InMemoryStorage(StorageBackend):
         """
         return (project_id, session_id)
 
+    @staticmethod
+    def _discard_index_entry(index: dict, index_key: object, member: object) -> None:
+        """Remove a member from an index bucket, dropping the bucket when empty.
+
+        Args:
+            index: Index mapping bucket keys to ordered sets
+            index_key: Bucket key within the index
+            member: Member to remove from the bucket
+        """
+        bucket = index.get(index_key)
+        if bucket is None:
+            return
+        bucket.pop(member, None)
+        if not bucket:
+            del index[index_key]
+
+    def _index_session(self, project_id: str, session: Session) -> None:
+        """Add or move a session in the project and status indexes.
+
+        Args:
+            project_id: Project identifier
+            session: Session being saved
+        """
+        key = self._session_key(project_id, session.session_id)
+        previous_status = self._indexed_status.get(key)
+
+        if previous_status == session.status:
+            return
+
+        if previous_status is None:
+            self._project_sessions.setdefault(project_id, {})[session.session_id] = None
+        else:
+            self._discard_index_entry(
+                self._status_sessions, (project_id, previous_status), session.session_id
+            )
+
+        self._status_sessions.setdefault((project_id, session.status), {})[
+            session.session_id
+        ] = None
+        self._indexed_status[key] = session.status
+
+    def _unindex_session(self, project_id: str, session_id: UUID) -> None:
+        """Remove a session from the project and status indexes.
+
+        Args:
+            project_id: Project identifier
+            session_id: Session UUID
+        """
+        previous_status = self._indexed_status.pop(self._session_key(project_id, session_id), None)
+        if previous_status is None:
+            return
+
+        self._discard_index_entry(self._project_sessions, project_id, session_id)
+        self._discard_index_entry(
+            self._status_sessions, (project_id, previous_status), session_id
+        )
+
     async def get_protocol(
         self, name: str, version: str, project_id: str = "default"
     ) -> ProtocolDefinition | None:
@@ -143,6 +361,7 @@ class InMemoryStorage(StorageBackend):
             )
 
         self._protocols[key] = protocol
+        self._project_protocols.setdefault(project_id, {})[key] = None
 
         # Update registry for fast lookup
         registry_key = self._protocol_registry_key(project_id, protocol.name)
@@ -178,14 +397,6 @@ class InMemoryStorage(StorageBackend):
         Returns:
             List of matching protocols
         """
-        # Filter by project first
-        project_protocols = [
-            p for (pid, _, _), p in self._protocols.items() if pid == project_id
-        ]
-
-        if name is None and version is None:
-            return project_protocols
-
         if name is not None and version is not None:
             protocol = await self.get_protocol(name, version, project_id)
             return [protocol] if protocol else []
@@ -199,8 +410,13 @@ class InMemoryStorage(StorageBackend):
                 if self._protocol_key(project_id, name, v) in self._protocols
             ]
 
+        project_keys = self._project_protocols.get(project_id, {})
+
+        if version is None:
+            return [self._protocols[key] for key in project_keys]
+
         # Filter by version only
-        return [p for p in project_protocols if p.version == version]
+        return [self._protocols[key] for key in project_keys if key[2] == version]
 
     async def delete_protocol(
         self, name: str, version: str, project_id: str = "default"
@@ -221,6 +437,7 @@ class InMemoryStorage(StorageBackend):
             return False
 
         del self._protocols[key]
+        self._discard_index_entry(self._project_protocols, project_id, key)
 
         # Update registry
         registry_key = self._protocol_registry_key(project_id, name)
@@ -267,15 +484,16 @@ class InMemoryStorage(StorageBackend):
         """
         key = self._session_key(project_id, session.session_id)
         self._sessions[key] = session
-
-        logger.debug(
-            f"Saved session: {session.session_id} in project {project_id}",
-            extra={
-                "context": {
-                    "project_id": project_id,
-                    "session_id": str(session.session_id),
-                    "status": session.status,
-                }
+        self._index_session(project_id, session)
+
+        log_lazy(
+            logger,
+            logging.DEBUG,
+            lambda: f"Saved session: {session.session_id} in project {project_id}",
+            lambda: {
+                "project_id": project_id,
+                "session_id": str(session.session_id),
+                "status": session.status,
             },
         )
 
@@ -291,15 +509,12 @@ class InMemoryStorage(StorageBackend):
         Returns:
             List of matching sessions
         """
-        # Filter by project first
-        project_sessions = [
-            s for (pid, _), s in self._sessions.items() if pid == project_id
-        ]
-
         if status:
-            project_sessions = [s for s in project_sessions if s.status == status]
+            session_ids = self._status_sessions.get((project_id, status), {})
+        else:
+            session_ids = self._project_sessions.get(project_id, {})
 
-        return project_sessions
+        return [self._sessions[(project_id, sid)] for sid in session_ids]
 
     async def delete_session(
         self, session_id: UUID, project_id: str = "default"
@@ -320,10 +535,13 @@ class InMemoryStorage(StorageBackend):
 
         # Clean up session data
         del self._sessions[key]
+        self._unindex_session(project_id, session_id)
 
         queue_key = self._session_key(project_id, session_id)
         if queue_key in self._message_queues:
-            del self._message_queues[queue_key]
+            self._message_queues.pop(queue_key).drain()
+            if self._wal is not None:
+                await self._wal.log_clear(project_id, session_id)
 
         logger.info(
             f"Deleted session: {session_id} from project {project_id}",
@@ -347,16 +565,17 @@ class InMemoryStorage(StorageBackend):
             project_id: Project identifier (defaults to "default")
 
         Raises:
-            ValueError: If queue is at capacity
+            ValueError: If queue is at capacity or the message could not be logged
         """
+        await self.evict_expired_messages()
         queue_key = self._session_key(project_id, session_id)
 
         if queue_key not in self._message_queues:
-            self._message_queues[queue_key] = deque()
+            self._message_queues[queue_key] = SessionQueue()
 
         queue = self._message_queues[queue_key]
 
-        if len(queue) >= self.queue_capacity:
+        if len(queue) + self._reserved.get(queue_key, 0) >= self.queue_capacity:
             logger.warning(
                 f"Queue full for session {session_id} in project {project_id}",
                 extra={
@@ -373,7 +592,21 @@ class InMemoryStorage(StorageBackend):
                 f"for session {session_id} in project {project_id}"
             )
 
-        queue.append(message)
+        entry = QueuedMessage(message)
+        if self._wal is not None:
+            self._reserve(queue_key, 1)
+            try:
+                await self._log_enqueues(project_id, [(session_id, entry)])
+            except OSError as e:
+                raise ValueError(
+                    f"Failed to persist message for session {session_id} "
+                    f"in project {project_id}: {e}"
+                ) from e
+            finally:
+                self._reserve(queue_key, -1)
+        # A clear logged while the record was committed covers this message too
+        if self._message_queues.get(queue_key) is queue:
+            self._push_entry(queue_key, queue, entry)
 
         # Update session queue size
         session = await self.get_session(session_id, project_id)
@@ -381,29 +614,104 @@ class InMemoryStorage(StorageBackend):
             session.queue_size = len(queue)
             await self.save_session(session, project_id)
 
+        log_lazy(
+            logger,
+            logging.DEBUG,
+            lambda: f"Enqueued message for session {session_id} in project {project_id}",
+            lambda: {
+                "project_id": project_id,
+                "session_id": str(session_id),
+                "queue_size": len(queue),
+            },
+        )
+
+    async def enqueue_messages(
+        self, items: list[tuple[UUID, Message]], project_id: str = "default"
+    ) -> list[bool]:
+        """Add several messages to session queues in one operation.
+
+        Args:
+            items: (session_id, message) pairs to enqueue, in order
+            project_id: Project identifier (defaults to "default")
+
+        Returns:
+            One flag per item: True if enqueued, False if the queue was full
+            (or, with a WAL, if the batch could not be logged)
+        """
+        await self.evict_expired_messages()
+        accepted: list[bool] = []
+        entries: list[tuple[UUID, QueuedMessage]] = []
+        pending: dict[tuple[str, UUID], int] = {}
+        touched: dict[tuple[str, UUID], SessionQueue] = {}
+
+        for session_id, message in items:
+            queue_key = self._session_key(project_id, session_id)
+            queue = self._message_queues.get(queue_key)
+            if queue is None:
+                queue = self._message_queues[queue_key] = SessionQueue()
+            touched[queue_key] = queue
+
+            size = len(queue) + self._reserved.get(queue_key, 0) + pending.get(queue_key, 0)
+            if size >= self.queue_capacity:
+                accepted.append(False)
+                continue
+
+            entries.append((session_id, QueuedMessage(message)))
+            pending[queue_key] = pending.get(queue_key, 0) + 1
+            accepted.append(True)
+
+        if self._wal is not None and entries:
+            # All records share one group commit
+            for queue_key, count in pending.items():
+                self._reserve(queue_key, count)
+            try:
+                await self._log_enqueues(project_id, entries)
+            except OSError:
+                return [False] * len(items)
+            finally:
+                for queue_key, count in pending.items():
+                    self._reserve(queue_key, -count)
+
+        for session_id, entry in entries:
+            queue_key = self._session_key(project_id, session_id)
+            queue = touched[queue_key]
+            # A clear logged while the records were committed covers these too
+            if self._message_queues.get(queue_key) is queue:
+                self._push_entry(queue_key, queue, entry)
+
+        # Update session queue sizes once per touched queue
+        for queue_key, queue in touched.items():
+            session = self._sessions.get(queue_key)
+            if session:
+                session.queue_size = len(queue)
+
         logger.debug(
-            f"Enqueued message for session {session_id} in project {project_id}",
+            f"Enqueued {accepted.count(True)} of {len(items)} messages in project {project_id}",
             extra={
                 "context": {
                     "project_id": project_id,
-                    "session_id": str(session_id),
-                    "queue_size": len(queue),
+                    "requested": len(items),
+                    "accepted": accepted.count(True),
                 }
             },
         )
 
+        return accepted
+
     async def dequeue_messages(
         self, session_id: UUID, limit: int = 10, project_id: str = "default"
     ) -> list[Message]:
         """Dequeue messages for a session.
 
+        Expired messages reached along the way are dropped, not returned.
+
         Args:
             session_id: Session UUID
             limit: Maximum number of messages to dequeue
             project_id: Project identifier (defaults to "default")
 
         Returns:
-            List of dequeued messages (oldest first)
+            List of dequeued messages (most urgent first, oldest first within a priority)
         """
         queue_key = self._session_key(project_id, session_id)
 
@@ -411,11 +719,13 @@ class InMemoryStorage(StorageBackend):
             return []
 
         queue = self._message_queues[queue_key]
-        messages = []
+        taken, expired = queue.pop(limit, time.time())
+        messages = [entry.message for entry in taken]
 
-        for _ in range(min(limit, len(queue))):
-            if queue:
-                messages.append(cast(Message, queue.popleft()))
+        if (taken or expired) and self._wal is not None:
+            await self._wal.log_dequeue(
+                project_id, session_id, [entry.lsn for entry in taken + expired]
+            )
 
         # Update session queue size
         session = await self.get_session(session_id, project_id)
@@ -431,6 +741,7 @@ class InMemoryStorage(StorageBackend):
                         "project_id": project_id,
                         "session_id": str(session_id),
                         "count": len(messages),
+                        "expired": len(expired),
                     }
                 },
             )
@@ -449,6 +760,7 @@ class InMemoryStorage(StorageBackend):
         Returns:
             Current queue size
         """
+        await self.evict_expired_messages()
         queue_key = self._session_key(project_id, session_id)
         if queue_key not in self._message_queues:
             return 0
@@ -471,8 +783,9 @@ class InMemoryStorage(StorageBackend):
         if queue_key not in self._message_queues:
             return 0
 
-        count = len(self._message_queues[queue_key])
-        del self._message_queues[queue_key]
+        count = len(self._message_queues.pop(queue_key).drain())
+        if self._wal is not None:
+            await self._wal.log_clear(project_id, session_id)
 
         # Update session queue size
         session = await self.get_session(session_id, project_id)
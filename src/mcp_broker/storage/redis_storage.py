@@ -0,0 +1,567 @@
+"""
+Redis storage implementation for MCP Broker Server.
+
+This module provides a Redis-backed storage backend so that several
+broker processes can share protocols, sessions and message queues.
+Data survives broker restarts for as long as Redis retains it.
+
+Keys follow the project namespace pattern used by the in-memory backend:
+- "{prefix}:{project_id}:protocols" -> Hash of "name:version" -> ProtocolDefinition JSON
+- "{prefix}:{project_id}:sessions" -> Hash of session_id -> Session JSON
+- "{prefix}:{project_id}:queue:{session_id}" -> List of Message JSON (oldest first)
+"""
+
+from typing import Any
+from uuid import UUID
+
+from mcp_broker.core.logging import get_logger
+from mcp_broker.models.message import Message
+from mcp_broker.models.protocol import ProtocolDefinition
+from mcp_broker.models.session import Session
+from mcp_broker.storage.interface import StorageBackend
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import WatchError
+except ImportError:  # pragma: no cover - exercised only without the redis extra
+    aioredis = None  # type: ignore[assignment]
+    WatchError = Exception  # type: ignore[assignment,misc]
+
+logger = get_logger(__name__)
+
+
+class RedisStorage(StorageBackend):
+    """
+    Redis storage backend for multi-process deployments.
+
+    Queue mutations run inside MULTI/EXEC transactions so that concurrent
+    broker workers never exceed the queue capacity or hand the same
+    message to two consumers.
+
+    Session queue sizes are not stored in the session document; they are
+    read from the queue length whenever a session is loaded, so enqueue
+    and dequeue never need a read-modify-write of the session.
+
+    Attributes:
+        queue_capacity: Maximum messages per session queue
+        key_prefix: Prefix applied to every Redis key
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        queue_capacity: int = 100,
+        key_prefix: str = "mcp_broker",
+        client: Any = None,
+    ) -> None:
+        """Initialize Redis storage.
+
+        Args:
+            redis_url: Redis connection URL (ignored if client is given)
+            queue_capacity: Maximum messages per session queue
+            key_prefix: Prefix applied to every Redis key
+            client: Optional pre-built redis.asyncio client (e.g. fakeredis)
+
+        Raises:
+            RuntimeError: If the redis package is not installed
+            ValueError: If neither redis_url nor client is provided
+        """
+        if client is None:
+            if aioredis is None:
+                raise RuntimeError(
+                    "redis package not installed. Install with: pip install -e '.[redis]'"
+                )
+            if not redis_url:
+                raise ValueError("redis_url is required for the Redis storage backend")
+            client = aioredis.from_url(redis_url, decode_responses=True)
+
+        self.queue_capacity = queue_capacity
+        self.key_prefix = key_prefix
+        self._redis = client
+
+        logger.info(
+            "RedisStorage initialized",
+            extra={"context": {"queue_capacity": queue_capacity, "key_prefix": key_prefix}},
+        )
+
+    def _protocols_key(self, project_id: str) -> str:
+        """Create the project-scoped key of the protocol hash.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            Redis key for the protocol hash
+        """
+        return f"{self.key_prefix}:{project_id}:protocols"
+
+    def _sessions_key(self, project_id: str) -> str:
+        """Create the project-scoped key of the session hash.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            Redis key for the session hash
+        """
+        return f"{self.key_prefix}:{project_id}:sessions"
+
+    def _queue_key(self, project_id: str, session_id: UUID) -> str:
+        """Create the project-scoped key of a session message queue.
+
+        Args:
+            project_id: Project identifier
+            session_id: Session UUID
+
+        Returns:
+            Redis key for the message queue list
+        """
+        return f"{self.key_prefix}:{project_id}:queue:{session_id}"
+
+    @staticmethod
+    def _protocol_field(name: str, version: str) -> str:
+        """Create the hash field for a protocol.
+
+        Args:
+            name: Protocol name
+            version: Protocol version
+
+        Returns:
+            Hash field name
+        """
+        return f"{name}:{version}"
+
+    async def close(self) -> None:
+        """Close the underlying Redis connection pool."""
+        await self._redis.aclose()
+
+    async def get_protocol(
+        self, name: str, version: str, project_id: str = "default"
+    ) -> ProtocolDefinition | None:
+        """Retrieve a protocol by name and version.
+
+        Args:
+            name: Protocol name
+            version: Protocol version
+            project_id: Project identifier (defaults to "default")
+
+        Returns:
+            ProtocolDefinition if found, None otherwise
+        """
+        raw = await self._redis.hget(
+            self._protocols_key(project_id), self._protocol_field(name, version)
+        )
+        return ProtocolDefinition.model_validate_json(raw) if raw else None
+
+    async def save_protocol(
+        self, protocol: ProtocolDefinition, project_id: str = "default"
+    ) -> None:
+        """Save a protocol definition.
+
+        Args:
+            protocol: Protocol definition to save
+            project_id: Project identifier (defaults to "default")
+
+        Raises:
+            ValueError: If protocol with same name/version already exists
+        """
+        created = await self._redis.hsetnx(
+            self._protocols_key(project_id),
+            self._protocol_field(protocol.name, protocol.version),
+            protocol.model_dump_json(),
+        )
+
+        if not created:
+            logger.warning(
+                f"Protocol {protocol.name} v{protocol.version} already exists in project {project_id}",
+                extra={
+                    "context": {
+                        "project_id": project_id,
+                        "protocol_name": protocol.name,
+                        "version": protocol.version,
+                    }
+                },
+            )
+            raise ValueError(
+                f"Protocol '{protocol.name}' version '{protocol.version}' already exists in project '{project_id}'"
+            )
+
+        logger.info(
+            f"Registered protocol: {protocol.name} v{protocol.version} in project {project_id}",
+            extra={
+                "context": {
+                    "project_id": project_id,
+                    "protocol_name": protocol.name,
+                    "version": protocol.version,
+                    "capabilities": protocol.capabilities,
+                }
+            },
+        )
+
+    async def list_protocols(
+        self,
+        name: str | None = None,
+        version: str | None = None,
+        project_id: str = "default",
+    ) -> list[ProtocolDefinition]:
+        """List protocols with optional filtering.
+
+        Args:
+            name: Filter by protocol name (optional)
+            version: Filter by version (optional)
+            project_id: Project identifier (defaults to "default")
+
+        Returns:
+            List of matching protocols
+        """
+        if name is not None and version is not None:
+            protocol = await self.get_protocol(name, version, project_id)
+            return [protocol] if protocol else []
+
+        entries = await self._redis.hgetall(self._protocols_key(project_id))
+        protocols: list[ProtocolDefinition] = []
+
+        for field_name, raw in entries.items():
+            proto_name, _, proto_version = field_name.partition(":")
+            if name is not None and proto_name != name:
+                continue
+            if version is not None and proto_version != version:
+                continue
+            protocols.append(ProtocolDefinition.model_validate_json(raw))
+
+        return protocols
+
+    async def delete_protocol(self, name: str, version: str, project_id: str = "default") -> bool:
+        """Delete a protocol by name and version.
+
+        Args:
+            name: Protocol name
+            version: Protocol version
+            project_id: Project identifier (defaults to "default")
+
+        Returns:
+            True if deleted, False if not found
+        """
+        removed = await self._redis.hdel(
+            self._protocols_key(project_id), self._protocol_field(name, version)
+        )
+        if not removed:
+            return False
+
+        logger.info(
+            f"Deleted protocol: {name} v{version} from project {project_id}",
+            extra={
+                "context": {
+                    "project_id": project_id,
+                    "protocol_name": name,
+                    "version": version,
+                }
+            },
+        )
+        return True
+
+    async def get_session(self, session_id: UUID, project_id: str = "default") -> Session | None:
+        """Retrieve a session by ID.
+
+        Args:
+            session_id: Session UUID
+            project_id: Project identifier (defaults to "default")
+
+        Returns:
+            Session if found, None otherwise
+        """
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.hget(self._sessions_key(project_id), str(session_id))
+            pipe.llen(self._queue_key(project_id, session_id))
+            raw, queue_size = await pipe.execute()
+
+        if not raw:
+            return None
+
+        session = Session.model_validate_json(raw)
+        session.queue_size = queue_size
+        return session
+
+    async def save_session(self, session: Session, project_id: str = "default") -> None:
+        """Save or update a session.
+
+        Args:
+            session: Session to save
+            project_id: Project identifier (defaults to "default")
+        """
+        await self._redis.hset(
+            self._sessions_key(project_id),
+            str(session.session_id),
+            session.model_dump_json(exclude={"queue_size"}),
+        )
+
+        logger.debug(
+            f"Saved session: {session.session_id} in project {project_id}",
+            extra={
+                "context": {
+                    "project_id": project_id,
+                    "session_id": str(session.session_id),
+                    "status": session.status,
+                }
+            },
+        )
+
+    async def list_sessions(
+        self, status: str | None = None, project_id: str = "default"
+    ) -> list[Session]:
+        """List sessions with optional status filter.
+
+        Args:
+            status: Filter by session status (optional)
+            project_id: Project identifier (defaults to "default")
+
+        Returns:
+            List of matching sessions
+        """
+        entries = await self._redis.hgetall(self._sessions_key(project_id))
+
+        sessions = [Session.model_validate_json(raw) for raw in entries.values()]
+        if status:
+            sessions = [s for s in sessions if s.status == status]
+
+        if sessions:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for session in sessions:
+                    pipe.llen(self._queue_key(project_id, session.session_id))
+                sizes = await pipe.execute()
+            for session, size in zip(sessions, sizes, strict=True):
+                session.queue_size = size
+
+        return sessions
+
+    async def delete_session(self, session_id: UUID, project_id: str = "default") -> bool:
+        """Delete a session by ID.
+
+        Args:
+            session_id: Session UUID
+            project_id: Project identifier (defaults to "default")
+
+        Returns:
+            True if deleted, False if not found
+        """
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hdel(self._sessions_key(project_id), str(session_id))
+            pipe.delete(self._queue_key(project_id, session_id))
+            removed, _ = await pipe.execute()
+
+        if not removed:
+            return False
+
+        logger.info(
+            f"Deleted session: {session_id} from project {project_id}",
+            extra={
+                "context": {
+                    "project_id": project_id,
+                    "session_id": str(session_id),
+                }
+            },
+        )
+        return True
+
+    async def enqueue_message(
+        self, session_id: UUID, message: Message, project_id: str = "default"
+    ) -> None:
+        """Add a message to a session's queue.
+
+        The capacity check and the push run under WATCH/MULTI so that
+        concurrent workers cannot overfill the queue.
+
+        Args:
+            session_id: Session UUID
+            message: Message to enqueue
+            project_id: Project identifier (defaults to "default")
+
+        Raises:
+            ValueError: If queue is at capacity
+        """
+        queue_key = self._queue_key(project_id, session_id)
+        data = message.model_dump_json()
+
+        async with self._redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(queue_key)
+                    queue_size = await pipe.llen(queue_key)
+
+                    if queue_size >= self.queue_capacity:
+                        await pipe.unwatch()
+                        logger.warning(
+                            f"Queue full for session {session_id} in project {project_id}",
+                            extra={
+                                "context": {
+                                    "project_id": project_id,
+                                    "session_id": str(session_id),
+                                    "queue_size": queue_size,
+                                    "capacity": self.queue_capacity,
+                                }
+                            },
+                        )
+                        raise ValueError(
+                            f"Message queue full ({self.queue_capacity} messages) "
+                            f"for session {session_id} in project {project_id}"
+                        )
+
+                    pipe.multi()
+                    pipe.rpush(queue_key, data)
+                    (queue_size,) = await pipe.execute()
+                    break
+                except WatchError:
+                    # Another worker touched the queue; retry with a fresh length
+                    continue
+
+        logger.debug(
+            f"Enqueued message for session {session_id} in project {project_id}",
+            extra={
+                "context": {
+                    "project_id": project_id,
+                    "session_id": str(session_id),
+                    "queue_size": queue_size,
+                }
+            },
+        )
+
+    async def enqueue_messages(
+        self, items: list[tuple[UUID, Message]], project_id: str = "default"
+    ) -> list[bool]:
+        """Add several messages to session queues in one operation.
+
+        All target queues are watched, their lengths read in one pipeline and
+        the accepted pushes applied in a single MULTI/EXEC.
+
+        Args:
+            items: (session_id, message) pairs to enqueue, in order
+            project_id: Project identifier (defaults to "default")
+
+        Returns:
+            One flag per item: True if enqueued, False if the queue was full
+        """
+        if not items:
+            return []
+
+        queue_keys = [self._queue_key(project_id, session_id) for session_id, _ in items]
+        unique_keys = list(dict.fromkeys(queue_keys))
+        payloads = [message.model_dump_json() for _, message in items]
+
+        async with self._redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(*unique_keys)
+                    sizes = {key: int(await pipe.llen(key)) for key in unique_keys}
+
+                    accepted: list[bool] = []
+                    pipe.multi()
+                    for queue_key, data in zip(queue_keys, payloads, strict=True):
+                        if sizes[queue_key] >= self.queue_capacity:
+                            accepted.append(False)
+                            continue
+                        sizes[queue_key] += 1
+                        pipe.rpush(queue_key, data)
+                        accepted.append(True)
+
+                    await pipe.execute()
+                    break
+                except WatchError:
+                    # A watched queue changed; retry with fresh lengths
+                    continue
+
+        logger.debug(
+            f"Enqueued {accepted.count(True)} of {len(items)} messages in project {project_id}",
+            extra={
+                "context": {
+                    "project_id": project_id,
+                    "requested": len(items),
+                    "accepted": accepted.count(True),
+                }
+            },
+        )
+
+        return accepted
+
+    async def dequeue_messages(
+        self, session_id: UUID, limit: int = 10, project_id: str = "default"
+    ) -> list[Message]:
+        """Dequeue messages for a session.
+
+        Reading and trimming happen in one MULTI/EXEC transaction, so each
+        message is handed to exactly one consumer.
+
+        Args:
+            session_id: Session UUID
+            limit: Maximum number of messages to dequeue
+            project_id: Project identifier (defaults to "default")
+
+        Returns:
+            List of dequeued messages (oldest first)
+        """
+        if limit <= 0:
+            return []
+
+        queue_key = self._queue_key(project_id, session_id)
+
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.lrange(queue_key, 0, limit - 1)
+            pipe.ltrim(queue_key, limit, -1)
+            raw_messages, _ = await pipe.execute()
+
+        messages = [Message.model_validate_json(raw) for raw in raw_messages]
+
+        if messages:
+            logger.debug(
+                f"Dequeued {len(messages)} messages for session {session_id} in project {project_id}",
+                extra={
+                    "context": {
+                        "project_id": project_id,
+                        "session_id": str(session_id),
+                        "count": len(messages),
+                    }
+                },
+            )
+
+        return messages
+
+    async def get_queue_size(self, session_id: UUID, project_id: str = "default") -> int:
+        """Get the current queue size for a session.
+
+        Args:
+            session_id: Session UUID
+            project_id: Project identifier (defaults to "default")
+
+        Returns:
+            Current queue size
+        """
+        return int(await self._redis.llen(self._queue_key(project_id, session_id)))
+
+    async def clear_queue(self, session_id: UUID, project_id: str = "default") -> int:
+        """Clear all messages from a session's queue.
+
+        Args:
+            session_id: Session UUID
+            project_id: Project identifier (defaults to "default")
+
+        Returns:
+            Number of messages cleared
+        """
+        queue_key = self._queue_key(project_id, session_id)
+
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.llen(queue_key)
+            pipe.delete(queue_key)
+            count, _ = await pipe.execute()
+
+        if count:
+            logger.info(
+                f"Cleared {count} messages for session {session_id} in project {project_id}",
+                extra={
+                    "context": {
+                        "project_id": project_id,
+                        "session_id": str(session_id),
+                        "cleared": count,
+                    }
+                },
+            )
+        return int(count)
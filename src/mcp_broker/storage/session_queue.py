@@ -0,0 +1,195 @@
+"""
+Priority- and TTL-aware session queue for MCP Broker Server.
+
+This module provides the SessionQueue class used by InMemoryStorage.
+Each session queue keeps one FIFO lane per message priority and dequeues
+from the most urgent non-empty lane first. Messages whose TTL has elapsed
+are skipped on dequeue, and can be evicted ahead of time through their
+QueuedMessage handle without scanning the queue.
+"""
+
+from collections import deque
+from collections.abc import Iterator
+
+from mcp_broker.models.message import Message
+
+# Lane order: most urgent first
+PRIORITY_LEVELS: tuple[str, ...] = ("urgent", "high", "normal", "low")
+_LANE_INDEX = {priority: index for index, priority in enumerate(PRIORITY_LEVELS)}
+
+
+def message_priority(message: Message) -> str:
+    """Get a message's priority, defaulting to "normal".
+
+    Args:
+        message: Message to inspect
+
+    Returns:
+        Priority level name
+    """
+    return message.headers.priority if message.headers else "normal"
+
+
+def message_deadline(message: Message) -> float | None:
+    """Get the POSIX time after which a message is expired.
+
+    Args:
+        message: Message to inspect
+
+    Returns:
+        Expiry timestamp, or None if the message has no TTL
+    """
+    if message.headers and message.headers.ttl:
+        return message.timestamp.timestamp() + message.headers.ttl
+    return None
+
+
+class QueuedMessage:
+    """A message held in a SessionQueue.
+
+    Attributes:
+        message: The queued message
+        deadline: Expiry timestamp, or None if the message never expires
+        lsn: Write-ahead log sequence number (0 when not logged)
+        alive: False once the message has been evicted
+    """
+
+    __slots__ = ("message", "deadline", "lsn", "alive")
+
+    def __init__(self, message: Message, lsn: int = 0) -> None:
+        """Wrap a message for queueing.
+
+        Args:
+            message: The queued message
+            lsn: Write-ahead log sequence number
+        """
+        self.message = message
+        self.deadline = message_deadline(message)
+        self.lsn = lsn
+        self.alive = True
+
+    def is_expired(self, now: float) -> bool:
+        """Check whether the message's TTL has elapsed at time now.
+
+        Args:
+            now: Current POSIX timestamp
+
+        Returns:
+            True if the message is expired
+        """
+        return self.deadline is not None and now > self.deadline
+
+
+class SessionQueue:
+    """
+    Multi-level priority queue of messages for one session.
+
+    Evicted entries are tombstoned rather than removed, so len() reflects
+    only live messages and capacity is reclaimed immediately. Tombstones
+    are discarded when they reach the front of their lane, or in bulk once
+    they outnumber live entries.
+    """
+
+    __slots__ = ("_lanes", "_live", "_dead")
+
+    def __init__(self) -> None:
+        """Initialize an empty queue."""
+        self._lanes: tuple[deque[QueuedMessage], ...] = tuple(deque() for _ in PRIORITY_LEVELS)
+        self._live = 0
+        self._dead = 0
+
+    def __len__(self) -> int:
+        return self._live
+
+    def __iter__(self) -> Iterator[QueuedMessage]:
+        """Iterate live entries in dequeue order."""
+        for lane in self._lanes:
+            for entry in lane:
+                if entry.alive:
+                    yield entry
+
+    def append(self, entry: QueuedMessage) -> None:
+        """Add an entry to the back of its priority lane.
+
+        Args:
+            entry: Entry to enqueue
+        """
+        self._lanes[_LANE_INDEX.get(message_priority(entry.message), 2)].append(entry)
+        self._live += 1
+
+    def pop(self, limit: int, now: float) -> tuple[list[QueuedMessage], list[QueuedMessage]]:
+        """Remove up to limit unexpired entries, most urgent first.
+
+        Expired entries met along the way are removed as well.
+
+        Args:
+            limit: Maximum number of entries to return
+            now: Current POSIX timestamp
+
+        Returns:
+            Tuple of (dequeued entries, expired entries removed)
+        """
+        taken: list[QueuedMessage] = []
+        expired: list[QueuedMessage] = []
+
+        for lane in self._lanes:
+            while lane and len(taken) < limit:
+                entry = lane.popleft()
+                if not entry.alive:
+                    self._dead -= 1
+                    continue
+                entry.alive = False
+                self._live -= 1
+                if entry.is_expired(now):
+                    expired.append(entry)
+                else:
+                    taken.append(entry)
+            if len(taken) >= limit:
+                break
+
+        return taken, expired
+
+    def evict(self, entry: QueuedMessage) -> bool:
+        """Tombstone an entry in place.
+
+        Args:
+            entry: Entry previously appended to this queue
+
+        Returns:
+            True if the entry was live
+        """
+        if not entry.alive:
+            return False
+
+        entry.alive = False
+        self._live -= 1
+        self._dead += 1
+
+        # Drop tombstones at lane fronts, and rebuild when they dominate
+        for lane in self._lanes:
+            while lane and not lane[0].alive:
+                lane.popleft()
+                self._dead -= 1
+        if self._dead > self._live + 16:
+            for lane in self._lanes:
+                kept = [e for e in lane if e.alive]
+                lane.clear()
+                lane.extend(kept)
+            self._dead = 0
+
+        return True
+
+    def drain(self) -> list[QueuedMessage]:
+        """Remove and return every live entry.
+
+        Returns:
+            Live entries in dequeue order
+        """
+        entries = list(self)
+        for entry in entries:
+            entry.alive = False
+        for lane in self._lanes:
+            lane.clear()
+        self._live = 0
+        self._dead = 0
+        return entries
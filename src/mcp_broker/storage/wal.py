@@ -0,0 +1,371 @@
+"""
+Write-ahead log for in-memory message queues.
+
+This module provides the MessageQueueWAL class that makes
+InMemoryStorage message queues durable. Queue mutations are appended as
+compact JSON records to numbered segment files; the queues themselves
+stay in memory and all reads are served from there.
+
+Records (one JSON object per line):
+- {"o": "e", "n": lsn, "p": project_id, "s": session_id, "m": message} -> enqueue
+- {"o": "d", "p": project_id, "s": session_id, "l": [lsn, ...]} -> dequeue or expiry
+- {"o": "c", "p": project_id, "s": session_id, "u": lsn} -> clear through lsn
+
+Removals name lsns explicitly because priority queues do not dequeue in
+enqueue order.
+
+Appends are group-committed: records logged within one commit window are
+written and fsynced together, and every caller in the window is released
+once the batch is durable. Segments are deleted oldest first once every
+message they enqueued has been dequeued or cleared.
+"""
+
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import IO, Any
+from uuid import UUID
+
+from mcp_broker.core.logging import get_logger
+from mcp_broker.models.message import Message
+
+logger = get_logger(__name__)
+
+SEGMENT_PREFIX = "wal-"
+SEGMENT_SUFFIX = ".log"
+
+QueueKey = tuple[str, UUID]
+
+
+class MessageQueueWAL:
+    """
+    Segmented, group-committed write-ahead log for message queues.
+
+    The log mirrors queue operations exactly, so it tracks for every queued
+    message the sequence number (lsn) and segment that enqueued it. That is
+    what allows fully-dequeued segments to be dropped safely.
+
+    Attributes:
+        directory: Directory holding segment files
+        segment_max_bytes: Size at which a new segment is started
+        commit_interval: Seconds to gather records before a group commit
+        fsync: Whether commits are fsynced to stable storage
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        segment_max_bytes: int = 4 * 1024 * 1024,
+        commit_interval: float = 0.002,
+        fsync: bool = True,
+    ) -> None:
+        """Initialize the write-ahead log.
+
+        Call recover() before logging new records.
+
+        Args:
+            directory: Directory holding segment files (created if missing)
+            segment_max_bytes: Size at which a new segment is started
+            commit_interval: Seconds to gather records before a group commit
+            fsync: Whether commits are fsynced to stable storage
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes
+        self.commit_interval = commit_interval
+        self.fsync = fsync
+
+        self._next_lsn = 1
+        self._active_segment = 1
+        self._active_bytes = 0
+        self._segments: dict[int, int] = {}  # segment -> live (undequeued) messages
+        self._positions: dict[QueueKey, dict[int, int]] = {}  # lsn -> segment
+
+        self._pending: list[tuple[int, str]] = []  # (segment, line)
+        self._pending_commit: asyncio.Future[None] | None = None
+        self._write_lock = asyncio.Lock()
+        self._commit_tasks: set[asyncio.Future[None]] = set()
+        self._handle: IO[str] | None = None
+        self._handle_segment = 0
+
+    def recover(self) -> dict[QueueKey, list[tuple[int, Message]]]:
+        """Rebuild queue contents from the segment files.
+
+        A truncated final record (from a crash mid-write) is ignored.
+
+        Returns:
+            Dict of (project_id, session_id) -> (lsn, message) pairs in enqueue order
+        """
+        queues: dict[QueueKey, dict[int, Message]] = {}
+
+        for segment, path in self._segment_files():
+            self._segments.setdefault(segment, 0)
+            with path.open(encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(
+                            f"Ignoring truncated WAL record in {path.name}",
+                            extra={"context": {"segment": segment}},
+                        )
+                        break
+                    self._apply(record, segment, queues)
+            self._active_segment = segment
+            self._active_bytes = path.stat().st_size
+
+        # Start a fresh segment so recovered files are never appended to
+        if self._segments:
+            self._active_segment += 1
+            self._active_bytes = 0
+        self._segments.setdefault(self._active_segment, 0)
+
+        recovered = {key: list(queue.items()) for key, queue in queues.items() if queue}
+        self.compact()
+
+        logger.info(
+            f"Recovered {sum(len(q) for q in recovered.values())} queued messages from WAL",
+            extra={
+                "context": {
+                    "directory": str(self.directory),
+                    "queues": len(recovered),
+                    "segments": len(self._segments),
+                }
+            },
+        )
+        return recovered
+
+    def log_enqueue(
+        self, project_id: str, session_id: UUID, message: Message
+    ) -> tuple[int, "asyncio.Future[None]"]:
+        """Log a message appended to a queue.
+
+        Args:
+            project_id: Project identifier
+            session_id: Session UUID
+            message: Message that was enqueued
+
+        Returns:
+            Tuple of (lsn identifying the message, future completing when durable)
+        """
+        lsn = self._next_lsn
+        self._next_lsn += 1
+        line = json.dumps(
+            {
+                "o": "e",
+                "n": lsn,
+                "p": project_id,
+                "s": str(session_id),
+                "m": message.model_dump(mode="json"),
+            },
+            separators=(",", ":"),
+        )
+        segment = self._assign_segment(line)
+        self._positions.setdefault((project_id, session_id), {})[lsn] = segment
+        self._segments[segment] = self._segments.get(segment, 0) + 1
+        return lsn, self._append(segment, line)
+
+    def log_dequeue(
+        self, project_id: str, session_id: UUID, lsns: list[int]
+    ) -> "asyncio.Future[None]":
+        """Log messages removed from a queue by dequeue or expiry.
+
+        Args:
+            project_id: Project identifier
+            session_id: Session UUID
+            lsns: Sequence numbers of the removed messages
+
+        Returns:
+            Future that completes when the record is durable
+        """
+        key = (project_id, session_id)
+        positions = self._positions.get(key, {})
+        removed = [lsn for lsn in lsns if lsn in positions]
+        if not removed:
+            return self._completed()
+
+        for lsn in removed:
+            self._segments[positions.pop(lsn)] -= 1
+        if not positions:
+            self._positions.pop(key, None)
+
+        line = json.dumps(
+            {"o": "d", "p": project_id, "s": str(session_id), "l": removed},
+            separators=(",", ":"),
+        )
+        return self._append(self._assign_segment(line), line)
+
+    def log_clear(self, project_id: str, session_id: UUID) -> "asyncio.Future[None]":
+        """Log a queue being emptied.
+
+        Args:
+            project_id: Project identifier
+            session_id: Session UUID
+
+        Returns:
+            Future that completes when the record is durable
+        """
+        positions = self._positions.pop((project_id, session_id), None)
+        if not positions:
+            return self._completed()
+
+        for enqueued_in in positions.values():
+            self._segments[enqueued_in] -= 1
+
+        line = json.dumps(
+            {"o": "c", "p": project_id, "s": str(session_id), "u": max(positions)},
+            separators=(",", ":"),
+        )
+        return self._append(self._assign_segment(line), line)
+
+    def compact(self) -> int:
+        """Delete the oldest segments whose messages have all been dequeued.
+
+        Only a prefix of the log is removed, so dequeue records never outlive
+        the enqueue records they refer to. The active segment is kept.
+
+        Returns:
+            Number of segments deleted
+        """
+        removed = 0
+        for segment in sorted(self._segments):
+            if segment >= self._active_segment or self._segments[segment]:
+                break
+            if any(pending_segment == segment for pending_segment, _ in self._pending):
+                break
+            if self._handle is not None and self._handle_segment == segment:
+                self._handle.close()
+                self._handle = None
+            self._segment_path(segment).unlink(missing_ok=True)
+            del self._segments[segment]
+            removed += 1
+
+        if removed:
+            logger.debug(
+                f"Compacted {removed} WAL segments",
+                extra={"context": {"segments": len(self._segments)}},
+            )
+        return removed
+
+    async def flush(self) -> None:
+        """Commit all pending records and wait for any commit in progress."""
+        await self._commit()
+
+    async def close(self) -> None:
+        """Commit pending records and close the active segment."""
+        await self.flush()
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _segment_path(self, segment: int) -> Path:
+        """Get the file path of a segment."""
+        return self.directory / f"{SEGMENT_PREFIX}{segment:08d}{SEGMENT_SUFFIX}"
+
+    def _segment_files(self) -> list[tuple[int, Path]]:
+        """List existing segment files in log order."""
+        segments = []
+        for path in self.directory.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"):
+            number = path.name[len(SEGMENT_PREFIX) : -len(SEGMENT_SUFFIX)]
+            if number.isdigit():
+                segments.append((int(number), path))
+        return sorted(segments)
+
+    def _apply(
+        self,
+        record: dict[str, Any],
+        segment: int,
+        queues: dict[QueueKey, dict[int, Message]],
+    ) -> None:
+        """Replay one record into the recovered queues and live counts."""
+        key = (record["p"], UUID(record["s"]))
+
+        if record["o"] == "e":
+            lsn = record["n"]
+            queues.setdefault(key, {})[lsn] = Message.model_validate(record["m"])
+            self._positions.setdefault(key, {})[lsn] = segment
+            self._segments[segment] += 1
+            self._next_lsn = max(self._next_lsn, lsn + 1)
+            return
+
+        queue = queues.get(key, {})
+        positions = self._positions.get(key, {})
+        if record["o"] == "d":
+            removed = [lsn for lsn in record["l"] if lsn in positions]
+        else:
+            removed = [lsn for lsn in positions if lsn <= record["u"]]
+
+        for lsn in removed:
+            queue.pop(lsn, None)
+            self._segments[positions.pop(lsn)] -= 1
+        if not positions:
+            self._positions.pop(key, None)
+
+    def _assign_segment(self, line: str) -> int:
+        """Pick the segment for a record, rotating when the active one is full."""
+        size = len(line.encode("utf-8")) + 1
+        if self._active_bytes and self._active_bytes + size > self.segment_max_bytes:
+            self._active_segment += 1
+            self._active_bytes = 0
+            self._segments[self._active_segment] = 0
+        self._active_bytes += size
+        return self._active_segment
+
+    def _append(self, segment: int, line: str) -> "asyncio.Future[None]":
+        """Queue a record for the next group commit."""
+        self._pending.append((segment, line))
+        if self._pending_commit is None:
+            self._pending_commit = asyncio.get_running_loop().create_future()
+            asyncio.get_running_loop().call_later(self.commit_interval, self._schedule_commit)
+        return self._pending_commit
+
+    def _schedule_commit(self) -> None:
+        """Start a commit task at the end of the commit window."""
+        task = asyncio.ensure_future(self._commit())
+        self._commit_tasks.add(task)
+        task.add_done_callback(self._commit_tasks.discard)
+
+    def _completed(self) -> "asyncio.Future[None]":
+        """Get an already-completed future for operations that log nothing."""
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        future.set_result(None)
+        return future
+
+    async def _commit(self) -> None:
+        """Write and fsync the pending batch, then release its waiters."""
+        async with self._write_lock:
+            batch, waiter = self._pending, self._pending_commit
+            self._pending, self._pending_commit = [], None
+            if not batch or waiter is None:
+                return
+
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            except OSError as e:
+                logger.error(f"WAL commit failed: {e}")
+                waiter.set_exception(e)
+                return
+
+            waiter.set_result(None)
+            self.compact()
+
+    def _write_batch(self, batch: list[tuple[int, str]]) -> None:
+        """Append a batch of records to their segments (runs in a worker thread)."""
+        for segment, line in batch:
+            if self._handle is None or self._handle_segment != segment:
+                self._sync_handle()
+                if self._handle is not None:
+                    self._handle.close()
+                self._handle = self._segment_path(segment).open("a", encoding="utf-8")
+                self._handle_segment = segment
+            self._handle.write(line + "\n")
+        self._sync_handle()
+
+    def _sync_handle(self) -> None:
+        """Flush the open segment and fsync it when configured."""
+        if self._handle is None:
+            return
+        self._handle.flush()
+        if self.fsync:
+            os.fsync(self._handle.fileno())
@@ -0,0 +1 @@
+"""Benchmarks for MCP Broker Server hot paths (run as modules, not collected by pytest)."""
@@ -0,0 +1,262 @@
+"""
+Benchmark: broker hot paths at 100 / 1k / 10k sessions.
+
+Scenarios, each run against InMemoryStorage with size sessions:
+- send_message: MessageRouter.send_message between neighbouring sessions
+- broadcast_message: MessageRouter.broadcast_message to every session
+- enqueue_message: SessionManager.enqueue_message round-robin
+- dequeue_messages: SessionManager.dequeue_messages, one message each
+- negotiate: CapabilityNegotiator.negotiate between neighbouring sessions
+- compatibility_matrix: CapabilityNegotiator.compute_compatibility_matrix
+  over every session
+- discover: ProtocolRegistry.discover by name and version range, with
+  size registered protocols instead of sessions
+
+Sessions cycle through a few capability sets so negotiation and the
+matrix see more than one capability class. Scenarios whose cost grows
+with size (broadcast, matrix) run fewer operations at larger sizes.
+
+Each result reports throughput, p50/p95/p99/max latency in microseconds
+and peak traced memory in KiB. With --compare, results are checked
+against a baseline written earlier with --output, and the exit status is
+1 if any throughput, p95 latency or peak memory figure regressed beyond
+--threshold.
+
+Usage:
+    python -m tests.benchmarks.bench_broker [--sizes 100,1000,10000]
+        [--iterations N] [--scenarios a,b] [--output FILE]
+        [--compare BASELINE] [--threshold 0.2]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+from mcp_broker.core.logging import setup_logging
+from mcp_broker.models.message import Message
+from mcp_broker.models.protocol import ProtocolDefinition, ProtocolMetadata
+from mcp_broker.models.session import Session, SessionCapabilities
+from mcp_broker.negotiation.negotiator import CapabilityNegotiator
+from mcp_broker.protocol.registry import ProtocolRegistry
+from mcp_broker.routing.router import MessageRouter
+from mcp_broker.session.manager import SessionManager
+from mcp_broker.storage.memory import InMemoryStorage
+from tests.benchmarks.harness import Operation, Setup, compare, measure
+
+CAPABILITY_SETS = [
+    SessionCapabilities(
+        supported_protocols={"chat": ["1.0.0"]},
+        supported_features=["point_to_point", "broadcast"],
+    ),
+    SessionCapabilities(
+        supported_protocols={"chat": ["1.0.0", "1.1.0"], "files": ["2.0.0"]},
+        supported_features=["point_to_point", "broadcast", "compression"],
+    ),
+    SessionCapabilities(
+        supported_protocols={"chat": ["1.0.0"], "files": ["1.0.0", "2.0.0"]},
+        supported_features=["point_to_point", "broadcast", "encryption"],
+    ),
+]
+
+# Recipient visits per size for scenarios that touch every session per operation
+FANOUT_BUDGET = 100_000
+
+
+async def create_sessions(
+    size: int, queue_capacity: int
+) -> tuple[InMemoryStorage, SessionManager, list[Session]]:
+    """Create storage, a session manager and size sessions."""
+    storage = InMemoryStorage(queue_capacity=queue_capacity)
+    manager = SessionManager(storage, queue_capacity=queue_capacity)
+    sessions = [
+        await manager.create_session(CAPABILITY_SETS[index % len(CAPABILITY_SETS)])
+        for index in range(size)
+    ]
+    return storage, manager, sessions
+
+
+def chat_message(sender: Session, text: str) -> Message:
+    """Create a chat message from a session."""
+    return Message(
+        sender_id=sender.session_id,
+        protocol_name="chat",
+        protocol_version="1.0.0",
+        payload={"text": text},
+    )
+
+
+async def setup_send_message(size: int, iterations: int) -> Operation:
+    storage, manager, sessions = await create_sessions(size, queue_capacity=iterations + 1)
+    router = MessageRouter(manager, storage)
+    messages = [chat_message(sessions[i % size], f"message {i}") for i in range(iterations)]
+
+    async def operation(index: int) -> None:
+        sender = sessions[index % size]
+        recipient = sessions[(index + 1) % size]
+        result = await router.send_message(sender.session_id, recipient.session_id, messages[index])
+        assert result.success, result.error_reason
+
+    return operation
+
+
+async def setup_broadcast_message(size: int, iterations: int) -> Operation:
+    storage, manager, sessions = await create_sessions(size, queue_capacity=iterations + 1)
+    router = MessageRouter(manager, storage)
+    sender = sessions[0]
+
+    async def operation(index: int) -> None:
+        result = await router.broadcast_message(
+            sender.session_id, chat_message(sender, f"broadcast {index}")
+        )
+        assert result.success, result.reason
+
+    return operation
+
+
+async def setup_enqueue_message(size: int, iterations: int) -> Operation:
+    _, manager, sessions = await create_sessions(size, queue_capacity=iterations + 1)
+    messages = [chat_message(sessions[0], f"message {i}") for i in range(iterations)]
+
+    async def operation(index: int) -> None:
+        result = await manager.enqueue_message(sessions[index % size].session_id, messages[index])
+        assert result.success, result.error_reason
+
+    return operation
+
+
+async def setup_dequeue_messages(size: int, iterations: int) -> Operation:
+    _, manager, sessions = await create_sessions(size, queue_capacity=iterations + 1)
+    for index in range(iterations):
+        await manager.enqueue_message(
+            sessions[index % size].session_id, chat_message(sessions[0], f"message {index}")
+        )
+
+    async def operation(index: int) -> None:
+        messages = await manager.dequeue_messages(sessions[index % size].session_id, limit=1)
+        assert len(messages) == 1
+
+    return operation
+
+
+async def setup_negotiate(size: int, _iterations: int) -> Operation:
+    _, _, sessions = await create_sessions(size, queue_capacity=1)
+    negotiator = CapabilityNegotiator()
+
+    async def operation(index: int) -> None:
+        await negotiator.negotiate(sessions[index % size], sessions[(index + 1) % size])
+
+    return operation
+
+
+async def setup_compatibility_matrix(size: int, _iterations: int) -> Operation:
+    _, _, sessions = await create_sessions(size, queue_capacity=1)
+    negotiator = CapabilityNegotiator()
+
+    async def operation(_index: int) -> None:
+        negotiator.compute_compatibility_matrix(sessions)
+
+    return operation
+
+
+async def setup_discover(size: int, _iterations: int) -> Operation:
+    registry = ProtocolRegistry(InMemoryStorage())
+    for index in range(size):
+        await registry.register(
+            ProtocolDefinition(
+                name=f"protocol_{index}",
+                version=f"1.{index % 5}.0",
+                message_schema={"type": "object"},
+                capabilities=["point_to_point"],
+                metadata=ProtocolMetadata(tags=[f"tag_{index % 10}"]),
+            )
+        )
+
+    async def operation(index: int) -> None:
+        found = await registry.discover(name=f"protocol_{index % size}", version="^1.0")
+        assert len(found) == 1
+
+    return operation
+
+
+# name -> (setup, whether each operation touches every session)
+SCENARIOS: dict[str, tuple[Setup, bool]] = {
+    "send_message": (setup_send_message, False),
+    "broadcast_message": (setup_broadcast_message, True),
+    "enqueue_message": (setup_enqueue_message, False),
+    "dequeue_messages": (setup_dequeue_messages, False),
+    "negotiate": (setup_negotiate, False),
+    "compatibility_matrix": (setup_compatibility_matrix, True),
+    "discover": (setup_discover, False),
+}
+
+
+async def run_benchmark(
+    scenarios: list[str], sizes: list[int], iterations: int
+) -> list[dict[str, Any]]:
+    """Run each scenario at each size and return the results."""
+    results = []
+    for name in scenarios:
+        setup, fans_out = SCENARIOS[name]
+        for size in sizes:
+            count = max(3, min(iterations, FANOUT_BUDGET // size)) if fans_out else iterations
+            results.append(
+                await measure(name, size, setup, count, memory_iterations=min(count, 100))
+            )
+    return results
+
+
+def parse_list(value: str) -> list[str]:
+    """Split a comma-separated argument."""
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def main() -> None:
+    """Parse arguments, run the suite, print JSON and apply the regression gate."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="100,1000,10000", help="Session counts")
+    parser.add_argument("--iterations", type=int, default=2000, help="Operations per run")
+    parser.add_argument(
+        "--scenarios", default=",".join(SCENARIOS), help="Scenarios to run (default: all)"
+    )
+    parser.add_argument("--output", type=Path, help="Write results to this file")
+    parser.add_argument("--compare", type=Path, help="Baseline results to check against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="Allowed relative regression (default 0.2)"
+    )
+    args = parser.parse_args()
+
+    scenarios = parse_list(args.scenarios)
+    unknown = sorted(set(scenarios) - set(SCENARIOS))
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+
+    # Keep capacity warnings and the like out of the timings and the output
+    setup_logging(level="ERROR")
+    results = asyncio.run(
+        run_benchmark(scenarios, [int(size) for size in parse_list(args.sizes)], args.iterations)
+    )
+    report: dict[str, Any] = {"benchmark": "broker", "results": results}
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+
+    regressions = []
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        regressions = compare(baseline, results, args.threshold)
+        report["comparison"] = {
+            "baseline": str(args.compare),
+            "threshold": args.threshold,
+            "regressions": regressions,
+        }
+
+    print(json.dumps(report, indent=2))
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark: message routing throughput with logging off and on.
+
+Routes point-to-point messages through MessageRouter.send_message (with
+a heartbeat per message) under each logging mode:
+- off: level WARNING, so hot-path records are never built
+- sync: level DEBUG, JSON formatted and written on the event loop
+- queue: level DEBUG, formatted and written by a background listener
+- queue_sampled: as queue, keeping 1% of DEBUG records from mcp_broker
+
+Log output goes to a temporary file and /dev/null. For queue modes,
+drain_seconds is the time the listener needed afterwards to write out
+what was still queued.
+
+Usage:
+    python -m tests.benchmarks.bench_logging [--messages N]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from mcp_broker.core.logging import setup_logging, shutdown_logging
+from mcp_broker.models.message import Message
+from mcp_broker.models.session import SessionCapabilities
+from mcp_broker.routing.router import MessageRouter
+from mcp_broker.session.manager import SessionManager
+from mcp_broker.storage.memory import InMemoryStorage
+
+MODES: dict[str, dict[str, Any]] = {
+    "off": {"level": "WARNING"},
+    "sync": {"level": "DEBUG"},
+    "queue": {"level": "DEBUG", "use_queue": True, "max_queue_size": 1_000_000},
+    "queue_sampled": {
+        "level": "DEBUG",
+        "use_queue": True,
+        "max_queue_size": 1_000_000,
+        "sample_rates": {"mcp_broker": 0.01},
+    },
+}
+
+
+async def route_messages(count: int) -> float:
+    """Route count messages between two sessions and return elapsed seconds."""
+    # Ample queue room so capacity warnings do not skew the comparison
+    storage = InMemoryStorage(queue_capacity=count * 2)
+    manager = SessionManager(storage, queue_capacity=count * 2)
+    router = MessageRouter(manager, storage)
+    caps = SessionCapabilities(
+        supported_protocols={"chat": ["1.0.0"]}, supported_features=["point_to_point"]
+    )
+    sender = await manager.create_session(caps)
+    recipient = await manager.create_session(caps)
+    messages = [
+        Message(
+            sender_id=sender.session_id,
+            recipient_id=recipient.session_id,
+            protocol_name="chat",
+            protocol_version="1.0.0",
+            payload={"text": f"message {i}"},
+        )
+        for i in range(count)
+    ]
+
+    started = time.perf_counter()
+    for message in messages:
+        await manager.update_heartbeat(sender.session_id)
+        result = await router.send_message(sender.session_id, recipient.session_id, message)
+        assert result.success, result.error_reason
+    return time.perf_counter() - started
+
+
+def run_mode(name: str, count: int, log_file: Path) -> dict[str, float | str]:
+    """Configure logging for one mode and measure routing throughput."""
+    stdout = sys.stdout
+    with open(os.devnull, "w") as devnull:
+        # The console handler binds sys.stdout when created; keep it off the results
+        sys.stdout = devnull
+        try:
+            setup_logging(format_type="json", log_file=log_file, **MODES[name])
+        finally:
+            sys.stdout = stdout
+
+        elapsed = asyncio.run(route_messages(count))
+        drain_started = time.perf_counter()
+        shutdown_logging()
+        drain = time.perf_counter() - drain_started
+        setup_logging(level="WARNING", format_type="json", log_file=log_file)
+
+    return {
+        "mode": name,
+        "messages": count,
+        "seconds": elapsed,
+        "per_second": count / elapsed,
+        "drain_seconds": drain,
+    }
+
+
+def main() -> None:
+    """Parse arguments, run every mode and print JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=5000, help="Messages to route")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = [run_mode(name, args.messages, Path(tmp) / f"{name}.log") for name in MODES]
+
+    baseline = results[0]["per_second"]
+    for result in results:
+        result["relative_to_off"] = result["per_second"] / baseline  # type: ignore[operator]
+    print(json.dumps({"benchmark": "logging", "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
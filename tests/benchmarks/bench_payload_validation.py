@@ -0,0 +1,123 @@
+"""
+Benchmark: payload validation with and without the compiled-validator cache.
+
+Compares, for the same schema and payloads:
+- uncached: jsonschema.validate() per message (checks the schema and
+  builds a validator every time)
+- compiled: a validator compiled per message without the schema check
+- cached: ProtocolRegistry.validate_payload, which compiles once per
+  (project, name, version)
+
+Usage:
+    python -m tests.benchmarks.bench_payload_validation [--messages N]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections.abc import Callable
+from uuid import uuid4
+
+import jsonschema
+
+from mcp_broker.models.message import Message
+from mcp_broker.models.protocol import ProtocolDefinition
+from mcp_broker.protocol.registry import ProtocolRegistry
+from mcp_broker.protocol.validation import compile_schema
+from mcp_broker.storage.memory import InMemoryStorage
+
+SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "properties": {
+        "text": {"type": "string", "maxLength": 2000},
+        "priority": {"enum": ["low", "normal", "high"]},
+        "mentions": {"type": "array", "items": {"type": "string"}, "maxItems": 50},
+        "attachments": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "size": {"type": "integer", "minimum": 0},
+                },
+                "required": ["name", "size"],
+            },
+        },
+    },
+    "required": ["text"],
+    "additionalProperties": False,
+}
+
+
+def make_messages(count: int) -> list[Message]:
+    """Create chat messages with varied, valid payloads."""
+    sender = uuid4()
+    return [
+        Message(
+            sender_id=sender,
+            protocol_name="chat",
+            protocol_version="1.0.0",
+            payload={
+                "text": f"message {i}",
+                "priority": ("low", "normal", "high")[i % 3],
+                "mentions": [f"agent-{j}" for j in range(i % 5)],
+                "attachments": [{"name": f"file-{i}.txt", "size": i}],
+            },
+        )
+        for i in range(count)
+    ]
+
+
+def measure(label: str, count: int, run: Callable[[], None]) -> dict[str, float | str]:
+    """Time a synchronous run over count messages."""
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+    return {"mode": label, "messages": count, "seconds": elapsed, "per_second": count / elapsed}
+
+
+async def run_benchmark(count: int) -> list[dict[str, float | str]]:
+    """Run all three modes and return their results."""
+    messages = make_messages(count)
+    registry = ProtocolRegistry(InMemoryStorage())
+    await registry.register(ProtocolDefinition(name="chat", version="1.0.0", message_schema=SCHEMA))
+
+    def uncached() -> None:
+        for message in messages:
+            jsonschema.validate(message.payload, SCHEMA)
+
+    def compiled() -> None:
+        for message in messages:
+            compile_schema(SCHEMA).validate(message.payload)
+
+    results = [measure("uncached", count, uncached), measure("compiled", count, compiled)]
+
+    started = time.perf_counter()
+    for message in messages:
+        error = await registry.validate_payload(message)
+        assert error is None, error
+    elapsed = time.perf_counter() - started
+    results.append(
+        {"mode": "cached", "messages": count, "seconds": elapsed, "per_second": count / elapsed}
+    )
+
+    baseline = results[0]["per_second"]
+    for result in results:
+        result["speedup"] = result["per_second"] / baseline  # type: ignore[operator]
+    return results
+
+
+def main() -> None:
+    """Parse arguments, run the benchmark and print JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=5000, help="Messages to validate")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_benchmark(args.messages))
+    print(json.dumps({"benchmark": "payload_validation", "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Benchmark: WebSocket room broadcast cost against room size.
+
+Scenarios, each broadcasting a meeting event to every socket in a room:
+- per_recipient_json: the previous fan-out, awaiting send_json (and so
+  json.dumps) once per socket
+- encode_once: ConnectionManager.broadcast_to_meeting, which encodes the
+  event once and queues the frame per socket; each operation waits
+  until every socket has been written to
+
+Sockets discard what they are sent, but send_json serializes exactly as
+Starlette does, so the difference is serialization and fan-out overhead
+rather than network I/O. The encoder used by encode_once (orjson or
+json) is reported with the results.
+
+Usage:
+    python -m tests.benchmarks.bench_ws_broadcast [--sizes 10,50,200,1000]
+        [--iterations N] [--output FILE]
+"""
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from communication_server.websocket import outbound
+from communication_server.websocket.manager import ConnectionManager
+from tests.benchmarks.harness import Operation, Setup, measure
+
+# Recipient visits per size, so large rooms run fewer broadcasts
+FANOUT_BUDGET = 200_000
+
+# Managers built by setup, disconnected at the end so writer tasks finish
+_rooms: list[tuple[ConnectionManager, list["NullWebSocket"]]] = []
+
+
+def meeting_event(index: int) -> dict[str, Any]:
+    """Create an opinion event of typical size."""
+    return {
+        "type": "opinion_presented",
+        "meeting_id": str(uuid4()),
+        "timestamp": "2026-01-01T00:00:00",
+        "agent_id": f"agent-{index % 7}",
+        "data": {
+            "opinion": "We should shard session queues by project. " * 4,
+            "round_number": index % 5,
+            "votes": {f"agent-{n}": "yes" for n in range(5)},
+        },
+    }
+
+
+class NullWebSocket:
+    """WebSocket stand-in that counts frames and discards them."""
+
+    def __init__(self) -> None:
+        self.frames = 0
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_json(self, data: Any) -> None:
+        # Same serialization as starlette.websockets.WebSocket.send_json
+        json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        self.frames += 1
+
+    async def send_text(self, _data: str) -> None:
+        self.frames += 1
+
+
+async def setup_per_recipient_json(size: int, _iterations: int) -> Operation:
+    sockets = [NullWebSocket() for _ in range(size)]
+
+    async def operation(index: int) -> None:
+        message = meeting_event(index)
+        for websocket in sockets:
+            await websocket.send_json(message)
+
+    return operation
+
+
+async def setup_encode_once(size: int, _iterations: int) -> Operation:
+    manager = ConnectionManager(max_queue=16)
+    meeting_id = uuid4()
+    sockets = [NullWebSocket() for _ in range(size)]
+    for websocket in sockets:
+        await manager.connect(websocket, meeting_id)  # type: ignore[arg-type]
+    _rooms.append((manager, sockets))
+    sent = 0
+
+    async def operation(index: int) -> None:
+        nonlocal sent
+        await manager.broadcast_to_meeting(meeting_id, meeting_event(index))
+        sent += 1
+        while sockets[-1].frames < sent or manager.get_queue_stats(meeting_id)["queued"]:
+            await asyncio.sleep(0)
+
+    return operation
+
+
+SCENARIOS: dict[str, Setup] = {
+    "per_recipient_json": setup_per_recipient_json,
+    "encode_once": setup_encode_once,
+}
+
+
+async def run_benchmark(sizes: list[int], iterations: int) -> list[dict[str, Any]]:
+    """Run each scenario at each room size and return the results."""
+    results = []
+    for size in sizes:
+        count = max(3, min(iterations, FANOUT_BUDGET // size))
+        for name, setup in SCENARIOS.items():
+            results.append(
+                await measure(name, size, setup, count, memory_iterations=min(count, 50))
+            )
+            for manager, sockets in _rooms:
+                for websocket in sockets:
+                    manager.disconnect(websocket)  # type: ignore[arg-type]
+            _rooms.clear()
+            await asyncio.sleep(0)
+    return results
+
+
+def main() -> None:
+    """Parse arguments, run both scenarios and print JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="10,50,200,1000", help="Room sizes")
+    parser.add_argument("--iterations", type=int, default=2000, help="Broadcasts per run")
+    parser.add_argument("--output", type=Path, help="Write results to this file")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    results = asyncio.run(run_benchmark(sizes, args.iterations))
+
+    legacy = {r["size"]: r["per_second"] for r in results if r["scenario"] == "per_recipient_json"}
+    for result in results:
+        result["speedup"] = result["per_second"] / legacy[result["size"]]
+
+    report = {
+        "benchmark": "ws_broadcast",
+        "encoder": "orjson" if outbound.orjson is not None else "json",
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
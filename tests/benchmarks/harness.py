@@ -0,0 +1,143 @@
+"""
+Measurement and regression-gate helpers for broker benchmarks.
+
+measure() times operations one at a time, so results carry latency
+percentiles as well as throughput, and takes peak memory from a separate
+tracemalloc pass (tracing slows Python code down too much to share the
+timed run). compare() checks a run against a stored baseline.
+"""
+
+import gc
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+Operation = Callable[[int], Awaitable[object]]
+Setup = Callable[[int, int], Awaitable[Operation]]
+
+# Higher is worse for every gated metric except throughput
+GATED_METRICS = {
+    "per_second": -1,
+    "p95_us": 1,
+    "peak_memory_kib": 1,
+}
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list.
+
+    Args:
+        sorted_values: Values in ascending order
+        fraction: Percentile as a fraction, e.g. 0.95
+
+    Returns:
+        The percentile value (0.0 for an empty list)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+async def measure(
+    scenario: str,
+    size: int,
+    setup: Setup,
+    iterations: int,
+    memory_iterations: int = 100,
+) -> dict[str, Any]:
+    """Benchmark one scenario at one size.
+
+    setup(size, iterations) builds fresh state and returns the operation
+    to time; it is called twice, once under tracemalloc for peak memory
+    (state plus memory_iterations operations) and once for timing.
+
+    Args:
+        scenario: Scenario name
+        size: Number of sessions (or protocols) the state is built with
+        setup: Coroutine building state and returning the operation
+        iterations: Operations to time
+        memory_iterations: Operations run while tracing memory
+
+    Returns:
+        Result with throughput, latency percentiles and peak memory
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        operation = await setup(size, memory_iterations)
+        for index in range(memory_iterations):
+            await operation(index)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del operation
+    gc.collect()
+
+    operation = await setup(size, iterations)
+    latencies: list[float] = []
+    clock = time.perf_counter
+    started = clock()
+    for index in range(iterations):
+        op_started = clock()
+        await operation(index)
+        latencies.append(clock() - op_started)
+    elapsed = clock() - started
+
+    latencies.sort()
+    return {
+        "scenario": scenario,
+        "size": size,
+        "iterations": iterations,
+        "seconds": elapsed,
+        "per_second": iterations / elapsed if elapsed else 0.0,
+        "p50_us": percentile(latencies, 0.50) * 1e6,
+        "p95_us": percentile(latencies, 0.95) * 1e6,
+        "p99_us": percentile(latencies, 0.99) * 1e6,
+        "max_us": latencies[-1] * 1e6 if latencies else 0.0,
+        "peak_memory_kib": peak / 1024,
+    }
+
+
+def compare(
+    baseline: list[dict[str, Any]],
+    current: list[dict[str, Any]],
+    threshold: float,
+) -> list[dict[str, Any]]:
+    """Find metrics that regressed beyond a threshold.
+
+    Results are matched on (scenario, size); results missing from either
+    side are ignored.
+
+    Args:
+        baseline: Results from a stored run
+        current: Results from this run
+        threshold: Allowed relative change, e.g. 0.2 for 20%
+
+    Returns:
+        One entry per regressed metric, with baseline, current and change
+    """
+    previous = {(r["scenario"], r["size"]): r for r in baseline}
+    regressions = []
+    for result in current:
+        before = previous.get((result["scenario"], result["size"]))
+        if before is None:
+            continue
+        for metric, direction in GATED_METRICS.items():
+            old, new = before.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if change * direction > threshold:
+                regressions.append(
+                    {
+                        "scenario": result["scenario"],
+                        "size": result["size"],
+                        "metric": metric,
+                        "baseline": old,
+                        "current": new,
+                        "change": change,
+                    }
+                )
+    return regressions
@@ -399,6 +399,47 @@ class TestPermissionCaching:
         # Verify cache is empty
         assert len(manager._permission_cache) == 0
 
+    @pytest.mark.asyncio
+    async def test_permission_cache_is_bounded(self) -> None:
+        """Test the cache evicts past its size and counts hits and misses."""
+        from mcp_broker.project.registry import ProjectRegistry
+
+        registry = ProjectRegistry()
+        manager = AdminPermissionManager(registry, cache_max_size=2)
+        for target in ("project_b", "project_c", "project_d"):
+            await manager.can_access_project("project_a", target)
+        await manager.can_access_project("project_a", "project_d")
+
+        stats = manager.get_permission_cache_stats()
+        assert stats["size"] == 2
+        assert stats["evictions"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 3
+
+    @pytest.mark.asyncio
+    async def test_project_update_invalidates_cached_decisions(self) -> None:
+        """Test registry updates and deletes drop stale decisions for that project."""
+        from mcp_broker.project.registry import ProjectRegistry
+
+        registry = ProjectRegistry()
+        manager = AdminPermissionManager(registry, cache_ttl_seconds=60)
+        await registry.create_project(
+            "project_a", "Project A", config=ProjectConfig(allow_cross_project=False)
+        )
+        allow = ProjectConfig(allow_cross_project=True)
+        await registry.create_project("project_b", "Project B", config=allow)
+        await registry.create_project("project_c", "Project C")
+        assert await manager.can_access_project("project_a", "project_b") is False
+        await manager.can_access_project("project_c", "project_b")
+
+        await registry.update_project("project_a", config=allow)
+
+        assert manager._get_cached_permission(("project_c", "access_project", "project_b")) is False
+        assert await manager.can_access_project("project_a", "project_b") is True
+
+        await registry.delete_project("project_a")
+        assert manager._get_cached_permission(("project_a", "access_project", "project_b")) is None
+
 
 class TestCrossProjectConfigValidation:
     """Tests for cross-project configuration validation."""
@@ -0,0 +1,58 @@
+"""
+Unit tests for the benchmark harness.
+
+Tests measurement output and the baseline regression gate in
+tests.benchmarks.harness.
+"""
+
+from tests.benchmarks.harness import compare, measure, percentile
+
+
+def result(scenario: str, size: int, per_second: float, p95_us: float) -> dict:
+    """Build a benchmark result with the gated metrics."""
+    return {
+        "scenario": scenario,
+        "size": size,
+        "per_second": per_second,
+        "p95_us": p95_us,
+        "peak_memory_kib": 100.0,
+    }
+
+
+class TestBenchmarkHarness:
+    """Tests for measure, percentile and compare."""
+
+    async def test_measure_reports_latency_and_memory(self) -> None:
+        """Test measure sets up twice and times every operation."""
+        setups: list[int] = []
+
+        async def setup(size: int, iterations: int):
+            setups.append(iterations)
+            state = list(range(size))
+
+            async def operation(index: int) -> None:
+                state.append(index)
+
+            return operation
+
+        measured = await measure("noop", 10, setup, iterations=50, memory_iterations=5)
+
+        assert setups == [5, 50]
+        assert measured["iterations"] == 50
+        assert 0 < measured["p50_us"] <= measured["p99_us"] <= measured["max_us"]
+        assert measured["peak_memory_kib"] > 0
+
+    def test_compare_flags_regressions_beyond_threshold(self) -> None:
+        """Test only metrics worse than the threshold are reported."""
+        baseline = [result("send", 100, 1000, 50), result("send", 1000, 1000, 50)]
+        current = [
+            result("send", 100, 850, 70),
+            result("send", 1000, 1500, 10),
+            result("new", 100, 1, 1),
+        ]
+
+        regressions = compare(baseline, current, threshold=0.2)
+
+        assert [(r["size"], r["metric"]) for r in regressions] == [(100, "p95_us")]
+        assert percentile([1.0, 2.0, 3.0, 4.0], 0.5) == 2.0
+        assert percentile([], 0.95) == 0.0
@@ -0,0 +1,81 @@
+"""
+Unit tests for bounded caches.
+
+Tests LRU eviction, expiry and invalidation in TTLCache.
+"""
+
+from mcp_broker.core.cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Tests for TTLCache class."""
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        """Test inserts past max_size evict the least recently used entry."""
+        cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get_stats() == {
+            "size": 2,
+            "hits": 2,
+            "misses": 1,
+            "evictions": 1,
+            "expirations": 0,
+        }
+
+    def test_entries_expire(self) -> None:
+        """Test entries expire after the default or per-entry TTL."""
+        clock = FakeClock()
+        cache: TTLCache[str, int] = TTLCache(max_size=10, ttl=10, clock=clock)
+        cache.set("default", 1)
+        cache.set("short", 2, ttl=1)
+        cache.set("gone", 3, ttl=0)
+
+        clock.now = 5
+        assert cache.get("short") is None
+        assert cache.get("default") == 1
+        assert cache.get("gone") is None
+
+        clock.now = 10
+        assert cache.get("default") is None
+        assert len(cache) == 0
+
+    def test_expired_entries_are_swept(self) -> None:
+        """Test inserts sweep out expired entries that were never read again."""
+        clock = FakeClock()
+        cache: TTLCache[str, int] = TTLCache(max_size=10, ttl=10, clock=clock, sweep_interval=10)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=30)
+
+        clock.now = 10
+        cache.set("c", 3)
+
+        assert len(cache) == 2
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_discard_where(self) -> None:
+        """Test predicate invalidation removes only matching entries."""
+        cache: TTLCache[str, int] = TTLCache(max_size=10, ttl=60)
+        for index, key in enumerate("abcd"):
+            cache.set(key, index)
+
+        assert cache.discard_where(lambda _, value: value % 2 == 0) == 2
+        assert cache.pop("b") == 1
+        assert cache.pop("b") is None
+        assert len(cache) == 1
@@ -0,0 +1,125 @@
+"""
+Unit tests for compiled session capabilities.
+
+Tests capability interning, the memoized pairwise compatibility
+cache, and cache invalidation when capabilities change.
+"""
+
+from mcp_broker.models.session import (
+    Session,
+    SessionCapabilities,
+    clear_compatibility_cache,
+    compatibility_cache_info,
+    compile_capabilities,
+)
+
+
+def make_session(protocols: dict[str, list[str]], features: list[str] | None = None) -> Session:
+    """Create a session with the given capabilities."""
+    return Session(
+        capabilities=SessionCapabilities(
+            supported_protocols=protocols,
+            supported_features=features or [],
+        )
+    )
+
+
+class TestCompiledCapabilities:
+    """Tests for compile_capabilities and SessionCapabilities.compiled."""
+
+    def test_equal_declarations_are_interned(self) -> None:
+        """Test equal capabilities compile to one shared instance."""
+        a = SessionCapabilities(supported_protocols={"chat": ["1.1.0", "1.0.0"]})
+        b = SessionCapabilities(supported_protocols={"chat": ["1.0.0", "1.1.0"]})
+
+        assert a.compiled is b.compiled
+        assert a.compiled.protocols["chat"] == frozenset({"1.0.0", "1.1.0"})
+
+    def test_compiled_is_cached_on_instance(self) -> None:
+        """Test repeated access does not recompile."""
+        caps = SessionCapabilities(supported_protocols={"chat": ["1.0.0"]})
+
+        assert caps.compiled is caps.compiled
+
+    def test_reassignment_recompiles(self) -> None:
+        """Test assigning a new declaration rebuilds the compiled form."""
+        caps = SessionCapabilities(supported_protocols={"chat": ["1.0.0"]})
+        before = caps.compiled
+
+        caps.supported_protocols = {"chat": ["2.0.0"]}
+
+        assert caps.compiled is not before
+        assert caps.compiled.protocols["chat"] == frozenset({"2.0.0"})
+
+    def test_model_copy_with_update_recompiles(self) -> None:
+        """Test model_copy(update=...) does not reuse a stale compiled form."""
+        caps = SessionCapabilities(supported_features=["broadcast"])
+        _ = caps.compiled
+
+        copy = caps.model_copy(update={"supported_features": ["encryption"]})
+
+        assert copy.compiled.features == frozenset({"encryption"})
+
+    def test_equality_ignores_compiled_cache(self) -> None:
+        """Test capabilities compare by declaration only."""
+        a = SessionCapabilities(supported_protocols={"chat": ["1.0.0"]})
+        b = SessionCapabilities(supported_protocols={"chat": ["1.0.0"]})
+        _ = a.compiled
+
+        assert a == b
+
+    def test_fingerprint_distinguishes_features(self) -> None:
+        """Test features are part of the fingerprint."""
+        a = compile_capabilities({"chat": ["1.0.0"]}, ["broadcast"])
+        b = compile_capabilities({"chat": ["1.0.0"]}, [])
+
+        assert a != b
+
+
+class TestCompatibilityCache:
+    """Tests for the pairwise compatibility cache."""
+
+    def test_common_protocols_memoized(self) -> None:
+        """Test repeated pair lookups hit the cache."""
+        clear_compatibility_cache()
+        a = make_session({"chat": ["1.0.0", "1.1.0"], "file": ["2.0.0"]})
+        b = make_session({"chat": ["1.1.0"], "file": ["3.0.0"]})
+
+        assert a.find_common_protocols(b) == {"chat": "1.1.0"}
+        assert a.common_protocol_version(b, "chat") == "1.1.0"
+        assert a.common_protocol_version(b, "file") is None
+
+        info = compatibility_cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_sessions_with_equal_capabilities_share_entries(self) -> None:
+        """Test the cache is keyed by capabilities, not by session."""
+        clear_compatibility_cache()
+        sender = make_session({"chat": ["1.0.0"]})
+        recipients = [make_session({"chat": ["1.0.0"]}) for _ in range(10)]
+
+        for recipient in recipients:
+            assert sender.common_protocol_version(recipient, "chat") == "1.0.0"
+
+        assert compatibility_cache_info().misses == 1
+
+    def test_find_common_protocols_returns_copy(self) -> None:
+        """Test callers cannot corrupt cached results."""
+        a = make_session({"chat": ["1.0.0"]})
+        b = make_session({"chat": ["1.0.0"]})
+
+        result = a.find_common_protocols(b)
+        result["chat"] = "9.9.9"
+
+        assert a.find_common_protocols(b) == {"chat": "1.0.0"}
+
+    def test_changed_capabilities_invalidate_result(self) -> None:
+        """Test a capability change is reflected on the next lookup."""
+        a = make_session({"chat": ["1.0.0"]})
+        b = make_session({"chat": ["1.0.0"]})
+        assert a.common_protocol_version(b, "chat") == "1.0.0"
+
+        b.capabilities = SessionCapabilities(supported_protocols={"chat": ["2.0.0"]})
+
+        assert a.common_protocol_version(b, "chat") is None
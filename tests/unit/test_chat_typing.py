@@ -0,0 +1,132 @@
+"""
+Unit tests for aggregated chat typing indicators.
+
+Tests that keystroke-rate typing reports are collapsed into one frame
+per window, that stale typing flags expire, and that typing state is
+shared across workers through the backplane.
+"""
+
+import asyncio
+import json
+from uuid import uuid4
+
+from communication_server.websocket.backplane import InMemoryBackplane
+from communication_server.websocket.chat_manager import ChatConnectionManager
+
+WINDOW = 0.02
+
+
+class FakeWebSocket:
+    """WebSocket stand-in that records what it is sent."""
+
+    def __init__(self) -> None:
+        self.sent: list[dict] = []
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        self.sent.append(json.loads(data))
+
+
+def typing_frames(ws: FakeWebSocket) -> list[list[str]]:
+    """Sender IDs listed in each typing frame a socket received."""
+    return [
+        [typing["sender_id"] for typing in message["data"]["typing"]]
+        for message in ws.sent
+        if message["event"] == "chat.typing"
+    ]
+
+
+class TestTypingAggregation:
+    """Tests for per-room typing windows."""
+
+    async def test_keystrokes_collapse_into_one_frame(self) -> None:
+        """Test many reports in a window produce a single frame."""
+        manager = ChatConnectionManager(typing_window=WINDOW)
+        room_id, alice, bob = uuid4(), uuid4(), uuid4()
+        sockets = [FakeWebSocket() for _ in range(3)]
+        for ws in sockets:
+            await manager.connect(ws, room_id)
+
+        for _ in range(20):
+            await manager.broadcast_typing(room_id, alice, "user", True)
+            await manager.broadcast_typing(room_id, bob, "agent", True)
+        await asyncio.sleep(WINDOW * 3)
+
+        for ws in sockets:
+            assert typing_frames(ws) == [[str(alice), str(bob)]]
+        assert manager.get_typing_indicators(room_id) == {alice: True, bob: True}
+
+    async def test_stop_within_window_sends_nothing(self) -> None:
+        """Test typing that starts and stops within one window is not sent."""
+        manager = ChatConnectionManager(typing_window=WINDOW)
+        room_id, alice = uuid4(), uuid4()
+        ws = FakeWebSocket()
+        await manager.connect(ws, room_id)
+
+        await manager.broadcast_typing(room_id, alice, "user", True)
+        await manager.broadcast_typing(room_id, alice, "user", False)
+        await asyncio.sleep(WINDOW * 3)
+
+        assert typing_frames(ws) == []
+        assert manager.get_typing_indicators(room_id) == {}
+
+    async def test_stale_typing_expires(self) -> None:
+        """Test a flag not refreshed within typing_ttl is cleared."""
+        manager = ChatConnectionManager(typing_window=WINDOW, typing_ttl=WINDOW * 3)
+        room_id, alice = uuid4(), uuid4()
+        ws = FakeWebSocket()
+        await manager.connect(ws, room_id)
+
+        await manager.broadcast_typing(room_id, alice, "user", True)
+        await asyncio.sleep(WINDOW * 8)
+
+        assert typing_frames(ws) == [[str(alice)], []]
+        assert manager.get_typing_indicators(room_id) == {}
+
+    async def test_continued_typing_is_refreshed(self) -> None:
+        """Test a sender who keeps typing does not expire."""
+        manager = ChatConnectionManager(typing_window=WINDOW, typing_ttl=WINDOW * 4)
+        room_id, alice = uuid4(), uuid4()
+        ws = FakeWebSocket()
+        await manager.connect(ws, room_id)
+
+        for _ in range(12):
+            await manager.broadcast_typing(room_id, alice, "user", True)
+            await asyncio.sleep(WINDOW / 2)
+
+        assert typing_frames(ws) == [[str(alice)]]
+        assert manager.get_typing_indicators(room_id) == {alice: True}
+
+    async def test_disconnect_cancels_timers(self) -> None:
+        """Test closing a room drops its typing state."""
+        manager = ChatConnectionManager(typing_window=WINDOW)
+        room_id, alice = uuid4(), uuid4()
+        ws = FakeWebSocket()
+        await manager.connect(ws, room_id)
+
+        await manager.broadcast_typing(room_id, alice, "user", True)
+        manager.disconnect(ws)
+        await asyncio.sleep(WINDOW * 3)
+
+        assert ws.sent == []
+        assert manager._typing_flushes == {}
+        assert manager.get_typing_indicators(room_id) == {}
+
+    async def test_typing_shared_across_workers(self) -> None:
+        """Test each worker sends the room state including remote typers."""
+        backplane = InMemoryBackplane()
+        worker_a = ChatConnectionManager(backplane=backplane, typing_window=WINDOW)
+        worker_b = ChatConnectionManager(backplane=backplane, typing_window=WINDOW)
+        room_id, alice, bob = uuid4(), uuid4(), uuid4()
+        on_a, on_b = FakeWebSocket(), FakeWebSocket()
+        await worker_a.connect(on_a, room_id)
+        await worker_b.connect(on_b, room_id)
+
+        await worker_a.broadcast_typing(room_id, alice, "user", True)
+        await worker_b.broadcast_typing(room_id, bob, "user", True)
+        await asyncio.sleep(WINDOW * 3)
+
+        assert typing_frames(on_a) == [[str(alice), str(bob)]]
+        assert typing_frames(on_b) == [[str(alice), str(bob)]]
@@ -0,0 +1,147 @@
+"""
+Unit tests for the compact compatibility matrix.
+
+Checks the class-based matrix against a direct pairwise comparison, with
+and without NumPy, and covers lazy pair materialization and incremental
+session joins.
+"""
+
+import random
+
+import pytest
+
+from mcp_broker.models.session import Session, SessionCapabilities
+from mcp_broker.negotiation import matrix as matrix_module
+from mcp_broker.negotiation.matrix import CompatibilityMatrix
+
+PROTOCOLS = ["chat", "file_transfer", "status"]
+VERSIONS = ["1.0.0", "1.1.0", "2.0.0"]
+FEATURES = ["point_to_point", "broadcast", "event_driven"]
+
+
+@pytest.fixture(params=["numpy", "bitset"])
+def engine(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run each test with the NumPy engine and the pure-Python fallback."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(matrix_module, "np", None)
+    return request.param
+
+
+def random_sessions(count: int, seed: int = 7) -> list[Session]:
+    """Create sessions with random capabilities across three projects."""
+    rng = random.Random(seed)
+    sessions = []
+    for _ in range(count):
+        protocols = {
+            name: rng.sample(VERSIONS, rng.randint(1, 2))
+            for name in rng.sample(PROTOCOLS, rng.randint(0, 2))
+        }
+        sessions.append(
+            Session(
+                project_id=rng.choice(["alpha", "beta", "gamma"]),
+                capabilities=SessionCapabilities(
+                    supported_protocols=protocols,
+                    supported_features=rng.sample(FEATURES, rng.randint(0, 3)),
+                ),
+            )
+        )
+    return sessions
+
+
+def expected_compatible(a: Session, b: Session, allow_cross_project: bool) -> bool:
+    """Compute pair compatibility directly from the sessions."""
+    if a.project_id != b.project_id and not allow_cross_project:
+        return False
+    return len(a.find_common_protocols(b)) > 0
+
+
+@pytest.mark.usefixtures("engine")
+class TestCompatibilityMatrix:
+    """Tests for CompatibilityMatrix class."""
+
+    @pytest.mark.parametrize("allow_cross_project", [False, True])
+    def test_matches_pairwise_comparison(self, allow_cross_project: bool) -> None:
+        """Test every pair agrees with a direct comparison."""
+        sessions = random_sessions(40)
+        matrix = CompatibilityMatrix(sessions, allow_cross_project=allow_cross_project)
+
+        expected_count = 0
+        for i, a in enumerate(sessions):
+            for j in range(i + 1, len(sessions)):
+                expected = expected_compatible(a, sessions[j], allow_cross_project)
+                expected_count += expected
+                assert matrix.is_compatible(i, j) is expected
+                assert matrix.pairs[f"{i}-{j}"].compatible is expected
+
+        assert matrix.compatible_pair_count() == expected_count
+        assert matrix.class_count <= len(sessions)
+
+    def test_pair_details(self) -> None:
+        """Test materialized pairs carry protocols, features and reasons."""
+        caps = SessionCapabilities(
+            supported_protocols={"chat": ["1.0.0"]},
+            supported_features=["point_to_point", "broadcast"],
+        )
+        sessions = [
+            Session(project_id="alpha", capabilities=caps),
+            Session(project_id="alpha", capabilities=caps),
+            Session(project_id="beta", capabilities=caps),
+        ]
+        matrix = CompatibilityMatrix(sessions)
+
+        same = matrix.pair(0, 1)
+        assert same.compatible is True
+        assert same.common_protocols == {"chat": "1.0.0"}
+        assert set(same.common_features) == {"point_to_point", "broadcast"}
+
+        cross = matrix.pairs["0-2"]
+        assert cross.compatible is False
+        assert cross.cross_project is True
+        assert "Cross-project" in (cross.reason or "")
+
+    def test_identical_capabilities_share_a_class(self) -> None:
+        """Test sessions with equal capabilities are compared once."""
+        sessions = [
+            Session(capabilities=SessionCapabilities(supported_protocols={"chat": ["1.0.0"]}))
+            for _ in range(50)
+        ]
+        matrix = CompatibilityMatrix(sessions)
+
+        assert matrix.class_count == 1
+        assert matrix.compatible_pair_count() == 50 * 49 // 2
+
+    def test_pairs_mapping_is_lazy(self) -> None:
+        """Test the pairs mapping has the usual keys without storing pairs."""
+        matrix = CompatibilityMatrix(random_sessions(5))
+
+        assert len(matrix.pairs) == 10
+        assert list(matrix.pairs)[:2] == ["0-1", "0-2"]
+        assert "0-4" in matrix.pairs
+        assert "4-0" not in matrix.pairs
+        assert "bogus" not in matrix.pairs
+
+    def test_add_session_matches_rebuild(self) -> None:
+        """Test incremental joins give the same answers as a full build."""
+        sessions = random_sessions(30, seed=11)
+        incremental = CompatibilityMatrix(sessions[:10])
+        for session in sessions[10:]:
+            incremental.add_session(session)
+        rebuilt = CompatibilityMatrix(sessions)
+
+        assert incremental.session_ids == rebuilt.session_ids
+        assert incremental.project_groups == rebuilt.project_groups
+        assert incremental.compatible_pair_count() == rebuilt.compatible_pair_count()
+        for i in range(len(sessions)):
+            assert incremental.compatible_peers(i) == rebuilt.compatible_peers(i)
+
+    def test_add_session_to_empty_matrix(self) -> None:
+        """Test a matrix can be grown from nothing."""
+        matrix = CompatibilityMatrix()
+        caps = SessionCapabilities(supported_protocols={"chat": ["1.0.0"]})
+
+        assert matrix.add_session(Session(capabilities=caps)) == 0
+        assert matrix.add_session(Session(capabilities=caps)) == 1
+        assert matrix.is_compatible(0, 1) is True
+        assert matrix.compatible_peers(0) == [1]
@@ -0,0 +1,110 @@
+"""
+Unit tests for the dead-letter queue.
+
+Tests the bounded per-project ring buffers, disk spill, paging,
+removal and persistence across instances.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from mcp_broker.routing.dead_letter import DeadLetterQueue
+
+
+def entry(n: int) -> dict:
+    """Create a dead-letter record with a predictable id."""
+    return {"dead_letter_id": f"dl-{n}", "reason": "queue_full", "n": n}
+
+
+class TestDeadLetterQueue:
+    """Tests for DeadLetterQueue class."""
+
+    async def test_overflow_is_dropped_without_spill_dir(self) -> None:
+        """Test memory stays bounded and overflow is counted."""
+        dlq = DeadLetterQueue(capacity=3)
+        for n in range(5):
+            dlq.append(entry(n))
+
+        assert len(dlq) == 3
+        assert dlq.dropped == 2
+        assert [e["n"] for e in await dlq.page()] == [2, 3, 4]
+
+    async def test_overflow_spills_to_disk_in_order(self, tmp_path: Path) -> None:
+        """Test spilled entries are read back before in-memory ones."""
+        dlq = DeadLetterQueue(capacity=2, spill_dir=tmp_path)
+        for n in range(5):
+            dlq.append(entry(n))
+
+        assert len(dlq) == 5
+        assert dlq.dropped == 0
+        assert [e["n"] for e in await dlq.page()] == [0, 1, 2, 3, 4]
+        assert (tmp_path / "default.jsonl").exists()
+        assert [e["n"] for e in await dlq.page(offset=1, limit=3)] == [1, 2, 3]
+        assert [e["n"] for e in await dlq.page(offset=4, limit=10)] == [4]
+
+    async def test_segment_capacity_bounds_disk(self, tmp_path: Path) -> None:
+        """Test spilled entries beyond the segment capacity are dropped."""
+        dlq = DeadLetterQueue(capacity=2, spill_dir=tmp_path, segment_capacity=2)
+        for n in range(6):
+            dlq.append(entry(n))
+
+        assert [e["n"] for e in await dlq.page()] == [2, 3, 4, 5]
+        assert dlq.dropped == 2
+        assert len((tmp_path / "default.jsonl").read_text().splitlines()) == 2
+
+    async def test_projects_are_partitioned(self, tmp_path: Path) -> None:
+        """Test each project has its own ring and segment."""
+        dlq = DeadLetterQueue(capacity=1, spill_dir=tmp_path)
+        dlq.append(entry(0), "alpha")
+        dlq.append(entry(1), "alpha")
+        dlq.append(entry(2), "beta/one")
+
+        assert dlq.size("alpha") == 2
+        assert dlq.size("beta/one") == 1
+        assert [e["n"] for e in await dlq.page("beta/one")] == [2]
+        assert [e["n"] for e in await dlq.page(limit=2)] == [0, 1]
+        assert set(dlq.projects()) == {"alpha", "beta/one"}
+
+    async def test_discard_from_memory_and_disk(self, tmp_path: Path) -> None:
+        """Test entries are removed by id wherever they live."""
+        dlq = DeadLetterQueue(capacity=2, spill_dir=tmp_path)
+        for n in range(4):
+            dlq.append(entry(n))
+
+        assert await dlq.discard("default", ["dl-0", "dl-3", "missing"]) == 2
+        assert [e["n"] for e in await dlq.page()] == [1, 2]
+
+        assert await dlq.discard("default", ["dl-1"]) == 1
+        assert not (tmp_path / "default.jsonl").exists()
+
+    async def test_flush_survives_restart(self, tmp_path: Path) -> None:
+        """Test flushed and spilled entries are reloaded by a new instance."""
+        dlq = DeadLetterQueue(capacity=2, spill_dir=tmp_path)
+        for n in range(3):
+            dlq.append(entry(n), "alpha")
+        # Flush also writes overflow the background spill has not reached yet
+        assert await dlq.flush() == 3
+
+        reloaded = DeadLetterQueue(capacity=2, spill_dir=tmp_path)
+        assert reloaded.size("alpha") == 3
+        assert [e["n"] for e in await reloaded.page("alpha")] == [0, 1, 2]
+
+    async def test_clear(self, tmp_path: Path) -> None:
+        """Test clearing one project or all of them."""
+        dlq = DeadLetterQueue(capacity=1, spill_dir=tmp_path)
+        for n in range(3):
+            dlq.append(entry(n), "alpha")
+        dlq.append(entry(3), "beta")
+
+        assert await dlq.clear("alpha") == 3
+        assert dlq.size("alpha") == 0
+        assert await dlq.clear() == 1
+        assert list(tmp_path.glob("*.jsonl")) == []
+
+    async def test_invalid_arguments(self) -> None:
+        """Test capacity and paging bounds are validated."""
+        with pytest.raises(ValueError, match="capacity"):
+            DeadLetterQueue(capacity=0)
+        with pytest.raises(ValueError, match="non-negative"):
+            await DeadLetterQueue().page(offset=-1)
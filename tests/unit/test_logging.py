@@ -0,0 +1,108 @@
+"""
+Unit tests for the logging pipeline.
+
+Tests queue mode, lazy context builders and per-logger sampling in
+mcp_broker.core.logging.
+"""
+
+import json
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from mcp_broker.core.logging import (
+    SamplingFilter,
+    get_logger,
+    log_lazy,
+    parse_sample_rates,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+@pytest.fixture
+def restore_logging() -> Iterator[None]:
+    """Restore the test suite's logging setup afterwards."""
+    yield
+    shutdown_logging()
+    setup_logging(level="INFO", format_type="text")
+
+
+def read_records(path: Path) -> list[dict]:
+    """Read JSON log records from a file."""
+    return [json.loads(line) for line in path.read_text().splitlines() if line.startswith("{")]
+
+
+class TestSamplingFilter:
+    """Tests for SamplingFilter class."""
+
+    def test_rates_are_inherited_by_child_loggers(self) -> None:
+        """Test a parent's rate applies to children and other loggers pass."""
+        sampler = SamplingFilter({"app.storage": 0.25, "app.quiet": 0})
+
+        kept = [sampler.sample("app.storage.memory", logging.DEBUG) for _ in range(8)]
+
+        assert kept == [True, False, False, False, True, False, False, False]
+        assert sampler.sample("app.quiet", logging.DEBUG) is False
+        assert sampler.sample("app.router", logging.DEBUG) is True
+        assert sampler.sample("app.storage", logging.WARNING) is True
+        assert sampler.dropped == 7
+
+    def test_parse_sample_rates(self) -> None:
+        """Test rate strings are parsed and malformed pairs rejected."""
+        assert parse_sample_rates("a.b=0.1, c=1") == {"a.b": 0.1, "c": 1.0}
+        assert parse_sample_rates("") == {}
+        with pytest.raises(ValueError):
+            parse_sample_rates("no-rate")
+
+
+@pytest.mark.usefixtures("restore_logging")
+class TestLazyLogging:
+    """Tests for log_lazy and queue mode."""
+
+    def test_builders_run_only_when_enabled(self) -> None:
+        """Test message and context builders are skipped for disabled levels."""
+        setup_logging(level="INFO")
+        calls: list[str] = []
+
+        def message() -> str:
+            calls.append("message")
+            return "built"
+
+        log_lazy(get_logger("test.lazy"), logging.DEBUG, message, lambda: calls.append("ctx"))
+
+        assert calls == []
+
+    def test_queue_mode_writes_records(self, tmp_path: Path) -> None:
+        """Test queued records keep their context, exception text and sampling."""
+        log_file = tmp_path / "broker.log"
+        setup_logging(
+            level="DEBUG",
+            log_file=log_file,
+            use_queue=True,
+            sample_rates={"test.sampled": 0.5},
+        )
+        logger = get_logger("test.sampled")
+
+        for index in range(4):
+            log_lazy(logger, logging.DEBUG, lambda i=index: f"lazy {i}", lambda: {"k": "v"})
+        for index in range(4):
+            logger.debug(f"eager {index}")
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            logger.exception("failed")
+        shutdown_logging()
+
+        records = read_records(log_file)
+        assert [r["message"] for r in records] == [
+            "lazy 0",
+            "lazy 2",
+            "eager 0",
+            "eager 2",
+            "failed",
+        ]
+        assert records[0]["context"] == {"k": "v"}
+        assert "RuntimeError: boom" in records[-1]["exception"]
@@ -10,6 +10,8 @@ Tests all 6 MCP tools:
 - list_sessions
 """
 
+import json
+
 import pytest
 from uuid import uuid4, UUID
 from datetime import UTC, datetime
@@ -398,6 +400,61 @@ class TestMCPTools:
         assert result.get("queued") is True
         assert "queue_size" in result
 
+    async def test_send_batch(
+        self,
+        broker_server: MCPServer,
+        test_session: Session,
+        test_session2: Session,
+    ) -> None:
+        """Test broker_send_batch returns one result per message."""
+        broker_server.current_session_id = test_session.session_id
+        message = {
+            "recipient_id": str(test_session2.session_id),
+            "protocol_name": "chat",
+            "protocol_version": "1.0.0",
+            "payload": {"text": "Hello!"},
+        }
+
+        result = json.loads(
+            await broker_server.call_tool(
+                "broker_send_batch",
+                {"messages": [message, {**message, "recipient_id": str(uuid4())}]},
+            )
+        )
+
+        assert result["sent"] == 1
+        assert result["failed"] == 1
+        assert result["results"][0]["success"] is True
+        assert "not found" in result["results"][1]["error"]
+
+    async def test_send_batch_malformed_recipient_fails_alone(
+        self,
+        broker_server: MCPServer,
+        test_session: Session,
+        test_session2: Session,
+    ) -> None:
+        """Test a malformed recipient_id fails only its own batch item."""
+        broker_server.current_session_id = test_session.session_id
+        message = {
+            "recipient_id": str(test_session2.session_id),
+            "protocol_name": "chat",
+            "protocol_version": "1.0.0",
+            "payload": {"text": "Hello!"},
+        }
+
+        result = json.loads(
+            await broker_server.call_tool(
+                "broker_send_batch",
+                {"messages": [{**message, "recipient_id": "not-a-uuid"}, message]},
+            )
+        )
+
+        assert result["sent"] == 1
+        assert result["failed"] == 1
+        assert result["results"][0]["success"] is False
+        assert "Invalid recipient_id" in result["results"][0]["error"]
+        assert result["results"][1]["success"] is True
+
     async def test_send_message_no_current_session(
         self, broker_server: MCPServer, test_session: Session
     ) -> None:
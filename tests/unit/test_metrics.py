@@ -0,0 +1,93 @@
+"""
+Unit tests for call metrics.
+
+Tests the geometric latency histogram, per-name call counters, and the
+table-driven MCP tool dispatch that records into them.
+"""
+
+import json
+
+import pytest
+
+from mcp_broker.core.metrics import CallMetrics, LatencyHistogram
+from mcp_broker.mcp.server import MCPServer
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram class."""
+
+    def test_empty_histogram(self) -> None:
+        """Test an empty histogram reports no latencies."""
+        histogram = LatencyHistogram()
+
+        assert histogram.percentile(0.5) is None
+        assert histogram.to_dict()["mean_ms"] is None
+
+    def test_percentiles_within_one_bucket(self) -> None:
+        """Test percentile estimates stay within one bucket of the truth."""
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(float(ms))
+
+        summary = histogram.to_dict()
+        assert summary["count"] == 1000
+        assert summary["min_ms"] == 1.0
+        assert summary["max_ms"] == 1000.0
+        assert summary["mean_ms"] == pytest.approx(500.5)
+        for key, exact in (("p50_ms", 500), ("p95_ms", 950), ("p99_ms", 990)):
+            assert exact <= summary[key] <= exact * 1.19
+
+    def test_estimates_are_clamped_to_observed_range(self) -> None:
+        """Test single samples and overflow report the observed values."""
+        histogram = LatencyHistogram()
+        histogram.record(3.0)
+        assert histogram.percentile(0.99) == 3.0
+
+        histogram.record(500_000.0)
+        assert histogram.percentile(1.0) == 500_000.0
+
+
+class TestCallMetrics:
+    """Tests for CallMetrics class."""
+
+    def test_snapshot_counts_calls_and_errors(self) -> None:
+        """Test calls and errors are counted per name."""
+        metrics = CallMetrics()
+        metrics.record("b", 2.0)
+        metrics.record("a", 1.0)
+        metrics.record("a", 4.0, error=True)
+
+        snapshot = metrics.snapshot()
+
+        assert list(snapshot) == ["a", "b"]
+        assert snapshot["a"]["calls"] == 2
+        assert snapshot["a"]["errors"] == 1
+        assert snapshot["a"]["max_ms"] == 4.0
+        assert snapshot["b"]["errors"] == 0
+
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+
+class TestToolDispatch:
+    """Tests for MCPServer.call_tool."""
+
+    async def test_results_are_json_and_recorded(self) -> None:
+        """Test tool results are JSON encoded and timed per tool."""
+        server = MCPServer()
+
+        text = await server.call_tool("list_sessions", {})
+
+        assert json.loads(text)["count"] == 0
+        assert server.tool_metrics.snapshot()["list_sessions"]["calls"] == 1
+
+    async def test_failures_count_as_errors(self) -> None:
+        """Test raised exceptions and unknown tools are handled."""
+        server = MCPServer()
+
+        assert (await server.call_tool("register_protocol", {})).startswith("Error: ")
+        assert await server.call_tool("no_such_tool", {}) == "Unknown tool: no_such_tool"
+
+        snapshot = server.tool_metrics.snapshot()
+        assert snapshot["register_protocol"]["errors"] == 1
+        assert "no_such_tool" not in snapshot
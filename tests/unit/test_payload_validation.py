@@ -0,0 +1,171 @@
+"""
+Unit tests for payload validation against protocol schemas.
+
+Tests the compiled-validator cache in ProtocolRegistry, its invalidation
+on delete and unshare, and opt-in enforcement in MessageRouter.
+"""
+
+import pytest
+
+from mcp_broker.models.message import Message
+from mcp_broker.models.protocol import ProtocolDefinition
+from mcp_broker.models.session import Session, SessionCapabilities
+from mcp_broker.protocol.registry import ProtocolRegistry
+from mcp_broker.routing.router import MessageRouter
+from mcp_broker.session.manager import SessionManager
+from mcp_broker.storage.memory import InMemoryStorage
+
+CHAT_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "properties": {"text": {"type": "string", "maxLength": 20}},
+    "required": ["text"],
+}
+
+
+def chat_protocol(version: str = "1.0.0") -> ProtocolDefinition:
+    """Create the chat protocol used by these tests."""
+    return ProtocolDefinition(
+        name="chat",
+        version=version,
+        message_schema=CHAT_SCHEMA,
+        capabilities=["point_to_point", "broadcast"],
+    )
+
+
+def chat(sender: Session, recipient: Session | None = None, **payload: object) -> Message:
+    """Create a chat message."""
+    return Message(
+        sender_id=sender.session_id,
+        recipient_id=recipient.session_id if recipient else None,
+        protocol_name="chat",
+        protocol_version="1.0.0",
+        payload=payload,
+    )
+
+
+class TestValidatePayload:
+    """Tests for ProtocolRegistry.validate_payload."""
+
+    async def test_validator_is_compiled_once(self) -> None:
+        """Test repeated validations reuse the cached validator."""
+        registry = ProtocolRegistry(InMemoryStorage())
+        await registry.register(chat_protocol())
+        sender = Session(capabilities=SessionCapabilities())
+
+        assert await registry.validate_payload(chat(sender, text="hi")) is None
+        error = await registry.validate_payload(chat(sender, text=42))
+        assert error is not None
+        assert "chat" in error
+        assert "/text" in error
+        assert await registry.validate_payload(chat(sender, body="no text")) is not None
+
+        assert registry.get_validator_stats() == {"size": 1, "hits": 2, "misses": 1}
+
+    async def test_unregistered_protocol_is_rejected(self) -> None:
+        """Test payloads for unknown protocols are rejected, not cached."""
+        registry = ProtocolRegistry(InMemoryStorage())
+        sender = Session(capabilities=SessionCapabilities())
+
+        error = await registry.validate_payload(chat(sender, text="hi"))
+
+        assert error is not None
+        assert "not registered" in error
+        assert registry.get_validator_stats()["size"] == 0
+
+    async def test_delete_protocol_invalidates_validator(self) -> None:
+        """Test deleting a protocol drops its cached validator."""
+        registry = ProtocolRegistry(InMemoryStorage())
+        await registry.register(chat_protocol())
+        sender = Session(capabilities=SessionCapabilities())
+        await registry.validate_payload(chat(sender, text="hi"))
+
+        assert await registry.delete_protocol("chat", "1.0.0") is True
+        assert await registry.delete_protocol("chat", "1.0.0") is False
+        assert registry.get_validator_stats()["size"] == 0
+        assert await registry.discover() == []
+        assert "not registered" in (await registry.validate_payload(chat(sender, text="hi")) or "")
+
+    async def test_shared_protocol_validates_until_unshared(self) -> None:
+        """Test projects can validate against protocols shared with them."""
+        registry = ProtocolRegistry(InMemoryStorage())
+        await registry.register(chat_protocol(), project_id="source")
+        await registry.share_protocol("chat", "1.0.0", "source", "target")
+        sender = Session(project_id="target", capabilities=SessionCapabilities())
+
+        assert await registry.validate_payload(chat(sender, text="hi"), "target") is None
+
+        await registry.unshare_protocol("chat", "1.0.0", "source", "target")
+        assert await registry.validate_payload(chat(sender, text="hi"), "target") is not None
+
+
+class TestRouterPayloadValidation:
+    """Tests for payload enforcement in MessageRouter."""
+
+    async def make_router(self, *enforced: str) -> tuple[MessageRouter, ProtocolRegistry, list]:
+        """Create a router with three chat-capable sessions."""
+        storage = InMemoryStorage()
+        manager = SessionManager(storage)
+        registry = ProtocolRegistry(storage)
+        await registry.register(chat_protocol())
+        router = MessageRouter(
+            manager, storage, protocol_registry=registry, payload_validation=enforced
+        )
+        caps = SessionCapabilities(
+            supported_protocols={"chat": ["1.0.0"]},
+            supported_features=["point_to_point", "broadcast"],
+        )
+        sessions = [await manager.create_session(caps) for _ in range(3)]
+        return router, registry, sessions
+
+    async def test_validation_is_opt_in(self) -> None:
+        """Test invalid payloads pass unless the project enforces schemas."""
+        router, _, (sender, recipient, _) = await self.make_router()
+
+        result = await router.send_message(
+            sender.session_id, recipient.session_id, chat(sender, recipient, text=42)
+        )
+
+        assert result.success is True
+        assert router.payload_validation_enabled("default") is False
+
+    async def test_send_rejects_invalid_payload(self) -> None:
+        """Test enforced projects reject payloads that violate the schema."""
+        router, _, (sender, recipient, _) = await self.make_router("default")
+
+        bad = await router.send_message(
+            sender.session_id, recipient.session_id, chat(sender, recipient, text=42)
+        )
+        good = await router.send_message(
+            sender.session_id, recipient.session_id, chat(sender, recipient, text="hello")
+        )
+
+        assert bad.success is False
+        assert "does not match protocol 'chat'" in (bad.error_reason or "")
+        assert good.success is True
+        assert router.get_project_statistics("default")["total_failed"] == 1
+
+    async def test_broadcast_validates_once(self) -> None:
+        """Test a broadcast checks its payload once, not per recipient."""
+        router, registry, (sender, _, _) = await self.make_router()
+        router.enable_payload_validation("*")
+
+        result = await router.broadcast_message(sender.session_id, chat(sender, text="hello"))
+        assert result.delivery_count == 2
+        assert registry.get_validator_stats() == {"size": 1, "hits": 0, "misses": 1}
+
+        rejected = await router.broadcast_message(sender.session_id, chat(sender, text="x" * 50))
+        assert rejected.success is False
+        assert registry.get_validator_stats()["hits"] == 1
+
+        router.disable_payload_validation("*")
+        assert router.payload_validation_enabled("default") is False
+
+    @pytest.mark.parametrize("enforced", [(), ("other",)])
+    async def test_other_projects_are_not_validated(self, enforced: tuple[str, ...]) -> None:
+        """Test enforcement is scoped to the listed projects."""
+        router, registry, (sender, _, _) = await self.make_router(*enforced)
+
+        await router.broadcast_message(sender.session_id, chat(sender, text=42))
+
+        assert registry.get_validator_stats()["misses"] == 0
@@ -376,3 +376,63 @@ class TestProjectRegistry:
         project = await registry.get_project("default")
         assert project is not None
         assert len(project.api_keys) == 1
+
+
+class TestApiKeyCache:
+    """Tests for API key validation caching in ProjectRegistry."""
+
+    async def test_valid_key_is_cached(self) -> None:
+        """Test a validated key is served from the cache afterwards."""
+        registry = ProjectRegistry()
+        project = await registry.create_project(project_id="test_project", name="Test")
+        api_key = project.api_keys[0].api_key
+
+        first = await registry.validate_api_key(api_key)
+        second = await registry.validate_api_key(api_key)
+
+        assert first == second == ("test_project", project.api_keys[0].key_id)
+        stats = registry.get_api_key_cache_stats()["validated"]
+        assert stats["size"] == 1
+        assert stats["hits"] == 1
+
+    async def test_rejected_key_is_cached_briefly(self) -> None:
+        """Test bad keys are refused from the negative cache."""
+        registry = ProjectRegistry()
+        await registry.create_project(project_id="test_project", name="Test")
+        bad_key = "test_project_key_00000000_not-the-secret"
+
+        assert await registry.validate_api_key(bad_key) is None
+        assert await registry.validate_api_key(bad_key) is None
+
+        assert registry.get_api_key_cache_stats()["rejected"]["hits"] == 1
+
+    async def test_rotation_invalidates_cached_keys(self) -> None:
+        """Test rotated keys stop validating immediately."""
+        registry = ProjectRegistry()
+        project = await registry.create_project(project_id="test_project", name="Test")
+        old_key = project.api_keys[0].api_key
+        assert await registry.validate_api_key(old_key) is not None
+
+        new_keys = await registry.rotate_api_keys("test_project", grace_period_seconds=0)
+
+        assert await registry.validate_api_key(old_key) is None
+        assert await registry.validate_api_key(new_keys[0].api_key) == (
+            "test_project",
+            new_keys[0].key_id,
+        )
+
+    async def test_delete_project_invalidates_cached_keys(self) -> None:
+        """Test keys of a deleted project stop validating immediately."""
+        registry = ProjectRegistry()
+        project = await registry.create_project(project_id="test_project", name="Test")
+        other = await registry.create_project(project_id="other_project", name="Other")
+        api_key = project.api_keys[0].api_key
+        other_key = other.api_keys[0].api_key
+        await registry.validate_api_key(api_key)
+        await registry.validate_api_key(other_key)
+
+        await registry.delete_project("test_project")
+
+        assert await registry.validate_api_key(api_key) is None
+        assert await registry.validate_api_key(other_key) is not None
+        assert registry.get_api_key_cache_stats()["validated"]["size"] == 1
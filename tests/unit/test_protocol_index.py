@@ -0,0 +1,123 @@
+"""
+Unit tests for the protocol discovery index.
+
+Tests semver range parsing, bisect-based range selection, the tag
+inverted index, and shared-entry handling.
+"""
+
+import pytest
+from semver import Version
+
+from mcp_broker.models.protocol import ProtocolInfo, ProtocolMetadata
+from mcp_broker.protocol.index import ProtocolIndex, VersionRange
+
+ALL_VERSIONS = [
+    "0.0.3",
+    "0.1.0",
+    "0.2.5",
+    "1.0.0",
+    "1.2.0",
+    "1.2.9",
+    "1.3.0",
+    "2.0.0",
+    "2.4.1",
+    "3.0.0",
+]
+
+
+def info(name: str, version: str, *tags: str) -> ProtocolInfo:
+    """Create a ProtocolInfo with optional tags."""
+    return ProtocolInfo(name=name, version=version, metadata=ProtocolMetadata(tags=list(tags)))
+
+
+class TestVersionRange:
+    """Tests for VersionRange class."""
+
+    @pytest.mark.parametrize(
+        ("spec", "expected"),
+        [
+            ("1.2.0", ["1.2.0"]),
+            ("==2.0.0", ["2.0.0"]),
+            ("1.2", ["1.2.0", "1.2.9"]),
+            ("1.x", ["1.0.0", "1.2.0", "1.2.9", "1.3.0"]),
+            ("^1.2", ["1.2.0", "1.2.9", "1.3.0"]),
+            ("^0.2.1", ["0.2.5"]),
+            ("^0.0.3", ["0.0.3"]),
+            ("~1.2.3", ["1.2.9"]),
+            (">=2,<3", ["2.0.0", "2.4.1"]),
+            (">=2.0.0 <3.0.0", ["2.0.0", "2.4.1"]),
+            (">1.2", ["1.3.0", "2.0.0", "2.4.1", "3.0.0"]),
+            ("<=1.2", ["0.0.3", "0.1.0", "0.2.5", "1.0.0", "1.2.0", "1.2.9"]),
+            (">=1, !=1.2.0, <2", ["1.0.0", "1.2.9", "1.3.0"]),
+            ("*", ALL_VERSIONS),
+        ],
+    )
+    def test_select_matches_contains(self, spec: str, expected: list[str]) -> None:
+        """Test bisect selection agrees with per-version checks."""
+        versions = [Version.parse(v) for v in ALL_VERSIONS]
+        version_range = VersionRange.parse(spec)
+
+        assert [str(v) for v in version_range.select(versions)] == expected
+        assert [str(v) for v in versions if version_range.contains(v)] == expected
+
+    @pytest.mark.parametrize("spec", ["1.2.3.4", ">=abc", "1.0.0 - 2.0.0", "!=1.2"])
+    def test_invalid_ranges(self, spec: str) -> None:
+        """Test malformed ranges are rejected."""
+        with pytest.raises(ValueError):
+            VersionRange.parse(spec)
+
+
+class TestProtocolIndex:
+    """Tests for ProtocolIndex class."""
+
+    def test_query_orders_by_name_and_semver(self) -> None:
+        """Test results use semver rather than string order."""
+        index = ProtocolIndex()
+        for version in ["1.10.0", "1.9.0", "1.2.0"]:
+            index.add(info("chat", version))
+        index.add(info("audio", "1.0.0"))
+
+        assert [(p.name, p.version) for p in index.query()] == [
+            ("audio", "1.0.0"),
+            ("chat", "1.2.0"),
+            ("chat", "1.9.0"),
+            ("chat", "1.10.0"),
+        ]
+        assert [p.version for p in index.query("chat", VersionRange.parse(">1.9"))] == ["1.10.0"]
+
+    def test_tag_index_matches_any_tag(self) -> None:
+        """Test tag queries combine with name and range filters."""
+        index = ProtocolIndex()
+        index.add(info("chat", "1.0.0", "text"))
+        index.add(info("chat", "2.0.0", "text", "rich"))
+        index.add(info("video", "1.0.0", "media"))
+
+        assert len(index.query(tags=["text", "media"])) == 3
+        assert [p.version for p in index.query("chat", VersionRange.parse("^2"), ["text"])] == [
+            "2.0.0"
+        ]
+        assert index.query(tags=["missing"]) == []
+
+    def test_remove_cleans_every_structure(self) -> None:
+        """Test removed entries disappear from names, versions and tags."""
+        index = ProtocolIndex()
+        index.add(info("chat", "1.0.0", "text"))
+
+        assert index.remove("chat", "1.0.0") is True
+        assert index.remove("chat", "1.0.0") is False
+        assert len(index) == 0
+        assert index.query() == []
+        assert index.query(tags=["text"]) == []
+
+    def test_shared_entries_are_kept_apart(self) -> None:
+        """Test shared entries sit beside own ones and can be cleared."""
+        index = ProtocolIndex()
+        index.add(info("chat", "1.0.0", "text"))
+        index.add(info("chat", "1.0.0", "text"), source_project="other")
+
+        assert len(index.query()) == 1
+        assert len(index.query(include_shared=True)) == 2
+        assert len(index.query(tags=["text"], include_shared=True)) == 2
+
+        index.clear_shared()
+        assert len(index.query(include_shared=True)) == 1
@@ -210,3 +210,59 @@ class TestProtocolRegistry:
         protocol = await registry.get("nonexistent", "1.0.0")
 
         assert protocol is None
+
+    async def test_discover_with_version_range(self) -> None:
+        """Test discovering protocols with a semver range."""
+        storage = InMemoryStorage()
+        registry = ProtocolRegistry(storage)
+
+        for version in ["1.0.0", "1.4.0", "2.0.0", "2.1.0"]:
+            await registry.register(
+                ProtocolDefinition(
+                    name="chat_message",
+                    version=version,
+                    message_schema={"type": "object"},
+                    capabilities=["point_to_point"],
+                )
+            )
+
+        protocols = await registry.discover(name="chat_message", version="^1.2")
+        assert [p.version for p in protocols] == ["1.4.0"]
+
+        protocols = await registry.discover(version=">=2,<3")
+        assert [p.version for p in protocols] == ["2.0.0", "2.1.0"]
+
+        with pytest.raises(ValueError, match="Invalid version range"):
+            await registry.discover(version="not-a-range")
+
+    async def test_discover_returns_registration_time(
+        self, protocol_definition: ProtocolDefinition
+    ) -> None:
+        """Test discovery reports when a protocol was registered."""
+        storage = InMemoryStorage()
+        registry = ProtocolRegistry(storage)
+
+        info = await registry.register(protocol_definition)
+        first = await registry.discover()
+        second = await ProtocolRegistry(storage).discover()
+
+        assert first[0].registered_at == info.registered_at
+        assert second[0].registered_at == info.registered_at
+
+    async def test_index_refresh_sees_other_registries(
+        self, protocol_definition: ProtocolDefinition
+    ) -> None:
+        """Test a refreshing registry picks up protocols saved elsewhere."""
+        storage = InMemoryStorage()
+        cached = ProtocolRegistry(storage)
+        refreshing = ProtocolRegistry(storage, index_refresh_interval=0)
+
+        assert await cached.discover() == []
+        assert await refreshing.discover() == []
+
+        await ProtocolRegistry(storage).register(protocol_definition)
+
+        assert await cached.discover() == []
+        assert len(await refreshing.discover()) == 1
+        cached.invalidate("default")
+        assert len(await cached.discover()) == 1
@@ -0,0 +1,172 @@
+"""
+Unit tests for cross-project rate limiting.
+
+Tests the GCRA decision function, the in-process and Redis-shared
+limiters, and how CrossProjectRouter resolves and applies limits.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from mcp_broker.models.message import Message
+from mcp_broker.models.project import CrossProjectPermission, ProjectConfig
+from mcp_broker.project.cross_project_config import CrossProjectRelationshipManager
+from mcp_broker.project.registry import ProjectRegistry
+from mcp_broker.routing.cross_project import CrossProjectRouter
+from mcp_broker.routing.rate_limit import RateLimiter, RedisRateLimiter, gcra
+from mcp_broker.session.manager import SessionManager
+from mcp_broker.storage.memory import InMemoryStorage
+
+
+class TestGCRA:
+    """Tests for the gcra decision function."""
+
+    def test_burst_then_steady_rate(self) -> None:
+        """Test a full minute's burst is admitted, then one per interval."""
+        tat = None
+        for _ in range(6):
+            allowed, tat = gcra(tat, 1000.0, 6)
+            assert allowed is True
+
+        allowed, unchanged = gcra(tat, 1000.0, 6)
+        assert allowed is False
+        assert unchanged == tat
+
+        # One emission interval (10s) later exactly one more fits
+        assert gcra(tat, 1010.0, 6)[0] is True
+        assert gcra(gcra(tat, 1010.0, 6)[1], 1010.0, 6)[0] is False
+
+    def test_idle_pair_resets(self) -> None:
+        """Test a TAT in the past does not bank extra credit."""
+        allowed, tat = gcra(500.0, 1000.0, 60)
+        assert allowed is True
+        assert tat == pytest.approx(1001.0)
+
+
+class TestRateLimiter:
+    """Tests for the in-process RateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_limits_each_direction_separately(self) -> None:
+        """Test pairs are keyed by direction and counted."""
+        limiter = RateLimiter()
+
+        results = [await limiter.acquire("alpha", "beta", 2, now=0.0) for _ in range(3)]
+        assert results == [True, True, False]
+        assert await limiter.acquire("beta", "alpha", 2, now=0.0) is True
+
+        assert limiter.get_stats() == {"active_project_pairs": 2, "allowed": 3, "throttled": 1}
+        assert limiter.get_pair_stats("alpha", "beta") == {"allowed": 2, "throttled": 1}
+
+    @pytest.mark.asyncio
+    async def test_zero_limit_is_unlimited(self) -> None:
+        """Test a limit of 0 always admits."""
+        limiter = RateLimiter()
+        for _ in range(100):
+            assert await limiter.acquire("alpha", "beta", 0, now=0.0) is True
+        assert limiter.throttled == 0
+
+
+class TestRedisRateLimiter:
+    """Tests for the Redis-shared RateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_limit_is_shared_between_workers(self) -> None:
+        """Test two limiters on one Redis server share a budget."""
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+        worker_a = RedisRateLimiter(
+            client=fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+        )
+        worker_b = RedisRateLimiter(
+            client=fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+        )
+
+        assert await worker_a.acquire("alpha", "beta", 3, now=100.0) is True
+        assert await worker_b.acquire("alpha", "beta", 3, now=100.0) is True
+        assert await worker_a.acquire("alpha", "beta", 3, now=100.0) is True
+        assert await worker_b.acquire("alpha", "beta", 3, now=100.0) is False
+        assert await worker_b.acquire("alpha", "beta", 3, now=120.0) is True
+
+        assert worker_a.get_stats()["allowed"] == 2
+        assert worker_b.get_stats() == {"active_project_pairs": 1, "allowed": 2, "throttled": 1}
+
+    @pytest.mark.asyncio
+    async def test_key_expires_with_tat(self) -> None:
+        """Test idle pairs leave no state behind."""
+        fakeredis = pytest.importorskip("fakeredis")
+        client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        limiter = RedisRateLimiter(client=client)
+
+        await limiter.acquire("alpha", "beta", 60, now=100.0)
+        ttl_ms = await client.pttl("mcp_broker:ratelimit:alpha:beta")
+        assert 0 < ttl_ms <= 1000
+
+
+class TestCrossProjectRouterRateLimit:
+    """Tests for rate limiting in CrossProjectRouter."""
+
+    async def make_router(
+        self, rate_limit: int, relationship_manager: CrossProjectRelationshipManager | None = None
+    ) -> CrossProjectRouter:
+        """Create a router over two cross-project-enabled projects."""
+        registry = ProjectRegistry()
+        config = ProjectConfig(allow_cross_project=True)
+        alpha = await registry.create_project(project_id="alpha", name="Alpha", config=config)
+        await registry.create_project(project_id="beta", name="Beta", config=config)
+        alpha.cross_project_permissions.append(
+            CrossProjectPermission(target_project_id="beta", message_rate_limit=rate_limit)
+        )
+        return CrossProjectRouter(
+            registry,
+            SessionManager(storage=InMemoryStorage()),
+            relationship_manager=relationship_manager,
+        )
+
+    async def send(self, router: CrossProjectRouter) -> str | None:
+        """Send one alpha -> beta message to unknown sessions."""
+        sender_id, recipient_id = uuid4(), uuid4()
+        message = Message(
+            sender_id=sender_id,
+            recipient_id=recipient_id,
+            protocol_name="chat",
+            protocol_version="1.0.0",
+            payload={"text": "hi"},
+        )
+        result = await router.send_cross_project_message(
+            sender_id, "alpha", recipient_id, "beta", message
+        )
+        return result.error_reason
+
+    @pytest.mark.asyncio
+    async def test_permission_limit_is_enforced(self) -> None:
+        """Test the permission's limit throttles once the burst is spent."""
+        router = await self.make_router(rate_limit=2)
+
+        reasons = [await self.send(router) for _ in range(3)]
+
+        # Admitted messages fail later, on the unknown sender session
+        assert "not found" in (reasons[0] or "")
+        assert "not found" in (reasons[1] or "")
+        assert reasons[2] == "Rate limit exceeded for alpha -> beta"
+        stats = router.get_cross_project_stats()
+        assert stats["total_messages_sent"] == 2
+        assert stats["throttled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_relationship_limit_takes_precedence(self) -> None:
+        """Test the relationship's directional limit overrides the permission."""
+        relationships = CrossProjectRelationshipManager()
+        relationships.create_relationship(
+            "beta",
+            "alpha",
+            permissions_a_to_b=CrossProjectPermission(target_project_id="alpha"),
+            permissions_b_to_a=CrossProjectPermission(
+                target_project_id="beta", message_rate_limit=1
+            ),
+        )
+        router = await self.make_router(rate_limit=100, relationship_manager=relationships)
+
+        assert "not found" in (await self.send(router) or "")
+        assert await self.send(router) == "Rate limit exceeded for alpha -> beta"
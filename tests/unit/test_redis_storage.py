@@ -0,0 +1,235 @@
+"""
+Unit tests for the Redis storage backend.
+
+Tests RedisStorage against fakeredis, covering protocols, sessions,
+message queues and project isolation.
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from mcp_broker.models.message import Message
+from mcp_broker.models.protocol import ProtocolDefinition
+from mcp_broker.models.session import Session, SessionCapabilities
+from mcp_broker.storage.factory import create_storage
+from mcp_broker.storage.memory import InMemoryStorage
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from mcp_broker.storage.redis_storage import RedisStorage  # noqa: E402
+
+SAMPLE_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "properties": {"text": {"type": "string"}},
+    "required": ["text"],
+}
+
+
+def make_storage(queue_capacity: int = 100) -> RedisStorage:
+    """Create a RedisStorage bound to a fresh fakeredis server."""
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    return RedisStorage(client=client, queue_capacity=queue_capacity)
+
+
+def make_message(session_id, **payload) -> Message:
+    """Create a test message addressed to session_id."""
+    return Message(
+        sender_id=uuid4(),
+        recipient_id=session_id,
+        protocol_name="test",
+        protocol_version="1.0.0",
+        payload=payload or {"data": "test"},
+    )
+
+
+class TestRedisStorage:
+    """Tests for RedisStorage class."""
+
+    async def test_protocol_save_get_and_duplicate(self) -> None:
+        """Test saving, retrieving and rejecting duplicate protocols."""
+        storage = make_storage()
+        protocol = ProtocolDefinition(
+            name="chat_message",
+            version="1.0.0",
+            message_schema=SAMPLE_SCHEMA,
+            capabilities=["point_to_point"],
+        )
+
+        await storage.save_protocol(protocol)
+        retrieved = await storage.get_protocol("chat_message", "1.0.0")
+
+        assert retrieved == protocol
+        with pytest.raises(ValueError, match="already exists"):
+            await storage.save_protocol(protocol)
+
+    async def test_protocol_list_and_delete(self) -> None:
+        """Test filtering and deleting protocols."""
+        storage = make_storage()
+        for name, version in [("chat", "1.0.0"), ("chat", "2.0.0"), ("file_transfer", "1.0.0")]:
+            await storage.save_protocol(
+                ProtocolDefinition(name=name, version=version, message_schema=SAMPLE_SCHEMA)
+            )
+
+        assert len(await storage.list_protocols()) == 3
+        assert len(await storage.list_protocols(name="chat")) == 2
+        assert len(await storage.list_protocols(version="1.0.0")) == 2
+        assert len(await storage.list_protocols(name="chat", version="2.0.0")) == 1
+
+        assert await storage.delete_protocol("chat", "1.0.0") is True
+        assert await storage.delete_protocol("chat", "1.0.0") is False
+        assert len(await storage.list_protocols(name="chat")) == 1
+
+    async def test_session_roundtrip_and_status_filter(self) -> None:
+        """Test saving, listing and deleting sessions."""
+        storage = make_storage()
+        caps = SessionCapabilities(supported_protocols={"chat": ["1.0.0"]})
+        active = Session(status="active", capabilities=caps)
+        stale = Session(status="stale", capabilities=caps)
+
+        await storage.save_session(active)
+        await storage.save_session(stale)
+
+        retrieved = await storage.get_session(active.session_id)
+        assert retrieved is not None
+        assert retrieved.capabilities == caps
+        assert len(await storage.list_sessions()) == 2
+        assert [s.session_id for s in await storage.list_sessions(status="stale")] == [
+            stale.session_id
+        ]
+
+        assert await storage.delete_session(active.session_id) is True
+        assert await storage.delete_session(active.session_id) is False
+        assert await storage.get_session(active.session_id) is None
+
+    async def test_queue_fifo_and_partial_dequeue(self) -> None:
+        """Test queued messages come back oldest first."""
+        storage = make_storage()
+        session_id = uuid4()
+
+        for i in range(5):
+            await storage.enqueue_message(session_id, make_message(session_id, order=i))
+
+        first = await storage.dequeue_messages(session_id, limit=2)
+        assert [m.payload["order"] for m in first] == [0, 1]
+        assert await storage.get_queue_size(session_id) == 3
+
+        rest = await storage.dequeue_messages(session_id, limit=10)
+        assert [m.payload["order"] for m in rest] == [2, 3, 4]
+        assert await storage.dequeue_messages(session_id) == []
+
+    async def test_queue_capacity(self) -> None:
+        """Test enqueue rejects messages once the queue is full."""
+        storage = make_storage(queue_capacity=2)
+        session_id = uuid4()
+
+        await storage.enqueue_message(session_id, make_message(session_id))
+        await storage.enqueue_message(session_id, make_message(session_id))
+
+        with pytest.raises(ValueError, match="full"):
+            await storage.enqueue_message(session_id, make_message(session_id))
+
+    async def test_concurrent_enqueue_respects_capacity(self) -> None:
+        """Test concurrent producers never overfill a queue."""
+        storage = make_storage(queue_capacity=5)
+        session_id = uuid4()
+
+        results = await asyncio.gather(
+            *(storage.enqueue_message(session_id, make_message(session_id)) for _ in range(20)),
+            return_exceptions=True,
+        )
+
+        assert sum(1 for r in results if r is None) == 5
+        assert await storage.get_queue_size(session_id) == 5
+
+    async def test_enqueue_messages_batch(self) -> None:
+        """Test batch enqueue accepts items until each queue is full."""
+        storage = make_storage(queue_capacity=2)
+        first, second = uuid4(), uuid4()
+        items = [(first, make_message(first, order=i)) for i in range(3)]
+        items.append((second, make_message(second)))
+
+        assert await storage.enqueue_messages(items) == [True, True, False, True]
+        assert await storage.get_queue_size(first) == 2
+        assert await storage.get_queue_size(second) == 1
+        assert await storage.enqueue_messages([]) == []
+
+    async def test_session_queue_size_reflects_queue(self) -> None:
+        """Test loaded sessions report their live queue length."""
+        storage = make_storage()
+        session = Session()
+        await storage.save_session(session)
+
+        await storage.enqueue_message(session.session_id, make_message(session.session_id))
+        await storage.enqueue_message(session.session_id, make_message(session.session_id))
+
+        loaded = await storage.get_session(session.session_id)
+        assert loaded is not None
+        assert loaded.queue_size == 2
+        assert (await storage.list_sessions())[0].queue_size == 2
+
+        assert await storage.clear_queue(session.session_id) == 2
+        loaded = await storage.get_session(session.session_id)
+        assert loaded is not None
+        assert loaded.queue_size == 0
+
+    async def test_shared_server_between_instances(self) -> None:
+        """Test two storage instances on one server see the same data."""
+        server = fakeredis.FakeServer()
+        worker_a = RedisStorage(
+            client=fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+        )
+        worker_b = RedisStorage(
+            client=fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+        )
+
+        session = Session()
+        await worker_a.save_session(session)
+        await worker_a.enqueue_message(session.session_id, make_message(session.session_id))
+
+        assert await worker_b.get_session(session.session_id) is not None
+        assert len(await worker_b.dequeue_messages(session.session_id)) == 1
+        assert await worker_a.get_queue_size(session.session_id) == 0
+
+    async def test_project_isolation(self) -> None:
+        """Test data in one project is invisible from another."""
+        storage = make_storage()
+        session = Session(project_id="alpha")
+
+        await storage.save_session(session, "alpha")
+        await storage.enqueue_message(session.session_id, make_message(session.session_id), "alpha")
+
+        assert await storage.get_session(session.session_id, "beta") is None
+        assert await storage.list_sessions(project_id="beta") == []
+        assert await storage.get_queue_size(session.session_id, "beta") == 0
+        assert await storage.get_queue_size(session.session_id, "alpha") == 1
+
+
+class TestCreateStorage:
+    """Tests for storage backend selection."""
+
+    def test_memory_backend(self) -> None:
+        """Test the memory backend is built by default."""
+        storage = create_storage(queue_capacity=7)
+
+        assert isinstance(storage, InMemoryStorage)
+        assert storage.queue_capacity == 7
+
+    def test_redis_backend_requires_url(self) -> None:
+        """Test the redis backend needs a URL."""
+        with pytest.raises(ValueError, match="redis_url"):
+            create_storage("redis")
+
+    def test_redis_backend(self) -> None:
+        """Test the redis backend is built from a URL."""
+        storage = create_storage("redis", queue_capacity=5, redis_url="redis://localhost:6379/0")
+
+        assert isinstance(storage, RedisStorage)
+        assert storage.queue_capacity == 5
+
+    def test_unknown_backend(self) -> None:
+        """Test unknown backends are rejected."""
+        with pytest.raises(ValueError, match="Unknown storage backend"):
+            create_storage("etcd")
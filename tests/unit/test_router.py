@@ -5,9 +5,11 @@ Tests point-to-point and broadcast message delivery,
 queuing, and error handling.
 """
 
-import pytest
+import asyncio
 from uuid import uuid4
 
+import pytest
+
 from mcp_broker.models.message import Message
 from mcp_broker.models.session import Session, SessionCapabilities
 from mcp_broker.routing.router import MessageRouter
@@ -223,5 +225,275 @@ class TestMessageRouter:
         assert result2.error_reason == "Queue full"
 
         # Check dead letter queue
-        dlq = router.get_dead_letter_queue()
+        dlq = await router.get_dead_letter_queue()
         assert len(dlq) > 0
+
+
+class TestBroadcastFanOut:
+    """Tests for the bulk broadcast fan-out path."""
+
+    @staticmethod
+    async def _setup(queue_capacity: int = 100):
+        storage = InMemoryStorage(queue_capacity=queue_capacity)
+        manager = SessionManager(storage, queue_capacity=queue_capacity)
+        router = MessageRouter(manager, storage)
+        sender = await manager.create_session(
+            SessionCapabilities(supported_protocols={"chat_message": ["1.0.0", "1.1.0"]})
+        )
+        return storage, manager, router, sender
+
+    async def test_broadcast_shares_payload_and_batches(self) -> None:
+        """Test every recipient gets its own envelope around one shared payload."""
+        storage, manager, router, sender = await self._setup()
+        recipients = [
+            await manager.create_session(
+                SessionCapabilities(supported_protocols={"chat_message": ["1.1.0"]})
+            )
+            for _ in range(3)
+        ]
+        incompatible = await manager.create_session(
+            SessionCapabilities(supported_protocols={"chat_message": ["2.0.0"]})
+        )
+        message = Message(
+            sender_id=sender.session_id,
+            protocol_name="chat_message",
+            protocol_version="1.1.0",
+            payload={"text": "hello"},
+        )
+
+        result = await router.broadcast_message(sender.session_id, message)
+
+        assert result.success is True
+        assert result.delivery_count == 3
+        assert set(result.recipients["delivered"]) == {r.session_id for r in recipients}
+        assert result.recipients["failed"] == []
+        assert set(result.recipients["skipped"]) == {incompatible.session_id, sender.session_id}
+        assert result.duration_ms is not None and result.duration_ms >= 0
+
+        for recipient in recipients:
+            (queued,) = await storage.dequeue_messages(recipient.session_id)
+            assert queued.recipient_id == recipient.session_id
+            assert queued.message_id == message.message_id
+            assert queued.payload is message.payload
+
+        stats = router.get_project_statistics("default")
+        assert stats["total_broadcast"] == 1
+        assert stats["total_delivered"] == 3
+        assert stats["last_broadcast_ms"] == result.duration_ms
+
+    async def test_broadcast_reports_full_queues_as_failed(self) -> None:
+        """Test recipients with full queues are reported as failed."""
+        storage, manager, router, sender = await self._setup(queue_capacity=1)
+        full = await manager.create_session(
+            SessionCapabilities(supported_protocols={"chat_message": ["1.0.0"]})
+        )
+        ok = await manager.create_session(
+            SessionCapabilities(supported_protocols={"chat_message": ["1.0.0"]})
+        )
+        await storage.enqueue_message(
+            full.session_id,
+            Message(
+                sender_id=sender.session_id,
+                protocol_name="chat_message",
+                protocol_version="1.0.0",
+                payload={"text": "earlier"},
+            ),
+        )
+
+        result = await router.broadcast_message(
+            sender.session_id,
+            Message(
+                sender_id=sender.session_id,
+                protocol_name="chat_message",
+                protocol_version="1.0.0",
+                payload={"text": "hello"},
+            ),
+        )
+
+        assert result.recipients["delivered"] == [ok.session_id]
+        assert result.recipients["failed"] == [full.session_id]
+        assert router.get_project_statistics("default")["total_failed"] == 1
+
+    async def test_broadcast_wakes_stream_consumers(self) -> None:
+        """Test broadcast recipients waiting on their queue are woken."""
+        _, manager, router, sender = await self._setup()
+        recipient = await manager.create_session(
+            SessionCapabilities(supported_protocols={"chat_message": ["1.0.0"]})
+        )
+        waiter = asyncio.create_task(manager.wait_for_messages(recipient.session_id, timeout=5))
+        await asyncio.sleep(0)
+
+        await router.broadcast_message(
+            sender.session_id,
+            Message(
+                sender_id=sender.session_id,
+                protocol_name="chat_message",
+                protocol_version="1.0.0",
+                payload={"text": "hello"},
+            ),
+        )
+
+        assert await asyncio.wait_for(waiter, timeout=1) is True
+
+
+class TestDeadLetterReplay:
+    """Tests for dead-letter paging and replay."""
+
+    @staticmethod
+    async def _fill(router: MessageRouter, manager: SessionManager, count: int):
+        caps = SessionCapabilities(supported_protocols={"chat_message": ["1.0.0"]})
+        sender = await manager.create_session(caps)
+        recipient = await manager.create_session(caps)
+        await manager.disconnect_session(recipient.session_id)
+
+        for n in range(count):
+            await router.send_message(
+                sender.session_id,
+                recipient.session_id,
+                Message(
+                    sender_id=sender.session_id,
+                    protocol_name="chat_message",
+                    protocol_version="1.0.0",
+                    payload={"n": n},
+                ),
+            )
+        return sender, recipient
+
+    async def test_dead_letters_are_bounded_and_paged(self, tmp_path) -> None:
+        """Test overflow spills to disk and pages come back oldest first."""
+        storage = InMemoryStorage(queue_capacity=1)
+        manager = SessionManager(storage, queue_capacity=1)
+        router = MessageRouter(manager, storage, dead_letter_capacity=2, dead_letter_dir=tmp_path)
+
+        await self._fill(router, manager, 5)
+
+        assert router.dead_letters.size("default") == 4
+        page = await router.get_dead_letter_queue("default", offset=1, limit=2)
+        assert [e["message"]["payload"]["n"] for e in page] == [2, 3]
+        assert len(await router.get_dead_letter_queue()) == 4
+
+    async def test_replay_delivers_when_queue_has_room(self) -> None:
+        """Test replay re-sends in order and keeps what still does not fit."""
+        storage = InMemoryStorage(queue_capacity=2)
+        manager = SessionManager(storage, queue_capacity=2)
+        router = MessageRouter(manager, storage)
+        _, recipient = await self._fill(router, manager, 5)
+
+        result = await router.replay_dead_letters()
+        assert result == {"replayed": 0, "retained": 3, "discarded": 0, "remaining": 3}
+
+        await manager.dequeue_messages(recipient.session_id, limit=2)
+        result = await router.replay_dead_letters()
+
+        assert result["replayed"] == 2
+        assert result["remaining"] == 1
+        queued = await manager.dequeue_messages(recipient.session_id, limit=10)
+        assert [m.payload["n"] for m in queued] == [2, 3]
+        remaining = await router.get_dead_letter_queue("default")
+        assert [e["message"]["payload"]["n"] for e in remaining] == [4]
+
+    async def test_replay_keeps_entries_when_queue_fills_during_send(self) -> None:
+        """Test a queue filled after the capacity check keeps entries in order."""
+        storage = InMemoryStorage(queue_capacity=2)
+        manager = SessionManager(storage, queue_capacity=2)
+        router = MessageRouter(manager, storage)
+        sender, recipient = await self._fill(router, manager, 5)
+        await manager.dequeue_messages(recipient.session_id, limit=2)
+
+        has_capacity = manager.has_queue_capacity
+
+        async def capacity_then_fill(session_id, project_id="default") -> bool:
+            ok = await has_capacity(session_id, project_id)
+            while await has_capacity(session_id, project_id):
+                await manager.enqueue_message(
+                    session_id,
+                    Message(
+                        sender_id=sender.session_id,
+                        protocol_name="chat_message",
+                        protocol_version="1.0.0",
+                        payload={"n": -1},
+                    ),
+                    project_id,
+                )
+            return ok
+
+        manager.has_queue_capacity = capacity_then_fill  # type: ignore[method-assign]
+        result = await router.replay_dead_letters()
+
+        assert result == {"replayed": 0, "retained": 3, "discarded": 0, "remaining": 3}
+        remaining = await router.get_dead_letter_queue("default")
+        assert [e["message"]["payload"]["n"] for e in remaining] == [2, 3, 4]
+
+
+class TestSendBatch:
+    """Tests for batched point-to-point sends."""
+
+    @staticmethod
+    def _message(sender: Session, recipient: Session, n: int, version: str = "1.0.0") -> Message:
+        return Message(
+            sender_id=sender.session_id,
+            recipient_id=recipient.session_id,
+            protocol_name="chat_message",
+            protocol_version=version,
+            payload={"n": n},
+        )
+
+    async def test_batch_delivers_in_order_with_per_item_results(self) -> None:
+        """Test one batch reaches several recipients and reports each item."""
+        storage = InMemoryStorage(queue_capacity=2)
+        manager = SessionManager(storage, queue_capacity=2)
+        router = MessageRouter(manager, storage)
+        caps = SessionCapabilities(supported_protocols={"chat_message": ["1.0.0"]})
+        sender = await manager.create_session(caps)
+        a = await manager.create_session(caps)
+        b = await manager.create_session(caps)
+        incompatible = await manager.create_session(
+            SessionCapabilities(supported_protocols={"chat_message": ["2.0.0"]})
+        )
+        b.status = "disconnected"
+        await storage.save_session(b)
+
+        items = [
+            self._message(sender, a, 1),
+            self._message(sender, b, 2),
+            self._message(sender, a, 3),
+            self._message(sender, incompatible, 4),
+            self._message(sender, a, 5),
+        ]
+        results = await router.send_batch(sender.session_id, [(m.recipient_id, m) for m in items])
+
+        assert [r.message_id for r in results] == [m.message_id for m in items]
+        assert [r.success for r in results] == [True, True, True, False, False]
+        assert results[1].queued is True
+        assert "Protocol mismatch" in results[3].error_reason
+        assert results[4].error_reason == "Queue full"
+        queued = await manager.dequeue_messages(a.session_id, limit=10)
+        assert [m.payload["n"] for m in queued] == [1, 3]
+
+        stats = router.get_project_statistics("default")
+        assert stats["total_sent"] == 5
+        assert stats["total_delivered"] == 2
+        assert stats["total_queued"] == 1
+        assert stats["total_failed"] == 2
+
+    async def test_batch_from_unknown_sender_fails_every_item(self) -> None:
+        """Test an unknown sender fails the whole batch without enqueuing."""
+        storage = InMemoryStorage()
+        manager = SessionManager(storage)
+        router = MessageRouter(manager, storage)
+        recipient = await manager.create_session(
+            SessionCapabilities(supported_protocols={"chat_message": ["1.0.0"]})
+        )
+        ghost = Session(
+            session_id=uuid4(),
+            capabilities=SessionCapabilities(supported_protocols={"chat_message": ["1.0.0"]}),
+        )
+
+        results = await router.send_batch(
+            ghost.session_id,
+            [(recipient.session_id, self._message(ghost, recipient, n)) for n in range(2)],
+        )
+
+        assert [r.success for r in results] == [False, False]
+        assert "not found" in results[0].error_reason
+        assert await storage.get_queue_size(recipient.session_id) == 0
@@ -5,6 +5,7 @@ Tests session creation, heartbeat monitoring,
 message queuing, and disconnection.
 """
 
+import asyncio
 from uuid import uuid4
 
 from mcp_broker.models.message import Message
@@ -384,3 +385,209 @@ class TestSessionManager:
         # First session should be disconnected
         retrieved1 = await manager.get_session(session_id)
         assert retrieved1.status == "active"  # New session is active
+
+
+class TestMessageStreaming:
+    """Tests for push-based message delivery."""
+
+    @staticmethod
+    def _message(recipient_id, order: int = 0) -> Message:
+        return Message(
+            sender_id=uuid4(),
+            recipient_id=recipient_id,
+            protocol_name="chat",
+            protocol_version="1.0.0",
+            payload={"order": order},
+        )
+
+    async def test_wait_for_messages_wakes_on_enqueue(self) -> None:
+        """Test a waiting consumer is woken as soon as a message lands."""
+        manager = SessionManager(InMemoryStorage())
+        session = await manager.create_session(SessionCapabilities())
+
+        waiter = asyncio.create_task(manager.wait_for_messages(session.session_id, timeout=5))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await manager.enqueue_message(session.session_id, self._message(session.session_id))
+
+        assert await asyncio.wait_for(waiter, timeout=1) is True
+
+    async def test_wait_for_messages_timeout(self) -> None:
+        """Test waiting on an empty queue times out."""
+        manager = SessionManager(InMemoryStorage())
+        session = await manager.create_session(SessionCapabilities())
+
+        assert await manager.wait_for_messages(session.session_id, timeout=0.01) is False
+
+    async def test_stream_drains_in_batches(self) -> None:
+        """Test the stream yields queued messages in batches."""
+        manager = SessionManager(InMemoryStorage())
+        session = await manager.create_session(SessionCapabilities())
+        for i in range(5):
+            await manager.enqueue_message(session.session_id, self._message(session.session_id, i))
+
+        stream = manager.stream_messages(session.session_id, batch_size=3, idle_timeout=0.01)
+
+        first = await anext(stream)
+        second = await anext(stream)
+        assert [m.payload["order"] for m in first] == [0, 1, 2]
+        assert [m.payload["order"] for m in second] == [3, 4]
+        assert await anext(stream) == []
+        await stream.aclose()
+
+    async def test_stream_ends_on_disconnect(self) -> None:
+        """Test the stream finishes when its session disconnects."""
+        manager = SessionManager(InMemoryStorage())
+        session = await manager.create_session(SessionCapabilities())
+
+        async def consume() -> list[list[Message]]:
+            return [
+                batch async for batch in manager.stream_messages(session.session_id, idle_timeout=5)
+            ]
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        await manager.enqueue_message(session.session_id, self._message(session.session_id))
+        await asyncio.sleep(0)
+        await manager.disconnect_session(session.session_id)
+
+        batches = await asyncio.wait_for(consumer, timeout=1)
+        assert [len(b) for b in batches if b] == [1]
+
+    async def test_wake_up_signals_are_dropped_after_last_waiter(self) -> None:
+        """Test per-queue signals do not outlive their waiters."""
+        manager = SessionManager(InMemoryStorage())
+        session = await manager.create_session(SessionCapabilities())
+
+        waiters = [
+            asyncio.create_task(manager.wait_for_messages(session.session_id, timeout=5))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        assert len(manager._message_signals) == 1
+
+        await manager.enqueue_message(session.session_id, self._message(session.session_id))
+        assert await asyncio.wait_for(asyncio.gather(*waiters), timeout=1) == [True, True]
+        assert manager._message_signals == {}
+        assert manager._message_waiters == {}
+
+        await manager.dequeue_messages(session.session_id)
+        assert await manager.wait_for_messages(session.session_id, timeout=0.01) is False
+        assert manager._message_signals == {}
+        assert manager._message_waiters == {}
+
+
+class TestLivenessDeadlines:
+    """Tests for deadline-ordered liveness tracking."""
+
+    async def test_expire_sessions_applies_due_deadlines(self) -> None:
+        """Test sessions go stale then disconnect at their own deadlines."""
+        manager = SessionManager(InMemoryStorage(), stale_threshold=30, disconnect_threshold=60)
+        session = await manager.create_session(SessionCapabilities())
+        heartbeat = session.last_heartbeat.timestamp()
+
+        assert manager.next_liveness_deadline() == heartbeat + 30
+        assert await manager.expire_sessions(now=heartbeat + 29) == ([], [])
+
+        stale, disconnected = await manager.expire_sessions(now=heartbeat + 30)
+        assert [s.session_id for s in stale] == [session.session_id]
+        assert disconnected == []
+
+        stale, disconnected = await manager.expire_sessions(now=heartbeat + 60)
+        assert stale == []
+        assert [s.session_id for s in disconnected] == [session.session_id]
+        assert (await manager.get_session(session.session_id)).status == "disconnected"
+        assert manager.next_liveness_deadline() is None
+
+    async def test_heartbeat_supersedes_pending_deadlines(self) -> None:
+        """Test a newer heartbeat invalidates the earlier deadlines."""
+        manager = SessionManager(InMemoryStorage(), stale_threshold=30, disconnect_threshold=60)
+        session = await manager.create_session(SessionCapabilities())
+        first = session.last_heartbeat.timestamp()
+
+        await asyncio.sleep(0.01)
+        updated = await manager.update_heartbeat(session.session_id)
+        second = updated.last_heartbeat.timestamp()
+
+        assert await manager.expire_sessions(now=first + 30) == ([], [])
+        stale, _ = await manager.expire_sessions(now=second + 30)
+        assert [s.session_id for s in stale] == [session.session_id]
+
+    async def test_deadlines_span_projects(self) -> None:
+        """Test one tick expires sessions from every project."""
+        manager = SessionManager(InMemoryStorage(), stale_threshold=1)
+        alpha = await manager.create_session(SessionCapabilities(), project_id="alpha")
+        beta = await manager.create_session(SessionCapabilities(), project_id="beta")
+
+        stale, _ = await manager.expire_sessions(now=beta.last_heartbeat.timestamp() + 1)
+
+        assert {s.session_id for s in stale} == {alpha.session_id, beta.session_id}
+
+    async def test_explicit_disconnect_stops_tracking(self) -> None:
+        """Test disconnected sessions are skipped when their deadline fires."""
+        manager = SessionManager(InMemoryStorage(), stale_threshold=1)
+        session = await manager.create_session(SessionCapabilities())
+        await manager.disconnect_session(session.session_id)
+
+        assert await manager.expire_sessions(now=session.last_heartbeat.timestamp() + 120) == (
+            [],
+            [],
+        )
+
+    async def test_heap_is_compacted(self) -> None:
+        """Test superseded entries do not accumulate without bound."""
+        manager = SessionManager(InMemoryStorage())
+        session = await manager.create_session(SessionCapabilities())
+
+        for _ in range(200):
+            await manager.update_heartbeat(session.session_id)
+
+        assert len(manager._liveness_heap) <= 4 + 64 + 2
+
+    async def test_monitor_marks_stale_promptly(self) -> None:
+        """Test the monitor wakes at the deadline rather than a fixed interval."""
+        manager = SessionManager(InMemoryStorage(), stale_threshold=1)
+        monitor = asyncio.create_task(manager.run_liveness_monitor(max_interval=60.0))
+        try:
+            await asyncio.sleep(0)
+            session = await manager.create_session(SessionCapabilities())
+            await asyncio.sleep(1.2)
+
+            assert (await manager.get_session(session.session_id)).status == "stale"
+        finally:
+            monitor.cancel()
+
+    async def test_track_sessions_loads_stored_sessions(self) -> None:
+        """Test sessions from before a restart get liveness deadlines."""
+        storage = InMemoryStorage()
+        session = await SessionManager(storage).create_session(
+            SessionCapabilities(), project_id="alpha"
+        )
+        manager = SessionManager(storage, stale_threshold=30)
+        assert manager.next_liveness_deadline() is None
+
+        assert await manager.track_sessions(["default", "alpha"]) == 1
+        assert await manager.track_sessions(["default", "alpha"]) == 0
+
+        stale, _ = await manager.expire_sessions(now=session.last_heartbeat.timestamp() + 30)
+        assert [s.session_id for s in stale] == [session.session_id]
+
+    async def test_monitor_resyncs_stored_sessions(self) -> None:
+        """Test the monitor picks up sessions saved by another process."""
+        storage = InMemoryStorage()
+        manager = SessionManager(storage, stale_threshold=1)
+        monitor = asyncio.create_task(
+            manager.run_liveness_monitor(
+                max_interval=0.1, project_ids=lambda: ["alpha"], resync_interval=0.1
+            )
+        )
+        try:
+            await asyncio.sleep(0)
+            other = SessionManager(storage)
+            session = await other.create_session(SessionCapabilities(), project_id="alpha")
+            await asyncio.sleep(1.3)
+
+            assert (await manager.get_session(session.session_id, "alpha")).status == "stale"
+        finally:
+            monitor.cancel()
@@ -0,0 +1,143 @@
+"""
+Unit tests for status board subscriptions.
+
+Tests SubscriptionIndex matching and filter validation, and that
+StatusWebSocketHandler only sends events to matching subscribers and
+applies filter changes live.
+"""
+
+import json
+
+import pytest
+
+from communication_server.websocket.status_handler import StatusWebSocketHandler
+from communication_server.websocket.subscriptions import SubscriptionIndex
+
+
+class FakeWebSocket:
+    """WebSocket stand-in that records what it is sent."""
+
+    def __init__(self) -> None:
+        self.sent: list[dict] = []
+
+    async def send_text(self, data: str) -> None:
+        self.sent.append(json.loads(data))
+
+    async def send_json(self, data: dict) -> None:
+        self.sent.append(data)
+
+
+class TestSubscriptionIndex:
+    """Tests for SubscriptionIndex."""
+
+    def test_unfiltered_subscriber_matches_everything(self) -> None:
+        """Test a subscriber without filters gets every event."""
+        index = SubscriptionIndex()
+        ws = object()
+        index.subscribe(ws)
+
+        assert index.match("agent_status_change", agent_ids=["a1"]) == {ws}
+        assert index.match("project_archived", project_id="p1") == {ws}
+
+    def test_filters_combine_across_dimensions(self) -> None:
+        """Test every filter a subscriber set must match the event."""
+        index = SubscriptionIndex()
+        project_dashboard, agent_watcher, status_only = object(), object(), object()
+        index.subscribe(project_dashboard, {"project_ids": ["p1"]})
+        index.subscribe(agent_watcher, {"agent_ids": ["a1", "a2"]})
+        index.subscribe(status_only, {"event_types": "agent_status_change"})
+
+        assert index.match("project_message", project_id="p1", agent_ids=["a9"]) == {
+            project_dashboard
+        }
+        assert index.match("project_message", project_id="p2", agent_ids=["a2"]) == {agent_watcher}
+        # Events without a project never reach project-filtered subscribers
+        assert index.match("agent_status_change", agent_ids=["a1"]) == {
+            agent_watcher,
+            status_only,
+        }
+        assert index.match("agent_status_change", agent_ids=["a3"]) == {status_only}
+
+    def test_resubscribe_replaces_filters(self) -> None:
+        """Test subscribing again replaces the old filters."""
+        index = SubscriptionIndex()
+        ws = object()
+        index.subscribe(ws, {"project_ids": ["p1"]})
+        index.subscribe(ws, {"project_ids": ["p2"]})
+
+        assert index.match("project_message", project_id="p1") == set()
+        assert index.match("project_message", project_id="p2") == {ws}
+        assert index.get_filters(ws) == {"project_ids": ["p2"]}
+
+        index.unsubscribe(ws)
+        assert len(index) == 0
+        assert index.match("project_message", project_id="p2") == set()
+
+    @pytest.mark.parametrize(
+        "filters",
+        [["p1"], {"projects": ["p1"]}, {"project_ids": [1]}, {"agent_ids": {"a": 1}}],
+    )
+    def test_invalid_filters_rejected(self, filters: object) -> None:
+        """Test malformed filters raise ValueError and leave state unchanged."""
+        index = SubscriptionIndex()
+        ws = object()
+        index.subscribe(ws, {"project_ids": ["p1"]})
+
+        with pytest.raises(ValueError):
+            index.subscribe(ws, filters)  # type: ignore[arg-type]
+        assert index.get_filters(ws) == {"project_ids": ["p1"]}
+
+
+class TestStatusHandlerRouting:
+    """Tests for filtered status board broadcasts."""
+
+    async def test_events_reach_only_matching_subscribers(self) -> None:
+        """Test events only reach subscribers whose filters they match."""
+        handler = StatusWebSocketHandler(None)  # type: ignore[arg-type]
+        everything, project, agent = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+        handler._subscriptions.subscribe(everything)
+        handler._subscriptions.subscribe(project, {"project_ids": ["p1"]})
+        handler._subscriptions.subscribe(agent, {"agent_ids": ["a1"]})
+
+        await handler.broadcast_event({"type": "project_archived", "project_id": "p2", "data": {}})
+        await handler.broadcast_event(
+            {"type": "project_message", "project_id": "p1", "data": {"from_agent": "a9"}}
+        )
+        await handler.broadcast_new_communication("a1", "a2", "request")
+
+        assert [m["type"] for m in everything.sent] == [
+            "project_archived",
+            "project_message",
+            "new_communication",
+        ]
+        assert [m["type"] for m in project.sent] == ["project_message"]
+        assert [m["type"] for m in agent.sent] == ["new_communication"]
+
+    async def test_subscribe_message_changes_filters_live(self) -> None:
+        """Test a subscribe message narrows later broadcasts."""
+        handler = StatusWebSocketHandler(None)  # type: ignore[arg-type]
+        ws = FakeWebSocket()
+        handler._subscriptions.subscribe(ws)
+
+        await handler._handle_client_message(
+            ws, json.dumps({"type": "subscribe", "filters": {"agent_ids": ["a1"]}}), None
+        )
+        await handler.broadcast_agent_status_change("a2", "online", "offline")
+        await handler.broadcast_agent_status_change("a1", "online", "offline")
+
+        assert ws.sent[0]["type"] == "subscribed"
+        assert ws.sent[0]["filters"] == {"agent_ids": ["a1"]}
+        assert [m["data"]["agent_id"] for m in ws.sent[1:]] == ["a1"]
+
+    async def test_invalid_subscribe_keeps_filters(self) -> None:
+        """Test a malformed subscribe gets an error and changes nothing."""
+        handler = StatusWebSocketHandler(None)  # type: ignore[arg-type]
+        ws = FakeWebSocket()
+        handler._subscriptions.subscribe(ws, {"agent_ids": ["a1"]})
+
+        await handler._handle_client_message(
+            ws, json.dumps({"type": "subscribe", "filters": {"rooms": ["r1"]}}), None
+        )
+
+        assert ws.sent[0]["type"] == "error"
+        assert handler._subscriptions.get_filters(ws) == {"agent_ids": ["a1"]}
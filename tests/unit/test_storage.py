@@ -5,15 +5,16 @@ Tests the InMemoryStorage implementation for protocol,
 session, and message queue operations.
 """
 
-import pytest
+from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
-from mcp_broker.models.message import Message
+import pytest
+
+from mcp_broker.models.message import Message, MessageHeaders
 from mcp_broker.models.protocol import ProtocolDefinition
 from mcp_broker.models.session import Session, SessionCapabilities
 from mcp_broker.storage.memory import InMemoryStorage
 
-
 # Sample schema for testing
 SAMPLE_SCHEMA = {
     "$schema": "http://json-schema.org/draft-07/schema#",
@@ -381,3 +382,149 @@ class TestInMemoryStorage:
 
         assert await storage.get_queue_size(session1_id) == 0
         assert await storage.get_queue_size(session2_id) == 1
+
+    async def test_session_status_index_follows_updates(self) -> None:
+        """Test status listings reflect in-place status changes once saved."""
+        storage = InMemoryStorage()
+
+        session = Session(session_id=uuid4(), status="active")
+        await storage.save_session(session)
+        assert await storage.list_sessions(status="active") == [session]
+
+        session.status = "stale"
+        await storage.save_session(session)
+
+        assert await storage.list_sessions(status="active") == []
+        assert await storage.list_sessions(status="stale") == [session]
+        assert await storage.list_sessions() == [session]
+
+    async def test_session_indexes_cleared_on_delete(self) -> None:
+        """Test deleted sessions disappear from all listings."""
+        storage = InMemoryStorage()
+
+        session = Session(session_id=uuid4(), status="active")
+        await storage.save_session(session)
+        await storage.delete_session(session.session_id)
+
+        assert await storage.list_sessions() == []
+        assert await storage.list_sessions(status="active") == []
+        assert storage._project_sessions == {}
+        assert storage._status_sessions == {}
+
+    async def test_listings_scoped_to_project_index(self) -> None:
+        """Test listings only return entries from the requested project."""
+        storage = InMemoryStorage()
+
+        session_a = Session(session_id=uuid4(), project_id="alpha")
+        session_b = Session(session_id=uuid4(), project_id="beta")
+        await storage.save_session(session_a, "alpha")
+        await storage.save_session(session_b, "beta")
+
+        for project_id, version in [("alpha", "1.0.0"), ("beta", "1.0.0"), ("beta", "2.0.0")]:
+            await storage.save_protocol(
+                ProtocolDefinition(name="chat", version=version, message_schema=SAMPLE_SCHEMA),
+                project_id,
+            )
+
+        assert await storage.list_sessions(status="active", project_id="alpha") == [session_a]
+        assert len(await storage.list_protocols(project_id="beta")) == 2
+        assert len(await storage.list_protocols(version="1.0.0", project_id="beta")) == 1
+
+        await storage.delete_protocol("chat", "1.0.0", "beta")
+        assert [p.version for p in await storage.list_protocols(project_id="beta")] == ["2.0.0"]
+        assert len(await storage.list_protocols(project_id="alpha")) == 1
+
+    async def test_enqueue_messages_batch(self) -> None:
+        """Test batch enqueue accepts items until each queue is full."""
+        storage = InMemoryStorage(queue_capacity=2)
+
+        session = Session(session_id=uuid4())
+        await storage.save_session(session)
+        other_id = uuid4()
+
+        def make(recipient_id, order: int) -> Message:
+            return Message(
+                sender_id=uuid4(),
+                recipient_id=recipient_id,
+                protocol_name="test",
+                protocol_version="1.0.0",
+                payload={"order": order},
+            )
+
+        items = [(session.session_id, make(session.session_id, i)) for i in range(3)]
+        items.append((other_id, make(other_id, 0)))
+
+        assert await storage.enqueue_messages(items) == [True, True, False, True]
+        assert session.queue_size == 2
+        assert await storage.get_queue_size(other_id) == 1
+
+
+class TestPriorityAndTTLQueues:
+    """Tests for priority ordering and message expiry in session queues."""
+
+    @staticmethod
+    def make(n: int, priority: str = "normal", ttl: int | None = None, age: float = 0) -> Message:
+        return Message(
+            sender_id=uuid4(),
+            protocol_name="test",
+            protocol_version="1.0.0",
+            payload={"n": n},
+            headers=MessageHeaders(priority=priority, ttl=ttl),
+            timestamp=datetime.now(UTC) - timedelta(seconds=age),
+        )
+
+    async def test_urgent_messages_dequeue_first(self) -> None:
+        """Test priority lanes drain most urgent first, FIFO within a lane."""
+        storage = InMemoryStorage()
+        session_id = uuid4()
+        for n, priority in enumerate(["low", "normal", "urgent", "high", "normal", "urgent"]):
+            await storage.enqueue_message(session_id, self.make(n, priority))
+
+        first = await storage.dequeue_messages(session_id, limit=3)
+        rest = await storage.dequeue_messages(session_id, limit=10)
+
+        assert [m.payload["n"] for m in first] == [2, 5, 3]
+        assert [m.payload["n"] for m in rest] == [1, 4, 0]
+
+    async def test_expired_messages_are_skipped_on_dequeue(self) -> None:
+        """Test expired messages are dropped lazily and never returned."""
+        storage = InMemoryStorage()
+        session_id = uuid4()
+        await storage.enqueue_message(session_id, self.make(0, ttl=60))
+        await storage.enqueue_message(session_id, self.make(1))
+        await storage.enqueue_message(session_id, self.make(2, ttl=1, age=5))
+
+        messages = await storage.dequeue_messages(session_id, limit=10)
+
+        assert [m.payload["n"] for m in messages] == [0, 1]
+        assert await storage.get_queue_size(session_id) == 0
+
+    async def test_expired_messages_free_capacity(self) -> None:
+        """Test the expiry index reclaims capacity before a queue-full check."""
+        storage = InMemoryStorage(queue_capacity=2)
+        session = Session(session_id=uuid4())
+        await storage.save_session(session)
+
+        await storage.enqueue_message(session.session_id, self.make(0, ttl=1, age=5))
+        await storage.enqueue_message(session.session_id, self.make(1, ttl=1, age=5))
+        await storage.enqueue_message(session.session_id, self.make(2))
+
+        assert await storage.get_queue_size(session.session_id) == 1
+        assert session.queue_size == 1
+        assert [m.payload["n"] for m in await storage.dequeue_messages(session.session_id)] == [2]
+
+    async def test_evict_expired_messages(self) -> None:
+        """Test proactive eviction counts only due messages."""
+        storage = InMemoryStorage()
+        session_id = uuid4()
+        await storage.enqueue_messages(
+            [
+                (session_id, self.make(0, ttl=1, age=5)),
+                (session_id, self.make(1, ttl=3600)),
+                (session_id, self.make(2)),
+            ]
+        )
+
+        assert await storage.evict_expired_messages() == 1
+        assert await storage.evict_expired_messages() == 0
+        assert await storage.get_queue_size(session_id) == 2
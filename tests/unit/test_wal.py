@@ -0,0 +1,159 @@
+"""
+Unit tests for the message queue write-ahead log.
+
+Tests recovery of InMemoryStorage queues across restarts, group commit,
+torn-write handling and segment compaction.
+"""
+
+import asyncio
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from mcp_broker.models.message import Message, MessageHeaders
+from mcp_broker.storage.memory import InMemoryStorage
+from mcp_broker.storage.wal import MessageQueueWAL
+
+
+def make_message(n: int, priority: str = "normal") -> Message:
+    """Create a numbered test message."""
+    return Message(
+        sender_id=uuid4(),
+        protocol_name="test",
+        protocol_version="1.0.0",
+        payload={"n": n},
+        headers=MessageHeaders(priority=priority),
+    )
+
+
+def segments(directory: Path) -> list[str]:
+    """List segment file names in log order."""
+    return sorted(path.name for path in directory.glob("wal-*.log"))
+
+
+class TestMessageQueueWAL:
+    """Tests for MessageQueueWAL with InMemoryStorage."""
+
+    async def test_queues_survive_restart(self, tmp_path: Path) -> None:
+        """Test enqueues, dequeues and clears are replayed on startup."""
+        storage = InMemoryStorage(wal_dir=tmp_path, wal_fsync=False)
+        first, second, cleared = uuid4(), uuid4(), uuid4()
+
+        for n in range(5):
+            await storage.enqueue_message(first, make_message(n))
+        await storage.enqueue_messages([(second, make_message(10)), (cleared, make_message(20))])
+        await storage.dequeue_messages(first, limit=2)
+        await storage.clear_queue(cleared)
+        await storage.close()
+
+        restarted = InMemoryStorage(wal_dir=tmp_path, wal_fsync=False)
+
+        assert await restarted.get_queue_size(first) == 3
+        assert [m.payload["n"] for m in await restarted.dequeue_messages(first)] == [2, 3, 4]
+        assert [m.payload["n"] for m in await restarted.dequeue_messages(second)] == [10]
+        assert await restarted.get_queue_size(cleared) == 0
+
+    async def test_projects_are_recovered_separately(self, tmp_path: Path) -> None:
+        """Test recovered queues keep their project namespace."""
+        storage = InMemoryStorage(wal_dir=tmp_path, wal_fsync=False)
+        session_id = uuid4()
+        await storage.enqueue_message(session_id, make_message(1), "alpha")
+        await storage.close()
+
+        restarted = InMemoryStorage(wal_dir=tmp_path, wal_fsync=False)
+
+        assert await restarted.get_queue_size(session_id, "alpha") == 1
+        assert await restarted.get_queue_size(session_id, "beta") == 0
+
+    async def test_concurrent_writes_share_a_commit(self, tmp_path: Path) -> None:
+        """Test writers in one commit window are released by one fsync batch."""
+        wal = MessageQueueWAL(tmp_path, commit_interval=0.01, fsync=False)
+        wal.recover()
+        session_id = uuid4()
+
+        futures = [wal.log_enqueue("default", session_id, make_message(n))[1] for n in range(10)]
+
+        assert len({id(future) for future in futures}) == 1
+        await asyncio.gather(*futures)
+        lines = (tmp_path / segments(tmp_path)[0]).read_text().splitlines()
+        assert len(lines) == 10
+
+    async def test_truncated_tail_is_ignored(self, tmp_path: Path) -> None:
+        """Test a torn final record does not prevent recovery."""
+        storage = InMemoryStorage(wal_dir=tmp_path, wal_fsync=False)
+        session_id = uuid4()
+        await storage.enqueue_message(session_id, make_message(1))
+        await storage.close()
+
+        with (tmp_path / segments(tmp_path)[-1]).open("a") as handle:
+            handle.write('{"o":"e","n":99,"p":"def')
+
+        restarted = InMemoryStorage(wal_dir=tmp_path, wal_fsync=False)
+        assert await restarted.get_queue_size(session_id) == 1
+
+    async def test_drained_segments_are_compacted(self, tmp_path: Path) -> None:
+        """Test fully-dequeued segments are deleted oldest first."""
+        wal = MessageQueueWAL(tmp_path, segment_max_bytes=512, fsync=False)
+        wal.recover()
+        session_id = uuid4()
+
+        lsns = []
+        for n in range(20):
+            lsn, committed = wal.log_enqueue("default", session_id, make_message(n))
+            lsns.append(lsn)
+            await committed
+        assert len(segments(tmp_path)) > 3
+
+        await wal.log_dequeue("default", session_id, lsns)
+        await wal.log_enqueue("default", session_id, make_message(99))[1]
+        await wal.close()
+
+        assert len(segments(tmp_path)) <= 2
+        restarted = MessageQueueWAL(tmp_path, fsync=False)
+        recovered = restarted.recover()
+        assert [m.payload["n"] for _, m in recovered[("default", session_id)]] == [99]
+
+    async def test_out_of_order_dequeue_is_recovered(self, tmp_path: Path) -> None:
+        """Test priority dequeues that skip older messages replay correctly."""
+        storage = InMemoryStorage(wal_dir=tmp_path, wal_fsync=False)
+        session_id = uuid4()
+        await storage.enqueue_message(session_id, make_message(1))
+        await storage.enqueue_message(session_id, make_message(2, priority="urgent"))
+        assert [m.payload["n"] for m in await storage.dequeue_messages(session_id, 1)] == [2]
+        await storage.close()
+
+        restarted = InMemoryStorage(wal_dir=tmp_path, wal_fsync=False)
+        assert [m.payload["n"] for m in await restarted.dequeue_messages(session_id)] == [1]
+
+    async def test_failed_commit_is_not_delivered_or_recovered(self, tmp_path: Path) -> None:
+        """Test a message whose commit fails is neither queued nor replayed."""
+        storage = InMemoryStorage(wal_dir=tmp_path, wal_fsync=False)
+        session_id = uuid4()
+        wal = storage._wal
+        write_batch = wal._write_batch
+
+        def write_then_fail(batch: list[tuple[int, str]]) -> None:
+            write_batch(batch)
+            raise OSError("fsync failed")
+
+        wal._write_batch = write_then_fail  # type: ignore[method-assign]
+        with pytest.raises(ValueError, match="Failed to persist"):
+            await storage.enqueue_message(session_id, make_message(1))
+        assert await storage.enqueue_messages([(session_id, make_message(2))]) == [False]
+        assert await storage.get_queue_size(session_id) == 0
+
+        wal._write_batch = write_batch  # type: ignore[method-assign]
+        await storage.enqueue_message(session_id, make_message(3))
+        await storage.close()
+
+        restarted = InMemoryStorage(wal_dir=tmp_path, wal_fsync=False)
+        assert [m.payload["n"] for m in await restarted.dequeue_messages(session_id)] == [3]
+
+    async def test_storage_without_wal_writes_nothing(self, tmp_path: Path) -> None:
+        """Test the default storage stays purely in memory."""
+        storage = InMemoryStorage()
+        await storage.enqueue_message(uuid4(), make_message(1))
+        await storage.close()
+
+        assert list(tmp_path.iterdir()) == []
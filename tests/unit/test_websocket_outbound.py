@@ -0,0 +1,177 @@
+"""
+Unit tests for per-connection WebSocket outbound queues.
+
+Tests that broadcasts do not wait on slow connections, the drop-oldest,
+coalesce and disconnect slow-consumer policies, and encode-once frames.
+"""
+
+import asyncio
+import json
+from uuid import uuid4
+
+from communication_server.websocket.chat_manager import ChatConnectionManager
+from communication_server.websocket.manager import ConnectionManager
+from communication_server.websocket.outbound import SlowConsumerPolicy, encode_frame
+
+
+class FakeWebSocket:
+    """WebSocket stand-in whose sends block until released."""
+
+    def __init__(self, blocked: bool = False, fail: bool = False) -> None:
+        self.sent: list[dict] = []
+        self.frames: list[str] = []
+        self.closed_with: int | None = None
+        self.fail = fail
+        self.gate = asyncio.Event()
+        if not blocked:
+            self.gate.set()
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.frames.append(data)
+        self.sent.append(json.loads(data))
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_with = code
+
+
+async def settle() -> None:
+    """Let writer tasks run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestConnectionManagerFanOut:
+    """Tests for queued meeting broadcasts."""
+
+    async def test_slow_connection_does_not_stall_others(self) -> None:
+        """Test a blocked socket does not delay delivery to the rest."""
+        manager = ConnectionManager()
+        meeting_id = uuid4()
+        slow, fast = FakeWebSocket(blocked=True), FakeWebSocket()
+        await manager.connect(slow, meeting_id)
+        await manager.connect(fast, meeting_id)
+
+        for n in range(3):
+            await manager.broadcast_to_meeting(meeting_id, {"type": "opinion", "n": n})
+        await settle()
+
+        assert [m["n"] for m in fast.sent] == [0, 1, 2]
+        assert slow.sent == []
+        stats = manager.get_queue_stats(meeting_id)
+        assert stats["connections"] == 2
+        assert stats["max_queue_depth"] >= 2
+
+        slow.gate.set()
+        await settle()
+        assert [m["n"] for m in slow.sent] == [0, 1, 2]
+        assert manager.get_queue_stats(meeting_id)["queued"] == 0
+
+    async def test_broadcast_encodes_once(self) -> None:
+        """Test every connection is sent the same pre-encoded frame."""
+        manager = ConnectionManager()
+        meeting_id = uuid4()
+        sockets = [FakeWebSocket() for _ in range(3)]
+        for ws in sockets:
+            await manager.connect(ws, meeting_id)
+        message = {"type": "opinion", "data": {"text": "héllo"}}
+
+        await manager.broadcast_to_meeting(meeting_id, message)
+        await settle()
+
+        frames = [ws.frames[0] for ws in sockets]
+        assert all(frame is frames[0] for frame in frames)
+        assert json.loads(frames[0]) == message
+        assert frames[0] == encode_frame(message)
+
+    async def test_drop_oldest_when_queue_full(self) -> None:
+        """Test the oldest frames are dropped and counted."""
+        manager = ConnectionManager(max_queue=2)
+        meeting_id = uuid4()
+        ws = FakeWebSocket(blocked=True)
+        await manager.connect(ws, meeting_id)
+        await settle()
+
+        await manager.broadcast_to_meeting(meeting_id, {"type": "opinion", "n": 0})
+        await settle()
+        for n in range(1, 5):
+            await manager.broadcast_to_meeting(meeting_id, {"type": "opinion", "n": n})
+        ws.gate.set()
+        await settle()
+
+        # Frame 0 was already in flight when the queue filled
+        assert [m["n"] for m in ws.sent] == [0, 3, 4]
+        assert manager.get_queue_stats(meeting_id)["dropped"] == 2
+
+    async def test_disconnect_policy_evicts_slow_consumer(self) -> None:
+        """Test an overflowing connection is dropped and closed."""
+        manager = ConnectionManager(max_queue=1, policy=SlowConsumerPolicy.DISCONNECT)
+        meeting_id = uuid4()
+        slow, fast = FakeWebSocket(blocked=True), FakeWebSocket()
+        await manager.connect(slow, meeting_id)
+        await manager.connect(fast, meeting_id)
+        await settle()
+
+        for n in range(3):
+            await manager.broadcast_to_meeting(meeting_id, {"type": "opinion", "n": n})
+            await settle()
+
+        assert not manager.is_connection_active(slow)
+        assert slow.closed_with == 1013
+        assert len(fast.sent) == 3
+        assert manager.get_queue_stats(meeting_id)["disconnected"] == 1
+
+    async def test_failed_send_disconnects(self) -> None:
+        """Test a socket that errors on send is removed."""
+        manager = ConnectionManager()
+        meeting_id = uuid4()
+        ws = FakeWebSocket(fail=True)
+        await manager.connect(ws, meeting_id)
+
+        await manager.broadcast_to_meeting(meeting_id, {"type": "opinion"})
+        await settle()
+
+        assert not manager.is_connection_active(ws)
+        assert manager.get_connection_count(meeting_id) == 0
+
+    async def test_disconnect_drains_queued_frames(self) -> None:
+        """Test frames queued before disconnect are still sent."""
+        manager = ConnectionManager()
+        meeting_id = uuid4()
+        ws = FakeWebSocket()
+        await manager.connect(ws, meeting_id)
+
+        await manager.send_personal_message({"type": "error"}, ws)
+        manager.disconnect(ws)
+        await settle()
+
+        assert ws.sent == [{"type": "error"}]
+
+
+class TestChatConnectionManagerFanOut:
+    """Tests for queued chat room broadcasts."""
+
+    async def test_typing_frames_coalesce(self) -> None:
+        """Test a queued typing frame is replaced by the newer room state."""
+        manager = ChatConnectionManager(typing_window=0)
+        room_id, alice, bob = uuid4(), uuid4(), uuid4()
+        ws = FakeWebSocket(blocked=True)
+        await manager.connect(ws, room_id)
+        await settle()
+
+        await manager.broadcast_message(room_id, uuid4(), "agent", alice, "first")
+        await manager.broadcast_typing(room_id, alice, "agent", True)
+        await settle()
+        await manager.broadcast_typing(room_id, bob, "agent", True)
+        await settle()
+        ws.gate.set()
+        await settle()
+
+        assert [m["event"] for m in ws.sent] == ["chat.message", "chat.typing"]
+        assert [t["sender_id"] for t in ws.sent[1]["data"]["typing"]] == [str(alice), str(bob)]
+        assert manager.get_queue_stats(room_id)["coalesced"] == 1
@@ -0,0 +1,139 @@
+"""
+Unit tests for write-behind communication logging.
+
+Tests batching, retry and drop behavior of CommunicationLogBuffer, and
+idempotent bulk inserts in CommunicationService.
+"""
+
+import asyncio
+
+from agent_comm_core.models.communication import (
+    CommunicationBatchResult,
+    CommunicationCreate,
+    CommunicationDirection,
+)
+from mcp_broker.client.http_client import CommunicationServerAPIError
+from mcp_broker.client.write_behind import CommunicationLogBuffer
+
+
+def communication(content: str = "hello") -> CommunicationCreate:
+    """Create a communication to log."""
+    return CommunicationCreate(
+        from_agent="agent-a",
+        to_agent="agent-b",
+        message_type="notification",
+        content=content,
+        direction=CommunicationDirection.OUTBOUND,
+    )
+
+
+class RecordingClient:
+    """HTTP client stand-in that records bulk requests."""
+
+    def __init__(self, failures: list[CommunicationServerAPIError] | None = None) -> None:
+        self.batches: list[list[CommunicationCreate]] = []
+        self.failures = list(failures or [])
+
+    async def log_communications(
+        self, communications: list[CommunicationCreate]
+    ) -> CommunicationBatchResult:
+        if self.failures:
+            raise self.failures.pop(0)
+        self.batches.append(list(communications))
+        return CommunicationBatchResult(created=len(communications))
+
+
+class TestCommunicationLogBuffer:
+    """Tests for CommunicationLogBuffer class."""
+
+    async def test_submit_returns_before_sending(self) -> None:
+        """Test callers get a record immediately and writes are batched."""
+        client = RecordingClient()
+        buffer = CommunicationLogBuffer(client, max_batch_size=3, flush_interval=0.05)
+
+        records = [await buffer.submit(communication(str(i))) for i in range(7)]
+        assert client.batches == []
+
+        await buffer.flush()
+
+        assert [len(batch) for batch in client.batches] == [3, 3, 1]
+        sent_ids = [item.id for batch in client.batches for item in batch]
+        assert sent_ids == [record.id for record in records]
+        assert buffer.get_stats()["sent"] == 7
+        await buffer.close()
+
+    async def test_transient_errors_are_retried(self) -> None:
+        """Test server and network errors are retried with the same IDs."""
+        client = RecordingClient(
+            [CommunicationServerAPIError("down", 503), CommunicationServerAPIError("reset")]
+        )
+        buffer = CommunicationLogBuffer(client, flush_interval=0.01, retry_base_delay=0.001)
+
+        record = await buffer.submit(communication())
+        await buffer.close()
+
+        assert client.batches[0][0].id == record.id
+        assert buffer.get_stats()["retries"] == 2
+        assert buffer.get_stats()["dropped"] == 0
+
+    async def test_client_errors_drop_the_batch(self) -> None:
+        """Test non-retryable errors drop the batch without killing the flusher."""
+        client = RecordingClient([CommunicationServerAPIError("bad", 422)])
+        buffer = CommunicationLogBuffer(client, flush_interval=0.01)
+
+        await buffer.submit(communication("first"))
+        await buffer.flush()
+        await buffer.submit(communication("second"))
+        await buffer.close()
+
+        stats = buffer.get_stats()
+        assert stats["dropped"] == 1
+        assert stats["retries"] == 0
+        assert [item.content for item in client.batches[0]] == ["second"]
+
+    async def test_full_queue_applies_backpressure(self) -> None:
+        """Test submit waits while max_pending communications are queued."""
+        client = RecordingClient()
+        release = asyncio.Event()
+        send = client.log_communications
+
+        async def slow_send(communications: list[CommunicationCreate]) -> CommunicationBatchResult:
+            await release.wait()
+            return await send(communications)
+
+        client.log_communications = slow_send  # type: ignore[method-assign]
+        buffer = CommunicationLogBuffer(client, max_batch_size=1, max_pending=2)
+
+        # One batch in flight plus two queued fills the buffer
+        for _ in range(3):
+            await buffer.submit(communication())
+            await asyncio.sleep(0)
+        blocked = asyncio.create_task(buffer.submit(communication()))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        assert buffer.pending == 2
+
+        release.set()
+        await blocked
+        await buffer.close()
+        assert buffer.get_stats()["sent"] == 4
+
+
+class TestBulkCommunicationLogging:
+    """Tests for CommunicationService.log_communications."""
+
+    async def test_retried_batches_are_idempotent(self, communication_service) -> None:
+        """Test items with already stored client IDs are skipped."""
+        buffer = CommunicationLogBuffer(RecordingClient())
+        first = [await buffer.submit(communication(str(i))) for i in range(3)]
+        items = [CommunicationCreate(**record.model_dump()) for record in first]
+
+        created = await communication_service.log_communications(items)
+        again = await communication_service.log_communications(
+            [*items, communication("new"), items[0]]
+        )
+
+        assert [c.id for c in created] == [c.id for c in first]
+        assert [c.content for c in again] == ["new"]
+        assert len(await communication_service.list_recent()) == 4
+        await buffer.close()
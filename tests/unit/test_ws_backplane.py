@@ -0,0 +1,146 @@
+"""
+Unit tests for the WebSocket pub/sub backplane.
+
+Tests that meeting, chat and status broadcasts published by one worker
+reach sockets held by another, using InMemoryBackplane to stand in for
+the shared transport, and RedisBackplane against fakeredis.
+"""
+
+import asyncio
+import json
+from uuid import uuid4
+
+import pytest
+
+from communication_server.websocket.backplane import InMemoryBackplane, create_backplane
+from communication_server.websocket.chat_manager import ChatConnectionManager
+from communication_server.websocket.manager import ConnectionManager
+from communication_server.websocket.status_handler import StatusWebSocketHandler
+
+
+class FakeWebSocket:
+    """WebSocket stand-in that records what it is sent."""
+
+    def __init__(self) -> None:
+        self.sent: list[dict] = []
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        self.sent.append(json.loads(data))
+
+
+async def settle() -> None:
+    """Let writer tasks run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestInMemoryBackplane:
+    """Tests for broadcasts across managers sharing a backplane."""
+
+    async def test_meeting_broadcast_reaches_every_worker(self) -> None:
+        """Test a broadcast from one manager reaches the other's sockets."""
+        backplane = InMemoryBackplane()
+        worker_a = ConnectionManager(backplane=backplane)
+        worker_b = ConnectionManager(backplane=backplane)
+        meeting_id = uuid4()
+        on_a, on_b, elsewhere = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+        await worker_a.connect(on_a, meeting_id)
+        await worker_b.connect(on_b, meeting_id)
+        await worker_b.connect(elsewhere, uuid4())
+
+        await worker_a.broadcast_to_meeting(meeting_id, {"type": "opinion"})
+        await worker_a.broadcast_to_meeting_excluding(meeting_id, {"type": "leave"}, on_a)
+        await settle()
+
+        assert [m["type"] for m in on_a.sent] == ["opinion"]
+        assert [m["type"] for m in on_b.sent] == ["opinion", "leave"]
+        assert elsewhere.sent == []
+
+    async def test_chat_broadcast_reaches_every_worker(self) -> None:
+        """Test a chat message posted on one worker reaches the other."""
+        backplane = InMemoryBackplane()
+        worker_a = ChatConnectionManager(backplane=backplane)
+        worker_b = ChatConnectionManager(backplane=backplane)
+        room_id = uuid4()
+        ws = FakeWebSocket()
+        await worker_b.connect(ws, room_id)
+
+        await worker_a.broadcast_message(room_id, uuid4(), "user", uuid4(), "hello")
+        await settle()
+
+        assert [m["data"]["content"] for m in ws.sent] == ["hello"]
+
+    async def test_status_event_reaches_every_worker(self) -> None:
+        """Test status events are filtered by each worker's subscriptions."""
+        backplane = InMemoryBackplane()
+        worker_a = StatusWebSocketHandler(None, backplane)  # type: ignore[arg-type]
+        worker_b = StatusWebSocketHandler(None, backplane)  # type: ignore[arg-type]
+        following, other = FakeWebSocket(), FakeWebSocket()
+        worker_b._subscriptions.subscribe(following, {"agent_ids": ["a1"]})
+        worker_b._subscriptions.subscribe(other, {"agent_ids": ["a2"]})
+
+        await worker_a.broadcast_agent_status_change("a1", "online", "offline")
+
+        assert [m["data"]["agent_id"] for m in following.sent] == ["a1"]
+        assert other.sent == []
+
+    async def test_failing_handler_does_not_stop_delivery(self) -> None:
+        """Test one failing subscriber does not block the others."""
+        backplane = InMemoryBackplane()
+        received = []
+
+        async def broken(_message: dict) -> None:
+            raise RuntimeError("boom")
+
+        async def working(message: dict) -> None:
+            received.append(message)
+
+        backplane.subscribe("meetings", broken)
+        backplane.subscribe("meetings", working)
+        await backplane.publish("meetings", {"n": 1})
+
+        assert received == [{"n": 1}]
+
+    def test_create_backplane_rejects_unknown_backend(self) -> None:
+        """Test an unknown backend name raises ValueError."""
+        assert isinstance(create_backplane("memory"), InMemoryBackplane)
+        with pytest.raises(ValueError, match="Unknown WebSocket backplane"):
+            create_backplane("kafka")
+
+
+class TestRedisBackplane:
+    """Tests for RedisBackplane against fakeredis."""
+
+    async def test_publish_reaches_every_worker(self) -> None:
+        """Test a publication is dispatched once in each subscribed worker."""
+        fakeredis = pytest.importorskip("fakeredis")
+        from communication_server.websocket.backplane import RedisBackplane
+
+        server = fakeredis.FakeServer()
+        workers = [
+            RedisBackplane(client=fakeredis.FakeAsyncRedis(server=server, decode_responses=True))
+            for _ in range(2)
+        ]
+        received: list[list[dict]] = [[], []]
+        for worker, inbox in zip(workers, received, strict=True):
+
+            async def handler(message: dict, inbox: list[dict] = inbox) -> None:
+                inbox.append(message)
+
+            worker.subscribe("chat", handler)
+            await worker.start()
+
+        try:
+            await workers[0].publish("chat", {"room_id": "r1", "message": {"n": 1}})
+            for _ in range(50):
+                if all(received):
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            for worker in workers:
+                await worker.close()
+
+        assert received == [[{"room_id": "r1", "message": {"n": 1}}]] * 2